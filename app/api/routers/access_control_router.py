@@ -1,5 +1,11 @@
 # routers/access_control_router.py
-from fastapi import APIRouter, Depends
+from typing import List
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.orm import Session
+from app.database.connection import get_db
+from app.dtos.assignment_result_dto import (
+    AssignmentResultDto, PolicyAssignmentDto, RolePermissionAssignmentDto, UserRoleAssignmentDto
+)
 from app.engine.cerberus import Cerberus
 from app.dependencies.auth import verify_token
 
@@ -8,28 +14,68 @@ engine = Cerberus()
 
 # 保護された操作群
 @router.post("/user/{user_id}/role/{role_id}", dependencies=[Depends(verify_token)])
-def assign_role(user_id: str, role_id: str):
-    return engine.assign_role_to_user(user_id, role_id)
+def assign_role(user_id: str, role_id: str, db: Session = Depends(get_db)):
+    engine.assign_role_to_user(db, user_id, role_id)
+    db.commit()
+    return {"detail": "Role assigned"}
 
 @router.delete("/user/{user_id}/role/{role_id}", dependencies=[Depends(verify_token)])
-def revoke_role(user_id: str, role_id: str):
-    engine.revoke_role_from_user(user_id, role_id)
+def revoke_role(user_id: str, role_id: str, db: Session = Depends(get_db)):
+    engine.revoke_role_from_user(db, user_id, role_id)
+    db.commit()
     return {"detail": "Role removed"}
 
 @router.post("/role/{role_id}/permission/{permission_id}", dependencies=[Depends(verify_token)])
-def assign_permission(role_id: str, permission_id: str):
-    return engine.assign_permission_to_role(role_id, permission_id)
+def assign_permission(role_id: str, permission_id: str, db: Session = Depends(get_db)):
+    engine.assign_permission_to_role(db, role_id, permission_id)
+    db.commit()
+    return {"detail": "Permission assigned"}
 
 @router.delete("/role/{role_id}/permission/{permission_id}", dependencies=[Depends(verify_token)])
-def revoke_permission(role_id: str, permission_id: str):
-    engine.revoke_permission_from_role(role_id, permission_id)
+def revoke_permission(role_id: str, permission_id: str, db: Session = Depends(get_db)):
+    try:
+        engine.revoke_permission_from_role(db, role_id, permission_id)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+    db.commit()
     return {"detail": "Permission removed"}
 
 @router.post("/policy", dependencies=[Depends(verify_token)])
-def assign_resource(role_id: str, permission_id: str, resource_id: str, condition: str = None):
-    return engine.assign_resource_to_role(role_id, permission_id, resource_id, condition)
+def assign_resource(
+    role_id: str, permission_id: str, resource_id: str, condition: str = None, db: Session = Depends(get_db)
+):
+    try:
+        engine.assign_resource_to_role(db, role_id, permission_id, resource_id, condition)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    db.commit()
+    return {"detail": "Policy assigned"}
 
 @router.delete("/policy", dependencies=[Depends(verify_token)])
-def revoke_resource(role_id: str, permission_id: str, resource_id: str):
-    engine.revoke_resource_from_role(role_id, permission_id, resource_id)
+def revoke_resource(role_id: str, permission_id: str, resource_id: str, db: Session = Depends(get_db)):
+    engine.revoke_resource_from_role(db, role_id, permission_id, resource_id)
+    db.commit()
     return {"detail": "Policy removed"}
+
+# 一括割り当て（オンボーディング用）。1リクエスト1トランザクションで登録し、行ごとの結果を返す
+@router.post("/bulk/user-roles", response_model=List[AssignmentResultDto], dependencies=[Depends(verify_token)])
+def bulk_assign_roles(assignments: List[UserRoleAssignmentDto], db: Session = Depends(get_db)):
+    results = engine.assign_roles_to_users(db, [(a.user_id, a.role_id) for a in assignments])
+    db.commit()
+    return results
+
+@router.post(
+    "/bulk/role-permissions", response_model=List[AssignmentResultDto], dependencies=[Depends(verify_token)]
+)
+def bulk_assign_permissions(assignments: List[RolePermissionAssignmentDto], db: Session = Depends(get_db)):
+    results = engine.assign_permissions_to_roles(db, [(a.role_id, a.permission_id) for a in assignments])
+    db.commit()
+    return results
+
+@router.post("/bulk/policies", response_model=List[AssignmentResultDto], dependencies=[Depends(verify_token)])
+def bulk_assign_resources(assignments: List[PolicyAssignmentDto], db: Session = Depends(get_db)):
+    results = engine.assign_resources_to_roles(
+        db, [(a.role_id, a.permission_id, a.resource_id, a.condition) for a in assignments]
+    )
+    db.commit()
+    return results
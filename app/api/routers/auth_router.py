@@ -3,7 +3,8 @@ from sqlalchemy.orm import Session
 from app.models.models import User
 from app.database.connection import get_db
 from app.utils.security import verify_password
-from app.utils.jwt import create_access_token
+from app.utils.jwt import EMBED_PERMISSIONS, create_access_token
+from app.dependencies.auth import permission_claims
 from pydantic import BaseModel
 
 router = APIRouter()
@@ -35,14 +36,20 @@ def login(data: LoginRequest, db: Session = Depends(get_db)):
         data (LoginRequest): ユーザー名とパスワードを含むリクエストボディ。
         db (Session): データベースセッション。FastAPIによって自動注入されます。
 
+    JWT_EMBED_PERMISSIONS が有効な場合は、ユーザーのロール・パーミッションのビットマップと
+    認可情報の版数をトークンに埋め込む（`require_permission` がDBを参照せずに判定できる）。
+
     Returns:
         dict: `access_token`（JWT）と `token_type`（常に "bearer"）を含む辞書。
 
     Raises:
         HTTPException: 認証失敗時に 401 Unauthorized を返します。
     """
-    user = db.query(User).filter(User.username == data.username).first()
+    user = db.query(User).filter(User.user_name == data.username).first()
     if not user or not verify_password(data.password, user.hashed_password):
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid credentials")
-    token = create_access_token({"sub": user.username})
+    claims = {"sub": user.user_uuid}
+    if EMBED_PERMISSIONS:
+        claims.update(permission_claims.issue(db, user.user_uuid))
+    token = create_access_token(claims)
     return {"access_token": token, "token_type": "bearer"}
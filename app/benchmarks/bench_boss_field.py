@@ -0,0 +1,68 @@
+"""
+上司入力欄の表示判定（is_display_boss_field）の単体呼び出しとバッチ呼び出しの比較。
+
+申請書選択画面を想定し、同じユーザー・部署で 150 件の申請書を判定する。
+
+    python -m app.benchmarks.bench_boss_field
+"""
+from app.benchmarks.common import count_queries, measure, memory_session, report
+from app.engine.laube import Laube
+from app.models.models import ApplicationForm, ApplicationFormRoute, Boss
+from app.models.specifiedValue import AutoApproverlFlag, PullingFlag, RouteFlag, WithdrawalFlag
+
+TENANT = "bench-tenant"
+FORM_COUNT = 150
+AUDIT = dict(create_user_uuid="bench", update_user_uuid="bench", update_count=1)
+ROUTE_FLAGS = (RouteFlag.NO_INDIVIDUAL_ROUTE, RouteFlag.INDIVIDUAL_ROUTE, RouteFlag.BOSS_ROUTE)
+
+
+def seed(session) -> list:
+    codes = []
+    for i in range(FORM_COUNT):
+        code = f"F{i:04d}"
+        route_flag = ROUTE_FLAGS[i % len(ROUTE_FLAGS)]
+        codes.append(code)
+        session.add(ApplicationForm(
+            tenant_uuid=TENANT, application_form_code=code, application_form_name=code,
+            application_classification_code="C1", skip_apply_employee=False,
+            auto_approverl_flag=AutoApproverlFlag.MANUAL_APPROVAL, pulling_flag=PullingFlag.A,
+            withdrawal_flag=WithdrawalFlag.ENABLED, route_flag=route_flag, sort_number=i,
+            table_name=f"t_{code}", screen_code=f"S{i:05d}", **AUDIT
+        ))
+        if route_flag == RouteFlag.INDIVIDUAL_ROUTE and i % 2:
+            session.add(ApplicationFormRoute(
+                tenant_uuid=TENANT, application_form_code=code, group_code="G1",
+                individual_route_code="R1", **AUDIT
+            ))
+        if route_flag == RouteFlag.BOSS_ROUTE and i % 4 == 0:
+            session.add(Boss(
+                tenant_uuid=TENANT, user_uuid="U1", group_code="G1", application_form_code=code,
+                boss_tenant_uuid=TENANT, boss_group_code="G9", boss_user_uuid="B1", **AUDIT
+            ))
+    session.commit()
+    return codes
+
+
+def main() -> None:
+    session = memory_session()
+    codes = seed(session)
+    laube = Laube()
+
+    def per_form():
+        return {code: laube.is_display_boss_field(session, TENANT, "G1", "U1", code) for code in codes}
+
+    def batch():
+        return laube.is_display_boss_fields(session, TENANT, "G1", "U1", codes)
+
+    assert per_form() == batch(), "バッチ判定の結果が単体判定と一致しません"
+
+    results = {}
+    for name, fn in (("per-form x150", per_form), ("batch", batch)):
+        results[name] = dict(queries=count_queries(session, fn), **measure(fn))
+    report(f"is_display_boss_field ({FORM_COUNT} forms)", results)
+    speedup = results["per-form x150"]["median_ms"] / results["batch"]["median_ms"]
+    print(f"  speedup (median)         {speedup:,.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,316 @@
+"""
+Cerberus の規模別ベンチマーク（リリース間の比較用）。
+
+合成テナント（既定: ユーザー10万・ロール2千・パーミッション500・ポリシー100万）を SQLite の
+ファイルに生成し、以下を計測して JSON に書き出す。乱数は --seed で固定するため、同じ引数なら
+同じデータ・同じ判定対象で計測される。
+
+- cold_start : PolicyIndex.load()（全件読込）と、スナップショットからの読込の所要時間・RSS
+- check      : Cerberus.check() 1件あたりのレイテンシ（キャッシュなし／キャッシュあり、p50/p99）
+- filter     : Cerberus.filter_allowed() のリソース数あたりのスループット
+- assign     : 割り当て・解除（1件1コミット）と一括割り当てのスループット
+
+    python -m app.benchmarks.bench_cerberus_scale --output cerberus.json
+    python -m app.benchmarks.bench_cerberus_scale --scale 0.01   # 1/100 の規模で素早く確認
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import resource
+import sqlite3
+import statistics
+import tempfile
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Sequence, Tuple
+import sqlalchemy
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.orm import Session, sessionmaker
+from app.engine.cerberus import Cerberus
+from app.engine.decision_cache import DecisionCache
+from app.engine.policy_index import PolicyIndex
+from app.models.models import Base, Permission, Policy, Role, RolePermission, UserRole
+
+AUDIT = dict(create_user_uuid="bench", update_user_uuid="bench", update_count=0)
+INSERT_CHUNK = 10000
+
+DEFAULTS = dict(users=100_000, roles=2_000, permissions=500, policies=1_000_000)
+
+
+def rss_mb() -> float:
+    """現在の RSS（MB）。/proc が無い環境ではピーク値で代用する。"""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 2**20
+    except OSError:
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def percentiles(samples_ns: Sequence[int]) -> Dict[str, float]:
+    """ナノ秒のサンプルから p50 / p99 / 平均（マイクロ秒）を返す。"""
+    ordered = sorted(samples_ns)
+
+    def pick(q: float) -> float:
+        return ordered[min(len(ordered) - 1, int(len(ordered) * q))] / 1000
+
+    return {"p50_us": pick(0.50), "p99_us": pick(0.99), "mean_us": statistics.fmean(ordered) / 1000}
+
+
+def timed(fn: Callable[[], Any]) -> Tuple[Any, float]:
+    started = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - started
+
+
+class SyntheticTenant:
+    """再現可能な合成データ（ID の一覧と、ロールごとの (パーミッション, リソース)）。"""
+
+    def __init__(self, users: int, roles: int, permissions: int, policies: int, roles_per_user: int, seed: int):
+        rng = random.Random(seed)
+        self.users = [f"user-{i:07d}" for i in range(users)]
+        self.roles = [f"role-{i:05d}" for i in range(roles)]
+        self.permissions = [f"perm-{i:04d}" for i in range(permissions)]
+        self.resources = [f"/resources/{i:07d}" for i in range(max(1000, policies // 20))]
+        self.user_roles = [
+            (user, role) for user in self.users for role in rng.sample(self.roles, min(roles_per_user, roles))
+        ]
+
+        # ロールごとに同じ件数のポリシーを、ロールに割り当てたパーミッションの範囲で作る
+        per_role = max(1, policies // roles)
+        permissions_per_role = min(permissions, max(1, per_role // 50))
+        self.role_permissions: List[Tuple[str, str]] = []
+        self.policies: List[Tuple[str, str, str, str]] = []
+        for role in self.roles:
+            granted = rng.sample(self.permissions, permissions_per_role)
+            self.role_permissions.extend((role, permission) for permission in granted)
+            grants: Dict[Tuple[str, str], None] = {}
+            while len(grants) < per_role:
+                grants.setdefault((rng.choice(granted), rng.choice(self.resources)))
+            self.policies.extend(
+                (f"{role}:{permission}:{resource_id}", role, permission, resource_id)
+                for permission, resource_id in grants
+            )
+        self.rng = rng
+
+    def write(self, db: Session) -> None:
+        """Core の executemany でまとめて登録する（ORM のイベントを通さない）。"""
+        def insert(table, rows):
+            for start in range(0, len(rows), INSERT_CHUNK):
+                db.execute(table.insert(), rows[start:start + INSERT_CHUNK])
+
+        insert(Role.__table__, [{"role_id": r, "role_name": r, **AUDIT} for r in self.roles])
+        insert(Permission.__table__, [{"permission_id": p, "permission_name": p, **AUDIT} for p in self.permissions])
+        insert(UserRole.__table__, [{"user_id": u, "role_id": r, **AUDIT} for u, r in self.user_roles])
+        insert(RolePermission.__table__, [
+            {"role_id": r, "permission_id": p, **AUDIT} for r, p in self.role_permissions
+        ])
+        insert(Policy.__table__, [
+            {"policy_id": pid, "role_id": r, "permission_id": p, "resource_id": res, "condition": None, **AUDIT}
+            for pid, r, p, res in self.policies
+        ])
+        db.commit()
+
+    def sample_checks(self, count: int) -> List[Tuple[str, str, str]]:
+        """判定対象（約半数は許可されるように、ユーザーのロールのポリシーから選ぶ）。"""
+        by_role: Dict[str, List[Tuple[str, str]]] = {}
+        for _, role, permission, resource_id in self.policies:
+            by_role.setdefault(role, []).append((permission, resource_id))
+        roles_of: Dict[str, List[str]] = {}
+        for user, role in self.user_roles:
+            roles_of.setdefault(user, []).append(role)
+
+        samples = []
+        for _ in range(count):
+            user = self.rng.choice(self.users)
+            if self.rng.random() < 0.5 and by_role.get(roles_of[user][0]):
+                permission, resource_id = self.rng.choice(by_role[roles_of[user][0]])
+            else:
+                permission, resource_id = self.rng.choice(self.permissions), self.rng.choice(self.resources)
+            samples.append((user, permission, resource_id))
+        return samples
+
+
+def load_and_save(session_factory, snapshot_path: str) -> Tuple[float, float, int, float]:
+    """DBから読み込んだインデックスのスナップショットを保存する（インデックスは戻り時に解放される）。"""
+    index = PolicyIndex()
+    with session_factory() as db:
+        _, load_seconds = timed(lambda index=index, db=db: index.load(db))
+    loaded_rss = rss_mb()
+    size, save_seconds = timed(lambda index=index: index.save_snapshot(snapshot_path))
+    return load_seconds, loaded_rss, size, save_seconds
+
+
+def bench_cold_start(session_factory, snapshot_path: str) -> Dict[str, Any]:
+    baseline = rss_mb()
+    load_seconds, loaded_rss, size, save_seconds = load_and_save(session_factory, snapshot_path)
+
+    warm = PolicyIndex()
+    with session_factory() as db:
+        status, snapshot_seconds = timed(lambda warm=warm, db=db: warm.load_snapshot(db, snapshot_path))
+    return {
+        "load_seconds": load_seconds,
+        "rss_before_mb": baseline,
+        "rss_after_load_mb": loaded_rss,
+        "index_rss_mb": loaded_rss - baseline,
+        "snapshot_bytes": size,
+        "snapshot_save_seconds": save_seconds,
+        "snapshot_load_seconds": snapshot_seconds,
+        "snapshot_status": status,
+        "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    }
+
+
+def bench_check(cerberus: Cerberus, samples: List[Tuple[str, str, str]]) -> Dict[str, Any]:
+    def run() -> Tuple[List[int], int]:
+        durations, allowed = [], 0
+        for user, permission, resource_id in samples:
+            started = time.perf_counter_ns()
+            allowed += cerberus.check(user, permission, resource_id)
+            durations.append(time.perf_counter_ns() - started)
+        return durations, allowed
+
+    cerberus.decision_cache.clear()
+    uncached, allowed = run()
+    cached, _ = run()
+    return {
+        "samples": len(samples),
+        "allowed_ratio": allowed / len(samples),
+        "uncached": percentiles(uncached),
+        "cached": percentiles(cached),
+    }
+
+
+def bench_filter(cerberus: Cerberus, tenant: SyntheticTenant, batch: int, rounds: int) -> Dict[str, Any]:
+    rng = tenant.rng
+    requests = [
+        (rng.choice(tenant.users), rng.choice(tenant.permissions), rng.sample(tenant.resources, batch))
+        for _ in range(rounds)
+    ]
+    durations = []
+    for user, permission, resource_ids in requests:
+        started = time.perf_counter_ns()
+        cerberus.filter_allowed(user, permission, resource_ids)
+        durations.append(time.perf_counter_ns() - started)
+    return {
+        "batch_size": batch,
+        "rounds": rounds,
+        "resources_per_second": batch * rounds / (sum(durations) / 1e9),
+        "latency": percentiles(durations),
+    }
+
+
+def bench_assign(cerberus: Cerberus, session_factory, tenant: SyntheticTenant, count: int) -> Dict[str, Any]:
+    pairs = [(f"bench-user-{i:06d}", tenant.rng.choice(tenant.roles)) for i in range(count)]
+
+    def assign_each():
+        with session_factory() as db:
+            for user, role in pairs:
+                cerberus.assign_role_to_user(db, user, role)
+                db.commit()
+
+    def revoke_each():
+        with session_factory() as db:
+            for user, role in pairs:
+                cerberus.revoke_role_from_user(db, user, role)
+                db.commit()
+
+    bulk_pairs = [(f"bulk-user-{i:06d}", tenant.rng.choice(tenant.roles)) for i in range(count * 10)]
+
+    def assign_bulk():
+        with session_factory() as db:
+            cerberus.assign_roles_to_users(db, bulk_pairs)
+            db.commit()
+
+    _, assign_seconds = timed(assign_each)
+    _, revoke_seconds = timed(revoke_each)
+    _, bulk_seconds = timed(assign_bulk)
+    return {
+        "operations": count,
+        "assign_per_second": count / assign_seconds,
+        "revoke_per_second": count / revoke_seconds,
+        "bulk_operations": len(bulk_pairs),
+        "bulk_assign_per_second": len(bulk_pairs) / bulk_seconds,
+    }
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    for name, value in DEFAULTS.items():
+        parser.add_argument(f"--{name}", type=int, default=value)
+    parser.add_argument("--scale", type=float, default=1.0, help="users/roles/permissions/policies に掛ける倍率")
+    parser.add_argument("--roles-per-user", type=int, default=2)
+    parser.add_argument("--checks", type=int, default=20_000)
+    parser.add_argument("--filter-batch", type=int, default=1_000)
+    parser.add_argument("--filter-rounds", type=int, default=200)
+    parser.add_argument("--assignments", type=int, default=500)
+    parser.add_argument("--seed", type=int, default=20250101)
+    parser.add_argument("--database", help="SQLite ファイル（省略時は一時ディレクトリ）")
+    parser.add_argument("--output", help="結果の JSON ファイル（省略時は標準出力）")
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> Dict[str, Any]:
+    args = parse_args(argv)
+    sizes = {name: max(1, int(getattr(args, name) * args.scale)) for name in DEFAULTS}
+
+    with tempfile.TemporaryDirectory() as workdir:
+        database = args.database or os.path.join(workdir, "cerberus.db")
+        engine = create_engine(f"sqlite:///{database}")
+        Base.metadata.create_all(bind=engine)
+        session_factory = sessionmaker(bind=engine)
+
+        tenant, generate_seconds = timed(lambda: SyntheticTenant(
+            sizes["users"], sizes["roles"], sizes["permissions"], sizes["policies"], args.roles_per_user, args.seed
+        ))
+        with session_factory() as db:
+            if db.execute(select(func.count()).select_from(Policy.__table__)).scalar():
+                raise SystemExit(f"{database} already contains policies; use an empty database")
+            _, write_seconds = timed(lambda: tenant.write(db))
+
+        results: Dict[str, Any] = {
+            "generate": {
+                "seconds": generate_seconds + write_seconds,
+                "user_roles": len(tenant.user_roles),
+                "role_permissions": len(tenant.role_permissions),
+                "policies": len(tenant.policies),
+            },
+            "cold_start": bench_cold_start(session_factory, os.path.join(workdir, "policy.idx")),
+        }
+
+        cerberus = Cerberus(
+            policy_index=PolicyIndex(), session_factory=session_factory,
+            decision_cache=DecisionCache(maxsize=max(args.checks, 1)), version_check_interval=3600, audit_sink=None
+        )
+        with session_factory() as db:
+            cerberus.load_index(db)
+        results["check"] = bench_check(cerberus, tenant.sample_checks(args.checks))
+        batch = min(args.filter_batch, len(tenant.resources))
+        results["filter"] = bench_filter(cerberus, tenant, batch, args.filter_rounds)
+        results["assign"] = bench_assign(cerberus, session_factory, tenant, args.assignments)
+        engine.dispose()
+
+    report = {
+        "benchmark": "cerberus_scale",
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "environment": {
+            "python": platform.python_version(),
+            "sqlalchemy": sqlalchemy.__version__,
+            "sqlite": sqlite3.sqlite_version,
+            "platform": platform.platform(),
+        },
+        "parameters": {**sizes, **{k: v for k, v in vars(args).items() if k not in DEFAULTS and k != "output"}},
+        "results": results,
+    }
+    text = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+    return report
+
+
+if __name__ == "__main__":
+    main()
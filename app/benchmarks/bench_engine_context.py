@@ -0,0 +1,85 @@
+"""
+Laube の生成コストと呼び出しオーバーヘッドの比較。
+
+- before: 呼び出しごとにコンテキストを作り直し、メッセージ定義もファイルから読み直す
+          （EngineContext 導入前の Laube() と同等のコスト）
+- after : プロセス共有の EngineContext を使う Laube()
+
+    python -m app.benchmarks.bench_engine_context
+"""
+from datetime import date
+from app.benchmarks.common import measure, memory_session, report
+from app.common.error_message_loader import load_message_catalog
+from app.engine.engine_context import EngineContext
+from app.engine.laube import Laube
+from app.models.models import ApplicationForm, Group, IndividualActivity, Tenant, TenantUser, User, UserGroup
+from app.models.specifiedValue import ApprovalFunction, AutoApproverlFlag, DefaultGroupFlg, PermissionRange, Range
+
+TENANT = "bench-tenant"
+AUDIT = dict(create_user_uuid="bench", update_user_uuid="bench", update_count=1)
+ITERATIONS = 1000
+
+
+def seed(session) -> None:
+    session.add(Tenant(tenant_uuid=TENANT, tenant_name="ベンチマーク株式会社", **AUDIT))
+    session.add(Group(
+        tenant_uuid=TENANT, group_code="G1", group_name="総務部",
+        term_from=date(2020, 1, 1), permission_range=PermissionRange.ALL, **AUDIT
+    ))
+    for i in range(3):
+        user_uuid = f"user-{i}"
+        session.add(User(user_uuid=user_uuid, user_name=f"社員{i}", hashed_password="x", **AUDIT))
+        session.add(TenantUser(tenant_uuid=TENANT, user_uuid=user_uuid, belong_start_date=date(2020, 1, 1), **AUDIT))
+        session.add(UserGroup(
+            tenant_uuid=TENANT, user_uuid=user_uuid, group_code="G1",
+            default_group_code=DefaultGroupFlg.ON, term_from=date(2020, 1, 1), range=Range.ALL, **AUDIT
+        ))
+        session.add(IndividualActivity(
+            tenant_uuid=TENANT, individual_route_code="R1", activity_code=i + 1,
+            approverl_tenant_uuid=TENANT, approverl_group_code="G1", approverl_user_uuid=user_uuid,
+            function=ApprovalFunction.EXAMINATION, **AUDIT
+        ))
+    session.commit()
+
+
+def cold_laube() -> Laube:
+    load_message_catalog.cache_clear()
+    return Laube(context=EngineContext())
+
+
+def main() -> None:
+    session = memory_session()
+    seed(session)
+    form = ApplicationForm(
+        tenant_uuid=TENANT, application_form_code="F1", auto_approverl_flag=AutoApproverlFlag.MANUAL_APPROVAL
+    )
+    Laube().get_individual_approverl_list(session, TENANT, TENANT, "R1", form)  # キャッシュを温める
+
+    def construct_before():
+        for _ in range(ITERATIONS):
+            cold_laube()
+
+    def construct_after():
+        for _ in range(ITERATIONS):
+            Laube()
+
+    def call_before():
+        for _ in range(100):
+            cold_laube().get_individual_approverl_list(session, TENANT, TENANT, "R1", form)
+
+    def call_after():
+        for _ in range(100):
+            Laube().get_individual_approverl_list(session, TENANT, TENANT, "R1", form)
+
+    report(f"Laube() x{ITERATIONS}", {
+        "before": measure(construct_before, repeat=5),
+        "after": measure(construct_after, repeat=5)
+    })
+    report("Laube().get_individual_approverl_list x100 (warm caches)", {
+        "before": measure(call_before, repeat=5),
+        "after": measure(call_after, repeat=5)
+    })
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""
+ベンチマーク共通処理。
+
+各ベンチマークは `python -m app.benchmarks.<モジュール名>` で実行する。
+DBはインメモリの SQLite を使うため、計測値はクエリ回数・往復回数の差を見る目安として扱う。
+"""
+import statistics
+import time
+from typing import Callable, Dict, List
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session, sessionmaker
+from app.models.models import Base
+
+
+def memory_session() -> Session:
+    """テーブル作成済みのインメモリ SQLite セッションを返す。"""
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(bind=engine)
+    return sessionmaker(bind=engine)()
+
+
+def count_queries(session: Session, fn: Callable[[], object]) -> int:
+    """fn の実行中に発行された SQL 文の数を返す。"""
+    statements: List[str] = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    engine = session.get_bind()
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        fn()
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+    return len(statements)
+
+
+def measure(fn: Callable[[], object], repeat: int = 20) -> Dict[str, float]:
+    """fn を repeat 回実行し、所要時間（ミリ秒）の中央値・最小値を返す。"""
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - started) * 1000)
+    return {"median_ms": statistics.median(samples), "min_ms": min(samples)}
+
+
+def report(title: str, results: Dict[str, Dict[str, float]]) -> None:
+    """計測結果を表形式で出力する。"""
+    print(f"== {title}")
+    for name, values in results.items():
+        columns = "  ".join(f"{key}={value:,.2f}" for key, value in values.items())
+        print(f"  {name:<24} {columns}")
@@ -0,0 +1,237 @@
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, TypeVar
+from sqlalchemy import Column, Table, and_, bindparam, or_, select
+from sqlalchemy.engine import Row
+from sqlalchemy.orm import Session
+from app.common.orm_invalidation import CHANGES_RECORDED
+
+T = TypeVar("T")
+
+# IN 句・一括 INSERT 1回あたりの件数（SQLite のバインド変数上限に収まる値）
+DEFAULT_CHUNK_SIZE = 500
+
+# INSERT ... ON CONFLICT / ON DUPLICATE KEY UPDATE で UPSERT できるDB
+UPSERT_DIALECTS = ("postgresql", "sqlite", "mysql", "mariadb")
+
+
+def chunked(items: Iterable[T], size: int = DEFAULT_CHUNK_SIZE) -> Iterator[List[T]]:
+    """items を size 件ずつのリストに分けて返す。"""
+    iterator = iter(items)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def find_existing_keys(
+    db: Session,
+    columns: Sequence[Column],
+    keys: Iterable[tuple],
+    extra_columns: Sequence[Column] = (),
+    chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> set:
+    """
+    columns の値の組が keys に含まれる行を検索し、存在する組を集合で返す。
+
+    match_keys() の条件で chunk_size 件ずつ検索する（1チャンク1クエリ）。
+    extra_columns を指定した場合は、キーの後ろにその列の値を付けた組を返す。
+    """
+    found = set()
+    selected = list(columns) + list(extra_columns)
+    for chunk in chunked(dict.fromkeys(keys), chunk_size):
+        rows = db.execute(select(*selected).where(match_keys(columns, chunk)))
+        found.update(tuple(row) for row in rows)
+    return found
+
+
+def match_keys(columns: Sequence[Column], keys: Sequence[tuple]):
+    """
+    columns の値の組が keys のいずれかに一致する条件を作る。
+
+    単一列は col IN (..)、複合キーは (a = ? AND b = ?) OR ... にする。(a, b) IN ((..), (..)) の
+    行値比較は SQLite では索引を使わず全件走査になるが、この形なら各組が索引の検索になる。
+    """
+    if len(columns) == 1:
+        return columns[0].in_([key[0] for key in keys])
+    return or_(*(and_(*(column == value for column, value in zip(columns, key))) for key in keys))
+
+
+def insert_ignoring_conflicts(
+    db: Session,
+    table: Table,
+    rows: Sequence[Dict[str, Any]],
+    returning: Sequence[Column] = (),
+    changes_recorded: bool = False
+) -> List[Row]:
+    """
+    rows を1文の executemany で INSERT し、一意制約に違反する行は読み飛ばす。
+
+    PostgreSQL / SQLite では INSERT ... ON CONFLICT DO NOTHING を使い、returning を指定した場合は
+    実際に追加された行だけを返す。それ以外のDBでは通常の INSERT になるため、事前に重複を
+    除いておくこと。ORM を経由しないため、マッパーのイベントは発生しない。
+
+    キャッシュ・認可インデックスは一括書き込みとして全体を破棄するが、呼び出し側が追加した行を
+    自分で反映する場合（record_bulk_insert() など）は changes_recorded=True を指定する。
+    """
+    if not rows:
+        return []
+    statement = _dialect_insert(db, table)
+    if hasattr(statement, "on_conflict_do_nothing"):
+        statement = statement.on_conflict_do_nothing()
+    if returning:
+        statement = statement.returning(*returning)
+    if changes_recorded:
+        statement = statement.execution_options(**{CHANGES_RECORDED: True})
+    result = db.execute(statement, list(rows))
+    return list(result.all()) if returning else []
+
+
+def insert_rows(
+    db: Session,
+    table: Table,
+    rows: Iterable[Dict[str, Any]],
+    ignore_conflicts: bool = False,
+    chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> int:
+    """
+    rows を chunk_size 件ずつ executemany で INSERT し、送信した行数を返す。
+
+    ignore_conflicts=True の場合は insert_ignoring_conflicts() と同じく一意制約に違反する行を
+    読み飛ばす（PostgreSQL / SQLite のみ）。
+    """
+    count = 0
+    for chunk in chunked(rows, chunk_size):
+        for group in _group_by_columns(chunk):
+            if ignore_conflicts:
+                insert_ignoring_conflicts(db, table, group)
+            else:
+                db.execute(table.insert(), group)
+            count += len(group)
+    return count
+
+
+def upsert_rows(
+    db: Session,
+    table: Table,
+    rows: Iterable[Dict[str, Any]],
+    key_columns: Sequence[str],
+    update_columns: Optional[Sequence[str]] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> int:
+    """
+    rows を chunk_size 件ずつ executemany で UPSERT し、送信した行数を返す。
+
+    key_columns（一意制約の列）が一致する行が既にあれば update_columns の列を行の値で更新する。
+    update_columns を省略した場合は、主キー・key_columns・作成者系（create_*）以外の行に含まれる
+    列を更新する。update_count 列がある場合は、行の値ではなく既存の値に1を足す。
+    PostgreSQL / SQLite では ON CONFLICT DO UPDATE、MySQL / MariaDB では ON DUPLICATE KEY UPDATE を使う。
+    それ以外のDBでは、チャンクごとに既存のキーを検索してから INSERT と UPDATE の executemany に分けて
+    実行する（既存キーの検索・INSERT・UPDATE）。この場合、検索から書き込みまでの間に他のトランザクションが同じキーを
+    追加すると一意制約違反になる。
+    """
+    excluded_columns = set(key_columns) | {c.name for c in table.primary_key.columns}
+    native = db.get_bind().dialect.name in UPSERT_DIALECTS
+    count = 0
+    for chunk in chunked(rows, chunk_size):
+        for group in _group_by_columns(chunk):
+            names = update_columns if update_columns is not None else [
+                name for name in group[0]
+                if name not in excluded_columns and not name.startswith("create_") and name != "update_count"
+            ]
+            if native:
+                db.execute(_upsert_statement(db, table, key_columns, names), group)
+            else:
+                _upsert_by_select(db, table, group, key_columns, names)
+            count += len(group)
+    return count
+
+
+def delete_by_keys(
+    db: Session,
+    table: Table,
+    key_columns: Sequence[str],
+    keys: Iterable[tuple],
+    chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> int:
+    """
+    key_columns の値の組が keys に含まれる行を chunk_size 件ずつ削除し、削除した行数を返す。
+
+    match_keys() の条件で1チャンク1文にする。
+    """
+    columns = [table.c[name] for name in key_columns]
+    count = 0
+    for chunk in chunked(dict.fromkeys(keys), chunk_size):
+        result = db.execute(table.delete().where(match_keys(columns, chunk)))
+        count += result.rowcount
+    return count
+
+
+def _dialect_insert(db: Session, table: Table):
+    dialect = db.get_bind().dialect.name
+    if dialect == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+        return insert(table)
+    if dialect == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert
+        return insert(table)
+    if dialect in ("mysql", "mariadb"):
+        from sqlalchemy.dialects.mysql import insert
+        return insert(table)
+    return table.insert()
+
+
+def _upsert_statement(db: Session, table: Table, key_columns: Sequence[str], update_columns: Sequence[str]):
+    statement = _dialect_insert(db, table)
+    if hasattr(statement, "on_conflict_do_update"):
+        values = {name: statement.excluded[name] for name in update_columns}
+    else:
+        values = {name: statement.inserted[name] for name in update_columns}
+    if "update_count" in table.c:
+        values["update_count"] = table.c.update_count + 1
+    if hasattr(statement, "on_conflict_do_update"):
+        if not values:
+            return statement.on_conflict_do_nothing(index_elements=list(key_columns))
+        return statement.on_conflict_do_update(index_elements=list(key_columns), set_=values)
+    return statement.on_duplicate_key_update(values or {key_columns[0]: table.c[key_columns[0]]})
+
+
+def _upsert_by_select(
+    db: Session,
+    table: Table,
+    rows: List[Dict[str, Any]],
+    key_columns: Sequence[str],
+    update_columns: Sequence[str]
+) -> None:
+    """UPSERT 構文の無いDB向けに、既存のキーを検索して INSERT と UPDATE に振り分ける。"""
+    # 同じキーの行は、UPSERT 構文と同じく後の行の値を残す
+    by_key = {tuple(row[name] for name in key_columns): row for row in rows}
+    existing = find_existing_keys(db, [table.c[name] for name in key_columns], by_key)
+    inserts = [row for key, row in by_key.items() if key not in existing]
+    if inserts:
+        db.execute(table.insert(), inserts)
+
+    values = {name: bindparam(f"new_{name}") for name in update_columns}
+    if "update_count" in table.c:
+        values["update_count"] = table.c.update_count + 1
+    updates = [row for key, row in by_key.items() if key in existing]
+    if updates and values:
+        # UPDATE の executemany では列名と同じ名前のバインドパラメータを使えないため、接頭辞を付ける
+        statement = table.update().where(
+            *(table.c[name] == bindparam(f"key_{name}") for name in key_columns)
+        ).values(values)
+        db.execute(statement, [
+            {
+                **{f"key_{name}": row[name] for name in key_columns},
+                **{f"new_{name}": row[name] for name in update_columns}
+            }
+            for row in updates
+        ])
+
+
+def _group_by_columns(rows: List[Dict[str, Any]]) -> List[List[Dict[str, Any]]]:
+    """executemany は全行が同じ列を持つ必要があるため、列の組み合わせごとに分ける。"""
+    groups: Dict[tuple, List[Dict[str, Any]]] = {}
+    for row in rows:
+        groups.setdefault(tuple(sorted(row)), []).append(row)
+    return list(groups.values())
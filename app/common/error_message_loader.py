@@ -1,9 +1,23 @@
 import json
+from functools import lru_cache
 from pathlib import Path
+from typing import Dict
+
+DEFAULT_MESSAGES_PATH = "app/constants/error_messages.json"
+
+
+@lru_cache(maxsize=None)
+def load_message_catalog(filepath: str) -> Dict[str, str]:
+    """
+    メッセージ定義ファイルを読み込む。同じファイルはプロセス内で1回だけ読む。
+    """
+    return json.loads(Path(filepath).read_text(encoding="utf-8"))
+
 
 class ErrorMessageLoader:
-    def __init__(self, filepath="app/constants/error_messages.json"):
-        self.messages = json.loads(Path(filepath).read_text(encoding="utf-8"))
+    def __init__(self, filepath=DEFAULT_MESSAGES_PATH):
+        self.messages = load_message_catalog(str(filepath))
 
-    def get_message(self, code: str) -> str:
-        return self.messages.get(code, f"[{code}] 不明なエラーコードです")
\ No newline at end of file
+    def get_message(self, code: str, *args) -> str:
+        message = self.messages.get(code, f"[{code}] 不明なエラーコードです")
+        return message.format(*args) if args else message
@@ -0,0 +1,96 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Generic, Hashable, List, Optional, Tuple, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class LruCache(Generic[K, V]):
+    """
+    スレッドセーフな LRU キャッシュ。
+
+    maxsize を超えた場合は最も長く参照されていないエントリから追い出す。
+    ttl（秒）を指定した場合は、登録から ttl 秒を過ぎたエントリを期限切れとして扱う。
+    FastAPI のスレッドプールから同時に参照されても壊れないよう、操作はロックで保護する。
+    """
+
+    def __init__(self, maxsize: int = 128, ttl: Optional[float] = None):
+        if maxsize <= 0:
+            raise ValueError("maxsize must be greater than 0")
+        if ttl is not None and ttl <= 0:
+            raise ValueError("ttl must be greater than 0")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: "OrderedDict[K, Tuple[V, Optional[float]]]" = OrderedDict()
+        self._lock = threading.RLock()
+
+    def get(self, key: K, default: Optional[V] = None) -> Optional[V]:
+        """キーに対応する値を返し、参照順を最新にする。"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or self._expired(entry):
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key: K, value: V) -> None:
+        """値を登録し、上限を超えた分を古い順に追い出す。"""
+        expires_at = time.monotonic() + self.ttl if self.ttl is not None else None
+        with self._lock:
+            self._entries[key] = (value, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def pop(self, key: K, default: Optional[V] = None) -> Optional[V]:
+        """キーを削除し、削除した値を返す。"""
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            return default if entry is None else entry[0]
+
+    def clear(self) -> None:
+        """全エントリを削除する。"""
+        with self._lock:
+            self._entries.clear()
+
+    def keys(self) -> List[K]:
+        """古い順のキー一覧（スナップショット）を返す。"""
+        with self._lock:
+            return list(self._entries.keys())
+
+    def stats(self) -> Dict[str, int]:
+        """監視用のヒット数・ミス数・追い出し数・件数を返す。"""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "size": len(self._entries)
+            }
+
+    def reset_stats(self) -> None:
+        """カウンタを0に戻す。"""
+        with self._lock:
+            self.hits = self.misses = self.evictions = 0
+
+    def _expired(self, entry: Tuple[V, Optional[float]]) -> bool:
+        return entry[1] is not None and entry[1] <= time.monotonic()
+
+    def __contains__(self, key: K) -> bool:
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry is not None and not self._expired(entry)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
@@ -0,0 +1,40 @@
+from contextlib import contextmanager
+from typing import Any, Iterator, Optional
+from sqlalchemy import inspect
+from sqlalchemy.orm.exc import StaleDataError
+from app.exception.laubeException import OptimisticLockException
+
+# 楽観ロックに使う列（モデル生成時に version_id_col として設定される）
+VERSION_COLUMN = "update_count"
+
+
+def version_attribute(model: Any) -> Optional[str]:
+    """モデルの version_id_col の属性名を返す（楽観ロック対象外のモデルは None）。"""
+    mapper = inspect(model)
+    if mapper.version_id_col is None:
+        return None
+    return mapper.get_property_by_column(mapper.version_id_col).key
+
+
+def check_update_count(instance: Any, expected_update_count: Optional[int]) -> None:
+    """
+    読み込んだインスタンスの更新回数が expected_update_count（画面で表示した時点の値など）と
+    一致しなければ OptimisticLockException を発生させる。expected_update_count が None の場合は何もしない。
+    """
+    attribute = version_attribute(type(instance))
+    if expected_update_count is None or attribute is None:
+        return
+    actual = getattr(instance, attribute)
+    if actual != expected_update_count:
+        raise OptimisticLockException(
+            type(instance).__name__, inspect(instance).identity, expected_update_count, actual
+        )
+
+
+@contextmanager
+def raise_on_conflict(entity: str, key: Any = None) -> Iterator[None]:
+    """flush 時の StaleDataError（条件付き UPDATE / DELETE が0件）を OptimisticLockException にする。"""
+    try:
+        yield
+    except StaleDataError as e:
+        raise OptimisticLockException(entity, key) from e
@@ -0,0 +1,84 @@
+from typing import Any, Callable, Hashable, Iterable, List, Optional, Set, Type
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import ORMExecuteState, Session, object_session
+
+# この実行オプションを付けた INSERT / UPDATE / DELETE は、呼び出し側で変更を反映済みとして扱う
+CHANGES_RECORDED = "changes_recorded"
+
+
+def written_model(orm_execute_state: ORMExecuteState, models: Iterable[Type]) -> Optional[Type]:
+    """
+    Session.execute() で実行される INSERT / UPDATE / DELETE の対象テーブルが models のいずれかなら、
+    そのモデルクラスを返す。SELECT と、CHANGES_RECORDED を付けて実行した文は None を返す。
+
+    ORM の update(Model) と Core の Table.insert() のどちらも対象になる。
+    """
+    if not (orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete):
+        return None
+    if orm_execute_state.execution_options.get(CHANGES_RECORDED):
+        return None
+    # update(Model) の対象は注釈付きのテーブルになるため、テーブル名で比較する
+    name = orm_execute_state.statement.table.name
+    return next((model for model in models if model.__table__.name == name), None)
+
+
+def invalidate_on_write(
+    models: Iterable[Type],
+    key_of: Callable[[Any], Iterable[Hashable]],
+    invalidate: Callable[[Set[Hashable]], None],
+    invalidate_all: Callable[[], None]
+) -> None:
+    """
+    ORM での書き込みに連動してプロセス内キャッシュを破棄するリスナーを登録する。
+
+    - insert / update / delete のフラッシュ時に key_of(対象行) のキーを即時に破棄する。
+    - 同じキーをセッションに記録しておき、コミット・ロールバック時にもう一度破棄する
+      （フラッシュ〜コミット間に他スレッドが旧データで再キャッシュした場合への対策）。
+    - Session.execute() による UPDATE / DELETE / INSERT 文（Query.update() / delete()、Core の一括処理を含む）は
+      対象行が分からないため invalidate_all() を呼び、コミット・ロールバック時にもう一度呼ぶ。
+
+    Args:
+        models: 監視するモデルクラス
+        key_of: 対象行から破棄するキーを返す関数
+        invalidate: キーの集合を破棄する関数
+        invalidate_all: すべてを破棄する関数
+    """
+    models = tuple(models)
+    pending_key = object()
+    pending_all_key = object()
+
+    def on_write(mapper, connection, target) -> None:
+        keys = set(key_of(target))
+        invalidate(keys)
+        session = object_session(target)
+        if session is not None:
+            session.info.setdefault(pending_key, set()).update(keys)
+
+    def on_session_end(session: Session, *args) -> None:
+        keys = session.info.pop(pending_key, None)
+        if keys:
+            invalidate(keys)
+        if session.info.pop(pending_all_key, False):
+            invalidate_all()
+
+    def on_execute(orm_execute_state: ORMExecuteState) -> None:
+        if written_model(orm_execute_state, models) is not None:
+            invalidate_all()
+            orm_execute_state.session.info[pending_all_key] = True
+
+    for model in models:
+        for event_name in ("after_insert", "after_update", "after_delete"):
+            event.listen(model, event_name, on_write)
+    event.listen(Session, "after_commit", on_session_end)
+    event.listen(Session, "after_soft_rollback", on_session_end)
+    event.listen(Session, "do_orm_execute", on_execute)
+
+
+def current_and_previous(target: Any, attribute: str) -> List[Any]:
+    """
+    属性の現在値と、このフラッシュで変更される前の値を返す。
+    キー項目自体が更新された場合に、変更前のキャッシュも破棄するために使う。
+    """
+    values = [getattr(target, attribute)]
+    values.extend(v for v in inspect(target).attrs[attribute].history.deleted if v not in values)
+    return values
@@ -0,0 +1,165 @@
+import threading
+import time
+from typing import Any, Callable, Dict, FrozenSet, Iterable, Optional, Sequence, Tuple
+from sqlalchemy import bindparam
+from sqlalchemy.engine import Result
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.expression import ColumnElement, Executable
+
+# 文の組み立て関数。値が None の NULL 可パラメータ名の集合を受け取り、文を返す
+StatementBuilder = Callable[[FrozenSet[str]], Executable]
+
+
+def match(column: ColumnElement, name: str, nulls: FrozenSet[str]) -> ColumnElement:
+    """
+    パラメータ name が None の組み合わせでは column IS NULL、それ以外では column = :name の条件を返す。
+
+    IS NOT DISTINCT FROM と違い、どちらの組み合わせでも列の索引を使える。
+    """
+    return column.is_(None) if name in nulls else column == bindparam(name)
+
+
+def fetch_all(result: Result) -> list:
+    return result.all()
+
+
+def fetch_scalars(result: Result) -> list:
+    return result.scalars().all()
+
+
+def fetch_scalar(result: Result) -> Any:
+    return result.scalar()
+
+
+def fetch_first_scalar(result: Result) -> Any:
+    return result.scalars().first()
+
+
+class StatementRegistry:
+    """
+    よく使う SELECT 文を名前を付けて1回だけ組み立て、バインドパラメータで実行する登録簿。
+
+    文は NULL 可パラメータのうち None になったものの組み合わせ（バリアント）ごとに1回だけ組み立て、
+    以降は同じ文オブジェクトを使い回す（SQLAlchemy のコンパイル済みキャッシュにも必ず当たる）。
+    文ごとの実行回数と累積時間（実行と fetch の合計）を stats() で返す。
+    FastAPI のスレッドプールから同時に使われても壊れないよう、登録と集計はロックで保護する。
+    """
+
+    def __init__(self):
+        self._builders: Dict[str, Tuple[StatementBuilder, FrozenSet[str]]] = {}
+        self._statements: Dict[Tuple[str, FrozenSet[str]], Executable] = {}
+        self._executions: Dict[str, int] = {}
+        self._seconds: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def define(self, name: str, builder: StatementBuilder, nullable: Iterable[str] = ()) -> str:
+        """
+        文を登録して名前を返す。同じ名前が既に登録されている場合は何もしない。
+
+        nullable には、None が渡されたときに IS NULL で比較するパラメータ名を指定する。
+        """
+        with self._lock:
+            if name not in self._builders:
+                self._builders[name] = (builder, frozenset(nullable))
+                self._executions[name] = 0
+                self._seconds[name] = 0.0
+        return name
+
+    def statement(self, name: str, nullable: Iterable[str] = ()) -> Callable[[StatementBuilder], StatementBuilder]:
+        """define() のデコレータ版。"""
+        def decorator(builder: StatementBuilder) -> StatementBuilder:
+            self.define(name, builder, nullable)
+            return builder
+        return decorator
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._builders
+
+    def get(self, name: str, nulls: FrozenSet[str] = frozenset()) -> Executable:
+        """NULL のパラメータの組み合わせに対応する文を返す（初回のみ組み立てる）。"""
+        key = (name, nulls)
+        statement = self._statements.get(key)
+        if statement is None:
+            try:
+                builder, _ = self._builders[name]
+            except KeyError:
+                raise KeyError(f"statement is not registered: {name}") from None
+            statement = builder(nulls)
+            with self._lock:
+                statement = self._statements.setdefault(key, statement)
+        return statement
+
+    def execute(
+        self,
+        db_session: Session,
+        name: str,
+        params: Optional[Dict[str, Any]] = None,
+        fetch: Callable[[Result], Any] = fetch_all
+    ) -> Any:
+        """
+        登録した文を params で実行し、fetch で取り出した結果を返す。
+
+        NULL 可パラメータの値が None の場合は IS NULL のバリアントを使い、そのパラメータは渡さない。
+        """
+        statement, bound = self._bind(name, params)
+        started = time.perf_counter()
+        try:
+            return fetch(db_session.execute(statement, bound))
+        finally:
+            self._record(name, time.perf_counter() - started)
+
+    async def execute_async(
+        self,
+        db_session: AsyncSession,
+        name: str,
+        params: Optional[Dict[str, Any]] = None,
+        fetch: Callable[[Result], Any] = fetch_all
+    ) -> Any:
+        """execute() の AsyncSession 版。同じ文オブジェクトを非同期ドライバで実行する。"""
+        statement, bound = self._bind(name, params)
+        started = time.perf_counter()
+        try:
+            return fetch(await db_session.execute(statement, bound))
+        finally:
+            self._record(name, time.perf_counter() - started)
+
+    def _bind(self, name: str, params: Optional[Dict[str, Any]]) -> Tuple[Executable, Dict[str, Any]]:
+        params = params or {}
+        _, nullable = self._builders.get(name, (None, frozenset()))
+        nulls = frozenset(key for key in nullable if params.get(key) is None)
+        bound = {key: value for key, value in params.items() if key not in nulls}
+        return self.get(name, nulls), bound
+
+    def _record(self, name: str, elapsed: float) -> None:
+        with self._lock:
+            self._executions[name] += 1
+            self._seconds[name] += elapsed
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """監視用に、文ごとの実行回数・累積時間（秒）・平均時間（秒）・バリアント数を返す。"""
+        with self._lock:
+            variants: Dict[str, int] = {}
+            for name, _ in self._statements:
+                variants[name] = variants.get(name, 0) + 1
+            return {
+                name: {
+                    "executions": count,
+                    "total_seconds": self._seconds[name],
+                    "mean_seconds": self._seconds[name] / count if count else 0.0,
+                    "variants": variants.get(name, 0),
+                }
+                for name, count in self._executions.items()
+            }
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            for name in self._executions:
+                self._executions[name] = 0
+                self._seconds[name] = 0.0
+
+    def names(self) -> Sequence[str]:
+        return sorted(self._builders)
+
+
+default_statement_registry = StatementRegistry()
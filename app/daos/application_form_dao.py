@@ -1,9 +1,21 @@
+from sqlalchemy import bindparam, select
 from sqlalchemy.orm import Session
 from typing import List, Optional, Any
-from sqlalchemy.sql import text
+from app.common.bulk_insert import chunked
+from app.common.statement_registry import default_statement_registry, fetch_scalars
 from app.models.models import ApplicationForm
 from app.daos.base.application_form_dao_base import ApplicationFormDaoBase
 
+
+# 申請書コードは expanding パラメータで渡す（件数が変わっても同じ文を使い回す）
+@default_statement_registry.statement("m_application_form.get_by_codes")
+def _get_by_codes(nulls):
+    return select(ApplicationForm).where(
+        ApplicationForm.tenant_uuid == bindparam("tenant_uuid"),
+        ApplicationForm.application_form_code.in_(bindparam("application_form_codes", expanding=True))
+    ).order_by(ApplicationForm.id)
+
+
 class ApplicationFormDao(ApplicationFormDaoBase):
     """
     ApplicationForm に関するカスタムDAO処理を書く場所
@@ -13,19 +25,28 @@ class ApplicationFormDao(ApplicationFormDaoBase):
         def custom_search(self, db_session: Session, keyword: str) -> List[ApplicationForm]:
             return db_session.query(ApplicationForm).filter(ApplicationForm.name.like(f"%{keyword}%")).all()
     """
-    def get_by_code(self, db_session: Session, tenant_uuid: str, application_form_code: str) -> ApplicationForm:
+    def get_by_code(self, db_session: Session, tenant_uuid: str, application_form_code: str) -> Optional[ApplicationForm]:
+        """
+        指定された申請書コードとテナントUUIDに一致する申請書フォームを取得する。
         """
-        指定された申請書コードとテナントUUIDに一致する申請書フォームをSQLで取得する。
+        return self.get_by_tenant_uuid_and_application_form_code(db_session, tenant_uuid, application_form_code)
+
+    def get_by_codes(self, db_session: Session, tenant_uuid: str, application_form_codes: List[str]) -> List[ApplicationForm]:
+        """
+        複数の申請書コードに一致する申請書フォームをまとめて取得する。
+
+        Args:
+            db_session (Session): SQLAlchemyのDBセッション
+            tenant_uuid (str): テナントUUID
+            application_form_codes (List[str]): 申請書コードのリスト
+
+        Returns:
+            List[ApplicationForm]: 一致した申請書フォーム（存在しないコードは含まれない）
         """
-        sql = text("""
-            SELECT * FROM application_forms
-            WHERE tenant_uuid = :tenant_uuid
-              AND application_form_code = :application_form_code
-            LIMIT 1
-        """)
-        result = db_session.execute(sql, {
-            "tenant_uuid": tenant_uuid,
-            "application_form_code": application_form_code
-        })
-        row = result.fetchone()
-        return ApplicationForm(**dict(row)) if row else None
+        forms = []
+        for codes in chunked(dict.fromkeys(application_form_codes)):
+            forms.extend(default_statement_registry.execute(
+                db_session, "m_application_form.get_by_codes",
+                {"tenant_uuid": tenant_uuid, "application_form_codes": codes}, fetch=fetch_scalars
+            ))
+        return forms
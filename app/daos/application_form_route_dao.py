@@ -1,9 +1,21 @@
 from sqlalchemy.orm import Session
-from sqlalchemy.sql import text
+from sqlalchemy import bindparam, or_, select
 from typing import List, Optional, Any
+from app.common.statement_registry import default_statement_registry, fetch_scalars
 from app.models.models import ApplicationFormRoute
 from app.daos.base.application_form_route_dao_base import ApplicationFormRouteDaoBase
 
+
+# グループは「一致」または「NULL（グループ未指定）」の行を候補にする
+@default_statement_registry.statement("m_application_form_route.find_by_codes_and_group")
+def _find_by_codes_and_group(nulls):
+    return select(ApplicationFormRoute).where(
+        ApplicationFormRoute.tenant_uuid == bindparam("tenant_uuid"),
+        ApplicationFormRoute.application_form_code.in_(bindparam("application_form_codes", expanding=True)),
+        or_(ApplicationFormRoute.group_code == bindparam("group_code"), ApplicationFormRoute.group_code.is_(None))
+    ).order_by(ApplicationFormRoute.id)
+
+
 class ApplicationFormRouteDao(ApplicationFormRouteDaoBase):
     """
     ApplicationFormRoute に関するカスタムDAO処理を書く場所
@@ -13,21 +25,37 @@ class ApplicationFormRouteDao(ApplicationFormRouteDaoBase):
         def custom_search(self, db_session: Session, keyword: str) -> List[ApplicationFormRoute]:
             return db_session.query(ApplicationFormRoute).filter(ApplicationFormRoute.name.like(f"%{keyword}%")).all()
     """
-    def get_by_code_and_group(self, db_session: Session, tenant_uuid: str, application_form_code: str, group_code: str) -> ApplicationFormRoute:
+    def get_by_code_and_group(self, db_session: Session, tenant_uuid: str, application_form_code: str, group_code: Optional[str]) -> Optional[ApplicationFormRoute]:
         """
         テナントUUID・申請書コード・グループコードに一致するルートを取得する
+        （group_code が None の場合はグループ未指定の共通ルートを取得する）
         """
-        sql = text("""
-            SELECT * FROM application_form_routes
-            WHERE tenant_uuid = :tenant_uuid
-              AND application_form_code = :application_form_code
-              AND group_code = :group_code
-            LIMIT 1
-        """)
-        row = db_session.execute(sql, {
+        result = self.find_by_columns(db_session, {
             "tenant_uuid": tenant_uuid,
             "application_form_code": application_form_code,
-            "group_code": group_code
-        }).mappings().first()
+            "group_code": group_code,
+        }, limit=1)
+        return result[0] if result else None
+
+    def find_by_codes_and_group(
+        self, db_session: Session, tenant_uuid: str, application_form_codes: List[str], group_code: Optional[str]
+    ) -> List[ApplicationFormRoute]:
+        """
+        複数の申請書について、指定グループのルートとグループ未指定のルートをまとめて取得する。
+
+        Args:
+            db_session (Session): SQLAlchemyのDBセッション
+            tenant_uuid (str): テナントUUID
+            application_form_codes (List[str]): 申請書コードのリスト
+            group_code (Optional[str]): グループコード
 
-        return ApplicationFormRoute(**row) if row else None
+        Returns:
+            List[ApplicationFormRoute]: 該当するルート（id 順）
+        """
+        if not application_form_codes:
+            return []
+        return default_statement_registry.execute(db_session, "m_application_form_route.find_by_codes_and_group", {
+            "tenant_uuid": tenant_uuid,
+            "application_form_codes": list(set(application_form_codes)),
+            "group_code": group_code,
+        }, fetch=fetch_scalars)
@@ -0,0 +1,28 @@
+from app.models.models import AuthorizationAudit
+from sqlalchemy.orm import Session
+from typing import Any, Dict, Sequence
+from app.daos.base.authorization_audit_dao_base import AuthorizationAuditDaoBase
+
+class AuthorizationAuditDao(AuthorizationAuditDaoBase):
+    """
+    AuthorizationAudit（認可の監査ログ）に関するカスタムDAO処理クラス。
+
+    監査ログは追記のみで、まとめて1回の executemany で登録する。
+    トランザクション制御は呼び出し元で行う。
+    """
+
+    table = AuthorizationAudit.__table__
+
+    def insert_events(self, db: Session, rows: Sequence[Dict[str, Any]]) -> int:
+        """
+        監査ログをまとめて登録する。
+
+        Returns:
+        -------
+        int
+            登録した行数
+        """
+        if not rows:
+            return 0
+        db.execute(self.table.insert(), list(rows))
+        return len(rows)
@@ -1,7 +1,10 @@
 from sqlalchemy.orm import Session
 from sqlalchemy import func
-from typing import List, Optional, Union, Any
+from typing import Iterable, Iterator, List, Optional, Sequence, Union, Any
+from app.common.bulk_insert import DEFAULT_CHUNK_SIZE
+from app.common.optimistic_lock import check_update_count, raise_on_conflict
 from app.daos.base.base_dao import BaseDao
+from app.exception.laubeException import OptimisticLockException
 from app.models.models import ApplicationClassificationFormat
 
 from datetime import datetime
@@ -12,6 +15,7 @@ class ApplicationClassificationFormatDaoBase(BaseDao[ApplicationClassificationFo
     Provides CRUD operations and utility methods for ApplicationClassificationFormat table.
     """
     model = ApplicationClassificationFormat
+    unique_key = ("application_classification_code",)
 
     def create(
         self,
@@ -56,11 +60,16 @@ class ApplicationClassificationFormatDaoBase(BaseDao[ApplicationClassificationFo
             None
 
         Raises:
+            OptimisticLockException: If the row was changed or deleted by another transaction.
             RuntimeError: If the deletion fails.
         """
         try:
             db_session.delete(instance)
-            db_session.flush()
+            with raise_on_conflict("ApplicationClassificationFormat"):
+                db_session.flush()
+        except OptimisticLockException:
+            db_session.rollback()
+            raise
         except Exception as e:
             db_session.rollback()
             raise RuntimeError(f"[DAO.delete] Failed to delete: {e}") from e
@@ -103,6 +112,47 @@ class ApplicationClassificationFormatDaoBase(BaseDao[ApplicationClassificationFo
 , id=id        )
         return result[0] if result else None
 
+    def get_by_application_classification_code(
+        self,
+        db_session: Session,
+        application_classification_code: str
+    ) -> Optional[ApplicationClassificationFormat]:
+        """
+        Retrieve a single record by the unique key (application_classification_code).
+
+        Args:
+            db_session (Session): SQLAlchemy database session.
+            application_classification_code (str): Unique key field.
+
+        Returns:
+            Optional[ApplicationClassificationFormat]: The matched record, or None if not found.
+        """
+        result = self.find_by_columns(db_session, {
+            "application_classification_code": application_classification_code
+        })
+        return result[0] if result else None
+
+    def get_many_by_application_classification_code(
+        self,
+        db_session: Session,
+        keys: Iterable[str],
+        chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> List[ApplicationClassificationFormat]:
+        """
+        Retrieve records for many unique keys (application_classification_code), chunk_size keys per query.
+
+        Args:
+            db_session (Session): SQLAlchemy database session.
+            keys (Iterable[str]): Unique key values.
+            chunk_size (int): Number of keys per query.
+
+        Returns:
+            List[ApplicationClassificationFormat]: List of matching records (unordered).
+        """
+        return self.get_many_by_columns(
+            db_session, ("application_classification_code",), keys, chunk_size=chunk_size
+        )
+
     def get_all(
         self,
         db_session: Session,
@@ -122,6 +172,44 @@ class ApplicationClassificationFormatDaoBase(BaseDao[ApplicationClassificationFo
         """
         return db_session.query(ApplicationClassificationFormat).limit(limit).offset(offset).all()
 
+    def get_page_after(
+        self,
+        db_session: Session,
+        last_id: Optional[Any] = None,
+        limit: int = 100,
+        key_columns: Sequence[str] = ("id",)
+    ) -> List[ApplicationClassificationFormat]:
+        """
+        Retrieve the next page of records after last_id using keyset (seek) pagination.
+
+        Args:
+            db_session (Session): SQLAlchemy database session.
+            last_id (Optional[Any]): Key of the last record of the previous page (None for the first page).
+            limit (int): Maximum number of records to retrieve.
+            key_columns (Sequence[str]): Unique column(s) to order and seek by; defaults to the primary key.
+
+        Returns:
+            List[ApplicationClassificationFormat]: List of retrieved records.
+        """
+        return super().get_page_after(db_session, last_id=last_id, limit=limit, key_columns=key_columns)
+
+    def iter_all(
+        self,
+        db_session: Session,
+        batch_size: int = 1000
+    ) -> Iterator[ApplicationClassificationFormat]:
+        """
+        Stream all records in primary key order, fetching batch_size rows at a time.
+
+        Args:
+            db_session (Session): SQLAlchemy database session.
+            batch_size (int): Number of rows fetched per batch.
+
+        Returns:
+            Iterator[ApplicationClassificationFormat]: Iterator over all records.
+        """
+        return super().iter_all(db_session, batch_size=batch_size)
+
     def count(
         self,
         db_session: Session
@@ -141,26 +229,103 @@ class ApplicationClassificationFormatDaoBase(BaseDao[ApplicationClassificationFo
         self,
         db_session: Session,
         id: Optional[int],
-        update_data: dict
+        update_data: dict,
+        expected_update_count: Optional[int] = None
     ) -> Optional[ApplicationClassificationFormat]:
         """
         Update a record matching the given primary key with provided data.
 
+        The UPDATE is conditional on update_count (optimistic locking). An update_count
+        in update_data is treated as expected_update_count.
+
         Args:
             db_session (Session): SQLAlchemy database session.
             id (Optional[int]): Primary key field.
             update_data (dict): Fields to update and their new values.
+            expected_update_count (Optional[int]): update_count the caller read the record with.
 
         Returns:
             Optional[ApplicationClassificationFormat]: The updated instance, or None if not found.
+
+        Raises:
+            OptimisticLockException: If the record was changed by another transaction.
         """
+        update_data, expected_update_count = self._split_update_count(update_data, expected_update_count)
         results = self.get_by_key(
             db_session
 , id=id        )
         instance = results[0] if results else None
         if instance:
+            check_update_count(instance, expected_update_count)
             for key, value in update_data.items():
                 setattr(instance, key, value)
             db_session.add(instance)
-            db_session.flush()
-        return instance
\ No newline at end of file
+            with raise_on_conflict("ApplicationClassificationFormat", id):
+                db_session.flush()
+        return instance
+
+    def bulk_insert(
+        self,
+        db_session: Session,
+        rows: Iterable[Union[ApplicationClassificationFormat, dict]],
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        ignore_conflicts: bool = False
+    ) -> int:
+        """
+        Insert many ApplicationClassificationFormat records with executemany, chunk_size rows at a time.
+
+        Args:
+            db_session (Session): SQLAlchemy database session.
+            rows (Iterable[Union[ApplicationClassificationFormat, dict]]): Model instances or dictionaries to insert.
+            chunk_size (int): Number of rows per executemany call.
+            ignore_conflicts (bool): Skip rows violating a unique constraint (PostgreSQL / SQLite).
+
+        Returns:
+            int: Number of rows sent to the database.
+        """
+        return super().bulk_insert(db_session, rows, chunk_size=chunk_size, ignore_conflicts=ignore_conflicts)
+
+    def bulk_upsert(
+        self,
+        db_session: Session,
+        rows: Iterable[Union[ApplicationClassificationFormat, dict]],
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        update_columns: Optional[Sequence[str]] = None
+    ) -> int:
+        """
+        Insert many ApplicationClassificationFormat records, updating rows that already exist for unique_key.
+
+        Args:
+            db_session (Session): SQLAlchemy database session.
+            rows (Iterable[Union[ApplicationClassificationFormat, dict]]): Model instances or dictionaries to upsert.
+            chunk_size (int): Number of rows per executemany call.
+            update_columns (Optional[Sequence[str]]): Columns to update on conflict.
+
+        Returns:
+            int: Number of rows sent to the database.
+
+        Raises:
+            ValueError: If the table has no unique constraint.
+        """
+        return super().bulk_upsert(db_session, rows, chunk_size=chunk_size, update_columns=update_columns)
+
+    def bulk_delete(
+        self,
+        db_session: Session,
+        keys: Iterable[Any],
+        key_columns: Optional[Sequence[str]] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> int:
+        """
+        Delete ApplicationClassificationFormat records whose key is in keys, chunk_size keys per statement.
+
+        Args:
+            db_session (Session): SQLAlchemy database session.
+            keys (Iterable[Any]): Key values (tuples for composite keys).
+            key_columns (Optional[Sequence[str]]): Key columns; defaults to the primary key.
+            chunk_size (int): Number of keys per DELETE statement.
+
+        Returns:
+            int: Number of deleted rows.
+        """
+        return super().bulk_delete(db_session, keys, key_columns=key_columns, chunk_size=chunk_size)
\ No newline at end of file
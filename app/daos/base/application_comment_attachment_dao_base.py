@@ -1,7 +1,10 @@
 from sqlalchemy.orm import Session
 from sqlalchemy import func
-from typing import List, Optional, Union, Any
+from typing import Iterable, Iterator, List, Optional, Sequence, Union, Any
+from app.common.bulk_insert import DEFAULT_CHUNK_SIZE
+from app.common.optimistic_lock import check_update_count, raise_on_conflict
 from app.daos.base.base_dao import BaseDao
+from app.exception.laubeException import OptimisticLockException
 from app.models.models import ApplicationCommentAttachment
 
 
@@ -11,6 +14,7 @@ class ApplicationCommentAttachmentDaoBase(BaseDao[ApplicationCommentAttachment])
     Provides CRUD operations and utility methods for ApplicationCommentAttachment table.
     """
     model = ApplicationCommentAttachment
+    unique_key = ()
 
     def create(
         self,
@@ -55,11 +59,16 @@ class ApplicationCommentAttachmentDaoBase(BaseDao[ApplicationCommentAttachment])
             None
 
         Raises:
+            OptimisticLockException: If the row was changed or deleted by another transaction.
             RuntimeError: If the deletion fails.
         """
         try:
             db_session.delete(instance)
-            db_session.flush()
+            with raise_on_conflict("ApplicationCommentAttachment"):
+                db_session.flush()
+        except OptimisticLockException:
+            db_session.rollback()
+            raise
         except Exception as e:
             db_session.rollback()
             raise RuntimeError(f"[DAO.delete] Failed to delete: {e}") from e
@@ -121,6 +130,44 @@ class ApplicationCommentAttachmentDaoBase(BaseDao[ApplicationCommentAttachment])
         """
         return db_session.query(ApplicationCommentAttachment).limit(limit).offset(offset).all()
 
+    def get_page_after(
+        self,
+        db_session: Session,
+        last_id: Optional[Any] = None,
+        limit: int = 100,
+        key_columns: Sequence[str] = ("id",)
+    ) -> List[ApplicationCommentAttachment]:
+        """
+        Retrieve the next page of records after last_id using keyset (seek) pagination.
+
+        Args:
+            db_session (Session): SQLAlchemy database session.
+            last_id (Optional[Any]): Key of the last record of the previous page (None for the first page).
+            limit (int): Maximum number of records to retrieve.
+            key_columns (Sequence[str]): Unique column(s) to order and seek by; defaults to the primary key.
+
+        Returns:
+            List[ApplicationCommentAttachment]: List of retrieved records.
+        """
+        return super().get_page_after(db_session, last_id=last_id, limit=limit, key_columns=key_columns)
+
+    def iter_all(
+        self,
+        db_session: Session,
+        batch_size: int = 1000
+    ) -> Iterator[ApplicationCommentAttachment]:
+        """
+        Stream all records in primary key order, fetching batch_size rows at a time.
+
+        Args:
+            db_session (Session): SQLAlchemy database session.
+            batch_size (int): Number of rows fetched per batch.
+
+        Returns:
+            Iterator[ApplicationCommentAttachment]: Iterator over all records.
+        """
+        return super().iter_all(db_session, batch_size=batch_size)
+
     def count(
         self,
         db_session: Session
@@ -140,7 +187,8 @@ class ApplicationCommentAttachmentDaoBase(BaseDao[ApplicationCommentAttachment])
         self,
         db_session: Session,
         id: Optional[int],
-        update_data: dict
+        update_data: dict,
+        expected_update_count: Optional[int] = None
     ) -> Optional[ApplicationCommentAttachment]:
         """
         Update a record matching the given primary key with provided data.
@@ -149,17 +197,90 @@ class ApplicationCommentAttachmentDaoBase(BaseDao[ApplicationCommentAttachment])
             db_session (Session): SQLAlchemy database session.
             id (Optional[int]): Primary key field.
             update_data (dict): Fields to update and their new values.
+            expected_update_count (Optional[int]): update_count the caller read the record with.
 
         Returns:
             Optional[ApplicationCommentAttachment]: The updated instance, or None if not found.
+
+        Raises:
+            OptimisticLockException: If the record was changed by another transaction.
         """
+        update_data, expected_update_count = self._split_update_count(update_data, expected_update_count)
         results = self.get_by_key(
             db_session
 , id=id        )
         instance = results[0] if results else None
         if instance:
+            check_update_count(instance, expected_update_count)
             for key, value in update_data.items():
                 setattr(instance, key, value)
             db_session.add(instance)
-            db_session.flush()
-        return instance
\ No newline at end of file
+            with raise_on_conflict("ApplicationCommentAttachment", id):
+                db_session.flush()
+        return instance
+
+    def bulk_insert(
+        self,
+        db_session: Session,
+        rows: Iterable[Union[ApplicationCommentAttachment, dict]],
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        ignore_conflicts: bool = False
+    ) -> int:
+        """
+        Insert many ApplicationCommentAttachment records with executemany, chunk_size rows at a time.
+
+        Args:
+            db_session (Session): SQLAlchemy database session.
+            rows (Iterable[Union[ApplicationCommentAttachment, dict]]): Model instances or dictionaries to insert.
+            chunk_size (int): Number of rows per executemany call.
+            ignore_conflicts (bool): Skip rows violating a unique constraint (PostgreSQL / SQLite).
+
+        Returns:
+            int: Number of rows sent to the database.
+        """
+        return super().bulk_insert(db_session, rows, chunk_size=chunk_size, ignore_conflicts=ignore_conflicts)
+
+    def bulk_upsert(
+        self,
+        db_session: Session,
+        rows: Iterable[Union[ApplicationCommentAttachment, dict]],
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        update_columns: Optional[Sequence[str]] = None
+    ) -> int:
+        """
+        Insert many ApplicationCommentAttachment records, updating rows that already exist for unique_key.
+
+        Args:
+            db_session (Session): SQLAlchemy database session.
+            rows (Iterable[Union[ApplicationCommentAttachment, dict]]): Model instances or dictionaries to upsert.
+            chunk_size (int): Number of rows per executemany call.
+            update_columns (Optional[Sequence[str]]): Columns to update on conflict.
+
+        Returns:
+            int: Number of rows sent to the database.
+
+        Raises:
+            ValueError: If the table has no unique constraint.
+        """
+        return super().bulk_upsert(db_session, rows, chunk_size=chunk_size, update_columns=update_columns)
+
+    def bulk_delete(
+        self,
+        db_session: Session,
+        keys: Iterable[Any],
+        key_columns: Optional[Sequence[str]] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> int:
+        """
+        Delete ApplicationCommentAttachment records whose key is in keys, chunk_size keys per statement.
+
+        Args:
+            db_session (Session): SQLAlchemy database session.
+            keys (Iterable[Any]): Key values (tuples for composite keys).
+            key_columns (Optional[Sequence[str]]): Key columns; defaults to the primary key.
+            chunk_size (int): Number of keys per DELETE statement.
+
+        Returns:
+            int: Number of deleted rows.
+        """
+        return super().bulk_delete(db_session, keys, key_columns=key_columns, chunk_size=chunk_size)
\ No newline at end of file
@@ -0,0 +1,328 @@
+from sqlalchemy.orm import Session
+from sqlalchemy import func
+from typing import Iterable, Iterator, List, Optional, Sequence, Union, Any
+from app.common.bulk_insert import DEFAULT_CHUNK_SIZE
+from app.common.optimistic_lock import check_update_count, raise_on_conflict
+from app.daos.base.base_dao import BaseDao
+from app.exception.laubeException import OptimisticLockException
+from app.models.models import AuthorizationAudit
+
+from datetime import datetime
+
+class AuthorizationAuditDaoBase(BaseDao[AuthorizationAudit]):
+    """
+    Data Access Object for AuthorizationAudit.
+    Provides CRUD operations and utility methods for AuthorizationAudit table.
+    """
+    model = AuthorizationAudit
+    unique_key = ()
+
+    def create(
+        self,
+        db_session: Session,
+        data: Union[AuthorizationAudit, dict]
+    ) -> AuthorizationAudit:
+        """
+        Create a new AuthorizationAudit record in the database.
+
+        Args:
+            db_session (Session): SQLAlchemy database session.
+            data (Union[AuthorizationAudit, dict]): Data to create the record. Accepts model instance or dictionary.
+
+        Returns:
+            AuthorizationAudit: The created AuthorizationAudit instance.
+
+        Raises:
+            RuntimeError: If the creation fails.
+        """
+        try:
+            instance = AuthorizationAudit(**data) if isinstance(data, dict) else data
+            db_session.add(instance)
+            db_session.flush()
+            return instance
+        except Exception as e:
+            db_session.rollback()
+            raise RuntimeError(f"[DAO.create] Failed to create: {e}") from e
+
+    def delete(
+        self,
+        db_session: Session,
+        instance: AuthorizationAudit
+    ) -> None:
+        """
+        Delete the specified AuthorizationAudit instance from the database.
+
+        Args:
+            db_session (Session): SQLAlchemy database session.
+            instance (AuthorizationAudit): The instance to be deleted.
+
+        Returns:
+            None
+
+        Raises:
+            OptimisticLockException: If the row was changed or deleted by another transaction.
+            RuntimeError: If the deletion fails.
+        """
+        try:
+            db_session.delete(instance)
+            with raise_on_conflict("AuthorizationAudit"):
+                db_session.flush()
+        except OptimisticLockException:
+            db_session.rollback()
+            raise
+        except Exception as e:
+            db_session.rollback()
+            raise RuntimeError(f"[DAO.delete] Failed to delete: {e}") from e
+
+    def get_by_key(
+        self,
+        db_session: Session,
+        id: Optional[int]    ) -> List[AuthorizationAudit]:
+        """
+        Retrieve records matching the given primary key conditions.
+
+        Args:
+            db_session (Session): SQLAlchemy database session.
+            id (Optional[int]): Primary key field.
+
+        Returns:
+            List[AuthorizationAudit]: List of matching records.
+        """
+        query = db_session.query(AuthorizationAudit)
+        if id is not None:
+            query = query.filter(AuthorizationAudit.id == id)
+        return query.all()
+
+    def get(
+        self,
+        db_session: Session,
+        id: Optional[int]    ) -> Optional[AuthorizationAudit]:
+        """
+        Retrieve a single record by primary key.
+
+        Args:
+            db_session (Session): SQLAlchemy database session.
+            id (Optional[int]): Primary key field.
+
+        Returns:
+            Optional[AuthorizationAudit]: The matched record, or None if not found.
+        """
+        result = self.get_by_key(
+            db_session
+, id=id        )
+        return result[0] if result else None
+
+    def find_by_event_date(
+        self,
+        db_session: Session,
+        event_date: datetime
+    ) -> List[AuthorizationAudit]:
+        """
+        Retrieve records by the indexed columns (event_date) in primary key order.
+
+        Args:
+            db_session (Session): SQLAlchemy database session.
+            event_date (datetime): Indexed field.
+
+        Returns:
+            List[AuthorizationAudit]: List of matching records.
+        """
+        return self.find_by_columns(db_session, {
+            "event_date": event_date
+        })
+
+    def find_by_user_id_and_event_date(
+        self,
+        db_session: Session,
+        user_id: str,
+        event_date: datetime
+    ) -> List[AuthorizationAudit]:
+        """
+        Retrieve records by the indexed columns (user_id, event_date) in primary key order.
+
+        Args:
+            db_session (Session): SQLAlchemy database session.
+            user_id (str): Indexed field.
+            event_date (datetime): Indexed field.
+
+        Returns:
+            List[AuthorizationAudit]: List of matching records.
+        """
+        return self.find_by_columns(db_session, {
+            "user_id": user_id,
+            "event_date": event_date
+        })
+
+    def get_all(
+        self,
+        db_session: Session,
+        limit: int = 100,
+        offset: int = 0
+    ) -> List[AuthorizationAudit]:
+        """
+        Retrieve all records with optional pagination.
+
+        Args:
+            db_session (Session): SQLAlchemy database session.
+            limit (int): Maximum number of records to retrieve.
+            offset (int): Starting position of the query.
+
+        Returns:
+            List[AuthorizationAudit]: List of retrieved records.
+        """
+        return db_session.query(AuthorizationAudit).limit(limit).offset(offset).all()
+
+    def get_page_after(
+        self,
+        db_session: Session,
+        last_id: Optional[Any] = None,
+        limit: int = 100,
+        key_columns: Sequence[str] = ("id",)
+    ) -> List[AuthorizationAudit]:
+        """
+        Retrieve the next page of records after last_id using keyset (seek) pagination.
+
+        Args:
+            db_session (Session): SQLAlchemy database session.
+            last_id (Optional[Any]): Key of the last record of the previous page (None for the first page).
+            limit (int): Maximum number of records to retrieve.
+            key_columns (Sequence[str]): Unique column(s) to order and seek by; defaults to the primary key.
+
+        Returns:
+            List[AuthorizationAudit]: List of retrieved records.
+        """
+        return super().get_page_after(db_session, last_id=last_id, limit=limit, key_columns=key_columns)
+
+    def iter_all(
+        self,
+        db_session: Session,
+        batch_size: int = 1000
+    ) -> Iterator[AuthorizationAudit]:
+        """
+        Stream all records in primary key order, fetching batch_size rows at a time.
+
+        Args:
+            db_session (Session): SQLAlchemy database session.
+            batch_size (int): Number of rows fetched per batch.
+
+        Returns:
+            Iterator[AuthorizationAudit]: Iterator over all records.
+        """
+        return super().iter_all(db_session, batch_size=batch_size)
+
+    def count(
+        self,
+        db_session: Session
+    ) -> int:
+        """
+        Count total number of records in the table.
+
+        Args:
+            db_session (Session): SQLAlchemy database session.
+
+        Returns:
+            int: Total number of records.
+        """
+        return db_session.query(func.count()).select_from(AuthorizationAudit).scalar()
+
+    def update(
+        self,
+        db_session: Session,
+        id: Optional[int],
+        update_data: dict,
+        expected_update_count: Optional[int] = None
+    ) -> Optional[AuthorizationAudit]:
+        """
+        Update a record matching the given primary key with provided data.
+
+        Args:
+            db_session (Session): SQLAlchemy database session.
+            id (Optional[int]): Primary key field.
+            update_data (dict): Fields to update and their new values.
+            expected_update_count (Optional[int]): update_count the caller read the record with.
+
+        Returns:
+            Optional[AuthorizationAudit]: The updated instance, or None if not found.
+
+        Raises:
+            OptimisticLockException: If the record was changed by another transaction.
+        """
+        update_data, expected_update_count = self._split_update_count(update_data, expected_update_count)
+        results = self.get_by_key(
+            db_session
+, id=id        )
+        instance = results[0] if results else None
+        if instance:
+            check_update_count(instance, expected_update_count)
+            for key, value in update_data.items():
+                setattr(instance, key, value)
+            db_session.add(instance)
+            with raise_on_conflict("AuthorizationAudit", id):
+                db_session.flush()
+        return instance
+
+    def bulk_insert(
+        self,
+        db_session: Session,
+        rows: Iterable[Union[AuthorizationAudit, dict]],
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        ignore_conflicts: bool = False
+    ) -> int:
+        """
+        Insert many AuthorizationAudit records with executemany, chunk_size rows at a time.
+
+        Args:
+            db_session (Session): SQLAlchemy database session.
+            rows (Iterable[Union[AuthorizationAudit, dict]]): Model instances or dictionaries to insert.
+            chunk_size (int): Number of rows per executemany call.
+            ignore_conflicts (bool): Skip rows violating a unique constraint (PostgreSQL / SQLite).
+
+        Returns:
+            int: Number of rows sent to the database.
+        """
+        return super().bulk_insert(db_session, rows, chunk_size=chunk_size, ignore_conflicts=ignore_conflicts)
+
+    def bulk_upsert(
+        self,
+        db_session: Session,
+        rows: Iterable[Union[AuthorizationAudit, dict]],
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        update_columns: Optional[Sequence[str]] = None
+    ) -> int:
+        """
+        Insert many AuthorizationAudit records, updating rows that already exist for unique_key.
+
+        Args:
+            db_session (Session): SQLAlchemy database session.
+            rows (Iterable[Union[AuthorizationAudit, dict]]): Model instances or dictionaries to upsert.
+            chunk_size (int): Number of rows per executemany call.
+            update_columns (Optional[Sequence[str]]): Columns to update on conflict.
+
+        Returns:
+            int: Number of rows sent to the database.
+
+        Raises:
+            ValueError: If the table has no unique constraint.
+        """
+        return super().bulk_upsert(db_session, rows, chunk_size=chunk_size, update_columns=update_columns)
+
+    def bulk_delete(
+        self,
+        db_session: Session,
+        keys: Iterable[Any],
+        key_columns: Optional[Sequence[str]] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> int:
+        """
+        Delete AuthorizationAudit records whose key is in keys, chunk_size keys per statement.
+
+        Args:
+            db_session (Session): SQLAlchemy database session.
+            keys (Iterable[Any]): Key values (tuples for composite keys).
+            key_columns (Optional[Sequence[str]]): Key columns; defaults to the primary key.
+            chunk_size (int): Number of keys per DELETE statement.
+
+        Returns:
+            int: Number of deleted rows.
+        """
+        return super().bulk_delete(db_session, keys, key_columns=key_columns, chunk_size=chunk_size)
\ No newline at end of file
@@ -1,18 +1,29 @@
 from sqlalchemy.orm import Session
-from sqlalchemy import func
-from typing import List, Optional, TypeVar, Generic
+from sqlalchemy import bindparam, func, inspect, select, tuple_, update
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, TypeVar, Generic, Union
+from app.common.bulk_insert import DEFAULT_CHUNK_SIZE, chunked, delete_by_keys, insert_rows, match_keys, upsert_rows
+from app.common.optimistic_lock import check_update_count, raise_on_conflict, version_attribute
+from app.common.statement_registry import default_statement_registry, fetch_scalars, match
+from app.exception.laubeException import OptimisticLockException
 
 T = TypeVar('T')
 
+# find_by_columns() の取得件数の上限を渡すバインドパラメータ名（None なら LIMIT なしのバリアント）
+_LIMIT_PARAM = "row_limit"
+
 
 class BaseDao(Generic[T]):
     """
     共通DAO基底クラス
 
     サブクラスで `model` 属性を必ずセットしてください。
+    `unique_key` は bulk_upsert() の衝突判定に使う一意制約の列です（自動生成DAOでは
+    テーブルの最初の一意制約がセットされます）。
     """
 
     model = None  # 継承先で必ずセットする
+    unique_key: Tuple[str, ...] = ()
+    statement_registry = default_statement_registry
 
     def get_by_key(self, db_session: Session, id: int) -> List[T]:
         """
@@ -57,7 +68,8 @@ class BaseDao(Generic[T]):
             None
         """
         db_session.delete(instance)
-        db_session.flush()
+        with raise_on_conflict(self.model.__name__):
+            db_session.flush()
 
     def get_all(self, db_session: Session, limit: int = 100, offset: int = 0) -> List[T]:
         """
@@ -73,6 +85,117 @@ class BaseDao(Generic[T]):
         """
         return db_session.query(self.model).limit(limit).offset(offset).all()
 
+    def find_by_columns(self, db_session: Session, values: Dict[str, Any], limit: Optional[int] = None) -> List[T]:
+        """
+        列の値がすべて一致するレコードを主キー順に取得します（自動生成の get_by_* / find_by_* が使用）。
+
+        値が None の列は IS NULL で比較します。文は列の組み合わせごとに statement_registry へ
+        1回だけ登録し、以降はバインドパラメータを変えて使い回します（limit もバインドパラメータで渡すため、
+        上限の値ごとに文が増えることはありません）。
+
+        Args:
+            db_session (Session): SQLAlchemyのDBセッション
+            values (dict): 検索条件（カラム名: 値）
+            limit (int, optional): 取得件数の上限（デフォルトは全件）
+
+        Returns:
+            List[T]: レコードリスト
+        """
+        columns = tuple(values)
+        name = f"{self.model.__tablename__}.find_by({', '.join(columns)})"
+        if name not in self.statement_registry:
+            model = self.model
+
+            def build(nulls):
+                query = select(model).where(
+                    *(match(getattr(model, column), column, nulls) for column in columns)
+                ).order_by(*inspect(model).primary_key)
+                return query if _LIMIT_PARAM in nulls else query.limit(bindparam(_LIMIT_PARAM))
+
+            self.statement_registry.define(name, build, nullable=columns + (_LIMIT_PARAM,))
+        params = {**values, _LIMIT_PARAM: limit}
+        return self.statement_registry.execute(db_session, name, params, fetch=fetch_scalars)
+
+    def get_many_by_columns(
+        self,
+        db_session: Session,
+        key_columns: Sequence[str],
+        keys: Iterable[Any],
+        chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> List[T]:
+        """
+        key_columns の値の組が keys のいずれかに一致するレコードを chunk_size 件ずつ取得します
+        （自動生成の get_many_by_* が使用）。
+
+        複合キーは (a = ? AND b = ?) OR ... で検索するため、key_columns の索引が使われます。
+
+        Args:
+            db_session (Session): SQLAlchemyのDBセッション
+            key_columns (Sequence[str]): キーの列
+            keys (Iterable[Any]): キーの値（複合キーの場合はタプル）。None を含むキーは無視します
+            chunk_size (int, optional): 1クエリで検索するキーの件数（デフォルト500）
+
+        Returns:
+            List[T]: 該当するレコードのリスト（順不同）
+        """
+        columns = [getattr(self.model, name) for name in key_columns]
+        wanted = (key if isinstance(key, tuple) else (key,) for key in keys)
+        results: List[T] = []
+        for chunk in chunked(dict.fromkeys(key for key in wanted if None not in key), chunk_size):
+            results.extend(db_session.scalars(select(self.model).where(match_keys(columns, chunk))))
+        return results
+
+    def get_page_after(
+        self,
+        db_session: Session,
+        last_id: Optional[Any] = None,
+        limit: int = 100,
+        key_columns: Sequence[str] = ("id",)
+    ) -> List[T]:
+        """
+        キーセット（シーク）方式で、last_id より後のレコードを key_columns の昇順に取得します。
+
+        OFFSET と違い、何ページ目でも索引を辿って limit 件を読むだけで済みます。
+        次のページは、返されたリストの最後のレコードのキーを last_id に渡して取得します。
+        key_columns は一意になる列の組（主キー、または索引の列 + id）を指定してください。
+
+        Args:
+            db_session (Session): SQLAlchemyのDBセッション
+            last_id (Any, optional): 前ページ最後のレコードのキー（複合キーの場合はタプル、先頭ページはNone）
+            limit (int, optional): 取得件数の上限（デフォルト100）
+            key_columns (Sequence[str], optional): 並び順とシークに使う列（デフォルトは id）
+
+        Returns:
+            List[T]: レコードリスト
+        """
+        columns = [getattr(self.model, name) for name in key_columns]
+        query = select(self.model).order_by(*columns).limit(limit)
+        if last_id is not None:
+            if len(columns) == 1:
+                query = query.where(columns[0] > last_id)
+            else:
+                query = query.where(tuple_(*columns) > tuple_(*last_id))
+        return list(db_session.scalars(query))
+
+    def iter_all(self, db_session: Session, batch_size: int = 1000) -> Iterator[T]:
+        """
+        全レコードを主キー順に1件ずつ返すジェネレータです（エクスポート等の全件処理用）。
+
+        yield_per により batch_size 件ずつ取り出すため、テーブル全体をメモリに載せません
+        （PostgreSQL 等ではサーバーサイドカーソルを使います）。読み出し中はカーソルが開いたままになるため、
+        同じセッションでの更新はジェネレータを使い切ってから行ってください。
+
+        Args:
+            db_session (Session): SQLAlchemyのDBセッション
+            batch_size (int, optional): 1回に取り出す件数（デフォルト1000）
+
+        Returns:
+            Iterator[T]: レコードのイテレータ
+        """
+        primary_key = inspect(self.model).primary_key
+        query = select(self.model).order_by(*primary_key).execution_options(yield_per=batch_size)
+        yield from db_session.scalars(query)
+
     def count(self, db_session: Session) -> int:
         """
         レコードの総数をカウントします。
@@ -85,23 +208,194 @@ class BaseDao(Generic[T]):
         """
         return db_session.query(func.count()).select_from(self.model).scalar()
 
-    def update(self, db_session: Session, id: int, update_data: dict) -> Optional[T]:
+    def update(
+        self, db_session: Session, id: int, update_data: dict, expected_update_count: Optional[int] = None
+    ) -> Optional[T]:
         """
         指定したIDのレコードを更新します。
 
+        update_count を持つモデルでは UPDATE ... WHERE id = ? AND update_count = ? の条件付き更新になり、
+        読み込み後に他のトランザクションが更新していれば OptimisticLockException が発生します。
+        update_data に update_count を含めた場合は、expected_update_count として扱います。
+
         Args:
             db_session (Session): SQLAlchemyのDBセッション
             id (int): 更新対象レコードのID
             update_data (dict): 更新内容（カラム名: 値）
+            expected_update_count (int, optional): 更新対象として読み込んだ時点の更新回数
 
         Returns:
             Optional[T]: 更新後のインスタンス（なければNone）
+
+        Raises:
+            OptimisticLockException: 更新回数が一致しない（他のトランザクションが先に更新した）場合
         """
+        update_data, expected_update_count = self._split_update_count(update_data, expected_update_count)
         results = self.get_by_key(db_session, id=id)
         instance = results[0] if results else None
         if instance:
+            check_update_count(instance, expected_update_count)
             for key, value in update_data.items():
                 setattr(instance, key, value)
             db_session.add(instance)
-        db_session.flush()
+        with raise_on_conflict(self.model.__name__, id):
+            db_session.flush()
         return instance
+
+    def compare_and_update(
+        self, db_session: Session, id: int, expected_update_count: int, update_data: dict
+    ) -> int:
+        """
+        読み込みを行わずに、UPDATE ... WHERE id = ? AND update_count = ? を1回だけ実行します。
+
+        更新回数は expected_update_count + 1 になります。セッションに読み込み済みのインスタンスにも
+        更新内容が反映されます。承認操作のように、画面で表示した時点の更新回数を持っている場合に使います。
+        マッパーのイベントは発生しないため、キャッシュは bulk_insert() と同じく対象テーブルの分を丸ごと破棄します。
+
+        Args:
+            db_session (Session): SQLAlchemyのDBセッション
+            id (int): 更新対象レコードのID
+            expected_update_count (int): 更新対象として読み込んだ時点の更新回数
+            update_data (dict): 更新内容（カラム名: 値）
+
+        Returns:
+            int: 更新後の更新回数
+
+        Raises:
+            OptimisticLockException: 更新回数が一致しない、またはレコードが無い場合
+            ValueError: モデルが update_count を持たない場合
+        """
+        attribute = version_attribute(self.model)
+        if attribute is None:
+            raise ValueError(f"{self.model.__name__} は楽観ロックの対象外です（update_count がありません）")
+        version = getattr(self.model, attribute)
+        db_session.flush()
+        result = db_session.execute(
+            update(self.model)
+            .where(self.model.id == id, version == expected_update_count)
+            .values({**update_data, attribute: expected_update_count + 1})
+        )
+        if result.rowcount != 1:
+            raise OptimisticLockException(self.model.__name__, id, expected_update_count)
+        return expected_update_count + 1
+
+    def _split_update_count(
+        self, update_data: dict, expected_update_count: Optional[int]
+    ) -> Tuple[dict, Optional[int]]:
+        """update_data に含まれる更新回数を取り除き、expected_update_count として返します。"""
+        attribute = version_attribute(self.model)
+        if attribute is None or attribute not in update_data:
+            return update_data, expected_update_count
+        update_data = dict(update_data)
+        received = update_data.pop(attribute)
+        return update_data, expected_update_count if expected_update_count is not None else received
+
+    def bulk_insert(
+        self,
+        db_session: Session,
+        rows: Iterable[Union[T, Dict[str, Any]]],
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        ignore_conflicts: bool = False
+    ) -> int:
+        """
+        複数レコードを chunk_size 件ずつ executemany で一括追加します。
+
+        ORM を経由しないため、マッパーのイベントは発生せず、モデルインスタンスを渡しても
+        セッションには追加されません。プロセス内のキャッシュと認可インデックスは、対象テーブルの
+        分を丸ごと破棄します（do_orm_execute のリスナー）。
+
+        Args:
+            db_session (Session): SQLAlchemyのDBセッション
+            rows (Iterable[Union[T, dict]]): 追加したいモデルインスタンスまたは辞書（カラム名: 値）
+            chunk_size (int, optional): 1回の executemany の件数（デフォルト500）
+            ignore_conflicts (bool, optional): 一意制約に違反する行を読み飛ばすか（PostgreSQL / SQLite のみ）
+
+        Returns:
+            int: 送信した行数
+        """
+        db_session.flush()
+        return insert_rows(
+            db_session, self.model.__table__, map(self._to_row, rows),
+            ignore_conflicts=ignore_conflicts, chunk_size=chunk_size
+        )
+
+    def bulk_upsert(
+        self,
+        db_session: Session,
+        rows: Iterable[Union[T, Dict[str, Any]]],
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        update_columns: Optional[Sequence[str]] = None
+    ) -> int:
+        """
+        `unique_key` の列が一致するレコードは更新し、無ければ追加します（一括UPSERT）。
+
+        update_columns を省略した場合は、主キー・unique_key・作成者系以外の列を更新し、
+        update_count は既存の値に1を足します。マッパーのイベントは発生せず、キャッシュは
+        bulk_insert() と同じく対象テーブルの分を丸ごと破棄します。
+
+        PostgreSQL / SQLite / MySQL / MariaDB では1文の UPSERT（ON CONFLICT / ON DUPLICATE KEY UPDATE）で
+        実行します。それ以外のDBでは既存のキーを検索してから INSERT と UPDATE に分けて実行するため、
+        並行して同じキーを追加するトランザクションがあると一意制約違反になる場合があります。
+
+        Args:
+            db_session (Session): SQLAlchemyのDBセッション
+            rows (Iterable[Union[T, dict]]): 追加・更新したいモデルインスタンスまたは辞書
+            chunk_size (int, optional): 1回の executemany の件数（デフォルト500）
+            update_columns (Sequence[str], optional): 既存レコードで更新する列
+
+        Returns:
+            int: 送信した行数
+
+        Raises:
+            ValueError: unique_key が定義されていない場合
+        """
+        if not self.unique_key:
+            raise ValueError(f"{self.model.__name__} に一意制約（unique_key）が定義されていません")
+        db_session.flush()
+        return upsert_rows(
+            db_session, self.model.__table__, map(self._to_row, rows), self.unique_key,
+            update_columns=update_columns, chunk_size=chunk_size
+        )
+
+    def bulk_delete(
+        self,
+        db_session: Session,
+        keys: Iterable[Any],
+        key_columns: Optional[Sequence[str]] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> int:
+        """
+        キーに一致するレコードを chunk_size 件ずつ一括削除します。
+
+        セッションに読み込み済みのインスタンスは削除後も残るため、必要に応じて expire してください。
+        マッパーのイベント（カスケード削除を含む）は発生せず、キャッシュは bulk_insert() と同じく
+        対象テーブルの分を丸ごと破棄します。
+
+        Args:
+            db_session (Session): SQLAlchemyのDBセッション
+            keys (Iterable[Any]): 削除したいキーの値（複合キーの場合はタプル）
+            key_columns (Sequence[str], optional): キーの列（デフォルトは主キー）
+            chunk_size (int, optional): 1文で削除する件数（デフォルト500）
+
+        Returns:
+            int: 削除した行数
+        """
+        table = self.model.__table__
+        columns = list(key_columns or [c.name for c in table.primary_key.columns])
+        db_session.flush()
+        return delete_by_keys(
+            db_session, table, columns,
+            (key if isinstance(key, tuple) else (key,) for key in keys), chunk_size=chunk_size
+        )
+
+    @staticmethod
+    def _to_row(data: Union[T, Dict[str, Any]]) -> Dict[str, Any]:
+        """モデルインスタンスをカラム名: 値の辞書にします（未設定の列は除き、既定値を使わせる）。"""
+        if isinstance(data, dict):
+            return data
+        row = {}
+        for attr in inspect(data).mapper.column_attrs:
+            value = getattr(data, attr.key)
+            if value is not None:
+                row[attr.columns[0].name] = value
+        return row
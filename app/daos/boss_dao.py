@@ -1,9 +1,41 @@
 from app.models.models import Boss
+from sqlalchemy import bindparam, or_, select
 from sqlalchemy.orm import Session
-from sqlalchemy.sql import text
 from typing import List, Optional, Any
+from app.common.statement_registry import default_statement_registry, fetch_first_scalar, fetch_scalars
 from app.daos.base.boss_dao_base import BossDaoBase
 
+
+# 部署・申請書は「一致」または「NULL（全般指定）」の行を候補にする。
+# パラメータが None の場合も = NULL が偽になるだけなので、NULL 用のバリアントは不要
+@default_statement_registry.statement("m_boss.find_prioritized")
+def _find_prioritized(nulls):
+    return select(Boss).where(
+        Boss.tenant_uuid == bindparam("tenant_uuid"),
+        Boss.user_uuid == bindparam("user_uuid"),
+        or_(Boss.group_code == bindparam("group_code"), Boss.group_code.is_(None)),
+        or_(Boss.application_form_code == bindparam("application_form_code"), Boss.application_form_code.is_(None))
+    ).order_by(
+        Boss.application_form_code.is_(None),
+        Boss.group_code.is_(None),
+        Boss.id
+    ).limit(1)
+
+
+@default_statement_registry.statement("m_boss.find_by_tenant")
+def _find_by_tenant(nulls):
+    return select(Boss).where(Boss.tenant_uuid == bindparam("tenant_uuid")).order_by(Boss.id)
+
+
+@default_statement_registry.statement("m_boss.find_candidates_for_user")
+def _find_candidates_for_user(nulls):
+    return select(Boss).where(
+        Boss.tenant_uuid == bindparam("tenant_uuid"),
+        Boss.user_uuid == bindparam("user_uuid"),
+        or_(Boss.group_code == bindparam("group_code"), Boss.group_code.is_(None))
+    ).order_by(Boss.id)
+
+
 class BossDao(BossDaoBase):
     """
     Boss に関するカスタムDAO処理を書く場所
@@ -21,22 +53,77 @@ class BossDao(BossDaoBase):
         :param conditions: 検索条件のdict（キー: カラム名, 値: 検索値、None指定で IS NULL）
         :return: BossオブジェクトまたはNone
         """
-        where_clauses = []
-        params = {}
-
-        for i, (key, value) in enumerate(conditions.items()):
-            param_key = f"param_{i}"
-            if value is None:
-                where_clauses.append(f"{key} IS NULL")
-            else:
-                where_clauses.append(f"{key} = :{param_key}")
-                params[param_key] = value
-
-        sql = text(f"""
-            SELECT * FROM boss
-            WHERE {' AND '.join(where_clauses)}
-            LIMIT 1
-        """)
-
-        row = db.execute(sql, params).mappings().first()
-        return Boss(**row) if row else None
+        result = self.find_by_columns(db, conditions, limit=1)
+        return result[0] if result else None
+
+    def find_prioritized(
+        self,
+        db: Session,
+        tenant_uuid: str,
+        user_uuid: str,
+        group_code: Optional[str],
+        application_form_code: Optional[str]
+    ) -> Optional[Boss]:
+        """
+        上司マスタのフォールバック検索を1クエリで行う。
+
+        部署・申請書が「一致」または「NULL（全般指定）」の行を候補とし、具体的な順に並べて先頭を返す。
+        優先順位は以下の通り（従来の4段階検索と同じ）：
+            1. 部署・申請書とも一致
+            2. 部署 NULL・申請書一致
+            3. 部署一致・申請書 NULL
+            4. 部署・申請書とも NULL
+
+        Args:
+            db (Session): SQLAlchemyのDBセッション
+            tenant_uuid (str): テナントUUID
+            user_uuid (str): 対象ユーザーUUID
+            group_code (Optional[str]): 対象部署コード
+            application_form_code (Optional[str]): 申請書コード
+
+        Returns:
+            Optional[Boss]: 最も具体的に一致した上司マスタ、または None
+        """
+        return default_statement_registry.execute(db, "m_boss.find_prioritized", {
+            "tenant_uuid": tenant_uuid,
+            "user_uuid": user_uuid,
+            "group_code": group_code,
+            "application_form_code": application_form_code,
+        }, fetch=fetch_first_scalar)
+
+    def find_by_tenant(self, db: Session, tenant_uuid: str) -> List[Boss]:
+        """
+        テナント内の上司マスタを全件取得する（上司インデックスの構築用）。
+
+        Args:
+            db (Session): SQLAlchemyのDBセッション
+            tenant_uuid (str): テナントUUID
+
+        Returns:
+            List[Boss]: 上司マスタのリスト
+        """
+        return default_statement_registry.execute(
+            db, "m_boss.find_by_tenant", {"tenant_uuid": tenant_uuid}, fetch=fetch_scalars
+        )
+
+    def find_candidates_for_user(
+        self, db: Session, tenant_uuid: str, user_uuid: str, group_code: Optional[str]
+    ) -> List[Boss]:
+        """
+        対象ユーザーについて、申請書を問わず部署が一致または NULL の上司マスタを取得する。
+        複数申請書分のフォールバック検索をメモリ上で行うための候補取得に使う。
+
+        Args:
+            db (Session): SQLAlchemyのDBセッション
+            tenant_uuid (str): テナントUUID
+            user_uuid (str): 対象ユーザーUUID
+            group_code (Optional[str]): 対象部署コード
+
+        Returns:
+            List[Boss]: 候補となる上司マスタ（id 順）
+        """
+        return default_statement_registry.execute(db, "m_boss.find_candidates_for_user", {
+            "tenant_uuid": tenant_uuid,
+            "user_uuid": user_uuid,
+            "group_code": group_code,
+        }, fetch=fetch_scalars)
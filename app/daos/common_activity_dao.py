@@ -1,8 +1,18 @@
 from app.models.models import CommonActivity
+from sqlalchemy import bindparam, select
 from sqlalchemy.orm import Session
 from typing import List, Optional, Any
+from app.common.statement_registry import default_statement_registry, fetch_scalars
 from app.daos.base.common_activity_dao_base import CommonActivityDaoBase
 
+
+@default_statement_registry.statement("m_common_activity.find_by_tenant_and_route")
+def _find_by_tenant_and_route(nulls):
+    return select(CommonActivity).where(
+        CommonActivity.tenant_uuid == bindparam("tenant_uuid"),
+        CommonActivity.common_route_code == bindparam("common_route_code")
+    ).order_by(CommonActivity.activity_code)
+
 class CommonActivityDao(CommonActivityDaoBase):
     """
     CommonActivity に関するカスタムDAO処理を書く場所
@@ -12,4 +22,16 @@ class CommonActivityDao(CommonActivityDaoBase):
         def custom_search(self, db_session: Session, keyword: str) -> List[CommonActivity]:
             return db_session.query(CommonActivity).filter(CommonActivity.name.like(f"%{keyword}%")).all()
     """
-    pass  # 必要に応じてカスタムメソッドをここに追加してください
\ No newline at end of file
+    def find_by_tenant_and_route(
+        self,
+        db_session: Session,
+        tenant_uuid: str,
+        common_route_code: str
+    ) -> List[CommonActivity]:
+        """
+        共通ルートのアクティビティをアクティビティコード順に取得する。
+        """
+        return default_statement_registry.execute(db_session, "m_common_activity.find_by_tenant_and_route", {
+            "tenant_uuid": tenant_uuid,
+            "common_route_code": common_route_code,
+        }, fetch=fetch_scalars)
\ No newline at end of file
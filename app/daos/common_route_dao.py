@@ -1,6 +1,7 @@
-from app.models.models import CommonRoute
+from app.models.models import CommonActivity, CommonRoute
+from sqlalchemy import func, select
 from sqlalchemy.orm import Session
-from typing import List, Optional, Any
+from typing import List, Optional, Any, Tuple
 from app.daos.base.common_route_dao_base import CommonRouteDaoBase
 
 class CommonRouteDao(CommonRouteDaoBase):
@@ -12,4 +13,63 @@ class CommonRouteDao(CommonRouteDaoBase):
         def custom_search(self, db_session: Session, keyword: str) -> List[CommonRoute]:
             return db_session.query(CommonRoute).filter(CommonRoute.name.like(f"%{keyword}%")).all()
     """
-    pass  # 必要に応じてカスタムメソッドをここに追加してください
\ No newline at end of file
+    def get_by_route_code(
+        self,
+        db_session: Session,
+        tenant_uuid: str,
+        common_route_code: str
+    ) -> Optional[CommonRoute]:
+        """
+        テナントUUIDと間接部門コードに一致する共通ルートを取得する。
+
+        Args:
+            db_session (Session): SQLAlchemyのDBセッション
+            tenant_uuid (str): テナントUUID
+            common_route_code (str): 間接部門コード
+
+        Returns:
+            Optional[CommonRoute]: 一致する共通ルート、なければ None
+        """
+        return self.get_by_tenant_uuid_and_common_route_code(db_session, tenant_uuid, common_route_code)
+
+    def get_route_version(
+        self,
+        db_session: Session,
+        tenant_uuid: str,
+        common_route_code: str
+    ) -> Tuple[Any, ...]:
+        """
+        共通ルートとそのアクティビティの更新状態を1回のクエリで取得する。
+        戻り値の形は IndividualRouteDao.get_route_version と同じ。
+
+        Args:
+            db_session (Session): SQLAlchemyのDBセッション
+            tenant_uuid (str): テナントUUID
+            common_route_code (str): 間接部門コード
+
+        Returns:
+            Tuple[Any, ...]: (ルート更新回数, ルート更新日時, アクティビティ件数,
+                              アクティビティ更新回数合計, アクティビティ最終更新日時)
+        """
+        route = select(CommonRoute.update_count, CommonRoute.update_date).where(
+            CommonRoute.tenant_uuid == tenant_uuid,
+            CommonRoute.common_route_code == common_route_code
+        ).limit(1).subquery()
+        activities = select(
+            func.count(CommonActivity.id).label("activity_count"),
+            func.coalesce(func.sum(CommonActivity.update_count), 0).label("activity_update_count"),
+            func.max(CommonActivity.update_date).label("activity_update_date")
+        ).where(
+            CommonActivity.tenant_uuid == tenant_uuid,
+            CommonActivity.common_route_code == common_route_code
+        ).subquery()
+        row = db_session.execute(
+            select(
+                select(route.c.update_count).scalar_subquery(),
+                select(route.c.update_date).scalar_subquery(),
+                activities.c.activity_count,
+                activities.c.activity_update_count,
+                activities.c.activity_update_date
+            )
+        ).one()
+        return tuple(row)
\ No newline at end of file
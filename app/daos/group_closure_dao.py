@@ -0,0 +1,146 @@
+from app.models.models import Group, GroupClosure
+from sqlalchemy import and_, delete, exists, select, update
+from sqlalchemy.orm import Session
+from typing import Dict, List, Optional, Tuple
+from app.daos.base.group_closure_dao_base import GroupClosureDaoBase
+
+class GroupClosureDao(GroupClosureDaoBase):
+    """
+    GroupClosure（部署階層の閉包）に関するカスタムDAO処理クラス。
+
+    m_group_closure は「上位部署（自部署を含む）→ 配下の部署」の全組み合わせを深さ付きで保持する。
+    行の追加・削除は ORM を経由せずテーブルに対して直接実行する（flush 中にも呼び出せるようにするため）。
+    トランザクション制御は呼び出し元で行う。
+    """
+
+    table = GroupClosure.__table__
+
+    def add_group(self, db: Session, tenant_uuid: str, group_code: str) -> None:
+        """
+        部署を階層に追加する（自部署のみの行。上位部署への接続は attach で行う）。
+        """
+        db.execute(self.table.insert(), [{
+            "tenant_uuid": tenant_uuid, "ancestor_group_code": group_code,
+            "descendant_group_code": group_code, "depth": 0
+        }])
+
+    def ancestors_of(self, db: Session, tenant_uuid: str, group_code: str) -> List[Tuple[str, int]]:
+        """
+        部署の上位部署（自部署を含む）を (部署コード, 階層の差) で返す。
+        """
+        rows = db.execute(
+            select(self.table.c.ancestor_group_code, self.table.c.depth).where(
+                self.table.c.tenant_uuid == tenant_uuid, self.table.c.descendant_group_code == group_code
+            )
+        )
+        return [(row.ancestor_group_code, row.depth) for row in rows]
+
+    def descendants_of(self, db: Session, tenant_uuid: str, group_code: str) -> List[Tuple[str, int]]:
+        """
+        部署の配下の部署（自部署を含む）を (部署コード, 階層の差) で返す。
+        """
+        rows = db.execute(
+            select(self.table.c.descendant_group_code, self.table.c.depth).where(
+                self.table.c.tenant_uuid == tenant_uuid, self.table.c.ancestor_group_code == group_code
+            )
+        )
+        return [(row.descendant_group_code, row.depth) for row in rows]
+
+    def attach(self, db: Session, tenant_uuid: str, group_code: str, upper_group_code: str) -> None:
+        """
+        部署（配下を含む）を上位部署の下に接続する。
+
+        上位部署の上位（自身を含む）× 部署の配下（自身を含む）の組み合わせを追加する。
+        上位部署が自身の配下にある場合（循環）は ValueError。
+        """
+        subtree = self.descendants_of(db, tenant_uuid, group_code) or [(group_code, 0)]
+        if any(code == upper_group_code for code, _ in subtree):
+            raise ValueError(f"Group {upper_group_code} is a descendant of {group_code}")
+        ancestors = self.ancestors_of(db, tenant_uuid, upper_group_code) or [(upper_group_code, 0)]
+        db.execute(self.table.insert(), [
+            {
+                "tenant_uuid": tenant_uuid, "ancestor_group_code": ancestor,
+                "descendant_group_code": descendant, "depth": up + down + 1
+            }
+            for ancestor, up in ancestors
+            for descendant, down in subtree
+        ])
+
+    def detach(self, db: Session, tenant_uuid: str, group_code: str) -> None:
+        """
+        部署（配下を含む）を上位部署から切り離す（部署の配下どうしの行は残す）。
+        """
+        subtree = [code for code, _ in self.descendants_of(db, tenant_uuid, group_code)]
+        outer = [code for code, depth in self.ancestors_of(db, tenant_uuid, group_code) if depth > 0]
+        if subtree and outer:
+            db.execute(delete(self.table).where(
+                self.table.c.tenant_uuid == tenant_uuid,
+                self.table.c.descendant_group_code.in_(subtree),
+                self.table.c.ancestor_group_code.in_(outer)
+            ))
+
+    def remove_group(self, db: Session, tenant_uuid: str, group_code: str) -> None:
+        """
+        部署を階層から削除する。配下の部署はそれぞれ最上位の部署として残る。
+        """
+        self.detach(db, tenant_uuid, group_code)
+        db.execute(delete(self.table).where(
+            self.table.c.tenant_uuid == tenant_uuid,
+            (self.table.c.ancestor_group_code == group_code) | (self.table.c.descendant_group_code == group_code)
+        ))
+
+    def rename_group(self, db: Session, tenant_uuid: str, old_group_code: str, new_group_code: str) -> None:
+        """
+        部署コードの変更を階層に反映する。
+        """
+        for column in (self.table.c.ancestor_group_code, self.table.c.descendant_group_code):
+            db.execute(
+                update(self.table)
+                .where(self.table.c.tenant_uuid == tenant_uuid, column == old_group_code)
+                .values({column.key: new_group_code})
+            )
+
+    def tenants_missing_closure(self, db: Session) -> List[str]:
+        """
+        m_group に部署があるのに自部署の行（depth=0）が無いテナントを返す。
+
+        閉包の導入前から存在する部署や、SQL で直接追加した部署を検出する。
+        """
+        missing = ~exists().where(and_(
+            self.table.c.tenant_uuid == Group.tenant_uuid,
+            self.table.c.ancestor_group_code == Group.group_code,
+            self.table.c.descendant_group_code == Group.group_code
+        ))
+        rows = db.execute(select(Group.tenant_uuid).where(missing).distinct().order_by(Group.tenant_uuid))
+        return [row.tenant_uuid for row in rows]
+
+    def rebuild(self, db: Session, tenant_uuid: str) -> int:
+        """
+        m_group の上位部署コードからテナントの階層を作り直す（初期構築・不整合時の復旧用）。
+
+        Returns:
+        -------
+        int
+            作成した行数
+        """
+        parents: Dict[str, Optional[str]] = {
+            row.group_code: row.upper_group_code
+            for row in db.execute(
+                select(Group.group_code, Group.upper_group_code).where(Group.tenant_uuid == tenant_uuid)
+            )
+        }
+        rows = []
+        for group_code in parents:
+            ancestor, depth, seen = group_code, 0, set()
+            while ancestor is not None and ancestor not in seen:
+                seen.add(ancestor)
+                rows.append({
+                    "tenant_uuid": tenant_uuid, "ancestor_group_code": ancestor,
+                    "descendant_group_code": group_code, "depth": depth
+                })
+                ancestor, depth = parents.get(ancestor), depth + 1
+
+        db.execute(delete(self.table).where(self.table.c.tenant_uuid == tenant_uuid))
+        if rows:
+            db.execute(self.table.insert(), rows)
+        return len(rows)
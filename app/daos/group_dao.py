@@ -1,6 +1,6 @@
 from app.models.models import Group
 from sqlalchemy.orm import Session
-from typing import List, Optional, Any
+from typing import List, Optional, Any, Tuple
 from app.daos.base.group_dao_base import GroupDaoBase
 
 class GroupDao(GroupDaoBase):
@@ -12,4 +12,21 @@ class GroupDao(GroupDaoBase):
         def custom_search(self, db_session: Session, keyword: str) -> List[Group]:
             return db_session.query(Group).filter(Group.name.like(f"%{keyword}%")).all()
     """
-    pass  # 必要に応じてカスタムメソッドをここに追加してください
\ No newline at end of file
+    def get_by_group_keys(
+        self,
+        db_session: Session,
+        keys: List[Tuple[str, str]]
+    ) -> List[Group]:
+        """
+        (テナントUUID, 部署コード) の組み合わせに一致する部署をまとめて取得する。
+
+        一意制約 (tenant_uuid, group_code) の索引で検索する（500件ごとに1クエリ）。
+
+        Args:
+            db_session (Session): SQLAlchemyのDBセッション
+            keys (List[Tuple[str, str]]): (テナントUUID, 部署コード) のリスト
+
+        Returns:
+            List[Group]: 該当する部署のリスト（順不同）
+        """
+        return self.get_many_by_tenant_uuid_and_group_code(db_session, [key for key in keys if key[0] and key[1]])
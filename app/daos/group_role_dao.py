@@ -0,0 +1,101 @@
+from app.models.models import GroupClosure, GroupRole, UserGroup
+from datetime import date
+from sqlalchemy import Select, or_, select
+from sqlalchemy.orm import Session
+from typing import List, Optional, Tuple
+from app.daos.base.group_role_dao_base import GroupRoleDaoBase
+
+
+def effective_group_role_ids(user_uuid: str, system_date: date) -> Select:
+    """
+    ユーザーの所属部署（有効期間内）とその上位部署に割り当てられたロールIDを返す SELECT を作成する。
+
+    m_user_group → m_group_closure（配下の部署コードで索引）→ m_group_role の結合のみで、
+    部署階層を辿る必要はない。サブクエリとして他の検索に組み込むこともできる。
+    """
+    return (
+        select(GroupRole.role_id)
+        .join(GroupClosure, (GroupClosure.tenant_uuid == GroupRole.tenant_uuid)
+              & (GroupClosure.ancestor_group_code == GroupRole.group_code))
+        .join(UserGroup, (UserGroup.tenant_uuid == GroupClosure.tenant_uuid)
+              & (UserGroup.group_code == GroupClosure.descendant_group_code))
+        .where(
+            UserGroup.user_uuid == user_uuid,
+            UserGroup.term_from <= system_date,
+            or_(UserGroup.term_to.is_(None), UserGroup.term_to >= system_date)
+        )
+    )
+
+
+class GroupRoleDao(GroupRoleDaoBase):
+    """
+    GroupRole に関するカスタムDAO処理クラス。
+
+    部署に割り当てたロールは、m_group_closure を介して配下の部署にも継承される。
+    トランザクション制御は呼び出し元で行う。
+    """
+
+    def add_group_role(
+        self, db: Session, tenant_uuid: str, group_code: str, role_id: str, operator_uuid: str = "system"
+    ) -> GroupRole:
+        """
+        部署にロールを割り当てる GroupRole エンティティを作成する。
+
+        Parameters:
+        ----------
+        db : Session
+            SQLAlchemyセッション
+        tenant_uuid : str
+            テナントUUID
+        group_code : str
+            部署コード
+        role_id : str
+            ロールID
+        operator_uuid : str
+            登録者のユーザーUUID（作成者・更新者に設定する）
+
+        Returns:
+        -------
+        GroupRole
+            作成された GroupRole エンティティ（commit前）
+        """
+        entity = GroupRole(
+            tenant_uuid=tenant_uuid, group_code=group_code, role_id=role_id,
+            create_user_uuid=operator_uuid, update_user_uuid=operator_uuid
+        )
+        db.add(entity)
+        return entity
+
+    def remove_group_role(self, db: Session, tenant_uuid: str, group_code: str, role_id: str) -> None:
+        """
+        指定された部署とロールの関連付けを削除する。
+        """
+        entity = db.query(GroupRole).filter_by(tenant_uuid=tenant_uuid, group_code=group_code, role_id=role_id).first()
+        if entity:
+            db.delete(entity)
+
+    def find_inherited_roles(self, db: Session) -> List[Tuple[str, str, str]]:
+        """
+        部署ごとの実効ロール（上位部署から継承したものを含む）を全件取得する（認可インデックスの構築用）。
+
+        Returns:
+        -------
+        List[Tuple[str, str, str]]
+            (テナントUUID, 部署コード, ロールID)
+        """
+        rows = db.execute(
+            select(GroupClosure.tenant_uuid, GroupClosure.descendant_group_code, GroupRole.role_id)
+            .join(GroupRole, (GroupRole.tenant_uuid == GroupClosure.tenant_uuid)
+                  & (GroupRole.group_code == GroupClosure.ancestor_group_code))
+            .distinct()
+        )
+        return [(row.tenant_uuid, row.descendant_group_code, row.role_id) for row in rows]
+
+    def find_effective_role_ids(self, db: Session, user_uuid: str, system_date: Optional[date] = None) -> List[str]:
+        """
+        ユーザーの所属部署（有効期間内）とその上位部署に割り当てられたロールを1回のクエリで取得する。
+
+        m_user_group → m_group_closure → m_group_role の結合（effective_group_role_ids()）で取得する。
+        """
+        rows = db.execute(effective_group_role_ids(user_uuid, system_date or date.today()).distinct())
+        return [row.role_id for row in rows]
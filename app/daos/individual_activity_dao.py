@@ -1,8 +1,22 @@
+from sqlalchemy import bindparam, select
 from sqlalchemy.orm import Session
 from app.models.models import IndividualActivity
 from typing import List, Optional, Any
+from app.common.statement_registry import default_statement_registry, fetch_scalars
 from app.daos.base.individual_activity_dao_base import IndividualActivityDaoBase
 
+
+# activity_code が None のバリアントはルート全体を返す
+@default_statement_registry.statement("m_individual_activity.find_by_tenant_and_route", nullable=("activity_code",))
+def _find_by_tenant_and_route(nulls):
+    query = select(IndividualActivity).where(
+        IndividualActivity.tenant_uuid == bindparam("tenant_uuid"),
+        IndividualActivity.individual_route_code == bindparam("individual_route_code")
+    )
+    if "activity_code" not in nulls:
+        query = query.where(IndividualActivity.activity_code == bindparam("activity_code"))
+    return query.order_by(IndividualActivity.activity_code)
+
 class IndividualActivityDao(IndividualActivityDaoBase):
     """
     IndividualActivity に関するカスタムDAO処理を書く場所
@@ -17,10 +31,15 @@ class IndividualActivityDao(IndividualActivityDaoBase):
         db_session: Session,
         tenant_uuid: str,
         individual_route_code: str,
-        activity_code: str
+        activity_code: Optional[int] = None
     ) -> List[IndividualActivity]:
-        return db_session.query(IndividualActivity).filter(
-            IndividualActivity.tenant_uuid == tenant_uuid,
-            IndividualActivity.individual_route_code == individual_route_code,
-            IndividualActivity.activity_code == activity_code
-        ).all()
+        """
+        個別ルートのアクティビティをアクティビティコード順に取得する。
+
+        activity_code を省略した場合はルート全体のアクティビティを返す。
+        """
+        return default_statement_registry.execute(db_session, "m_individual_activity.find_by_tenant_and_route", {
+            "tenant_uuid": tenant_uuid,
+            "individual_route_code": individual_route_code,
+            "activity_code": activity_code,
+        }, fetch=fetch_scalars)
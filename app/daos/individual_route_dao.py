@@ -1,6 +1,7 @@
-from app.models.models import IndividualRoute
+from app.models.models import IndividualActivity, IndividualRoute
+from sqlalchemy import func, select
 from sqlalchemy.orm import Session
-from typing import List, Optional, Any
+from typing import List, Optional, Any, Tuple
 from app.daos.base.individual_route_dao_base import IndividualRouteDaoBase
 
 class IndividualRouteDao(IndividualRouteDaoBase):
@@ -12,4 +13,65 @@ class IndividualRouteDao(IndividualRouteDaoBase):
         def custom_search(self, db_session: Session, keyword: str) -> List[IndividualRoute]:
             return db_session.query(IndividualRoute).filter(IndividualRoute.name.like(f"%{keyword}%")).all()
     """
-    pass  # 必要に応じてカスタムメソッドをここに追加してください
\ No newline at end of file
+    def get_by_route_code(
+        self,
+        db_session: Session,
+        tenant_uuid: str,
+        individual_route_code: str
+    ) -> Optional[IndividualRoute]:
+        """
+        テナントUUIDと直接部門コードに一致する個別ルートを取得する。
+
+        Args:
+            db_session (Session): SQLAlchemyのDBセッション
+            tenant_uuid (str): テナントUUID
+            individual_route_code (str): 直接部門コード
+
+        Returns:
+            Optional[IndividualRoute]: 一致する個別ルート、なければ None
+        """
+        return self.get_by_tenant_uuid_and_individual_route_code(db_session, tenant_uuid, individual_route_code)
+
+    def get_route_version(
+        self,
+        db_session: Session,
+        tenant_uuid: str,
+        individual_route_code: str
+    ) -> Tuple[Any, ...]:
+        """
+        個別ルートとそのアクティビティの更新状態を1回のクエリで取得する。
+
+        ルート構造そのものは読まずに、update_count / update_date と件数だけを返すため、
+        コンパイル済みルートプランの鮮度確認に使用する。
+
+        Args:
+            db_session (Session): SQLAlchemyのDBセッション
+            tenant_uuid (str): テナントUUID
+            individual_route_code (str): 直接部門コード
+
+        Returns:
+            Tuple[Any, ...]: (ルート更新回数, ルート更新日時, アクティビティ件数,
+                              アクティビティ更新回数合計, アクティビティ最終更新日時)
+        """
+        route = select(IndividualRoute.update_count, IndividualRoute.update_date).where(
+            IndividualRoute.tenant_uuid == tenant_uuid,
+            IndividualRoute.individual_route_code == individual_route_code
+        ).limit(1).subquery()
+        activities = select(
+            func.count(IndividualActivity.id).label("activity_count"),
+            func.coalesce(func.sum(IndividualActivity.update_count), 0).label("activity_update_count"),
+            func.max(IndividualActivity.update_date).label("activity_update_date")
+        ).where(
+            IndividualActivity.tenant_uuid == tenant_uuid,
+            IndividualActivity.individual_route_code == individual_route_code
+        ).subquery()
+        row = db_session.execute(
+            select(
+                select(route.c.update_count).scalar_subquery(),
+                select(route.c.update_date).scalar_subquery(),
+                activities.c.activity_count,
+                activities.c.activity_update_count,
+                activities.c.activity_update_date
+            )
+        ).one()
+        return tuple(row)
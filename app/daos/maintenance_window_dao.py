@@ -0,0 +1,31 @@
+from app.models.models import MaintenanceWindow
+from datetime import datetime
+from sqlalchemy import or_
+from sqlalchemy.orm import Session
+from typing import List
+from app.daos.base.maintenance_window_dao_base import MaintenanceWindowDaoBase
+
+
+class MaintenanceWindowDao(MaintenanceWindowDaoBase):
+    """
+    MaintenanceWindow に関するカスタムDAO処理を書く場所
+
+    - サンプルメソッドをここに追加できます。
+    - 例:
+        def custom_search(self, db_session: Session, keyword: str) -> List[MaintenanceWindow]:
+            return db_session.query(MaintenanceWindow).filter(MaintenanceWindow.name.like(f"%{keyword}%")).all()
+    """
+    def find_open_windows(self, db_session: Session, now: datetime) -> List[MaintenanceWindow]:
+        """
+        終了していない（実施中または予定の）停止期間を全エンジン分取得する。
+
+        Args:
+            db_session (Session): SQLAlchemyのDBセッション
+            now (datetime): 基準日時
+
+        Returns:
+            List[MaintenanceWindow]: 停止期間（開始日時順）
+        """
+        return db_session.query(MaintenanceWindow).filter(
+            or_(MaintenanceWindow.end_date.is_(None), MaintenanceWindow.end_date > now)
+        ).order_by(MaintenanceWindow.start_date).all()
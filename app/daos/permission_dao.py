@@ -1,15 +1,17 @@
 from app.models.models import Permission
+from sqlalchemy import select
 from sqlalchemy.orm import Session
-from typing import List, Optional, Any
+from typing import Dict
 from app.daos.base.permission_dao_base import PermissionDaoBase
 
 class PermissionDao(PermissionDaoBase):
     """
-    Permission に関するカスタムDAO処理を書く場所
-
-    - サンプルメソッドをここに追加できます。
-    - 例:
-        def custom_search(self, db_session: Session, keyword: str) -> List[Permission]:
-            return db_session.query(Permission).filter(Permission.name.like(f"%{keyword}%")).all()
+    Permission に関するカスタムDAO処理クラス。
     """
-    pass  # 必要に応じてカスタムメソッドをここに追加してください
\ No newline at end of file
+
+    def find_positions(self, db_session: Session) -> Dict[str, int]:
+        """
+        全パーミッションを {パーミッションID: サロゲートキー} で返す（権限ビットマップのビット位置に使う）。
+        """
+        rows = db_session.execute(select(Permission.permission_id, Permission.id))
+        return {row.permission_id: row.id for row in rows}
@@ -1,8 +1,12 @@
-from app.models.models import Policy
+from app.models.models import Policy, UserRole
+from datetime import date
+from sqlalchemy import Select, or_, select, union
 from sqlalchemy.orm import Session
-from typing import Optional
+from typing import Dict, Iterable, List, Optional, Set, Tuple
 import uuid
+from app.common.bulk_insert import chunked, find_existing_keys, insert_ignoring_conflicts
 from app.daos.base.policy_dao_base import PolicyDaoBase
+from app.daos.group_role_dao import effective_group_role_ids
 
 class PolicyDao(PolicyDaoBase):
     """
@@ -12,7 +16,15 @@ class PolicyDao(PolicyDaoBase):
     トランザクション制御（commit/rollback）は呼び出し元に委譲し、ここでは実行しない。
     """
 
-    def add_policy(self, db: Session, role_id: str, permission_id: str, resource_id: str, condition: Optional[str] = None) -> Policy:
+    def add_policy(
+        self,
+        db: Session,
+        role_id: str,
+        permission_id: str,
+        resource_id: str,
+        condition: Optional[str] = None,
+        operator_uuid: str = "system"
+    ) -> Policy:
         """
         Policy エンティティを作成してDBに追加（flush対象に追加）する。
 
@@ -28,6 +40,8 @@ class PolicyDao(PolicyDaoBase):
             リソースID
         condition : Optional[str]
             アクセス条件（JSONや式）
+        operator_uuid : str
+            登録者のユーザーUUID（更新者に設定する）
 
         Returns:
         -------
@@ -39,7 +53,8 @@ class PolicyDao(PolicyDaoBase):
             role_id=role_id,
             permission_id=permission_id,
             resource_id=resource_id,
-            condition=condition
+            condition=condition,
+            update_user_uuid=operator_uuid
         )
         db.add(entity)
         return entity
@@ -66,3 +81,120 @@ class PolicyDao(PolicyDaoBase):
         ).first()
         if entity:
             db.delete(entity)
+
+    def exists_for_role_permission(self, db: Session, role_id: str, permission_id: str) -> bool:
+        """
+        ロールとパーミッションの組み合わせを使うポリシーが1件以上存在するかを返す。
+        """
+        return db.query(
+            db.query(Policy).filter_by(role_id=role_id, permission_id=permission_id).exists()
+        ).scalar()
+
+    def find_all(self, db: Session) -> List[Policy]:
+        """
+        ポリシーを全件取得する（認可インデックスの構築用）。
+        """
+        return db.query(Policy).all()
+
+    def find_revisions(self, db: Session) -> Dict[str, int]:
+        """
+        全ポリシーの更新回数を {ポリシーID: 更新回数} で返す（スナップショットとの差分確認用）。
+
+        ORM のオブジェクトを作らずに2列だけを読むため、find_all() より大幅に軽い。
+        """
+        rows = db.execute(select(Policy.policy_id, Policy.update_count))
+        return {row.policy_id: row.update_count or 0 for row in rows}
+
+    def find_rows_by_policy_ids(
+        self, db: Session, policy_ids: Iterable[str]
+    ) -> List[Tuple[str, str, str, str, Optional[str], int]]:
+        """
+        ポリシーを (ポリシーID, ロールID, パーミッションID, リソースID, 条件, 更新回数) で取得する
+        （500件ごとに1クエリ）。
+        """
+        columns = (
+            Policy.policy_id, Policy.role_id, Policy.permission_id, Policy.resource_id,
+            Policy.condition, Policy.update_count
+        )
+        rows = []
+        for chunk in chunked(policy_ids):
+            rows.extend(tuple(row) for row in db.execute(select(*columns).where(Policy.policy_id.in_(chunk))))
+        return rows
+
+    def allowed_resource_ids(self, user_id: str, permission_id: str, system_date: Optional[date] = None) -> Select:
+        """
+        ユーザーがパーミッションを持つリソースIDを返す SELECT を作成する（実行はしない）。
+
+        一覧取得のクエリに `column.in_(...)` として組み込み、認可をDB側で絞り込むために使う。
+        ロールは直接割り当て（m_user_role）と、所属部署・上位部署からの継承（m_group_role）の和で、
+        認可インデックスの判定と同じになる。
+        条件（condition）付きのポリシーはSQLでは評価できないため含めない。
+
+        Parameters:
+        ----------
+        user_id : str
+            ユーザーID
+        permission_id : str
+            パーミッションID
+        system_date : Optional[date]
+            所属の有効期間を判定する基準日（省略時は当日）
+
+        Returns:
+        -------
+        Select
+            resource_id 1列の SELECT
+        """
+        role_ids = union(
+            select(UserRole.role_id).where(UserRole.user_id == user_id),
+            effective_group_role_ids(user_id, system_date or date.today())
+        )
+        return (
+            select(Policy.resource_id)
+            .where(
+                Policy.role_id.in_(role_ids),
+                Policy.permission_id == permission_id,
+                or_(Policy.condition.is_(None), Policy.condition == "")
+            )
+            .distinct()
+        )
+
+    def find_existing_policies(
+        self, db: Session, keys: Iterable[Tuple[str, str, str]]
+    ) -> Set[Tuple[str, str, str, Optional[str]]]:
+        """
+        (ロールID, パーミッションID, リソースID) に一致する登録済みのポリシーを
+        (ロールID, パーミッションID, リソースID, 条件) の集合で返す（500件ごとに1クエリ）。
+        """
+        return find_existing_keys(
+            db, (Policy.role_id, Policy.permission_id, Policy.resource_id), keys, extra_columns=(Policy.condition,)
+        )
+
+    def bulk_add_policies(
+        self,
+        db: Session,
+        policies: Iterable[Tuple[str, str, str, Optional[str]]],
+        operator_uuid: str = "system"
+    ) -> List[Tuple[str, str, str, str, Optional[str]]]:
+        """
+        (ロールID, パーミッションID, リソースID, 条件) のポリシーを1回の executemany で一括登録する。
+
+        ORM を経由しないため、認可インデックスへの反映は呼び出し側で行うこと（record_bulk_insert()）。
+
+        Returns:
+        -------
+        List[Tuple[str, str, str, str, Optional[str]]]
+            登録したポリシーの (ポリシーID, ロールID, パーミッションID, リソースID, 条件)
+        """
+        created = [
+            (str(uuid.uuid4()), role_id, permission_id, resource_id, condition)
+            for role_id, permission_id, resource_id, condition in policies
+        ]
+        insert_ignoring_conflicts(db, Policy.__table__, [
+            {
+                "policy_id": policy_id, "role_id": role_id, "permission_id": permission_id,
+                "resource_id": resource_id, "condition": condition,
+                "update_user_uuid": operator_uuid, "update_count": 0
+            }
+            for policy_id, role_id, permission_id, resource_id, condition in created
+        ], changes_recorded=True)
+        return created
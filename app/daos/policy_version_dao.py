@@ -0,0 +1,61 @@
+from app.models.models import PolicyVersion
+from datetime import datetime
+from sqlalchemy import bindparam, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+from app.common.statement_registry import default_statement_registry, fetch_scalar
+from app.daos.base.policy_version_dao_base import PolicyVersionDaoBase
+
+
+@default_statement_registry.statement("m_policy_version.get_version")
+def _get_version(nulls):
+    table = PolicyVersion.__table__
+    return select(table.c.version).where(table.c.scope == bindparam("scope"))
+
+class PolicyVersionDao(PolicyVersionDaoBase):
+    """
+    PolicyVersion（認可情報の版数）に関するカスタムDAO処理クラス。
+
+    版数の読み書きは ORM を経由せずテーブルに対して直接実行する（flush 中にも呼び出せるようにするため）。
+    トランザクション制御は呼び出し元で行う。
+    """
+
+    table = PolicyVersion.__table__
+
+    def get_version(self, db: Session, scope: str) -> int:
+        """
+        版数を返す（行が無い場合は0）。
+        """
+        version = default_statement_registry.execute(
+            db, "m_policy_version.get_version", {"scope": scope}, fetch=fetch_scalar
+        )
+        return version or 0
+
+    def bump(self, db: Session, scope: str) -> int:
+        """
+        版数を1加算し、加算後の版数を返す（行が無い場合は作成する）。
+
+        加算は UPDATE ... SET version = version + 1 で行うため、複数ワーカーから同時に
+        呼び出されても取りこぼさない。加算した行はトランザクションの終了までロックされるため、
+        同じトランザクション内の加算は連番になる。
+        """
+        statement = (
+            update(self.table).where(self.table.c.scope == scope)
+            .values(version=self.table.c.version + 1, update_date=datetime.now())
+        )
+        if db.get_bind().dialect.update_returning:
+            # 加算と加算後の版数の取得を1往復で行う
+            version = db.execute(statement.returning(self.table.c.version)).scalar()
+            if version is not None:
+                return version
+        elif db.execute(statement).rowcount:
+            return self.get_version(db, scope)
+        connection = db.connection()
+        try:
+            # flush 中でも使えるよう、セッションではなくコネクションのセーブポイントで囲む
+            with connection.begin_nested():
+                connection.execute(self.table.insert(), [{"scope": scope, "version": 1, "update_date": datetime.now()}])
+        except IntegrityError:
+            # 他のワーカーが先に行を作成した場合は加算し直す
+            return self.bump(db, scope)
+        return 1
@@ -1,6 +1,7 @@
 from app.models.models import Role
 from sqlalchemy.orm import Session
-from typing import List, Optional
+from typing import Dict, List, Optional
+from sqlalchemy import select
 from app.daos.base.role_dao_base import RoleDaoBase
 
 
@@ -110,3 +111,33 @@ class RoleDao(RoleDaoBase):
             )
             .all()
         )
+
+    def find_positions(self, db_session: Session) -> Dict[str, int]:
+        """
+        全ロールを {ロールID: サロゲートキー} で返す（権限ビットマップのビット位置に使う）。
+        """
+        rows = db_session.execute(select(Role.role_id, Role.id))
+        return {row.role_id: row.id for row in rows}
+
+    def get_by_role_ids(
+        self,
+        db_session: Session,
+        role_ids: List[str]
+    ) -> List[Role]:
+        """
+        複数のロールIDに一致するロールを1回のクエリで取得する。
+
+        承認ルート上のロールコード（approverl_role_code）はロールIDとして扱う。
+
+        Args:
+            db_session (Session): DBセッション
+            role_ids (List[str]): ロールIDのリスト
+
+        Returns:
+            List[Role]: 該当するロールのリスト（順不同）
+        """
+        if not role_ids:
+            return []
+        return db_session.query(Role).filter(
+            Role.role_id.in_(set(role_ids))
+        ).all()
@@ -1,6 +1,7 @@
+from app.common.bulk_insert import find_existing_keys, insert_ignoring_conflicts
 from app.models.models import RolePermission
 from sqlalchemy.orm import Session
-from typing import Optional
+from typing import Iterable, List, Optional, Set, Tuple
 from app.daos.base.role_permission_dao_base import RolePermissionDaoBase
 
 class RolePermissionDao(RolePermissionDaoBase):
@@ -11,7 +12,9 @@ class RolePermissionDao(RolePermissionDaoBase):
     トランザクション制御は呼び出し元で行う。
     """
 
-    def add_role_permission(self, db: Session, role_id: str, permission_id: str) -> RolePermission:
+    def add_role_permission(
+        self, db: Session, role_id: str, permission_id: str, operator_uuid: str = "system"
+    ) -> RolePermission:
         """
         ロールにパーミッションを関連付ける RolePermission を作成する。
 
@@ -23,13 +26,18 @@ class RolePermissionDao(RolePermissionDaoBase):
             ロールID
         permission_id : str
             パーミッションID
+        operator_uuid : str
+            登録者のユーザーUUID（作成者・更新者に設定する）
 
         Returns:
         -------
         RolePermission
             作成された RolePermission エンティティ（commit前）
         """
-        entity = RolePermission(role_id=role_id, permission_id=permission_id)
+        entity = RolePermission(
+            role_id=role_id, permission_id=permission_id,
+            create_user_uuid=operator_uuid, update_user_uuid=operator_uuid
+        )
         db.add(entity)
         return entity
 
@@ -49,3 +57,36 @@ class RolePermissionDao(RolePermissionDaoBase):
         entity = db.query(RolePermission).filter_by(role_id=role_id, permission_id=permission_id).first()
         if entity:
             db.delete(entity)
+
+    def exists(self, db: Session, role_id: str, permission_id: str) -> bool:
+        """
+        ロールとパーミッションの関連付けが存在するかを返す。
+        """
+        return db.query(
+            db.query(RolePermission).filter_by(role_id=role_id, permission_id=permission_id).exists()
+        ).scalar()
+
+    def find_existing_pairs(self, db: Session, pairs: Iterable[Tuple[str, str]]) -> Set[Tuple[str, str]]:
+        """
+        (ロールID, パーミッションID) の組のうち、登録済みのものを集合で返す（500件ごとに1クエリ）。
+        """
+        return find_existing_keys(db, (RolePermission.role_id, RolePermission.permission_id), pairs)
+
+    def bulk_add_role_permissions(
+        self, db: Session, pairs: Iterable[Tuple[str, str]], operator_uuid: str = "system"
+    ) -> List[Tuple[str, str]]:
+        """
+        ロールとパーミッションの関連付けを一括で登録し、実際に追加された (ロールID, パーミッションID) を返す。
+
+        登録済みの組は読み飛ばす（ON CONFLICT DO NOTHING）。
+        """
+        rows = [
+            {
+                "role_id": role_id, "permission_id": permission_id,
+                "create_user_uuid": operator_uuid, "update_user_uuid": operator_uuid
+            }
+            for role_id, permission_id in pairs
+        ]
+        table = RolePermission.__table__
+        inserted = insert_ignoring_conflicts(db, table, rows, returning=(table.c.role_id, table.c.permission_id))
+        return [tuple(row) for row in inserted]
@@ -12,4 +12,19 @@ class TenantDao(TenantDaoBase):
         def custom_search(self, db_session: Session, keyword: str) -> List[Tenant]:
             return db_session.query(Tenant).filter(Tenant.name.like(f"%{keyword}%")).all()
     """
-    pass  # 必要に応じてカスタムメソッドをここに追加してください
\ No newline at end of file
+    def get_by_tenant_uuids(
+        self,
+        db_session: Session,
+        tenant_uuids: List[str]
+    ) -> List[Tenant]:
+        """
+        複数のテナントUUIDに一致するテナントを取得する（500件ごとに1クエリ）。
+
+        Args:
+            db_session (Session): SQLAlchemyのDBセッション
+            tenant_uuids (List[str]): テナントUUIDのリスト
+
+        Returns:
+            List[Tenant]: 該当するテナントのリスト（順不同）
+        """
+        return self.get_many_by_tenant_uuid(db_session, tenant_uuids)
@@ -33,3 +33,28 @@ class TenantUserDao(TenantUserDaoBase):
             TenantUser.user_uuid == user_uuid,
             TenantUser.is_active.is_(True)
         ).first()
+
+    def find_active_users(
+        self,
+        db_session: Session,
+        tenant_uuid: str,
+        user_uuids: List[str]
+    ) -> List[TenantUser]:
+        """
+        指定されたテナント内で所属中（所属終了日がNULL）のユーザーをまとめて取得する。
+
+        Args:
+            db_session (Session): SQLAlchemyのDBセッション
+            tenant_uuid (str): テナントUUID
+            user_uuids (List[str]): ユーザーUUIDのリスト
+
+        Returns:
+            List[TenantUser]: 所属中のユーザーのリスト（順不同）
+        """
+        if not user_uuids:
+            return []
+        return db_session.query(TenantUser).filter(
+            TenantUser.tenant_uuid == tenant_uuid,
+            TenantUser.user_uuid.in_(set(user_uuids)),
+            TenantUser.belong_end_date.is_(None)
+        ).all()
@@ -12,4 +12,19 @@ class UserDao(UserDaoBase):
         def custom_search(self, db_session: Session, keyword: str) -> List[User]:
             return db_session.query(User).filter(User.name.like(f"%{keyword}%")).all()
     """
-    pass  # 必要に応じてカスタムメソッドをここに追加してください
\ No newline at end of file
+    def get_by_user_uuids(
+        self,
+        db_session: Session,
+        user_uuids: List[str]
+    ) -> List[User]:
+        """
+        複数のユーザーUUIDに一致するユーザーを取得する（500件ごとに1クエリ）。
+
+        Args:
+            db_session (Session): SQLAlchemyのDBセッション
+            user_uuids (List[str]): ユーザーUUIDのリスト
+
+        Returns:
+            List[User]: 該当するユーザーのリスト（順不同）
+        """
+        return self.get_many_by_user_uuid(db_session, user_uuids)
@@ -1,6 +1,6 @@
 from sqlalchemy.orm import Session
 from app.models.models import UserGroup
-from typing import List, Optional, Any
+from typing import List, Optional, Any, Tuple
 from app.daos.base.user_group_dao_base import UserGroupDaoBase
 
 class UserGroupDao(UserGroupDaoBase):
@@ -26,3 +26,34 @@ class UserGroupDao(UserGroupDaoBase):
             UserGroup.employee_code == employee_code,
             UserGroup.group_code == group_code
         ).first()
+
+    def find_by_user_group_keys(
+        self,
+        db_session: Session,
+        tenant_uuid: str,
+        keys: List[Tuple[str, str]]
+    ) -> List[UserGroup]:
+        """
+        (ユーザーUUID, 部署コード) の組み合わせに一致する従業員部署をまとめて取得する。
+
+        Args:
+            db_session (Session): SQLAlchemyのDBセッション
+            tenant_uuid (str): テナントUUID
+            keys (List[Tuple[str, str]]): (ユーザーUUID, 部署コード) のリスト
+
+        Returns:
+            List[UserGroup]: 該当する従業員部署のリスト（順不同）
+        """
+        return self.get_many_by_tenant_uuid_and_user_uuid_and_group_code(
+            db_session, [(tenant_uuid, user_uuid, group_code) for user_uuid, group_code in keys if user_uuid and group_code]
+        )
+
+    def find_all_affiliations(self, db_session: Session) -> List[Tuple[str, str, str, Any, Any]]:
+        """
+        全従業員の所属部署を (ユーザーUUID, テナントUUID, 部署コード, 有効開始日, 有効終了日) で取得する
+        （認可インデックスの構築用。エンティティは生成しない）。
+        """
+        rows = db_session.query(
+            UserGroup.user_uuid, UserGroup.tenant_uuid, UserGroup.group_code, UserGroup.term_from, UserGroup.term_to
+        ).all()
+        return [tuple(row) for row in rows]
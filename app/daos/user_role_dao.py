@@ -1,6 +1,8 @@
+from app.common.bulk_insert import find_existing_keys, insert_ignoring_conflicts
 from app.models.models import UserRole
+from sqlalchemy import select
 from sqlalchemy.orm import Session
-from typing import Optional
+from typing import Iterable, List, Optional, Set, Tuple
 from app.daos.base.user_role_dao_base import UserRoleDaoBase
 
 class UserRoleDao(UserRoleDaoBase):
@@ -11,7 +13,7 @@ class UserRoleDao(UserRoleDaoBase):
     トランザクション制御は呼び出し元で行う。
     """
 
-    def add_user_role(self, db: Session, user_id: str, role_id: str) -> UserRole:
+    def add_user_role(self, db: Session, user_id: str, role_id: str, operator_uuid: str = "system") -> UserRole:
         """
         ユーザーにロールを割り当てる UserRole エンティティを作成する。
 
@@ -23,13 +25,17 @@ class UserRoleDao(UserRoleDaoBase):
             ユーザーID（UUIDなど）
         role_id : str
             ロールID（UUIDなど）
+        operator_uuid : str
+            登録者のユーザーUUID（作成者・更新者に設定する）
 
         Returns:
         -------
         UserRole
             作成された UserRole エンティティ（commit前）
         """
-        entity = UserRole(user_id=user_id, role_id=role_id)
+        entity = UserRole(
+            user_id=user_id, role_id=role_id, create_user_uuid=operator_uuid, update_user_uuid=operator_uuid
+        )
         db.add(entity)
         return entity
 
@@ -49,3 +55,43 @@ class UserRoleDao(UserRoleDaoBase):
         entity = db.query(UserRole).filter_by(user_id=user_id, role_id=role_id).first()
         if entity:
             db.delete(entity)
+
+    def find_all(self, db: Session) -> List[UserRole]:
+        """
+        ユーザーとロールの関連付けを全件取得する（認可インデックスの構築用）。
+        """
+        return db.query(UserRole).all()
+
+    def find_all_pairs(self, db: Session) -> List[Tuple[str, str]]:
+        """
+        ユーザーとロールの関連付けを (ユーザーID, ロールID) で全件取得する（ORM のオブジェクトを作らない）。
+        """
+        return [tuple(row) for row in db.execute(select(UserRole.user_id, UserRole.role_id))]
+
+    def find_existing_pairs(self, db: Session, pairs: Iterable[Tuple[str, str]]) -> Set[Tuple[str, str]]:
+        """
+        (ユーザーID, ロールID) の組のうち、登録済みのものを集合で返す（500件ごとに1クエリ）。
+        """
+        return find_existing_keys(db, (UserRole.user_id, UserRole.role_id), pairs)
+
+    def bulk_add_user_roles(
+        self, db: Session, pairs: Iterable[Tuple[str, str]], operator_uuid: str = "system"
+    ) -> List[Tuple[str, str]]:
+        """
+        ユーザーとロールの関連付けを一括で登録し、実際に追加された (ユーザーID, ロールID) を返す。
+
+        登録済みの組は読み飛ばす（ON CONFLICT DO NOTHING）。ORM を経由しないため、
+        認可インデックスへの反映は呼び出し側で行うこと（record_bulk_insert()）。
+        """
+        rows = [
+            {
+                "user_id": user_id, "role_id": role_id,
+                "create_user_uuid": operator_uuid, "update_user_uuid": operator_uuid
+            }
+            for user_id, role_id in pairs
+        ]
+        table = UserRole.__table__
+        inserted = insert_ignoring_conflicts(
+            db, table, rows, returning=(table.c.user_id, table.c.role_id), changes_recorded=True
+        )
+        return [tuple(row) for row in inserted]
@@ -52,3 +52,70 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+# ------------------------------------------------------------
+# 非同期（AsyncSession）用
+#   ドライバ（asyncpg / aiosqlite）は非同期経路を使う場合のみ必要なため、
+#   エンジンは初回利用時に生成する。
+# ------------------------------------------------------------
+def build_async_database_url(url: str) -> str:
+    """
+    同期用のデータベースURLを非同期ドライバ用に変換する。
+    環境変数 ASYNC_DATABASE_URL が設定されている場合はそちらを優先する。
+    """
+    override = os.getenv("ASYNC_DATABASE_URL")
+    if override:
+        return override
+    scheme, sep, rest = url.partition("://")
+    if scheme.startswith("postgres"):
+        return f"postgresql+asyncpg{sep}{rest}"
+    if scheme.startswith("sqlite"):
+        return f"sqlite+aiosqlite{sep}{rest}"
+    return url
+
+
+ASYNC_DATABASE_URL = build_async_database_url(DATABASE_URL)
+
+_async_engine = None
+_async_session_factory = None
+
+
+def get_async_engine():
+    """
+    非同期エンジンを返す（初回呼び出し時に生成）。
+    """
+    global _async_engine
+    if _async_engine is None:
+        from sqlalchemy.ext.asyncio import create_async_engine
+        _async_engine = create_async_engine(ASYNC_DATABASE_URL, echo=False, pool_pre_ping=True)
+    return _async_engine
+
+
+def get_async_session_factory():
+    """
+    AsyncSession のファクトリを返す（初回呼び出し時に生成）。
+    AsyncLaube で独立した検索を並行実行する際にも使用する。
+    """
+    global _async_session_factory
+    if _async_session_factory is None:
+        from sqlalchemy.ext.asyncio import async_sessionmaker
+        _async_session_factory = async_sessionmaker(
+            bind=get_async_engine(),
+            autoflush=False,
+            expire_on_commit=False
+        )
+    return _async_session_factory
+
+
+async def get_async_db():
+    """
+    非同期データベースセッションを生成・クローズするための依存関数。
+
+    FastAPI の async エンドポイントで `Depends(get_async_db)` として使用する。
+
+    Yields:
+        AsyncSession: SQLAlchemy 非同期セッションインスタンス
+    """
+    async with get_async_session_factory()() as db:
+        yield db
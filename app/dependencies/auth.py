@@ -1,9 +1,13 @@
+from typing import Any, Callable, Dict
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from starlette.requests import Request
 import logging
 from fastapi.security import OAuth2PasswordBearer
 from jose import JWTError, jwt
+from app.engine.cerberus import Cerberus
+from app.engine.permission_claims import PermissionClaims
+from app.utils.jwt import ALGORITHM, SECRET_KEY
 
 
 security = HTTPBearer()
@@ -42,17 +46,40 @@ def verify_token(request: Request, credentials: HTTPAuthorizationCredentials = D
             detail="Invalid token",
         )
 
-SECRET_KEY = "super-secret"
-ALGORITHM = "HS256"
-
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/login")
 
-def get_current_user(token: str = Depends(oauth2_scheme)) -> str:
+permission_claims = PermissionClaims(Cerberus())
+
+def get_token_claims(token: str = Depends(oauth2_scheme)) -> Dict[str, Any]:
+    """
+    アクセストークン（JWT）を検証し、クレームを返す。sub が無い・署名が不正な場合は401。
+    """
     try:
         payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        username: str = payload.get("sub")
-        if username is None:
-            raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token")
-        return username
     except JWTError:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token")
+    if payload.get("sub") is None:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token")
+    return payload
+
+def get_current_user(claims: Dict[str, Any] = Depends(get_token_claims)) -> str:
+    return claims["sub"]
+
+def require_permission(permission_id: str) -> Callable[..., str]:
+    """
+    ユーザーがパーミッションを持つ（いずれかのリソースに対して）ことを要求する依存関数を作る。
+
+    トークンに権限ビットマップが埋め込まれていて、その版数が最新であればDBを参照せずに判定する。
+    そうでなければ Cerberus で判定する。権限が無い場合は403。
+
+    Usage:
+    ------
+    @router.get("/forms")
+    def list_forms(user: str = Depends(require_permission("read"))): ...
+    """
+    def dependency(claims: Dict[str, Any] = Depends(get_token_claims)) -> str:
+        if not permission_claims.authorize(claims, permission_id):
+            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Permission denied")
+        return claims["sub"]
+
+    return dependency
@@ -0,0 +1,34 @@
+from enum import Enum
+from typing import List, Optional
+from pydantic import BaseModel
+
+
+class AssignmentStatus(str, Enum):
+    CREATED = "created"      # 登録した
+    EXISTS = "exists"        # 登録済みのため何もしなかった
+    DUPLICATE = "duplicate"  # 同じ依頼内で重複していたため読み飛ばした
+    REJECTED = "rejected"    # 検証エラーのため登録しなかった（reason に理由）
+
+
+class AssignmentResultDto(BaseModel):
+    index: int  # 依頼内での位置（0始まり）
+    key: List[Optional[str]]  # 依頼された組（(ユーザー, ロール) など）
+    status: AssignmentStatus  # 処理結果
+    reason: Optional[str] = None  # REJECTED の理由
+
+
+class UserRoleAssignmentDto(BaseModel):
+    user_id: str  # ユーザーID
+    role_id: str  # ロールID
+
+
+class RolePermissionAssignmentDto(BaseModel):
+    role_id: str  # ロールID
+    permission_id: str  # パーミッションID
+
+
+class PolicyAssignmentDto(BaseModel):
+    role_id: str  # ロールID
+    permission_id: str  # パーミッションID
+    resource_id: str  # リソースID
+    condition: Optional[str] = None  # アクセス条件（JSON形式 or 式）
@@ -0,0 +1,249 @@
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+from sqlalchemy.orm import Session
+from app.dtos.approverl_info_dto import ApproverlInfoDto
+from app.models.models import IndividualActivity, Role, TenantUser, UserGroup
+from app.models.specifiedValue import ActivityStatus, ApprovalFunction, AutoApproverlFlag, RouteType
+from app.repositories.group_repository import GroupRepository
+from app.repositories.role_repository import RoleRepository
+from app.repositories.tenant_repository import TenantRepository
+from app.repositories.tenant_user_repository import TenantUserRepository
+from app.repositories.user_group_repository import UserGroupRepository
+from app.repositories.user_repository import UserRepository
+from app.common.error_message_loader import ErrorMessageLoader
+from app.engine.master_data_resolver import MasterDataCache, MasterDataResolver
+from app.exception.laubeException import LaubeException
+
+######################################################################
+# Copyright 2016–2025 Ryuta Miki. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+######################################################################
+
+
+@dataclass(frozen=True)
+class ApproverLookups:
+    """
+    承認者の検証に使うマスタの取得結果。
+    """
+    active_users: Dict[str, TenantUser] = field(default_factory=dict)
+    user_groups: Dict[Tuple[str, str], UserGroup] = field(default_factory=dict)
+    roles: Dict[str, Role] = field(default_factory=dict)
+
+
+class ApproverResolver:
+    """
+    ルート上のアクティビティ群から承認者リスト（ApproverlInfoDto）を組み立てるリゾルバ。
+
+    アクティビティごとにユーザー・従業員部署・ロール・各種名称を検索するのではなく、
+    ルート全体で必要なキーを先に集め、テーブルごとに1回の IN 検索でまとめて取得する。
+    テナント名・部署名・ユーザー名は MasterDataResolver 経由で解決し、プロセス共有キャッシュに
+    載っている名称は検索しない。そのため発行されるクエリ数はルートの長さに依存しない
+    （アクティビティの取得1本 + load() の3本 + prefetch_names() の3本で、最大7本）。
+    """
+
+    def __init__(
+        self,
+        error_loader: Optional[ErrorMessageLoader] = None,
+        tenant_user_repository: Optional[TenantUserRepository] = None,
+        user_group_repository: Optional[UserGroupRepository] = None,
+        role_repository: Optional[RoleRepository] = None,
+        tenant_repository: Optional[TenantRepository] = None,
+        group_repository: Optional[GroupRepository] = None,
+        user_repository: Optional[UserRepository] = None,
+        master_data_cache: Optional[MasterDataCache] = None
+    ):
+        self.error_loader = error_loader or ErrorMessageLoader()
+        self.tenant_user_repository = tenant_user_repository or TenantUserRepository()
+        self.user_group_repository = user_group_repository or UserGroupRepository()
+        self.role_repository = role_repository or RoleRepository()
+        self.tenant_repository = tenant_repository or TenantRepository()
+        self.group_repository = group_repository or GroupRepository()
+        self.user_repository = user_repository or UserRepository()
+        self.master_data_cache = master_data_cache
+
+    def resolve(
+        self,
+        db_session: Session,
+        target_tenant_uuid: str,
+        activities: Sequence[IndividualActivity],
+        application_form,
+        system_date: date,
+        master_data: Optional[MasterDataResolver] = None
+    ) -> List[ApproverlInfoDto]:
+        """
+        アクティビティ群を承認者リストに変換する。
+
+        判定内容はアクティビティ単位で検索していた従来処理と同じ：
+        - 個人指定で所属中のユーザーが存在しなければ、そのアクティビティは除外する
+        - 個人指定で従業員部署が存在しない、または有効期限切れなら Laube-E012
+        - ロール指定でロールマスタが存在しなければ Laube-E013
+        - 自動承認フォームでは同一承認者の2回目以降を自動承認にする
+
+        Args:
+            db_session (Session): DBセッション
+            target_tenant_uuid (str): ルートを保持するテナントUUID
+            activities (Sequence[IndividualActivity]): アクティビティコード順のアクティビティ（PlannedActivity も可）
+            application_form: 申請書マスタ（auto_approverl_flag を参照）
+            system_date (date): 有効期限判定の基準日
+            master_data (Optional[MasterDataResolver]): リクエスト内で共有する名称リゾルバ（省略時は新規作成）
+
+        Returns:
+            List[ApproverlInfoDto]: 承認者リスト
+        """
+        if not activities:
+            return []
+
+        lookups = self.load(db_session, target_tenant_uuid, activities)
+        names = master_data or self.new_master_data_resolver(db_session)
+        self.prefetch_names(names, target_tenant_uuid, activities)
+        return self.build(target_tenant_uuid, activities, application_form, system_date, lookups, names)
+
+    def load(
+        self, db_session: Session, target_tenant_uuid: str, activities: Sequence[IndividualActivity]
+    ) -> ApproverLookups:
+        """
+        承認者の検証に必要なユーザー・従業員部署・ロールをまとめて取得する（最大3本）。
+        """
+        personal = [a for a in activities if not self._is_role_activity(a)]
+        return ApproverLookups(
+            active_users=self._map_active_users(
+                db_session, target_tenant_uuid, [a.approverl_user_uuid for a in personal]
+            ),
+            user_groups=self._map_user_groups(
+                db_session, target_tenant_uuid,
+                [(a.approverl_user_uuid, a.approverl_group_code) for a in personal]
+            ),
+            roles=self._map_roles(db_session, [a.approverl_role_code for a in activities if a.approverl_role_code])
+        )
+
+    @staticmethod
+    def prefetch_names(
+        names: MasterDataResolver, target_tenant_uuid: str, activities: Sequence[IndividualActivity]
+    ) -> None:
+        """
+        承認者リストに表示するテナント名・部署名・ユーザー名をまとめて読み込む（最大3本）。
+        """
+        names.prefetch(
+            tenant_uuids=[target_tenant_uuid] + [a.approverl_tenant_uuid for a in activities],
+            group_keys=[(a.approverl_tenant_uuid, a.approverl_group_code) for a in activities],
+            user_uuids=[a.approverl_user_uuid for a in activities]
+        )
+
+    def build(
+        self,
+        target_tenant_uuid: str,
+        activities: Sequence[IndividualActivity],
+        application_form,
+        system_date: date,
+        lookups: ApproverLookups,
+        names: MasterDataResolver,
+        route_type: RouteType = RouteType.INDIVIDUAL,
+        route_user_uuids: Optional[Set[str]] = None
+    ) -> List[ApproverlInfoDto]:
+        """
+        取得済みのデータから承認者リストを組み立てる（DBアクセスなし）。
+        load() と prefetch_names() は互いに独立しているため、呼び出し側で並行に実行してもよい。
+
+        複数のルート（上司・直接部門・間接部門）を1つの承認経路として組み立てる場合は、
+        同じ route_user_uuids を渡すと、自動承認の重複判定がルートをまたいで行われる。
+        """
+        active_users, user_groups, roles = lookups.active_users, lookups.user_groups, lookups.roles
+
+        approver_list: List[ApproverlInfoDto] = []
+        if route_user_uuids is None:
+            route_user_uuids = set()
+
+        for activity in activities:
+            # 個人指定の場合の検証
+            if not self._is_role_activity(activity):
+                if activity.approverl_user_uuid not in active_users:
+                    continue
+
+                user_group = user_groups.get((activity.approverl_user_uuid, activity.approverl_group_code))
+                if not user_group or (user_group.term_to and user_group.term_to < system_date):
+                    raise LaubeException("Laube-E012", self.error_loader.get_message("Laube-E012"))
+
+            dto = ApproverlInfoDto()
+            dto.tenant_uuid = target_tenant_uuid
+            dto.tenant_name = names.tenant_name(target_tenant_uuid)
+            dto.route_type = route_type
+            dto.route_number = activity.activity_code
+            dto.approverl_tenant_uuid = activity.approverl_tenant_uuid
+            dto.approverl_tenant_name = names.tenant_name(activity.approverl_tenant_uuid)
+            dto.approverl_role_code = activity.approverl_role_code
+            dto.approverl_group_code = activity.approverl_group_code
+            dto.approverl_group_name = names.group_name(
+                activity.approverl_tenant_uuid, activity.approverl_group_code
+            )
+            dto.approverl_user_uuid = activity.approverl_user_uuid
+            dto.approverl_user_name = names.user_name(activity.approverl_user_uuid)
+            dto.activity_status = ActivityStatus.AUTHORIZER_UNTREATED
+            dto.approval_function = activity.function
+
+            # ロール名の取得（必要な場合）
+            if activity.approverl_role_code:
+                role = roles.get(activity.approverl_role_code)
+                if not role:
+                    raise LaubeException(
+                        "Laube-E013",
+                        self.error_loader.get_message("Laube-E013", activity.approverl_role_code)
+                    )
+                dto.approverl_role_name = role.role_name
+
+            # 自動承認判定（同一ユーザー重複）
+            if AutoApproverlFlag.AUTOMATIC_APPROVAL == application_form.auto_approverl_flag:
+                if activity.approverl_user_uuid in route_user_uuids:
+                    dto.approval_function = ApprovalFunction.AUTHORIZER_AUTOMATIC_APPROVAL
+                route_user_uuids.add(activity.approverl_user_uuid)
+
+            approver_list.append(dto)
+
+        return approver_list
+
+    def new_master_data_resolver(self, db_session: Session) -> MasterDataResolver:
+        """このリゾルバのリポジトリ・キャッシュを使う名称リゾルバを作成する。"""
+        return MasterDataResolver(
+            db_session,
+            cache=self.master_data_cache,
+            tenant_repository=self.tenant_repository,
+            group_repository=self.group_repository,
+            user_repository=self.user_repository
+        )
+
+    @staticmethod
+    def _is_role_activity(activity: IndividualActivity) -> bool:
+        return bool(activity.approverl_role_code and activity.approverl_role_code.strip())
+
+    def _map_active_users(self, db_session: Session, tenant_uuid: str, user_uuids: List[str]) -> Dict[str, TenantUser]:
+        keys = [u for u in user_uuids if u]
+        if not keys:
+            return {}
+        rows = self.tenant_user_repository.find_active_users(db_session, tenant_uuid, keys)
+        return {row.user_uuid: row for row in rows}
+
+    def _map_user_groups(
+        self, db_session: Session, tenant_uuid: str, keys: List[Tuple[str, str]]
+    ) -> Dict[Tuple[str, str], UserGroup]:
+        keys = [k for k in keys if k[0] and k[1]]
+        if not keys:
+            return {}
+        rows = self.user_group_repository.find_by_user_group_keys(db_session, tenant_uuid, keys)
+        return {(row.user_uuid, row.group_code): row for row in rows}
+
+    def _map_roles(self, db_session: Session, role_codes: List[str]) -> Dict[str, Role]:
+        if not role_codes:
+            return {}
+        rows = self.role_repository.get_by_role_ids(db_session, role_codes)
+        return {row.role_id: row for row in rows}
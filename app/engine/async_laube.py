@@ -0,0 +1,229 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from app.dtos.approverl_info_dto import ApproverlInfoDto
+from app.engine.boss_resolver import BossIndex, BossTarget
+from app.engine.laube import Laube
+from app.engine.master_data_resolver import MasterDataResolver
+from app.exception.laubeException import LaubeException
+from app.models.specifiedValue import RouteFlag
+from app.repositories.aio.application_form_repository import AsyncApplicationFormRepository
+from app.repositories.aio.application_form_route_repository import AsyncApplicationFormRouteRepository
+from app.repositories.aio.boss_repository import AsyncBossRepository
+
+######################################################################
+# Copyright 2016–2025 Ryuta Miki. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+######################################################################
+
+
+class AsyncLaube():
+    """
+    Laube の非同期版（AsyncSession 用）。
+
+    判定ロジック・バリデーション・エラーコードは Laube と共通で、DBアクセスのみ
+    AsyncSession 上で行うため、FastAPI の async エンドポイントからスレッドプールを使わずに呼び出せる。
+
+    - 申請書・申請ルート・上司マスタの検索は、DAO に登録した文を AsyncSession.execute で実行する。
+    - ルートプラン・承認者の検証・名称の検索と is_display_boss_field は、同期版の処理を
+      AsyncSession.run_sync で実行する（非同期ドライバ上で動くためイベントループはブロックしない）。
+
+    並行実行には session_factory（get_async_session_factory() など）が必要。1つの AsyncSession は
+    同時に1つの処理しか実行できないため、session_factory を渡さない場合は互いに独立した検索
+    （申請ルートと上司マスタ、承認者の検証用マスタと名称など）も db_session 上で順に実行する。
+    渡した場合はそれらを別セッションで並行に実行する。並行実行されるのはコミット済みマスタの参照のみのため、
+    呼び出し側のトランザクションで未コミットの変更を参照させたい場合は session_factory を渡さないこと。
+    """
+
+    def __init__(
+        self,
+        laube: Optional[Laube] = None,
+        session_factory: Optional[Callable[[], AsyncSession]] = None
+    ):
+        self.laube = laube or Laube()
+        self.error_loader = self.laube.error_loader
+        self.session_factory = session_factory
+        self.application_form_repository = AsyncApplicationFormRepository(self.laube.application_form_repository)
+        self.application_form_route_repository = AsyncApplicationFormRouteRepository(
+            self.laube.application_form_route_repository
+        )
+        self.boss_repository = AsyncBossRepository()
+
+    async def is_display_boss_field(
+        self,
+        db_session: AsyncSession,
+        tenant_uuid: str,
+        target_group_code: str,
+        target_user_uuid: str,
+        application_form_code: str
+    ) -> bool:
+        """
+        Laube.is_display_boss_field の非同期版。
+        各検索は前の結果に依存するため、同一セッション上で順に実行する。
+        """
+        if not db_session:
+            raise LaubeException("Laube-E001", self.error_loader.get_message("Laube-E001"))
+
+        def judge(session: Session) -> bool:
+            # メンテナンス判定は Laube.is_display_boss_field 側の health_check で行われる
+            return self.laube.is_display_boss_field(
+                session, tenant_uuid, target_group_code, target_user_uuid, application_form_code
+            )
+
+        return await db_session.run_sync(judge)
+
+    async def is_display_boss_fields(
+        self,
+        db_session: AsyncSession,
+        tenant_uuid: str,
+        target_group_code: str,
+        target_user_uuid: str,
+        application_form_codes: List[str]
+    ) -> Dict[str, bool]:
+        """
+        Laube.is_display_boss_fields の非同期版。
+        申請書の取得後、申請ルートと上司マスタの検索を並行に実行する。
+        """
+        try:
+            await self._ensure_available(db_session)
+            self.laube._validate_boss_fields_params(
+                db_session, tenant_uuid, target_group_code, target_user_uuid, application_form_codes
+            )
+            codes = list(dict.fromkeys(application_form_codes))
+
+            forms = {
+                form.application_form_code: form
+                for form in await self.application_form_repository.get_by_codes(db_session, tenant_uuid, codes)
+            }
+            individual_codes = self.laube._codes_with_flag(forms, RouteFlag.INDIVIDUAL_ROUTE)
+            boss_codes = self.laube._codes_with_flag(forms, RouteFlag.BOSS_ROUTE)
+
+            routes, bosses = await self._gather(
+                db_session,
+                lambda session: self.application_form_route_repository.find_by_codes_and_group(
+                    session, tenant_uuid, individual_codes, target_group_code
+                ),
+                lambda session: self._resolve_bosses(
+                    session, tenant_uuid, target_user_uuid, target_group_code, boss_codes
+                )
+            )
+            return self.laube._judge_boss_fields(codes, forms, self.laube._pick_form_routes(routes), bosses)
+
+        except LaubeException:
+            raise
+        except Exception as e:
+            raise LaubeException(e)
+
+    async def get_individual_approverl_list(
+        self,
+        db_session: AsyncSession,
+        tenant_uuid: str,
+        target_tenant_uuid: str,
+        individual_route_code: str,
+        application_form
+    ) -> List[ApproverlInfoDto]:
+        """
+        Laube.get_individual_approverl_list の非同期版。
+        ルートプランの取得後、承認者の検証用マスタと表示名称の検索を並行に実行する。
+        """
+        try:
+            if not db_session:
+                raise LaubeException("Laube-E001", self.error_loader.get_message("Laube-E001"))
+            await self._ensure_available(db_session)
+            if not tenant_uuid:
+                raise LaubeException("Laube-E002", self.error_loader.get_message("Laube-E002"))
+            if not individual_route_code:
+                return []
+            if application_form is None:
+                raise LaubeException("Laube-E006", self.error_loader.get_message("Laube-E006"))
+
+            system_date = self.laube.context.today()
+            resolver = self.laube.approver_resolver
+
+            plan = await db_session.run_sync(
+                self.laube.route_plan_cache.get_plan, target_tenant_uuid, individual_route_code
+            )
+            if not plan.activities:
+                return []
+
+            def prefetch_names(session: Session) -> MasterDataResolver:
+                names = resolver.new_master_data_resolver(session)
+                resolver.prefetch_names(names, target_tenant_uuid, plan.activities)
+                return names
+
+            lookups, names = await self._gather(
+                db_session,
+                lambda session: session.run_sync(resolver.load, target_tenant_uuid, plan.activities),
+                lambda session: session.run_sync(prefetch_names)
+            )
+            return resolver.build(target_tenant_uuid, plan.activities, application_form, system_date, lookups, names)
+
+        except LaubeException:
+            raise
+        except Exception as e:
+            raise LaubeException("UNEXPECTED", str(e))
+
+    async def _ensure_available(self, db_session: Optional[AsyncSession]) -> None:
+        """
+        Laube.health_check と同じメンテナンス判定を行う。
+        停止期間の再読込が必要な場合のみ AsyncSession 経由でDBを参照する。
+        """
+        registry = self.laube.maintenance_registry
+        if db_session is not None and registry.needs_refresh():
+            await db_session.run_sync(registry.refresh)
+        self.laube.ensure_available(None)
+
+    async def _resolve_bosses(
+        self,
+        db_session: AsyncSession,
+        tenant_uuid: str,
+        user_uuid: str,
+        group_code: Optional[str],
+        application_form_codes: List[str]
+    ) -> Dict[Optional[str], Optional[BossTarget]]:
+        """
+        BossResolver.resolve_many の非同期版。インデックス対象のテナントは構築済みのインデックスを共有する。
+        """
+        if not application_form_codes:
+            return {}
+        resolver = self.laube.boss_resolver
+        if tenant_uuid in resolver.hot_tenants:
+            index = resolver.cached_index(tenant_uuid)
+            if index is None:
+                index = resolver.store_index(
+                    BossIndex(tenant_uuid, await self.boss_repository.find_by_tenant(db_session, tenant_uuid))
+                )
+        else:
+            index = BossIndex(
+                tenant_uuid,
+                await self.boss_repository.find_candidates_for_user(db_session, tenant_uuid, user_uuid, group_code)
+            )
+        return index.resolve_many(user_uuid, group_code, application_form_codes)
+
+    async def _gather(
+        self, db_session: AsyncSession, *calls: Callable[[AsyncSession], Awaitable[Any]]
+    ) -> Sequence[Any]:
+        """
+        互いに独立した検索を実行する。
+        session_factory があれば別セッションで並行に、無ければ db_session 上で順に実行する。
+        """
+        if self.session_factory is None:
+            return [await call(db_session) for call in calls]
+
+        async def in_new_session(call: Callable[[AsyncSession], Awaitable[Any]]) -> Any:
+            async with self.session_factory() as session:
+                return await call(session)
+
+        return await asyncio.gather(*(in_new_session(call) for call in calls))
@@ -0,0 +1,331 @@
+import atexit
+import json
+import logging
+import os
+import queue
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Protocol, Sequence
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+from app.database.connection import SessionLocal
+from app.repositories.authorization_audit_repository import AuthorizationAuditRepository
+
+######################################################################
+# Copyright 2016–2025 Ryuta Miki. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+######################################################################
+
+# ----------------------------------------------------------------------
+# Cerberus の認可判定・割り当て／解除を監査ログとして記録する。
+#
+# 判定（check）のたびに同期で書き込むと応答時間が倍になるため、イベントはメモリ上の
+# キューに積むだけにして、専用のスレッドが件数（batch_size）または経過時間
+# （flush_interval）ごとにまとめて書き込む。キューが一杯の場合は判定を待たせずに
+# イベントを破棄し、件数を dropped として数える（block_timeout を指定した場合のみ、
+# その秒数まで空きを待つ）。プロセス終了時（atexit）には残りを書き込んでから停止する。
+#
+# 環境変数 CERBERUS_AUDIT_SINK で既定の出力先を指定する。
+#   db               … t_authorization_audit へ登録する
+#   ndjson:<パス>    … 1行1イベントの JSON としてファイルへ追記する
+#   未設定           … 記録しない
+# ----------------------------------------------------------------------
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_SIZE = int(os.getenv("CERBERUS_AUDIT_BATCH_SIZE", "500"))
+DEFAULT_FLUSH_SECONDS = float(os.getenv("CERBERUS_AUDIT_FLUSH_SECONDS", "1"))
+DEFAULT_MAX_QUEUE = int(os.getenv("CERBERUS_AUDIT_QUEUE_SIZE", "100000"))
+
+_PENDING_KEY = "cerberus_audit_events"
+
+
+@dataclass
+class AuditEvent:
+    """
+    監査ログ1件（判定の場合は allowed に結果、割り当て／解除の場合は None）。
+    """
+    event_type: str
+    user_id: Optional[str] = None
+    role_id: Optional[str] = None
+    permission_id: Optional[str] = None
+    resource_id: Optional[str] = None
+    allowed: Optional[bool] = None
+    detail: Optional[Dict[str, Any]] = None
+    operator_uuid: Optional[str] = None
+    event_date: datetime = field(default_factory=datetime.now)
+
+    def to_row(self) -> Dict[str, Any]:
+        """t_authorization_audit の1行に変換する（detail は JSON 文字列）。"""
+        return {
+            "event_type": self.event_type,
+            "event_date": self.event_date,
+            "user_id": self.user_id,
+            "role_id": self.role_id,
+            "permission_id": self.permission_id,
+            "resource_id": self.resource_id,
+            "allowed": self.allowed,
+            "detail": json.dumps(self.detail, ensure_ascii=False) if self.detail is not None else None,
+            "operator_uuid": self.operator_uuid,
+        }
+
+    def to_json(self) -> str:
+        """NDJSON の1行に変換する。"""
+        record = dict(self.__dict__)
+        record["event_date"] = self.event_date.isoformat()
+        return json.dumps(record, ensure_ascii=False)
+
+
+class AuditWriter(Protocol):
+    def write(self, events: Sequence[AuditEvent]) -> None:
+        ...
+
+
+class DatabaseAuditWriter:
+    """
+    監査ログを t_authorization_audit へまとめて登録する（1バッチ1トランザクション）。
+    """
+
+    def __init__(self, session_factory: Callable[[], Session] = SessionLocal):
+        self.session_factory = session_factory
+        self.repository = AuthorizationAuditRepository()
+
+    def write(self, events: Sequence[AuditEvent]) -> None:
+        db = self.session_factory()
+        try:
+            self.repository.insert_events(db, [e.to_row() for e in events])
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+
+class NdjsonAuditWriter:
+    """
+    監査ログを1行1イベントの JSON としてファイルへ追記する。
+    バッチごとに開き直すため、ログローテーションでファイルを移動しても追従する。
+    """
+
+    def __init__(self, path: str):
+        self.path = Path(path)
+
+    def write(self, events: Sequence[AuditEvent]) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self.path.open("a", encoding="utf-8") as f:
+            f.write("".join(e.to_json() + "\n" for e in events))
+
+
+class _Flush:
+    def __init__(self):
+        self.done = threading.Event()
+
+
+_STOP = object()
+
+
+class AuditSink:
+    """
+    監査ログをメモリ上にためて、専用スレッドでまとめて書き込む。
+
+    emit() はキューに積むだけで I/O を行わない。書き込みに失敗したバッチは
+    ログに出力して破棄し、件数を failed として数える（認可判定は止めない）。
+    """
+
+    def __init__(
+        self,
+        writer: AuditWriter,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        flush_interval: float = DEFAULT_FLUSH_SECONDS,
+        max_queue: int = DEFAULT_MAX_QUEUE,
+        block_timeout: float = 0.0
+    ):
+        if batch_size < 1:
+            raise ValueError("batch_size must be positive")
+        self.writer = writer
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.block_timeout = block_timeout
+        self._queue: "queue.Queue[Any]" = queue.Queue(maxsize=max_queue)
+        self._lock = threading.Lock()
+        self._closed = False
+        self.emitted = 0
+        self.dropped = 0
+        self.written = 0
+        self.failed = 0
+        self.batches = 0
+        self._thread = threading.Thread(target=self._run, name="cerberus-audit", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def emit(self, event: AuditEvent) -> bool:
+        """
+        イベントをキューに積む。キューが一杯（または停止済み）で積めなかった場合は False。
+        """
+        if self._closed:
+            return self._drop()
+        try:
+            if self.block_timeout > 0:
+                self._queue.put(event, timeout=self.block_timeout)
+            else:
+                self._queue.put_nowait(event)
+        except queue.Full:
+            return self._drop()
+        with self._lock:
+            self.emitted += 1
+        return True
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        呼び出し時点までに積まれたイベントを書き込むまで待つ。タイムアウトした場合は False。
+        """
+        if self._closed or not self._thread.is_alive():
+            return False
+        marker = _Flush()
+        try:
+            self._queue.put(marker, timeout=timeout)
+        except queue.Full:
+            return False
+        return marker.done.wait(timeout)
+
+    def close(self, timeout: Optional[float] = 10.0) -> None:
+        """
+        残りのイベントを書き込んでスレッドを停止する（2回目以降は何もしない）。
+        """
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+        atexit.unregister(self.close)
+        if self._thread.is_alive():
+            try:
+                self._queue.put(_STOP, timeout=timeout)
+            except queue.Full:
+                logger.warning("監査ログのキューが空かないため、書き込みを待たずに停止します")
+                return
+            self._thread.join(timeout)
+
+    def stats(self) -> Dict[str, int]:
+        """監視用の件数（受付・書込・破棄・書込失敗・キュー滞留・バッチ数）を返す。"""
+        with self._lock:
+            return {
+                "emitted": self.emitted,
+                "written": self.written,
+                "dropped": self.dropped,
+                "failed": self.failed,
+                "queued": self._queue.qsize(),
+                "batches": self.batches,
+            }
+
+    def _drop(self) -> bool:
+        with self._lock:
+            self.dropped += 1
+            dropped = self.dropped
+        # 大量に破棄されてもログが溢れないよう、1件目と以降1000件ごとにのみ出力する
+        if dropped == 1 or dropped % 1000 == 0:
+            logger.warning("監査ログのキューが一杯のため破棄しました（累計 %d 件）", dropped)
+        return False
+
+    def _run(self) -> None:
+        batch: List[AuditEvent] = []
+        while True:
+            try:
+                item = self._queue.get(timeout=self.flush_interval)
+            except queue.Empty:
+                self._write(batch)
+                continue
+            if item is _STOP:
+                self._write(batch)
+                return
+            if isinstance(item, _Flush):
+                self._write(batch)
+                item.done.set()
+                continue
+            batch.append(item)
+            if len(batch) >= self.batch_size:
+                self._write(batch)
+
+    def _write(self, batch: List[AuditEvent]) -> None:
+        if not batch:
+            return
+        events = list(batch)
+        batch.clear()
+        try:
+            self.writer.write(events)
+        except Exception:
+            logger.exception("監査ログ %d 件の書き込みに失敗しました", len(events))
+            with self._lock:
+                self.failed += len(events)
+            return
+        with self._lock:
+            self.written += len(events)
+            self.batches += 1
+
+
+def create_audit_sink(spec: Optional[str]) -> Optional[AuditSink]:
+    """
+    出力先の指定（"db" / "ndjson:<パス>"）から AuditSink を作成する（未指定の場合は None）。
+    """
+    if not spec:
+        return None
+    if spec == "db":
+        return AuditSink(DatabaseAuditWriter())
+    if spec.startswith("ndjson:") and spec[len("ndjson:"):]:
+        return AuditSink(NdjsonAuditWriter(spec[len("ndjson:"):]))
+    raise ValueError(f"Unknown audit sink: {spec}")
+
+
+_default_sink: Optional[AuditSink] = None
+_default_lock = threading.Lock()
+
+
+def default_audit_sink() -> Optional[AuditSink]:
+    """
+    環境変数 CERBERUS_AUDIT_SINK で指定された AuditSink を返す（プロセスで1つ）。
+    """
+    global _default_sink
+    spec = os.getenv("CERBERUS_AUDIT_SINK")
+    if not spec:
+        return None
+    with _default_lock:
+        if _default_sink is None:
+            _default_sink = create_audit_sink(spec)
+        return _default_sink
+
+
+# ----------------------------------------------------------------------
+# 割り当て／解除はコミットされたものだけを記録する
+# ----------------------------------------------------------------------
+
+def record_on_commit(session: Session, sink: AuditSink, audit_event: AuditEvent) -> None:
+    """
+    イベントをセッションのコミット時に sink へ送る（ロールバックした場合は破棄する）。
+    """
+    session.info.setdefault(_PENDING_KEY, []).append((sink, audit_event))
+
+
+def _emit_on_commit(session: Session) -> None:
+    for sink, audit_event in session.info.pop(_PENDING_KEY, ()):
+        sink.emit(audit_event)
+
+
+def _discard_on_rollback(session: Session, previous_transaction) -> None:
+    session.info.pop(_PENDING_KEY, None)
+
+
+event.listen(Session, "after_commit", _emit_on_commit)
+event.listen(Session, "after_soft_rollback", _discard_on_rollback)
@@ -0,0 +1,226 @@
+import weakref
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+from sqlalchemy.orm import Session
+from app.common.lru_cache import LruCache
+from app.common.orm_invalidation import current_and_previous, invalidate_on_write
+from app.models.models import Boss
+from app.repositories.boss_repository import BossRepository
+
+######################################################################
+# Copyright 2016–2025 Ryuta Miki. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+######################################################################
+
+
+@dataclass(frozen=True)
+class BossTarget:
+    """
+    上司マスタの検索結果（不変）。
+
+    group_code / application_form_code は一致した上司マスタ側の値で、
+    全般指定（NULL）の行に一致した場合は None になる。
+    """
+    tenant_uuid: str
+    user_uuid: str
+    group_code: Optional[str]
+    application_form_code: Optional[str]
+    boss_tenant_uuid: str
+    boss_group_code: str
+    boss_user_uuid: str
+
+    @classmethod
+    def from_model(cls, boss: Boss) -> "BossTarget":
+        return cls(
+            tenant_uuid=boss.tenant_uuid,
+            user_uuid=boss.user_uuid,
+            group_code=boss.group_code,
+            application_form_code=boss.application_form_code,
+            boss_tenant_uuid=boss.boss_tenant_uuid,
+            boss_group_code=boss.boss_group_code,
+            boss_user_uuid=boss.boss_user_uuid
+        )
+
+
+class BossIndex:
+    """
+    1テナント分の上司マスタをメモリ上に展開したインデックス。
+
+    (user_uuid, group_code, application_form_code) をキーに持ち、
+    フォールバック検索は最大4回の辞書参照で完結する。
+    """
+
+    def __init__(self, tenant_uuid: str, bosses: Iterable[Boss]):
+        self.tenant_uuid = tenant_uuid
+        self._entries: Dict[Tuple[str, Optional[str], Optional[str]], BossTarget] = {}
+        for boss in bosses:
+            key = (boss.user_uuid, boss.group_code, boss.application_form_code)
+            # 同一キーが複数ある場合は DB 検索と同じく id の小さい行を採用する
+            self._entries.setdefault(key, BossTarget.from_model(boss))
+
+    def resolve(
+        self, user_uuid: str, group_code: Optional[str], application_form_code: Optional[str]
+    ) -> Optional[BossTarget]:
+        """BossDao.find_prioritized と同じ優先順位で上司を返す。"""
+        for key in (
+            (user_uuid, group_code, application_form_code),
+            (user_uuid, None, application_form_code),
+            (user_uuid, group_code, None),
+            (user_uuid, None, None)
+        ):
+            target = self._entries.get(key)
+            if target is not None:
+                return target
+        return None
+
+    def resolve_many(
+        self, user_uuid: str, group_code: Optional[str], application_form_codes: Iterable[Optional[str]]
+    ) -> Dict[Optional[str], Optional[BossTarget]]:
+        """申請書ごとに resolve() した結果を返す。"""
+        return {code: self.resolve(user_uuid, group_code, code) for code in application_form_codes}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class BossResolver:
+    """
+    上司マスタのフォールバック検索（部署・申請書の一致 → NULL 指定）を解決するリゾルバ。
+
+    - 通常は BossRepository.find_prioritized_boss による1クエリで解決する。
+    - hot_tenants に登録したテナントは、初回に m_boss を1回読み込んで BossIndex を構築し、
+      以降はメモリ上で解決する。Boss を ORM で書き込むと、そのテナントのインデックスは破棄される。
+    """
+
+    def __init__(
+        self,
+        boss_repository: Optional[BossRepository] = None,
+        hot_tenants: Optional[Iterable[str]] = None,
+        max_indexed_tenants: int = 64
+    ):
+        self.boss_repository = boss_repository or BossRepository()
+        self.hot_tenants: Set[str] = set(hot_tenants or ())
+        self._indexes: LruCache[str, BossIndex] = LruCache(max_indexed_tenants)
+        _resolvers.add(self)
+
+    def enable_index(self, tenant_uuid: str) -> None:
+        """テナントをインデックス対象に追加する。"""
+        self.hot_tenants.add(tenant_uuid)
+
+    def disable_index(self, tenant_uuid: str) -> None:
+        """テナントをインデックス対象から外し、構築済みのインデックスを破棄する。"""
+        self.hot_tenants.discard(tenant_uuid)
+        self._indexes.pop(tenant_uuid)
+
+    def resolve(
+        self,
+        db_session: Session,
+        tenant_uuid: str,
+        user_uuid: str,
+        group_code: Optional[str],
+        application_form_code: Optional[str]
+    ) -> Optional[BossTarget]:
+        """
+        対象ユーザーの上司を優先順位に従って1件返す。
+
+        Args:
+            db_session (Session): DBセッション
+            tenant_uuid (str): テナントUUID
+            user_uuid (str): 対象ユーザーUUID
+            group_code (Optional[str]): 対象部署コード
+            application_form_code (Optional[str]): 申請書コード
+
+        Returns:
+            Optional[BossTarget]: 上司情報、または None
+        """
+        if tenant_uuid in self.hot_tenants:
+            return self._index(db_session, tenant_uuid).resolve(user_uuid, group_code, application_form_code)
+
+        boss = self.boss_repository.find_prioritized_boss(
+            db_session, tenant_uuid, user_uuid, group_code, application_form_code
+        )
+        return BossTarget.from_model(boss) if boss else None
+
+    def resolve_many(
+        self,
+        db_session: Session,
+        tenant_uuid: str,
+        user_uuid: str,
+        group_code: Optional[str],
+        application_form_codes: List[Optional[str]]
+    ) -> Dict[Optional[str], Optional[BossTarget]]:
+        """
+        複数の申請書について、対象ユーザーの上司をまとめて解決する。
+
+        インデックス対象外のテナントでも、ユーザーの上司マスタ候補を1クエリで取得し、
+        申請書ごとのフォールバック検索はメモリ上で行う。
+
+        Returns:
+            Dict[Optional[str], Optional[BossTarget]]: 申請書コード → 上司情報（無ければ None）
+        """
+        if not application_form_codes:
+            return {}
+        if tenant_uuid in self.hot_tenants:
+            index = self._index(db_session, tenant_uuid)
+        else:
+            index = BossIndex(
+                tenant_uuid,
+                self.boss_repository.find_candidates_for_user(db_session, tenant_uuid, user_uuid, group_code)
+            )
+        return index.resolve_many(user_uuid, group_code, application_form_codes)
+
+    def invalidate(self, tenant_uuid: Optional[str] = None) -> None:
+        """インデックスを破棄する。テナント省略時は全テナント分を破棄する。"""
+        if tenant_uuid is None:
+            self._indexes.clear()
+        else:
+            self._indexes.pop(tenant_uuid)
+
+    def cached_index(self, tenant_uuid: str) -> Optional[BossIndex]:
+        """構築済みのインデックスを返す（未構築なら None）。"""
+        return self._indexes.get(tenant_uuid)
+
+    def store_index(self, index: BossIndex) -> BossIndex:
+        """呼び出し側（非同期版など）で構築したインデックスを登録する。"""
+        self._indexes.put(index.tenant_uuid, index)
+        return index
+
+    def _index(self, db_session: Session, tenant_uuid: str) -> BossIndex:
+        index = self.cached_index(tenant_uuid)
+        if index is None:
+            index = self.store_index(
+                BossIndex(tenant_uuid, self.boss_repository.find_by_tenant(db_session, tenant_uuid))
+            )
+        return index
+
+
+# ----------------------------------------------------------------------
+# ORM 書き込み時の無効化
+# ----------------------------------------------------------------------
+
+_resolvers: "weakref.WeakSet[BossResolver]" = weakref.WeakSet()
+
+
+def _invalidate(tenant_uuids: Set[str]) -> None:
+    for resolver in list(_resolvers):
+        for tenant_uuid in tenant_uuids:
+            resolver.invalidate(tenant_uuid)
+
+
+def _invalidate_all() -> None:
+    for resolver in list(_resolvers):
+        resolver.invalidate()
+
+
+invalidate_on_write((Boss,), lambda target: current_and_previous(target, "tenant_uuid"), _invalidate, _invalidate_all)
@@ -1,5 +1,18 @@
+from datetime import date
+from typing import Any, Callable, Dict, FrozenSet, Hashable, Iterable, List, Mapping, Optional, Sequence, Set, Tuple
+from sqlalchemy import ColumnElement
 from sqlalchemy.orm import Session
+from app.database.connection import SessionLocal
+from app.engine.policy_condition import PolicyConditionError, compile_condition
+from app.dtos.assignment_result_dto import AssignmentResultDto, AssignmentStatus
+from app.engine.audit_sink import AuditEvent, AuditSink, default_audit_sink, record_on_commit
+from app.engine.decision_cache import DecisionCache, default_decision_cache
+from app.engine.policy_index import (
+    DEFAULT_VERSION_CHECK_SECONDS, PolicyIndex, default_policy_index, record_bulk_insert, record_reload
+)
 from app.repositories.user_role_repository import UserRoleRepository
+from app.repositories.group_role_repository import GroupRoleRepository
+from app.repositories.group_closure_repository import GroupClosureRepository
 from app.repositories.role_permission_repository import RolePermissionRepository
 from app.repositories.policy_repository import PolicyRepository
 
@@ -31,35 +44,278 @@ class Cerberus:
     【非責務】
     - 承認者の決定
     - 承認ルート構築（LaubeEngine等の役割）
+
+    認可判定（check）は PolicyIndex（ユーザー → ロール → (パーミッション, リソース)）で行い、
+    DBを参照しない。割り当て／解除の結果はコミット時にインデックスへ反映される。
+    同じ (ユーザー, パーミッション, リソース) の判定結果は DecisionCache に保持する（拒否も含む）。
+    部署の所属の有効期間は today()（省略時は date.today）の日付で判定し、日付が変わると判定キャッシュを破棄する。
+
+    他のワーカーでの割り当て／解除は、version_check_interval 秒ごとに m_policy_version の
+    版数を確認して検出し、インデックスの再読込とキャッシュの破棄を行う
+    （version_check_interval=0 の場合は判定のたびに確認する）。
+
+    audit_sink（省略時は環境変数 CERBERUS_AUDIT_SINK の設定）を指定すると、判定結果と
+    コミットされた割り当て／解除を監査ログとして非同期に記録する。
     """
-    def __init__(self):
+    def __init__(
+        self,
+        policy_index: Optional[PolicyIndex] = None,
+        session_factory: Callable[[], Session] = SessionLocal,
+        decision_cache: Optional[DecisionCache] = None,
+        version_check_interval: float = DEFAULT_VERSION_CHECK_SECONDS,
+        audit_sink: Optional[AuditSink] = None,
+        today: Callable[[], date] = date.today
+    ):
         self.user_role_repo = UserRoleRepository()
         self.role_permission_repo = RolePermissionRepository()
         self.policy_repo = PolicyRepository()
+        self.group_role_repo = GroupRoleRepository()
+        self.group_closure_repo = GroupClosureRepository()
+        self.policy_index = policy_index or default_policy_index
+        self.session_factory = session_factory
+        self.decision_cache = decision_cache or default_decision_cache
+        self.version_check_interval = version_check_interval
+        self.audit_sink = audit_sink if audit_sink is not None else default_audit_sink()
+        self.today = today
+
+    def check(
+        self,
+        user_id: str,
+        permission_id: str,
+        resource_id: str,
+        context: Optional[Mapping[str, Any]] = None
+    ) -> bool:
+        """
+        ユーザーがリソースに対してパーミッションを持つかを判定する。
+
+        判定はメモリ上の PolicyIndex で行い、条件を評価しなかった判定の結果はキャッシュする。
+        インデックスが未読込・不整合の場合、または他ワーカーでの書き込みを検出した場合のみ、
+        session_factory のセッションで読み込み直す。
+
+        Args:
+            user_id (str): ユーザーID
+            permission_id (str): パーミッションID
+            resource_id (str): リソースID
+            context (Optional[Mapping[str, Any]]): 条件付きポリシーの評価に使う属性
+                （build_context() で作成する。省略時は現在時刻のみ）
+
+        Returns:
+            bool: 許可されていれば True
+        """
+        self.policy_index.ensure_current(self.session_factory, self.version_check_interval)
+        key = (user_id, permission_id, resource_id)
+        # 判定より前に世代番号を取ることで、判定中に変更された場合の結果は登録されない
+        generation = self.policy_index.generation
+        # 部署の所属は有効期間で判定するため、基準日もキャッシュの世代に含める
+        system_date = self.today()
+        allowed = self.decision_cache.get(key, generation, system_date)
+        if allowed is None:
+            allowed, cacheable = self.policy_index.decide(
+                user_id, permission_id, resource_id, context, system_date
+            )
+            if cacheable:
+                self.decision_cache.put(key, allowed, generation, system_date)
+        if self.audit_sink is not None:
+            self.audit_sink.emit(AuditEvent(
+                "check", user_id=user_id, permission_id=permission_id, resource_id=resource_id, allowed=allowed
+            ))
+        return allowed
+
+    @property
+    def decision_cache_stats(self) -> Dict[str, Any]:
+        """判定キャッシュのヒット率・件数・追い出し数・無効化回数を返す。"""
+        return self.decision_cache.stats()
+
+    def filter_allowed(
+        self,
+        user_id: str,
+        permission_id: str,
+        resource_ids: Iterable[str],
+        context: Optional[Mapping[str, Any]] = None
+    ) -> Set[str]:
+        """
+        resource_ids のうち、ユーザーがパーミッションを持つものを返す（一覧画面の絞り込み用）。
+
+        PolicyIndex 上の集合演算で判定するため、件数分 check() を呼ぶ必要はない。
+        条件付きポリシーは全リソース共通の context で評価する。
+
+        Args:
+            user_id (str): ユーザーID
+            permission_id (str): パーミッションID
+            resource_ids (Iterable[str]): 判定対象のリソースID
+            context (Optional[Mapping[str, Any]]): 条件付きポリシーの評価に使う属性
+
+        Returns:
+            Set[str]: 許可されたリソースID
+        """
+        self.policy_index.ensure_current(self.session_factory, self.version_check_interval)
+        if self.audit_sink is None:
+            return self.policy_index.filter_allowed(user_id, permission_id, resource_ids, context)
+
+        resource_ids = list(resource_ids)
+        allowed = self.policy_index.filter_allowed(user_id, permission_id, resource_ids, context)
+        self.audit_sink.emit(AuditEvent(
+            "filter", user_id=user_id, permission_id=permission_id,
+            detail={"allowed": sorted(allowed), "denied": sorted(set(resource_ids) - allowed)}
+        ))
+        return allowed
 
-    def assign_role_to_user(self, db: Session, user_id: str, role_id: str):
+    def allowed_resource_filter(
+        self, column: ColumnElement, user_id: str, permission_id: str, system_date: Optional[date] = None
+    ) -> ColumnElement:
+        """
+        column（リソースIDの列）を許可されたリソースに絞り込む WHERE 条件を返す。
+
+        m_user_role・m_group_role（所属部署と上位部署からの継承）/ m_policy を参照するサブクエリ（IN 句）なので、
+        DAO の一覧取得にそのまま渡せば、取得後に Python で間引く必要がない。
+        条件付きポリシーは評価できないため、この絞り込みでは許可しない側に倒す。
+
+        使用例:
+            db.query(Form).filter(cerberus.allowed_resource_filter(Form.resource_id, user_id, "read"))
+        """
+        return column.in_(self.policy_repo.allowed_resource_ids(user_id, permission_id, system_date))
+
+    @property
+    def condition_metrics(self) -> Dict[str, Any]:
+        """条件のコンパイル回数・評価回数・累積評価時間を返す。"""
+        return self.policy_index.condition_compiler.metrics.snapshot()
+
+    def load_index(self, db: Session) -> None:
+        """
+        指定セッションで認可インデックスを読み込み直す。
+
+        部署階層の閉包（m_group_closure）が作られていない部署があれば、先にそのテナントの閉包を作り直す
+        （rebuild_missing_group_closures）。作り直した場合のコミットは呼び出し元で行う。
+        """
+        self.rebuild_missing_group_closures(db)
+        self.policy_index.load(db)
+
+    def warm_start(self, snapshot_path: str) -> str:
+        """
+        ワーカー起動時に、スナップショットから認可インデックスを読み込む。
+        DBの版数が進んでいれば差分のみを取得して追いつく（PolicyIndex.load_snapshot）。
+
+        Returns:
+            str: "current" / "caught_up" / "loaded"
+        """
+        with self.session_factory() as db:
+            if self.rebuild_missing_group_closures(db):
+                db.commit()
+            return self.policy_index.load_snapshot(db, snapshot_path)
+
+    def save_snapshot(self, snapshot_path: str) -> int:
+        """
+        認可インデックスをスナップショットとして書き出す（未読込の場合は先に読み込む）。
+        """
+        self.policy_index.ensure_current(self.session_factory, self.version_check_interval)
+        return self.policy_index.save_snapshot(snapshot_path)
+
+    def assign_role_to_user(self, db: Session, user_id: str, role_id: str, operator_uuid: str = "system"):
         """
         ユーザーにロールを割り当てる。
         """
-        return self.user_role_repo.assign_role_to_user(db, user_id, role_id)
+        user_role = self.user_role_repo.assign_role_to_user(db, user_id, role_id, operator_uuid)
+        self._audit(db, "assign_role", operator_uuid, user_id=user_id, role_id=role_id)
+        return user_role
 
-    def revoke_role_from_user(self, db: Session, user_id: str, role_id: str):
+    def revoke_role_from_user(self, db: Session, user_id: str, role_id: str, operator_uuid: str = "system"):
         """
         ユーザーからロールを解除する。
         """
         self.user_role_repo.revoke_role_from_user(db, user_id, role_id)
+        self._audit(db, "revoke_role", operator_uuid, user_id=user_id, role_id=role_id)
+
+    def roles_of(self, user_id: str, system_date: Optional[date] = None) -> FrozenSet[str]:
+        """
+        ユーザーの実効ロール（直接割り当て＋所属部署・上位部署から継承したもの）を返す。
+        """
+        self.policy_index.ensure_current(self.session_factory, self.version_check_interval)
+        return self.policy_index.roles_of(user_id, system_date)
+
+    def permissions_of(self, user_id: str, system_date: Optional[date] = None) -> FrozenSet[str]:
+        """
+        ユーザーがいずれかのリソースに対して持つパーミッションを返す（画面・API単位の粗い認可用）。
+        """
+        self.policy_index.ensure_current(self.session_factory, self.version_check_interval)
+        return self.policy_index.permissions_of(user_id, system_date)
 
-    def assign_permission_to_role(self, db: Session, role_id: str, permission_id: str):
+    def has_permission(self, user_id: str, permission_id: str) -> bool:
+        """
+        ユーザーがいずれかのリソースに対してパーミッションを持つかを返す。
+        """
+        return permission_id in self.permissions_of(user_id)
+
+    @property
+    def policy_version(self) -> Optional[int]:
+        """
+        認可インデックスの版数（m_policy_version）。確認間隔を過ぎていればDBの版数と照合してから返す。
+        """
+        self.policy_index.ensure_current(self.session_factory, self.version_check_interval)
+        return self.policy_index.version
+
+    def assign_role_to_group(
+        self, db: Session, tenant_uuid: str, group_code: str, role_id: str, operator_uuid: str = "system"
+    ):
+        """
+        部署にロールを割り当てる。配下の部署（m_group.upper_group_code で辿れる部署）にも継承される。
+        """
+        group_role = self.group_role_repo.assign_role_to_group(db, tenant_uuid, group_code, role_id, operator_uuid)
+        self._audit(
+            db, "assign_group_role", operator_uuid, role_id=role_id,
+            detail={"tenant_uuid": tenant_uuid, "group_code": group_code}
+        )
+        return group_role
+
+    def revoke_role_from_group(
+        self, db: Session, tenant_uuid: str, group_code: str, role_id: str, operator_uuid: str = "system"
+    ):
+        """
+        部署からロールを解除する。
+        """
+        self.group_role_repo.revoke_role_from_group(db, tenant_uuid, group_code, role_id)
+        self._audit(
+            db, "revoke_group_role", operator_uuid, role_id=role_id,
+            detail={"tenant_uuid": tenant_uuid, "group_code": group_code}
+        )
+
+    def rebuild_group_closure(self, db: Session, tenant_uuid: str) -> int:
+        """
+        部署階層の閉包（m_group_closure）を m_group から作り直す。
+        通常は m_group の変更時に自動で更新されるため、初期構築や SQL で直接変更した後に使う。
+        コミット時に認可インデックスを再読込する（他のワーカーも版数の変化で再読込する）。
+        """
+        count = self.group_closure_repo.rebuild(db, tenant_uuid)
+        record_reload(db)
+        return count
+
+    def rebuild_missing_group_closures(self, db: Session) -> Dict[str, int]:
+        """
+        閉包が作られていない部署（閉包の導入前から存在する部署など）のあるテナントだけ閉包を作り直し、
+        テナントごとの作成行数を返す。ワーカーの起動時（load_index・warm_start）に実行される。
+        """
+        rebuilt = self.group_closure_repo.rebuild_missing(db)
+        if rebuilt:
+            record_reload(db)
+        return rebuilt
+
+    def assign_permission_to_role(self, db: Session, role_id: str, permission_id: str, operator_uuid: str = "system"):
         """
         ロールにパーミッションを割り当てる。
         """
-        return self.role_permission_repo.assign_permission_to_role(db, role_id, permission_id)
+        role_permission = self.role_permission_repo.assign_permission_to_role(db, role_id, permission_id, operator_uuid)
+        self._audit(db, "assign_permission", operator_uuid, role_id=role_id, permission_id=permission_id)
+        return role_permission
 
-    def revoke_permission_from_role(self, db: Session, role_id: str, permission_id: str):
+    def revoke_permission_from_role(self, db: Session, role_id: str, permission_id: str, operator_uuid: str = "system"):
         """
         ロールからパーミッションを解除する。
+        policyが関連している場合は削除不可。
         """
+        if self.policy_repo.has_policy(db, role_id, permission_id):
+            raise ValueError(f"Permission {permission_id} is still used in policies for Role {role_id}")
+
         self.role_permission_repo.revoke_permission_from_role(db, role_id, permission_id)
+        self._audit(db, "revoke_permission", operator_uuid, role_id=role_id, permission_id=permission_id)
 
     def assign_resource_to_role(
         self,
@@ -67,19 +323,162 @@ class Cerberus:
         role_id: str,
         permission_id: str,
         resource_id: str,
-        condition: str = None
+        condition: str = None,
+        operator_uuid: str = "system"
     ):
         """
         ポリシーを作成して、ロールにリソースとパーミッションを割り当てる。
         事前にrole-permissionに存在しないとエラー。
+        条件（condition）を解釈できない場合は PolicyConditionError（ValueError）。
         """
+        if condition:
+            compile_condition(condition)
         if not self.role_permission_repo.has_permission(db, role_id, permission_id):
             raise ValueError(f"Permission {permission_id} is not assigned to Role {role_id}")
 
-        return self.policy_repo.assign_resource_to_role(db, role_id, permission_id, resource_id, condition)
+        policy = self.policy_repo.assign_resource_to_role(
+            db, role_id, permission_id, resource_id, condition, operator_uuid
+        )
+        self._audit(
+            db, "assign_policy", operator_uuid, role_id=role_id, permission_id=permission_id,
+            resource_id=resource_id, detail={"condition": condition} if condition else None
+        )
+        return policy
 
-    def revoke_resource_from_role(self, db: Session, role_id: str, permission_id: str, resource_id: str):
+    def revoke_resource_from_role(
+        self, db: Session, role_id: str, permission_id: str, resource_id: str, operator_uuid: str = "system"
+    ):
         """
         ロールからリソースとパーミッションのポリシーを削除する。
         """
         self.policy_repo.revoke_resource_from_role(db, role_id, permission_id, resource_id)
+        self._audit(
+            db, "revoke_policy", operator_uuid, role_id=role_id, permission_id=permission_id, resource_id=resource_id
+        )
+
+    def _audit(self, db: Session, event_type: str, operator_uuid: str, **fields) -> None:
+        # 割り当て／解除はコミットされた時点で記録する（ロールバックした場合は記録しない）
+        if self.audit_sink is not None:
+            record_on_commit(db, self.audit_sink, AuditEvent(event_type, operator_uuid=operator_uuid, **fields))
+
+    # ------------------------------------------------------------------
+    # 一括割り当て（オンボーディング用）
+    #   いずれも検証・既存確認は集合単位のクエリ（500件ごとに1回）で行い、登録は1回の
+    #   executemany（ON CONFLICT DO NOTHING）で行う。コミットは呼び出し側で1回だけ行うこと。
+    #   結果は依頼と同じ順序で1件ずつ返す。
+    # ------------------------------------------------------------------
+
+    def assign_roles_to_users(
+        self, db: Session, pairs: Iterable[Tuple[str, str]], operator_uuid: str = "system"
+    ) -> List[AssignmentResultDto]:
+        """
+        (ユーザーID, ロールID) の組を一括でユーザーに割り当てる。
+
+        Returns:
+            List[AssignmentResultDto]: 組ごとの結果（created / exists / duplicate）
+        """
+        results, pending = _deduplicate(pairs)
+        existing = self.user_role_repo.find_existing_pairs(db, pending)
+        created = set(self.user_role_repo.bulk_assign_roles_to_users(
+            db, [key for key in pending if key not in existing], operator_uuid
+        ))
+        record_bulk_insert(db, user_roles=created)
+        for user_id, role_id in created:
+            self._audit(db, "assign_role", operator_uuid, user_id=user_id, role_id=role_id)
+        return _resolve(results, pending, created)
+
+    def assign_permissions_to_roles(
+        self, db: Session, pairs: Iterable[Tuple[str, str]], operator_uuid: str = "system"
+    ) -> List[AssignmentResultDto]:
+        """
+        (ロールID, パーミッションID) の組を一括でロールに割り当てる。
+
+        Returns:
+            List[AssignmentResultDto]: 組ごとの結果（created / exists / duplicate）
+        """
+        results, pending = _deduplicate(pairs)
+        existing = self.role_permission_repo.find_existing_pairs(db, pending)
+        created = set(self.role_permission_repo.bulk_assign_permissions_to_roles(
+            db, [key for key in pending if key not in existing], operator_uuid
+        ))
+        for role_id, permission_id in created:
+            self._audit(db, "assign_permission", operator_uuid, role_id=role_id, permission_id=permission_id)
+        return _resolve(results, pending, created)
+
+    def assign_resources_to_roles(
+        self,
+        db: Session,
+        policies: Iterable[Sequence[Optional[str]]],
+        operator_uuid: str = "system"
+    ) -> List[AssignmentResultDto]:
+        """
+        (ロールID, パーミッションID, リソースID[, 条件]) のポリシーを一括で作成する。
+
+        ロールにパーミッションが割り当てられていないもの（m_role_permission を1回の集合検索で確認）と、
+        条件を解釈できないものは rejected になる。同じロール・パーミッション・リソース・条件の
+        ポリシーが登録済みの場合は exists。
+
+        Returns:
+            List[AssignmentResultDto]: ポリシーごとの結果
+        """
+        keys = [
+            (role_id, permission_id, resource_id, (rest[0] if rest else None) or None)
+            for role_id, permission_id, resource_id, *rest in policies
+        ]
+        results, pending = _deduplicate(keys)
+
+        for key, index in list(pending.items()):
+            if key[3] is not None:
+                try:
+                    compile_condition(key[3])
+                except PolicyConditionError as e:
+                    results[index] = _result(index, key, AssignmentStatus.REJECTED, str(e))
+                    del pending[key]
+        granted = self.role_permission_repo.find_existing_pairs(db, {key[:2] for key in pending})
+        for key, index in list(pending.items()):
+            if key[:2] not in granted:
+                reason = f"Permission {key[1]} is not assigned to Role {key[0]}"
+                results[index] = _result(index, key, AssignmentStatus.REJECTED, reason)
+                del pending[key]
+
+        existing = self.policy_repo.find_existing_policies(db, {key[:3] for key in pending})
+        rows = self.policy_repo.bulk_assign_resources_to_roles(
+            db, [key for key in pending if key not in existing], operator_uuid
+        )
+        record_bulk_insert(db, policies=rows)
+        for _, role_id, permission_id, resource_id, condition in rows:
+            self._audit(
+                db, "assign_policy", operator_uuid, role_id=role_id, permission_id=permission_id,
+                resource_id=resource_id, detail={"condition": condition} if condition else None
+            )
+        return _resolve(results, pending, {row[1:] for row in rows})
+
+
+def _result(index: int, key: Tuple, status: AssignmentStatus, reason: Optional[str] = None) -> AssignmentResultDto:
+    return AssignmentResultDto(index=index, key=list(key), status=status, reason=reason)
+
+
+def _deduplicate(
+    keys: Iterable[Tuple]
+) -> Tuple[List[Optional[AssignmentResultDto]], Dict[Tuple, int]]:
+    """依頼内の重複を duplicate にし、(結果の枠, 未処理のキー → 位置) を返す。"""
+    results: List[Optional[AssignmentResultDto]] = []
+    pending: Dict[Tuple, int] = {}
+    for index, key in enumerate(keys):
+        key = tuple(key)
+        if key in pending:
+            results.append(_result(index, key, AssignmentStatus.DUPLICATE))
+        else:
+            results.append(None)
+            pending[key] = index
+    return results, pending
+
+
+def _resolve(
+    results: List[Optional[AssignmentResultDto]], pending: Dict[Tuple, int], created: Set[Hashable]
+) -> List[AssignmentResultDto]:
+    # 事前確認の後に他のトランザクションが登録した組は、ON CONFLICT で読み飛ばされ exists になる
+    for key, index in pending.items():
+        status = AssignmentStatus.CREATED if key in created else AssignmentStatus.EXISTS
+        results[index] = _result(index, key, status)
+    return results
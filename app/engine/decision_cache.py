@@ -0,0 +1,91 @@
+import os
+import threading
+from datetime import date
+from typing import Any, Dict, Optional, Tuple
+from app.common.lru_cache import LruCache
+
+######################################################################
+# Copyright 2016–2025 Ryuta Miki. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+######################################################################
+
+DEFAULT_MAXSIZE = int(os.getenv("CERBERUS_DECISION_CACHE_SIZE", "100000"))
+
+# (user_id, permission_id, resource_id)
+DecisionKey = Tuple[str, str, str]
+
+
+class DecisionCache:
+    """
+    Cerberus の認可判定結果（許可・拒否の両方）を保持する LRU キャッシュ。
+
+    エントリは PolicyIndex の世代番号（generation）と判定の基準日に紐づき、新しい世代・基準日で
+    参照された時点で全件破棄する。世代番号はインデックスへの差分反映・再読込のたびに変わるため、
+    割り当て・解除（他ワーカーの分は m_policy_version の版数で検出して再読込）の後に
+    古い判定結果が返ることはない。部署の所属は有効期間で判定するため、日付が変わった場合も破棄する。
+
+    世代の確認と参照・登録は1つのロックの中で行い、古い世代で判定した結果は登録しない
+    （判定中に別スレッドが新しい世代へ進めた場合に、古い結果が新しい世代で返らないようにする）。
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_MAXSIZE):
+        self._cache: LruCache[DecisionKey, bool] = LruCache(maxsize=maxsize)
+        # (世代番号, 基準日)
+        self._stamp: Optional[Tuple[int, date]] = None
+        self._lock = threading.Lock()
+        self.invalidations = 0
+
+    def get(self, key: DecisionKey, generation: int, day: date) -> Optional[bool]:
+        """判定結果を返す（無い場合、または古い世代・基準日での参照の場合は None）。"""
+        with self._lock:
+            if not self._sync((generation, day)):
+                return None
+            return self._cache.get(key)
+
+    def put(self, key: DecisionKey, allowed: bool, generation: int, day: date) -> None:
+        """判定結果を登録する（古い世代・基準日で判定した結果は登録しない）。"""
+        with self._lock:
+            if self._sync((generation, day)):
+                self._cache.put(key, allowed)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._cache.clear()
+            self._stamp = None
+
+    def stats(self) -> Dict[str, Any]:
+        """監視用のヒット率・件数・追い出し数・無効化回数を返す。"""
+        stats: Dict[str, Any] = dict(self._cache.stats())
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_ratio"] = stats["hits"] / lookups if lookups else 0.0
+        stats["invalidations"] = self.invalidations
+        return stats
+
+    def reset_stats(self) -> None:
+        self._cache.reset_stats()
+        self.invalidations = 0
+
+    def _sync(self, stamp: Tuple[int, date]) -> bool:
+        # 世代番号は増える一方なので、保持している世代より古い参照はキャッシュを使わせない
+        if self._stamp is not None and stamp < self._stamp:
+            return False
+        if stamp != self._stamp:
+            self._cache.clear()
+            if self._stamp is not None:
+                self.invalidations += 1
+            self._stamp = stamp
+        return True
+
+
+default_decision_cache = DecisionCache()
@@ -0,0 +1,175 @@
+import threading
+from datetime import date, datetime
+from typing import Any, Callable, Dict, Optional
+from app.common.error_message_loader import DEFAULT_MESSAGES_PATH, ErrorMessageLoader
+from app.common.utility import Utility
+from app.engine.approver_resolver import ApproverResolver
+from app.engine.boss_resolver import BossResolver
+from app.engine.maintenance_registry import MaintenanceRegistry, default_maintenance_registry
+from app.engine.master_data_resolver import MasterDataCache, default_master_data_cache
+from app.engine.route_expander import RouteExpander
+from app.engine.route_plan_cache import RoutePlanCache, default_route_plan_cache
+from app.repositories.application_form_repository import ApplicationFormRepository
+from app.repositories.application_form_route_repository import ApplicationFormRouteRepository
+from app.repositories.boss_repository import BossRepository
+from app.repositories.individual_activity_repository import IndividualActivityRepository
+from app.repositories.role_repository import RoleRepository
+from app.repositories.tenant_user_repository import TenantUserRepository
+from app.repositories.user_group_repository import UserGroupRepository
+
+######################################################################
+# Copyright 2016–2025 Ryuta Miki. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+######################################################################
+
+
+class EngineContext:
+    """
+    エンジン（Laube / AsyncLaube）が使う部品をまとめて保持するコンテナ。
+
+    リポジトリ・リゾルバ・メッセージ定義は初回参照時に1回だけ生成し、同じコンテキストを
+    使うエンジンインスタンス間・リクエスト間で共有する。リポジトリはDBセッションを
+    引数で受け取り状態を持たないため、スレッド間で共有してよい。
+
+    テストで部品を差し替える（MagicMock を代入する）場合は、共有コンテキストを汚さないよう
+    EngineContext() を新規に作成して Laube(context=...) に渡すこと。
+    """
+
+    def __init__(
+        self,
+        messages_path: str = DEFAULT_MESSAGES_PATH,
+        clock: Callable[[], datetime] = datetime.now,
+        route_plan_cache: Optional[RoutePlanCache] = None,
+        master_data_cache: Optional[MasterDataCache] = None,
+        maintenance_registry: Optional[MaintenanceRegistry] = None
+    ):
+        self.messages_path = messages_path
+        self.clock = clock
+        self._route_plan_cache = route_plan_cache
+        self._master_data_cache = master_data_cache
+        self._maintenance_registry = maintenance_registry
+        self._components: Dict[str, Any] = {}
+        # リゾルバの生成中に他の部品を参照するため再入可能なロックにする
+        self._lock = threading.RLock()
+
+    # ------------------------------------------------------------------
+    # 時刻
+    # ------------------------------------------------------------------
+    def now(self) -> datetime:
+        """現在日時（clock で差し替え可能）を返す。"""
+        return self.clock()
+
+    def today(self) -> date:
+        """有効期限判定などに使うシステム日付を返す。"""
+        return self.utility.convert_datetime_2_date(self.clock())
+
+    # ------------------------------------------------------------------
+    # 共有部品（初回参照時に生成）
+    # ------------------------------------------------------------------
+    @property
+    def utility(self) -> Utility:
+        return self._get("utility", Utility)
+
+    @property
+    def error_loader(self) -> ErrorMessageLoader:
+        return self._get("error_loader", lambda: ErrorMessageLoader(self.messages_path))
+
+    @property
+    def boss_repository(self) -> BossRepository:
+        return self._get("boss_repository", BossRepository)
+
+    @property
+    def application_form_repository(self) -> ApplicationFormRepository:
+        return self._get("application_form_repository", ApplicationFormRepository)
+
+    @property
+    def application_form_route_repository(self) -> ApplicationFormRouteRepository:
+        return self._get("application_form_route_repository", ApplicationFormRouteRepository)
+
+    @property
+    def tenant_user_repository(self) -> TenantUserRepository:
+        return self._get("tenant_user_repository", TenantUserRepository)
+
+    @property
+    def user_group_repository(self) -> UserGroupRepository:
+        return self._get("user_group_repository", UserGroupRepository)
+
+    @property
+    def individual_activity_repository(self) -> IndividualActivityRepository:
+        return self._get("individual_activity_repository", IndividualActivityRepository)
+
+    @property
+    def role_repository(self) -> RoleRepository:
+        return self._get("role_repository", RoleRepository)
+
+    @property
+    def route_plan_cache(self) -> RoutePlanCache:
+        return self._route_plan_cache or default_route_plan_cache
+
+    @property
+    def master_data_cache(self) -> MasterDataCache:
+        return self._master_data_cache or default_master_data_cache
+
+    @property
+    def maintenance_registry(self) -> MaintenanceRegistry:
+        return self._maintenance_registry or default_maintenance_registry
+
+    @property
+    def approver_resolver(self) -> ApproverResolver:
+        return self._get("approver_resolver", lambda: ApproverResolver(
+            error_loader=self.error_loader,
+            tenant_user_repository=self.tenant_user_repository,
+            user_group_repository=self.user_group_repository,
+            role_repository=self.role_repository,
+            master_data_cache=self.master_data_cache
+        ))
+
+    @property
+    def boss_resolver(self) -> BossResolver:
+        return self._get("boss_resolver", lambda: BossResolver(boss_repository=self.boss_repository))
+
+    @property
+    def route_expander(self) -> RouteExpander:
+        return self._get("route_expander", lambda: RouteExpander(
+            error_loader=self.error_loader,
+            application_form_repository=self.application_form_repository,
+            application_form_route_repository=self.application_form_route_repository,
+            boss_resolver=self.boss_resolver,
+            route_plan_cache=self.route_plan_cache,
+            approver_resolver=self.approver_resolver
+        ))
+
+    def _get(self, name: str, factory: Callable[[], Any]) -> Any:
+        component = self._components.get(name)
+        if component is None:
+            with self._lock:
+                component = self._components.get(name)
+                if component is None:
+                    component = factory()
+                    self._components[name] = component
+        return component
+
+
+_default_context: Optional[EngineContext] = None
+_default_context_lock = threading.Lock()
+
+
+def get_default_context() -> EngineContext:
+    """プロセス共有の EngineContext を返す。"""
+    global _default_context
+    if _default_context is None:
+        with _default_context_lock:
+            if _default_context is None:
+                _default_context = EngineContext()
+    return _default_context
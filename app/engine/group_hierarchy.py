@@ -0,0 +1,89 @@
+from typing import List
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session
+from app.daos.group_closure_dao import GroupClosureDao
+from app.models.models import Group
+
+######################################################################
+# Copyright 2016–2025 Ryuta Miki. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+######################################################################
+
+# ----------------------------------------------------------------------
+# m_group の変更を部署階層の閉包（m_group_closure）へ差分で反映する。
+#
+# ORM で Group を追加・更新・削除すると、同じフラッシュ（同じトランザクション）の中で
+# 閉包の行を追加・削除する。部署の移動は「配下ごと上位部署から切り離して、新しい
+# 上位部署の下に接続する」操作になり、影響するのは移動した部署の配下と上位の組み合わせのみ。
+# Query.update() / delete() や SQL で直接 m_group を変更した場合は反映されないため、
+# GroupClosureDao.rebuild() で作り直すこと。
+# ----------------------------------------------------------------------
+
+_dao = GroupClosureDao()
+
+
+def _history(target: Group, attribute: str):
+    return inspect(target).attrs[attribute].history
+
+
+def _previous(target: Group, attribute: str):
+    deleted = _history(target, attribute).deleted
+    return deleted[0] if deleted else getattr(target, attribute)
+
+
+def _has_upper(group: Group) -> bool:
+    # 自部署を上位部署に指定している行は最上位の部署として扱う
+    return bool(group.upper_group_code) and group.upper_group_code != group.group_code
+
+
+def _maintain_closure(session: Session, flush_context) -> None:
+    deleted: List[Group] = [obj for obj in session.deleted if isinstance(obj, Group)]
+    new: List[Group] = [obj for obj in session.new if isinstance(obj, Group)]
+    dirty: List[Group] = [
+        obj for obj in session.dirty
+        if isinstance(obj, Group) and obj not in session.deleted and session.is_modified(obj)
+    ]
+    if not (deleted or new or dirty):
+        return
+
+    for group in deleted:
+        _dao.remove_group(session, _previous(group, "tenant_uuid"), _previous(group, "group_code"))
+
+    for group in new:
+        _dao.add_group(session, group.tenant_uuid, group.group_code)
+
+    moved: List[Group] = [group for group in new if _has_upper(group)]
+    for group in dirty:
+        tenant_uuid = _previous(group, "tenant_uuid")
+        if tenant_uuid != group.tenant_uuid:
+            # テナントの付け替えは、旧テナントから削除して新テナントに追加し直す
+            _dao.remove_group(session, tenant_uuid, _previous(group, "group_code"))
+            _dao.add_group(session, group.tenant_uuid, group.group_code)
+            if _has_upper(group):
+                moved.append(group)
+            continue
+        old_code = _previous(group, "group_code")
+        if old_code != group.group_code:
+            _dao.rename_group(session, group.tenant_uuid, old_code, group.group_code)
+        if _history(group, "upper_group_code").has_changes():
+            _dao.detach(session, group.tenant_uuid, group.group_code)
+            if _has_upper(group):
+                moved.append(group)
+
+    # 追加・移動された部署を上位部署の下に接続する（接続の順序によらず結果は同じ）
+    for group in moved:
+        _dao.attach(session, group.tenant_uuid, group.group_code, group.upper_group_code)
+
+
+event.listen(Session, "after_flush", _maintain_closure)
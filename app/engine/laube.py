@@ -1,25 +1,16 @@
-from datetime import date, datetime
-from typing import List, Optional
+from typing import Callable, Dict, List, Optional
 from functools import wraps
-from app.database.connection import get_db
 from sqlalchemy.orm import Session
-from app.models.specifiedValue import ActivityStatus, ApprovalFunction, AutoApproverlFlag, RouteFlag, RouteType
+from app.models.specifiedValue import RouteFlag
 from app.dtos.application_info_dto import ApplicationInfoDto
-from app.models.models import Role
+from app.models.models import ApplicationForm, ApplicationFormRoute
 from app.dtos.approverl_info_dto import ApproverlInfoDto
-from app.repositories.boss_repository import BossRepository
-from app.repositories.application_form_repository import ApplicationFormRepository
-from app.repositories.application_form_route_repository import ApplicationFormRouteRepository
-from app.repositories.tenant_user_repository import TenantUserRepository
-from app.repositories.user_group_repository import UserGroupRepository
-from app.repositories.individual_activity_repository import IndividualActivityRepository
-from app.repositories.role_repository import RoleRepository
-from app.common.utility import Utility
-from app.common.error_message_loader import ErrorMessageLoader
+from app.engine.boss_resolver import BossTarget
+from app.engine.engine_context import EngineContext, get_default_context
+from app.engine.master_data_resolver import MasterDataCache, MasterDataResolver
+from app.engine.route_expander import RouteExpansion
+from app.engine.route_plan_cache import RoutePlanCache
 from app.exception.laubeException import LaubeException
-from datetime import datetime
-from typing import Optional
-from sqlalchemy.orm import Session
 
 
 ######################################################################
@@ -39,28 +30,42 @@ from sqlalchemy.orm import Session
 ######################################################################
 
 
+ENGINE_NAME = "Laube"
+
+
 class Laube():
 
-    def __init__(self):
+    def __init__(self, context: Optional[EngineContext] = None):
         """
         LaubeService の初期化処理。
-        必要なリポジトリおよびエラーメッセージローダーを生成する。
+        リポジトリ・リゾルバ・エラーメッセージは EngineContext から取得する（生成済みのものを共有する）。
+
+        Args:
+            context (Optional[EngineContext]): 省略時はプロセス共有のコンテキスト
         """
-        self.error_loader = ErrorMessageLoader()
-        self.boss_repository = BossRepository()
-        self.application_form_repository = ApplicationFormRepository()
-        self.application_form_route_repository = ApplicationFormRouteRepository()
-        self.tenant_user_repository = TenantUserRepository()
-        self.user_group_repository = UserGroupRepository()
-        self.individual_activity_repository = IndividualActivityRepository()
-        self.role_repository = RoleRepository()
+        self.context = context or get_default_context()
+        self.error_loader = self.context.error_loader
+        self.boss_repository = self.context.boss_repository
+        self.application_form_repository = self.context.application_form_repository
+        self.application_form_route_repository = self.context.application_form_route_repository
+        self.tenant_user_repository = self.context.tenant_user_repository
+        self.user_group_repository = self.context.user_group_repository
+        self.individual_activity_repository = self.context.individual_activity_repository
+        self.role_repository = self.context.role_repository
+        self.master_data_cache: MasterDataCache = self.context.master_data_cache
+        self.approver_resolver = self.context.approver_resolver
+        self.route_plan_cache: RoutePlanCache = self.context.route_plan_cache
+        self.boss_resolver = self.context.boss_resolver
+        self.maintenance_registry = self.context.maintenance_registry
+        self.route_expander = self.context.route_expander
 
     @staticmethod
     def health_check(f):
         """
         エンジンのメンテナンス状態を確認するデコレータ。
-        セッションの第1引数（通常はDBセッション）を渡してメンテナンス判定を行い、
-        稼働不可状態であれば LaubeException をスローする。
+        第1引数（DBセッション）を MaintenanceRegistry に渡して判定し、
+        停止期間中であれば Laube-W001 の LaubeException をスローする。
+        判定はプロセス内に保持した停止期間で行い、再読込が必要な場合のみDBを参照する。
 
         Args:
             f (Callable): 対象メソッド
@@ -70,11 +75,23 @@ class Laube():
         """
         @wraps(f)
         def wrapper(self, *args, **kwargs):
-            if self.engineUtility.is_mentenance(args[0], 'Laube'):
-                raise LaubeException(self.W001)
+            self.ensure_available(args[0] if args else kwargs.get("db_session"))
             return f(self, *args, **kwargs)
         return wrapper
 
+    def ensure_available(self, db_session) -> None:
+        """
+        エンジンが停止期間中であれば Laube-W001 をスローする。
+        停止期間を一度も読み込めない場合（フェイルオープンでないとき）は、その例外を LaubeException で包んで投げる。
+        """
+        try:
+            under_maintenance = self.maintenance_registry.is_under_maintenance(db_session, ENGINE_NAME)
+        except Exception as e:
+            raise LaubeException(e)
+        if under_maintenance:
+            raise LaubeException("Laube-W001", self.error_loader.get_message("Laube-W001"))
+
+    @health_check
     def is_display_boss_field(
         self,
         db_session: Session,
@@ -141,50 +158,25 @@ class Laube():
             application_form = self.application_form_repository.get_by_code(
                 db_session, tenant_uuid, application_form_code
             )
-            if application_form is None:
-                raise LaubeException(self.E006)
 
-            # ルート種別が「直接部門なし」の場合 → 上司入力欄は不要
-            if RouteFlag.NO_INDIVIDUAL_ROUTE == application_form.route_flag:
-                return False
-
-            # ルート種別が「直接部門有り」の場合
-            elif RouteFlag.INDIVIDUAL_ROUTE == application_form.route_flag:
-                # 指定されたグループの直接部門ルートを取得
-                application_form_route = self.application_form_route_repository.get_by_code_and_group(
-                    db_session, tenant_uuid, application_form_code, target_group_code
-                )
-                # グループ未指定（共通）ルートも探す
-                if not application_form_route:
-                    application_form_route = self.application_form_route_repository.get_by_code_and_group(
+            def find_form_route():
+                # 指定されたグループの直接部門ルートを取得し、無ければグループ未指定（共通）ルートも探す
+                return (
+                    self.application_form_route_repository.get_by_code_and_group(
+                        db_session, tenant_uuid, application_form_code, target_group_code
+                    )
+                    or self.application_form_route_repository.get_by_code_and_group(
                         db_session, tenant_uuid, application_form_code, None
                     )
-                # 直接部門ルートコードが設定されている場合 → 上司入力欄は不要
-                if application_form_route and application_form_route.individual_route_code and application_form_route.individual_route_code.strip():
-                    return False
-                # 直接部門ルートが未設定なら → 上司欄の可能性あり（下に続く）
-
-            # ルート種別が「上司ルート」の場合
-            elif RouteFlag.BOSS_ROUTE == application_form.route_flag:
-
-                # 優先度順に上司マスタを検索（以下、OR条件）
-                boss = (
-                    self.boss_repository.get_by_all_keys(db_session, tenant_uuid, target_group_code, target_user_uuid, application_form_code)
-                    or self.boss_repository.get_by_group_null(db_session, tenant_uuid, target_user_uuid, application_form_code)
-                    or self.boss_repository.get_by_form_null(db_session, tenant_uuid, target_group_code, target_user_uuid)
-                    or self.boss_repository.get_by_group_and_form_null(db_session, tenant_uuid, target_user_uuid)
                 )
 
-                # 上司情報が1件も見つからない → 手入力が必要 → 入力欄を表示
-                if boss is None:
-                    return True
-
-            # どのルート種別にも当てはまらない（異常値）
-            else:
-                raise LaubeException(self.E007)
+            def find_boss():
+                # 優先度順（部署・申請書の一致 → NULL 指定）の上司マスタ検索を1回で行う
+                return self.boss_resolver.resolve(
+                    db_session, tenant_uuid, target_user_uuid, target_group_code, application_form_code
+                )
 
-            # デフォルトは「表示しない」
-            return False
+            return self._judge_boss_field(application_form, find_form_route, find_boss)
 
         except LaubeException:
             # 自前のバリデーションエラーなどはそのまま投げ直す
@@ -193,17 +185,195 @@ class Laube():
             # その他想定外のエラーもラップして投げる
             raise LaubeException(e)
 
+    @health_check
+    def is_display_boss_fields(
+        self,
+        db_session: Session,
+        tenant_uuid: str,
+        target_group_code: str,
+        target_user_uuid: str,
+        application_form_codes: List[str]
+    ) -> Dict[str, bool]:
+        """
+        複数の申請フォームについて「上司入力欄」を表示するかをまとめて判定する。
+
+        申請書選択画面のように同じユーザー・部署で多数のフォームを判定する用途向け。
+        申請書・申請ルート・上司マスタはそれぞれ1回の検索でまとめて取得し、
+        各フォームの判定結果は is_display_boss_field と同じになる。
+
+        パラメータ:
+        ----------
+        db_session : Session
+            データベースセッション
+        tenant_uuid : str
+            テナントUUID
+        target_group_code : str
+            対象のグループコード
+        target_user_uuid : str
+            対象のユーザーUUID
+        application_form_codes : List[str]
+            申請フォームのコード一覧
+
+        戻り値:
+        -------
+        Dict[str, bool]
+            申請フォームコード → 上司入力欄を表示するか
+
+        例外:
+        -------
+        LaubeException
+            パラメータ不足、存在しない申請フォーム、または内部処理エラー
+        """
+        try:
+            self._validate_boss_fields_params(
+                db_session, tenant_uuid, target_group_code, target_user_uuid, application_form_codes
+            )
+            codes = list(dict.fromkeys(application_form_codes))
+
+            forms = {
+                form.application_form_code: form
+                for form in self.application_form_repository.get_by_codes(db_session, tenant_uuid, codes)
+            }
+            form_routes = self._pick_form_routes(
+                self.application_form_route_repository.find_by_codes_and_group(
+                    db_session, tenant_uuid, self._codes_with_flag(forms, RouteFlag.INDIVIDUAL_ROUTE), target_group_code
+                )
+            )
+            bosses = self.boss_resolver.resolve_many(
+                db_session, tenant_uuid, target_user_uuid, target_group_code,
+                self._codes_with_flag(forms, RouteFlag.BOSS_ROUTE)
+            )
+            return self._judge_boss_fields(codes, forms, form_routes, bosses)
+
+        except LaubeException:
+            raise
+        except Exception as e:
+            raise LaubeException(e)
+
+    def _validate_boss_fields_params(
+        self,
+        db_session,
+        tenant_uuid: str,
+        target_group_code: str,
+        target_user_uuid: str,
+        application_form_codes: List[str]
+    ) -> None:
+        """
+        is_display_boss_fields の引数を検証する（エラーコードは is_display_boss_field と同じ）。
+        """
+        if not db_session:
+            msg = self.error_loader.get_message("Laube-E001")
+            raise LaubeException("Laube-E001", msg)
+
+        if not tenant_uuid:
+            msg = self.error_loader.get_message("Laube-E002")
+            raise LaubeException("Laube-E002", msg)
+
+        if not target_group_code:
+            msg = self.error_loader.get_message("Laube-E003")
+            raise LaubeException("Laube-E003", msg)
+
+        if not target_user_uuid:
+            msg = self.error_loader.get_message("Laube-E004")
+            raise LaubeException("Laube-E004", msg)
+
+        if not application_form_codes or not all(application_form_codes):
+            msg = self.error_loader.get_message("Laube-E005")
+            raise LaubeException("Laube-E005", msg)
+
+    @staticmethod
+    def _codes_with_flag(forms: Dict[str, ApplicationForm], route_flag: RouteFlag) -> List[str]:
+        return [code for code, form in forms.items() if route_flag == form.route_flag]
+
+    @staticmethod
+    def _pick_form_routes(routes: List[ApplicationFormRoute]) -> Dict[str, ApplicationFormRoute]:
+        """
+        申請書ごとに直接部門ルートを1件選ぶ（「指定グループ」を「グループ未指定」より優先する）。
+        """
+        form_routes: Dict[str, ApplicationFormRoute] = {}
+        for route in routes:
+            current = form_routes.get(route.application_form_code)
+            if current is None or (current.group_code is None and route.group_code is not None):
+                form_routes[route.application_form_code] = route
+        return form_routes
+
+    def _judge_boss_fields(
+        self,
+        codes: List[str],
+        forms: Dict[str, ApplicationForm],
+        form_routes: Dict[str, ApplicationFormRoute],
+        bosses: Dict[str, Optional[BossTarget]]
+    ) -> Dict[str, bool]:
+        return {
+            code: self._judge_boss_field(
+                forms.get(code),
+                lambda code=code: form_routes.get(code),
+                lambda code=code: bosses.get(code)
+            )
+            for code in codes
+        }
+
+    def _judge_boss_field(
+        self,
+        application_form: Optional[ApplicationForm],
+        find_form_route: Callable[[], Optional[ApplicationFormRoute]],
+        find_boss: Callable[[], Optional[BossTarget]]
+    ) -> bool:
+        """
+        上司入力欄の表示判定本体。申請ルート・上司の取得方法は呼び出し側から渡す。
+        """
+        if application_form is None:
+            raise LaubeException("Laube-E006", self.error_loader.get_message("Laube-E006"))
+
+        # ルート種別が「直接部門なし」の場合 → 上司入力欄は不要
+        if RouteFlag.NO_INDIVIDUAL_ROUTE == application_form.route_flag:
+            return False
+
+        # ルート種別が「直接部門有り」の場合
+        elif RouteFlag.INDIVIDUAL_ROUTE == application_form.route_flag:
+            application_form_route = find_form_route()
+            # 直接部門ルートコードが設定されている場合 → 上司入力欄は不要
+            route_code = application_form_route.individual_route_code if application_form_route else None
+            if route_code and route_code.strip():
+                return False
+            # 直接部門ルートが未設定なら → 上司欄の可能性あり（下に続く）
+
+        # ルート種別が「上司ルート」の場合
+        elif RouteFlag.BOSS_ROUTE == application_form.route_flag:
+            # 上司情報が1件も見つからない → 手入力が必要 → 入力欄を表示
+            if find_boss() is None:
+                return True
+
+        # どのルート種別にも当てはまらない（異常値）
+        else:
+            raise LaubeException("Laube-E007", self.error_loader.get_message("Laube-E007"))
+
+        # デフォルトは「表示しない」
+        return False
+
+    def new_master_data_resolver(self, db_session: Session) -> MasterDataResolver:
+        """
+        1リクエスト分の名称リゾルバ（テナント名・部署名・ユーザー名）を作成する。
+        """
+        return self.approver_resolver.new_master_data_resolver(db_session)
+
+    @health_check
     def get_individual_approverl_list(
         self,
         db_session: Session,
         tenant_uuid: str,
         target_tenant_uuid: str,
         individual_route_code: str,
-        application_form
+        application_form,
+        master_data: Optional[MasterDataResolver] = None
     ) -> List[ApproverlInfoDto]:
         """
         個別ルートに基づく承認者リストを取得します。
         テナント間ワークフロー対応。
+        ルート構造はコンパイル済みプラン（RoutePlanCache）から取得するため、キャッシュヒット時は
+        アクティビティの再読込を行わない。承認者情報の解決は ApproverResolver に委譲する。
+        同じリクエスト内で複数のルートを解決する場合は、new_master_data_resolver() で作成した
+        master_data を渡すと名称の再検索を避けられる。
         """
         try:
             if not db_session:
@@ -215,84 +385,76 @@ class Laube():
             if application_form is None:
                 raise LaubeException("Laube-E006", self.error_loader.get_message("Laube-E006"))
 
-            system_date = Utility().convert_datetime_2_date(datetime.now())
+            system_date = self.context.today()
 
-            activities = self.individual_activity_repository.find_by_tenant_and_route(
-                db_session, target_tenant_uuid, individual_route_code
-            )
+            plan = self.route_plan_cache.get_plan(db_session, target_tenant_uuid, individual_route_code)
 
-            if not activities:
+            if not plan.activities:
                 return []
 
-            role_repo = RoleRepository()
-            approver_list: List[ApproverlInfoDto] = []
-            route_user_uuids: set[str] = set()
-
-            for activity in activities:
-                # 個人指定の場合の検証
-                if not activity.approverl_role_code or not activity.approverl_role_code.strip():
-                    user = self.tenant_user_repository.find_active_user(
-                        db_session,
-                        target_tenant_uuid,
-                        activity.approverl_user_uuid
-                    )
+            # ユーザー・部署・ロール・名称はルート単位でまとめて取得する（N+1回避）
+            return self.approver_resolver.resolve(
+                db_session, target_tenant_uuid, plan.activities, application_form, system_date, master_data
+            )
 
-                    if not user or user.logical_deletion or (
-                        user.retirement_date and user.retirement_date < system_date
-                    ):
-                        continue
+        except LaubeException:
+            raise
+        except Exception as e:
+            raise LaubeException("UNEXPECTED", str(e))
 
-                    user_group = self.user_group_repository.find_by_keys(
-                        db_session,
-                        target_tenant_uuid,
-                        activity.approverl_user_uuid,
-                        activity.approverl_group_code
-                    )
+    @health_check
+    def expand_route(
+        self,
+        db_session: Session,
+        tenant_uuid: str,
+        application: ApplicationInfoDto,
+        master_data: Optional[MasterDataResolver] = None
+    ) -> RouteExpansion:
+        """
+        申請の承認経路全体（上司ルート・直接部門ルート・間接部門ルート）を1回で展開する。
 
-                    if not user_group or (user_group.term_to and user_group.term_to < system_date):
-                        raise LaubeException("Laube-E012", self.error_loader.get_message("Laube-E012"))
-
-                # DTO生成
-                dto = ApproverlInfoDto()
-                dto.tenant_uuid = target_tenant_uuid
-                dto.tenant_name = self.__get_company_name(db_session, target_tenant_uuid)
-                dto.route_type = RouteType.INDIVIDUAL_ROUTE
-                dto.route_number = activity.activity_code
-                dto.approverl_tenant_uuid = activity.approverl_tenant_uuid
-                dto.approverl_tenant_name = self.__get_company_name(db_session, activity.approverl_tenant_uuid)
-                dto.approverl_role_code = activity.approverl_role_code
-                dto.approverl_group_code = activity.approverl_group_code
-                dto.approverl_group_name = self.__get_group_name(
-                    db_session, activity.approverl_tenant_uuid, activity.approverl_group_code
-                )
-                dto.approverl_user_uuid = activity.approverl_user_uuid
-                dto.approverl_user_name = self.__get_user_name(
-                    db_session, activity.approverl_tenant_uuid, activity.approverl_user_uuid
-                )
-                dto.activity_status = ActivityStatus.AUTHORIZER_UNTREATED
-                dto.approval_function = activity.function
-
-                # ロール名の取得（必要な場合）
-                if activity.approverl_role_code:
-                    role: Optional[Role] = role_repo.find_by_code(
-                        db_session,
-                        tenant_uuid=target_tenant_uuid,
-                        approverl_tenant_uuid=activity.approverl_tenant_uuid,
-                        role_code=activity.approverl_role_code
-                    )
-                    if not role:
-                        raise LaubeException("Laube-E013", self.error_loader.get_message("Laube-E013", activity.approverl_role_code))
-                    dto.approverl_role_name = role.role_name
+        申請書の route_flag に従って上司ルートまたは個別ルートを直接部門側に、申請書別ルートの
+        common_route_code を間接部門側に展開する。skip_apply_employee が設定された申請書では
+        申請者本人を承認者から外し、自動承認の重複判定は両ルートをまたいで行う。
+        結果の timings にはフェーズごとの経過時間（秒）が入る。
 
-                # 自動承認判定（同一ユーザー重複）
-                if AutoApproverlFlag.AUTOMATIC_APPROVAL == application_form.auto_approverl_flag:
-                    if activity.approverl_user_uuid in route_user_uuids:
-                        dto.approval_function = ApprovalFunction.AUTHORIZER_AUTOMATIC_APPROVAL
-                    route_user_uuids.add(activity.approverl_user_uuid)
+        パラメータ:
+        ----------
+        db_session : Session
+            データベースセッション
+        tenant_uuid : str
+            申請書・ルートマスタを保持するテナントUUID
+        application : ApplicationInfoDto
+            申請内容（application_form_code / target_group_code / target_user_uuid /
+            applicant_user_uuid を参照）
+        master_data : Optional[MasterDataResolver]
+            リクエスト内で共有する名称リゾルバ
 
-                approver_list.append(dto)
+        戻り値:
+        -------
+        RouteExpansion
+            直接部門側・間接部門側の承認者リストとフェーズごとの経過時間
 
-            return approver_list
+        例外:
+        -------
+        LaubeException
+            パラメータ不足、存在しない申請フォーム、承認者マスタの不整合、または内部処理エラー
+        """
+        try:
+            if not db_session:
+                raise LaubeException("Laube-E001", self.error_loader.get_message("Laube-E001"))
+            if not tenant_uuid:
+                raise LaubeException("Laube-E002", self.error_loader.get_message("Laube-E002"))
+            if application is None or not application.target_group_code:
+                raise LaubeException("Laube-E003", self.error_loader.get_message("Laube-E003"))
+            if not application.target_user_uuid:
+                raise LaubeException("Laube-E004", self.error_loader.get_message("Laube-E004"))
+            if not application.application_form_code:
+                raise LaubeException("Laube-E005", self.error_loader.get_message("Laube-E005"))
+
+            return self.route_expander.expand(
+                db_session, tenant_uuid, application, self.context.today(), master_data
+            )
 
         except LaubeException:
             raise
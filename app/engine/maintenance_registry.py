@@ -0,0 +1,181 @@
+import logging
+import os
+import threading
+import time
+import weakref
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Callable, Optional, Tuple
+from sqlalchemy.orm import Session
+from app.common.orm_invalidation import invalidate_on_write
+from app.models.models import MaintenanceWindow
+from app.repositories.maintenance_window_repository import MaintenanceWindowRepository
+
+######################################################################
+# Copyright 2016–2025 Ryuta Miki. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+######################################################################
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_REFRESH_SECONDS = float(os.getenv("LAUBE_MAINTENANCE_REFRESH_SECONDS", "30"))
+# 読込に失敗したとき、停止期間が分からなくても稼働させるか（true / false）
+DEFAULT_FAIL_OPEN = os.getenv("LAUBE_MAINTENANCE_FAIL_OPEN", "false").lower() == "true"
+
+
+@dataclass(frozen=True)
+class MaintenancePeriod:
+    """
+    m_maintenance_window の1行分（不変）。
+    """
+    engine_name: str
+    start_date: datetime
+    end_date: Optional[datetime]
+    reason: Optional[str] = None
+
+    def covers(self, now: datetime) -> bool:
+        """指定日時が停止期間内かを返す。"""
+        return self.start_date <= now and (self.end_date is None or now < self.end_date)
+
+
+class MaintenanceRegistry:
+    """
+    エンジンの利用停止期間をプロセス内に保持するレジストリ。
+
+    終了していない停止期間を refresh_interval 秒ごとに1回だけ読み込み、判定は
+    保持している期間と現在日時の比較で行う。そのため通常の呼び出しではDBにアクセスしない。
+
+    - MaintenanceWindow を ORM で書き込むと版数が上がり、次の判定時に再読込する。
+    - 読込に失敗した場合は、最後に読み込めた停止期間で判定を続け、stale（再読込待ち）として
+      refresh_interval 秒後に再試行する。一度も読み込めていない場合は例外をそのまま投げる。
+    - 読込は呼び出し元のセッションのセーブポイント内で行い、失敗してもセーブポイントまでの
+      ロールバックに留める（PostgreSQL で呼び出し元のトランザクションが中断されないようにする）。
+    - fail_open=True（環境変数 LAUBE_MAINTENANCE_FAIL_OPEN=true）の場合は、一度も読み込めていなくても
+      停止期間なしとして稼働させ（フェイルオープン）、次の間隔で再試行する。
+    """
+
+    def __init__(
+        self,
+        repository: Optional[MaintenanceWindowRepository] = None,
+        refresh_interval: float = DEFAULT_REFRESH_SECONDS,
+        clock: Callable[[], datetime] = datetime.now,
+        fail_open: bool = DEFAULT_FAIL_OPEN
+    ):
+        self.repository = repository or MaintenanceWindowRepository()
+        self.refresh_interval = refresh_interval
+        self.clock = clock
+        self.fail_open = fail_open
+        self._periods: Tuple[MaintenancePeriod, ...] = ()
+        self._version = 0
+        self._loaded_version: Optional[int] = None
+        self._loaded_at = 0.0
+        self._stale = False
+        self._retry_at = 0.0
+        # セーブポイントの終了時に、同じスレッドから bump_version() が呼ばれることがある
+        self._lock = threading.RLock()
+        _registries.add(self)
+
+    def is_under_maintenance(self, db_session, engine_name: str) -> bool:
+        """
+        エンジンが停止期間中かを返す。
+
+        Args:
+            db_session: 再読込が必要な場合に使うDBセッション（Session 以外が渡された場合は再読込しない）
+            engine_name (str): エンジン名（Laube / Cerberus）
+
+        Returns:
+            bool: 停止期間中なら True
+        """
+        if self.needs_refresh() and isinstance(db_session, Session):
+            self.refresh(db_session)
+        now = self.clock()
+        return any(p.engine_name == engine_name and p.covers(now) for p in self._periods)
+
+    @property
+    def stale(self) -> bool:
+        """直前の再読込に失敗し、最後に読み込めた停止期間で判定している場合に True を返す。"""
+        return self._stale
+
+    def refresh(self, db_session: Session) -> None:
+        """
+        停止期間を読み込み直す。
+
+        Raises:
+            Exception: 読込に失敗し、一度も読み込めていない場合（fail_open=False のとき）
+        """
+        with self._lock:
+            version = self._version
+            savepoint = db_session.begin_nested()
+            try:
+                rows = self.repository.find_open_windows(db_session, self.clock())
+                savepoint.commit()
+            except Exception:
+                savepoint.rollback()
+                if not self.fail_open:
+                    if self._loaded_version is None:
+                        raise
+                    logger.warning("メンテナンス状態の読込に失敗したため、最後に読み込めた状態で判定します", exc_info=True)
+                    self._stale = True
+                    self._retry_at = time.monotonic() + self.refresh_interval
+                    return
+                logger.warning("メンテナンス状態の読込に失敗したため、直前の状態で稼働を継続します", exc_info=True)
+            else:
+                self._periods = tuple(
+                    MaintenancePeriod(row.engine_name, row.start_date, row.end_date, row.reason) for row in rows
+                )
+                self._stale = False
+            self._loaded_version = version
+            self._loaded_at = time.monotonic()
+
+    def bump_version(self) -> None:
+        """次の判定時に再読込させる。"""
+        with self._lock:
+            self._version += 1
+
+    def reset(self) -> None:
+        """保持している停止期間を破棄する（未読込の状態に戻す）。"""
+        with self._lock:
+            self._periods = ()
+            self._loaded_version = None
+            self._loaded_at = 0.0
+            self._stale = False
+            self._retry_at = 0.0
+
+    def needs_refresh(self) -> bool:
+        """停止期間の再読込が必要か（版数の更新・読込間隔の経過・直前の読込失敗からの間隔の経過）を返す。"""
+        if self._stale:
+            # 読込に失敗している間は、判定のたびにDBへ再試行しない
+            return time.monotonic() >= self._retry_at
+        return (
+            self._loaded_version != self._version
+            or time.monotonic() - self._loaded_at >= self.refresh_interval
+        )
+
+
+# ----------------------------------------------------------------------
+# ORM 書き込み時の版数更新
+# ----------------------------------------------------------------------
+
+_registries: "weakref.WeakSet[MaintenanceRegistry]" = weakref.WeakSet()
+
+
+def _bump_all(*args) -> None:
+    for registry in list(_registries):
+        registry.bump_version()
+
+
+invalidate_on_write((MaintenanceWindow,), lambda target: [target.engine_name], _bump_all, _bump_all)
+
+
+default_maintenance_registry = MaintenanceRegistry()
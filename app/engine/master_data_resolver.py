@@ -0,0 +1,207 @@
+import weakref
+from typing import Dict, Hashable, Iterable, List, Optional, Set, Tuple
+from sqlalchemy.orm import Session
+from app.common.lru_cache import LruCache
+from app.common.orm_invalidation import current_and_previous, invalidate_on_write
+from app.models.models import Group, Tenant, User
+from app.repositories.group_repository import GroupRepository
+from app.repositories.tenant_repository import TenantRepository
+from app.repositories.user_repository import UserRepository
+
+######################################################################
+# Copyright 2016–2025 Ryuta Miki. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+######################################################################
+
+GroupKey = Tuple[str, str]
+
+TENANT = "tenant"
+GROUP = "group"
+USER = "user"
+
+
+class MasterDataCache:
+    """
+    テナント名・部署名（m_group）・ユーザー名のプロセス共有キャッシュ。
+
+    種別ごとに LRU + TTL のキャッシュを持つ。名称の変更は ORM イベントで即時に破棄され、
+    ORM を経由しない更新も ttl 秒以内に反映される。
+    """
+
+    def __init__(self, maxsize: int = 10000, ttl: Optional[float] = 300):
+        self._caches: Dict[str, LruCache[Hashable, Optional[str]]] = {
+            TENANT: LruCache(maxsize, ttl),
+            GROUP: LruCache(maxsize, ttl),
+            USER: LruCache(maxsize, ttl)
+        }
+        _master_caches.add(self)
+
+    def cache(self, kind: str) -> LruCache:
+        """種別（tenant / group / user）のキャッシュを返す。"""
+        return self._caches[kind]
+
+    def invalidate(self, kind: str, keys: Iterable[Hashable]) -> None:
+        """指定した種別のキーを破棄する。"""
+        cache = self._caches[kind]
+        for key in keys:
+            cache.pop(key)
+
+    def clear(self) -> None:
+        """全種別のキャッシュを破棄する。"""
+        for cache in self._caches.values():
+            cache.clear()
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """種別ごとのヒット数・ミス数などを返す（監視用）。"""
+        return {kind: cache.stats() for kind, cache in self._caches.items()}
+
+
+class MasterDataResolver:
+    """
+    1リクエスト分の名称解決を担うリゾルバ。
+
+    - リクエスト内ではアイデンティティマップで同じキーを再検索しない。
+    - アイデンティティマップに無いキーはプロセス共有の MasterDataCache から取り、
+      それでも無いキーだけを種別ごとに1回の IN 検索でまとめて取得する。
+    - 存在しないキーはリクエスト内でのみ None として記憶する（共有キャッシュには載せない）。
+    """
+
+    def __init__(
+        self,
+        db_session: Session,
+        cache: Optional[MasterDataCache] = None,
+        tenant_repository: Optional[TenantRepository] = None,
+        group_repository: Optional[GroupRepository] = None,
+        user_repository: Optional[UserRepository] = None
+    ):
+        self.db_session = db_session
+        self.cache = cache if cache is not None else default_master_data_cache
+        self.tenant_repository = tenant_repository or TenantRepository()
+        self.group_repository = group_repository or GroupRepository()
+        self.user_repository = user_repository or UserRepository()
+        self._identity: Dict[str, Dict[Hashable, Optional[str]]] = {TENANT: {}, GROUP: {}, USER: {}}
+        self.identity_hits = 0
+        self.cache_hits = 0
+        self.db_loads = 0
+
+    def prefetch(
+        self,
+        tenant_uuids: Iterable[Optional[str]] = (),
+        group_keys: Iterable[Tuple[Optional[str], Optional[str]]] = (),
+        user_uuids: Iterable[Optional[str]] = ()
+    ) -> None:
+        """
+        指定したキーの名称をまとめて読み込む。未解決のキーは種別ごとに1クエリで取得する。
+
+        Args:
+            tenant_uuids: テナントUUID
+            group_keys: (テナントUUID, 部署コード)
+            user_uuids: ユーザーUUID
+        """
+        self._prefetch(TENANT, [t for t in tenant_uuids if t])
+        self._prefetch(GROUP, [k for k in group_keys if k[0] and k[1]])
+        self._prefetch(USER, [u for u in user_uuids if u])
+
+    def tenant_name(self, tenant_uuid: Optional[str]) -> Optional[str]:
+        """テナント名（会社名）を返す。"""
+        return self._lookup(TENANT, tenant_uuid) if tenant_uuid else None
+
+    def group_name(self, tenant_uuid: Optional[str], group_code: Optional[str]) -> Optional[str]:
+        """部署名を返す。"""
+        return self._lookup(GROUP, (tenant_uuid, group_code)) if tenant_uuid and group_code else None
+
+    def user_name(self, user_uuid: Optional[str]) -> Optional[str]:
+        """ユーザー名を返す。"""
+        return self._lookup(USER, user_uuid) if user_uuid else None
+
+    def stats(self) -> Dict[str, int]:
+        """このリクエスト内のヒット数・DB読込件数を返す（監視用）。"""
+        return {
+            "identity_hits": self.identity_hits,
+            "cache_hits": self.cache_hits,
+            "db_loads": self.db_loads
+        }
+
+    def _lookup(self, kind: str, key: Hashable) -> Optional[str]:
+        identity = self._identity[kind]
+        if key in identity:
+            self.identity_hits += 1
+            return identity[key]
+        self._prefetch(kind, [key])
+        return identity.get(key)
+
+    def _prefetch(self, kind: str, keys: List[Hashable]) -> None:
+        identity = self._identity[kind]
+        cache = self.cache.cache(kind)
+        missing: Set[Hashable] = set()
+        for key in keys:
+            if key in identity or key in missing:
+                continue
+            name = cache.get(key)
+            if name is not None:
+                self.cache_hits += 1
+                identity[key] = name
+            else:
+                missing.add(key)
+        if not missing:
+            return
+
+        loaded = self._load(kind, list(missing))
+        self.db_loads += len(loaded)
+        for key in missing:
+            name = loaded.get(key)
+            identity[key] = name
+            if name is not None:
+                cache.put(key, name)
+
+    def _load(self, kind: str, keys: List[Hashable]) -> Dict[Hashable, Optional[str]]:
+        if kind == TENANT:
+            rows: List[Tenant] = self.tenant_repository.get_by_tenant_uuids(self.db_session, keys)
+            return {row.tenant_uuid: row.tenant_name for row in rows}
+        if kind == GROUP:
+            rows: List[Group] = self.group_repository.get_by_group_keys(self.db_session, keys)
+            return {(row.tenant_uuid, row.group_code): row.group_name for row in rows}
+        rows: List[User] = self.user_repository.get_by_user_uuids(self.db_session, keys)
+        return {row.user_uuid: row.user_name for row in rows}
+
+
+# ----------------------------------------------------------------------
+# ORM 書き込み時の無効化
+# ----------------------------------------------------------------------
+
+_master_caches: "weakref.WeakSet[MasterDataCache]" = weakref.WeakSet()
+
+
+def _register(model, kind: str, key_of) -> None:
+    def invalidate(keys: Set[Hashable]) -> None:
+        for cache in list(_master_caches):
+            cache.invalidate(kind, keys)
+
+    def invalidate_all() -> None:
+        for cache in list(_master_caches):
+            cache.cache(kind).clear()
+
+    invalidate_on_write((model,), key_of, invalidate, invalidate_all)
+
+
+_register(Tenant, TENANT, lambda target: current_and_previous(target, "tenant_uuid"))
+_register(Group, GROUP, lambda target: [
+    (tenant_uuid, group_code)
+    for tenant_uuid in current_and_previous(target, "tenant_uuid")
+    for group_code in current_and_previous(target, "group_code")
+])
+_register(User, USER, lambda target: current_and_previous(target, "user_uuid"))
+
+
+default_master_data_cache = MasterDataCache()
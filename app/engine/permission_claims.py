@@ -0,0 +1,170 @@
+import base64
+import threading
+from typing import Any, Callable, Dict, Iterable, Mapping, Optional
+from sqlalchemy.orm import Session
+from app.engine.cerberus import Cerberus
+from app.repositories.permission_repository import PermissionRepository
+from app.repositories.role_repository import RoleRepository
+
+######################################################################
+# Copyright 2016–2025 Ryuta Miki. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+######################################################################
+
+# ----------------------------------------------------------------------
+# アクセストークンに埋め込む権限ビットマップ。
+#
+# ユーザーの実効ロールとパーミッションを、m_role.id / m_permission.id をビット位置とする
+# ビットマップ（base64url）にして、発行時の m_policy_version の版数と一緒にクレームへ入れる。
+# ビット位置はサロゲートキーなので、どのワーカーでも同じ位置になる。
+#
+# 判定時は、トークンの版数がこのプロセスの認可インデックスの版数と一致すればビットマップだけで
+# 判定する（DBアクセスなし）。版数が異なる・クレームが無い・パーミッションのビット位置が
+# 分からない場合は Cerberus で判定し直す。
+# ----------------------------------------------------------------------
+
+VERSION_CLAIM = "pv"
+ROLE_CLAIM = "roles"
+PERMISSION_CLAIM = "perms"
+
+
+def encode_bitmap(positions: Iterable[int]) -> str:
+    """ビット位置の集合を base64url（パディングなし）のビットマップにする。"""
+    bits = 0
+    for position in positions:
+        bits |= 1 << position
+    data = bits.to_bytes((bits.bit_length() + 7) // 8, "little")
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode("ascii")
+
+
+def decode_bitmap(encoded: str) -> int:
+    """encode_bitmap() の結果を整数のビット列に戻す。"""
+    data = base64.urlsafe_b64decode(encoded + "=" * (-len(encoded) % 4))
+    return int.from_bytes(data, "little")
+
+
+class PermissionCatalog:
+    """
+    ロールID・パーミッションID → ビット位置（サロゲートキー）の対応表。
+
+    プロセスで1回読み込み、未知のIDが現れた場合や版数が変わった場合に読み込み直す。
+    """
+
+    def __init__(
+        self,
+        permission_repository: Optional[PermissionRepository] = None,
+        role_repository: Optional[RoleRepository] = None
+    ):
+        self.permission_repository = permission_repository or PermissionRepository()
+        self.role_repository = role_repository or RoleRepository()
+        self._permissions: Dict[str, int] = {}
+        self._roles: Dict[str, int] = {}
+        self._version: Optional[int] = None
+        self._lock = threading.Lock()
+
+    @property
+    def version(self) -> Optional[int]:
+        """読込時の認可インデックスの版数（未読込の場合は None）。"""
+        return self._version
+
+    def load(self, db_session: Session, version: Optional[int]) -> None:
+        permissions = self.permission_repository.find_positions(db_session)
+        roles = self.role_repository.find_positions(db_session)
+        with self._lock:
+            self._permissions, self._roles, self._version = permissions, roles, version
+
+    def permission_position(self, permission_id: str) -> Optional[int]:
+        return self._permissions.get(permission_id)
+
+    def role_position(self, role_id: str) -> Optional[int]:
+        return self._roles.get(role_id)
+
+
+class PermissionClaims:
+    """
+    権限ビットマップのクレームの発行と、クレームによる粗い認可（パーミッション単位）を行う。
+    """
+
+    def __init__(self, cerberus: Cerberus, catalog: Optional[PermissionCatalog] = None):
+        self.cerberus = cerberus
+        self.catalog = catalog or PermissionCatalog()
+        self.claim_decisions = 0
+        self.fallbacks = 0
+
+    def issue(self, db_session: Session, user_id: str) -> Dict[str, Any]:
+        """
+        ユーザーの実効ロール・パーミッションのクレームを作る（ログイン時に1回）。
+
+        ビット位置が登録されていないロール・パーミッション（m_role / m_permission に無いもの）は
+        含めない。判定時にビットが無い場合も、ビット位置が分からなければ Cerberus で判定する。
+        """
+        version = self.cerberus.policy_version
+        roles = self.cerberus.roles_of(user_id)
+        permissions = self.cerberus.permissions_of(user_id)
+        if self.catalog.version != version or not self._knows(roles, permissions):
+            self.catalog.load(db_session, version)
+        return {
+            VERSION_CLAIM: version,
+            ROLE_CLAIM: encode_bitmap(self._positions(roles, self.catalog.role_position)),
+            PERMISSION_CLAIM: encode_bitmap(self._positions(permissions, self.catalog.permission_position)),
+        }
+
+    def authorize(
+        self,
+        claims: Mapping[str, Any],
+        permission_id: str,
+        session_factory: Optional[Callable[[], Session]] = None
+    ) -> bool:
+        """
+        トークンのクレーム（sub を含む）で、ユーザーがパーミッションを持つかを判定する。
+        """
+        allowed = self.decide_from_claims(claims, permission_id, session_factory)
+        if allowed is None:
+            self.fallbacks += 1
+            return self.cerberus.has_permission(claims["sub"], permission_id)
+        self.claim_decisions += 1
+        return allowed
+
+    def decide_from_claims(
+        self,
+        claims: Mapping[str, Any],
+        permission_id: str,
+        session_factory: Optional[Callable[[], Session]] = None
+    ) -> Optional[bool]:
+        """
+        クレームだけで判定できれば結果を返し、できなければ None を返す。
+        """
+        encoded = claims.get(PERMISSION_CLAIM)
+        if encoded is None or claims.get(VERSION_CLAIM) != self.cerberus.policy_version:
+            return None
+        if self.catalog.version is None:
+            # このプロセスでは未読込（他のワーカーが発行したトークン）
+            with (session_factory or self.cerberus.session_factory)() as db:
+                self.catalog.load(db, self.cerberus.policy_index.version)
+        position = self.catalog.permission_position(permission_id)
+        if position is None:
+            return None
+        try:
+            return bool(decode_bitmap(encoded) >> position & 1)
+        except (TypeError, ValueError):
+            return None
+
+    def _knows(self, roles: Iterable[str], permissions: Iterable[str]) -> bool:
+        return all(self.catalog.role_position(r) is not None for r in roles) and all(
+            self.catalog.permission_position(p) is not None for p in permissions
+        )
+
+    @staticmethod
+    def _positions(ids: Iterable[str], position_of: Callable[[str], Optional[int]]) -> Iterable[int]:
+        return (position for position in map(position_of, ids) if position is not None)
@@ -0,0 +1,369 @@
+import ast
+import json
+import logging
+import operator
+import threading
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, Mapping, Optional, Tuple
+
+######################################################################
+# Copyright 2016–2025 Ryuta Miki. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+######################################################################
+
+logger = logging.getLogger(__name__)
+
+# 評価コンテキスト（user / resource / now など）を受け取り、許可するかを返す
+Predicate = Callable[[Mapping[str, Any]], bool]
+_Operand = Callable[[Mapping[str, Any]], Any]
+
+
+class PolicyConditionError(ValueError):
+    """ポリシー条件（Policy.condition）を解釈できない場合の例外。"""
+
+
+class _Missing:
+    """コンテキストに存在しない変数の値（偽として扱い、どの比較も成立しない）。"""
+
+    __slots__ = ()
+
+    def __bool__(self) -> bool:
+        return False
+
+    def __repr__(self) -> str:
+        return "MISSING"
+
+
+_MISSING = _Missing()
+
+
+def _guarded(op: Callable[[Any, Any], bool], ordered: bool = False) -> Callable[[Any, Any], bool]:
+    # 存在しない変数・型が合わない値との比較は、許可しない側（False）に倒す
+    def compare(left: Any, right: Any) -> bool:
+        if left is _MISSING or right is _MISSING:
+            return False
+        if ordered and (left is None or right is None):
+            return False
+        try:
+            return op(left, right)
+        except TypeError:
+            return False
+    return compare
+
+
+def _contains(item: Any, container: Any) -> bool:
+    return container is not None and item in container
+
+
+_COMPARATORS: Dict[str, Callable[[Any, Any], bool]] = {
+    "==": _guarded(operator.eq),
+    "!=": _guarded(operator.ne),
+    "<": _guarded(operator.lt, ordered=True),
+    "<=": _guarded(operator.le, ordered=True),
+    ">": _guarded(operator.gt, ordered=True),
+    ">=": _guarded(operator.ge, ordered=True),
+    "in": _guarded(_contains),
+    "not in": _guarded(lambda item, container: not _contains(item, container)),
+}
+
+_AST_COMPARATORS: Dict[type, str] = {
+    ast.Eq: "==", ast.NotEq: "!=", ast.Lt: "<", ast.LtE: "<=", ast.Gt: ">", ast.GtE: ">=",
+    ast.In: "in", ast.NotIn: "not in",
+}
+
+
+def _variable(path: Tuple[str, ...]) -> _Operand:
+    def lookup(context: Mapping[str, Any]) -> Any:
+        value: Any = context
+        for key in path:
+            if not isinstance(value, Mapping):
+                return _MISSING
+            value = value.get(key, _MISSING)
+        return value
+    return lookup
+
+
+def _constant(value: Any) -> _Operand:
+    return lambda context: value
+
+
+def _compare(op: str, left: _Operand, right: _Operand) -> Predicate:
+    comparator = _COMPARATORS[op]
+    return lambda context: bool(comparator(left(context), right(context)))
+
+
+def _all(operands: Tuple[_Operand, ...]) -> Predicate:
+    return lambda context: all(operand(context) for operand in operands)
+
+
+def _any(operands: Tuple[_Operand, ...]) -> Predicate:
+    return lambda context: any(operand(context) for operand in operands)
+
+
+def _not(operand: _Operand) -> Predicate:
+    return lambda context: not operand(context)
+
+
+def _truthy(operand: _Operand) -> Predicate:
+    return lambda context: bool(operand(context))
+
+
+def _split_path(path: Any) -> Tuple[str, ...]:
+    if not isinstance(path, str) or not path or any(not key or key.startswith("_") for key in path.split(".")):
+        raise PolicyConditionError(f"Invalid variable path: {path!r}")
+    return tuple(path.split("."))
+
+
+# ----------------------------------------------------------------------
+# JSON 形式（JSON Logic のサブセット）
+#   {"and": [{"==": [{"var": "user.group_code"}, {"var": "resource.group_code"}]},
+#            {">=": [{"var": "now.time"}, "09:00"]}]}
+# ----------------------------------------------------------------------
+
+_JSON_LITERALS = (str, int, float, bool, type(None))
+
+
+def _compile_json(node: Any) -> _Operand:
+    if isinstance(node, _JSON_LITERALS):
+        return _constant(node)
+    if isinstance(node, list):
+        if not all(isinstance(item, _JSON_LITERALS) for item in node):
+            raise PolicyConditionError("List literals may contain only scalar values")
+        return _constant(tuple(node))
+    if not isinstance(node, dict) or len(node) != 1:
+        raise PolicyConditionError(f"Invalid condition node: {node!r}")
+
+    (op, args), = node.items()
+    if op == "var":
+        return _variable(_split_path(args))
+    if not isinstance(args, list):
+        args = [args]
+    operands = tuple(_compile_json(arg) for arg in args)
+    if op in ("and", "or"):
+        if not operands:
+            raise PolicyConditionError(f"'{op}' requires at least one operand")
+        return (_all if op == "and" else _any)(operands)
+    if op == "!":
+        if len(operands) != 1:
+            raise PolicyConditionError("'!' requires exactly one operand")
+        return _not(operands[0])
+    if op in _COMPARATORS:
+        if len(operands) != 2:
+            raise PolicyConditionError(f"'{op}' requires exactly two operands")
+        return _compare(op, *operands)
+    raise PolicyConditionError(f"Unsupported operator: {op!r}")
+
+
+# ----------------------------------------------------------------------
+# 式形式（Python 式のサブセット。AST から関数を組み立て、eval は使わない）
+#   user.group_code == resource.group_code and now.time >= "09:00"
+# ----------------------------------------------------------------------
+
+def _attribute_path(node: ast.AST) -> Tuple[str, ...]:
+    if isinstance(node, ast.Name):
+        return _split_path(node.id)
+    if isinstance(node, ast.Attribute):
+        return _attribute_path(node.value) + _split_path(node.attr)
+    raise PolicyConditionError(f"Unsupported expression: {ast.dump(node)}")
+
+
+def _compile_expression(node: ast.AST) -> _Operand:
+    if isinstance(node, ast.BoolOp):
+        operands = tuple(_compile_expression(value) for value in node.values)
+        return (_all if isinstance(node.op, ast.And) else _any)(operands)
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.Not):
+        return _not(_compile_expression(node.operand))
+    if isinstance(node, ast.Compare):
+        terms = [_compile_expression(node.left)] + [_compile_expression(c) for c in node.comparators]
+        comparisons = []
+        for i, op in enumerate(node.ops):
+            if type(op) not in _AST_COMPARATORS:
+                raise PolicyConditionError(f"Unsupported comparison: {type(op).__name__}")
+            comparisons.append(_compare(_AST_COMPARATORS[type(op)], terms[i], terms[i + 1]))
+        return comparisons[0] if len(comparisons) == 1 else _all(tuple(comparisons))
+    if isinstance(node, ast.Constant) and isinstance(node.value, _JSON_LITERALS):
+        return _constant(node.value)
+    if isinstance(node, (ast.List, ast.Tuple, ast.Set)):
+        values = []
+        for element in node.elts:
+            if not (isinstance(element, ast.Constant) and isinstance(element.value, _JSON_LITERALS)):
+                raise PolicyConditionError("List literals may contain only scalar values")
+            values.append(element.value)
+        return _constant(tuple(values))
+    if isinstance(node, (ast.Name, ast.Attribute)):
+        return _variable(_attribute_path(node))
+    raise PolicyConditionError(f"Unsupported expression: {type(node).__name__}")
+
+
+def compile_condition(source: str) -> Predicate:
+    """
+    ポリシー条件を評価関数にコンパイルする。
+
+    先頭が '{' の場合は JSON 形式（JSON Logic のサブセット）、それ以外は式形式として解釈する。
+    変数はコンテキストのキーをドット区切りで参照する（user.group_code など）。
+    存在しない変数を含む比較（== / != も含む）と、None や型の異なる値との大小比較は False になる。
+
+    Raises:
+        PolicyConditionError: 構文が不正、または未対応の演算子・構文を含む場合
+    """
+    if not isinstance(source, str) or not source.strip():
+        raise PolicyConditionError("Condition is empty")
+    text = source.strip()
+    if text.startswith("{"):
+        try:
+            tree = json.loads(text)
+        except ValueError as e:
+            raise PolicyConditionError(f"Invalid JSON condition: {e}") from e
+        return _truthy(_compile_json(tree))
+    try:
+        tree = ast.parse(text, mode="eval")
+    except SyntaxError as e:
+        raise PolicyConditionError(f"Invalid condition expression: {e.msg}") from e
+    return _truthy(_compile_expression(tree.body))
+
+
+def build_context(
+    user: Optional[Mapping[str, Any]] = None,
+    resource: Optional[Mapping[str, Any]] = None,
+    now: Optional[datetime] = None,
+    **extra: Any
+) -> Dict[str, Any]:
+    """
+    条件評価用のコンテキストを作成する。
+
+    now は日時そのものではなく、比較しやすい値に分解して渡す
+    （date: "YYYY-MM-DD", time: "HH:MM", hour, minute, weekday: 月曜=0）。
+    """
+    now = now or datetime.now()
+    return {
+        "user": user or {},
+        "resource": resource or {},
+        "now": {
+            "date": now.strftime("%Y-%m-%d"),
+            "time": now.strftime("%H:%M"),
+            "hour": now.hour,
+            "minute": now.minute,
+            "weekday": now.weekday(),
+        },
+        **extra,
+    }
+
+
+class ConditionMetrics:
+    """
+    条件のコンパイル・評価の統計。評価時間は perf_counter による累積秒数。
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.compiles = 0
+            self.cache_hits = 0
+            self.evaluations = 0
+            self.evaluation_seconds = 0.0
+            self.evaluation_errors = 0
+
+    def record_compile(self, hit: bool) -> None:
+        with self._lock:
+            if hit:
+                self.cache_hits += 1
+            else:
+                self.compiles += 1
+
+    def record_evaluation(self, seconds: float, failed: bool) -> None:
+        with self._lock:
+            self.evaluations += 1
+            self.evaluation_seconds += seconds
+            if failed:
+                self.evaluation_errors += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        """現在の値を dict で返す（ログやメトリクス出力用）。"""
+        with self._lock:
+            return {
+                "compiles": self.compiles,
+                "cache_hits": self.cache_hits,
+                "evaluations": self.evaluations,
+                "evaluation_seconds": self.evaluation_seconds,
+                "evaluation_errors": self.evaluation_errors,
+            }
+
+
+class ConditionCompiler:
+    """
+    ポリシー条件のコンパイル結果をポリシーごとに1つ保持するキャッシュ。
+
+    キャッシュは policy_id と update_count で照合し、ポリシーが更新されて update_count が
+    変わると再コンパイルする。update_count を変えずに条件だけが書き換えられた場合に備え、
+    条件文字列も照合する。
+    DB に保存済みの条件が解釈できない場合は、常に False を返す関数として扱う（許可しない）。
+    """
+
+    def __init__(self, metrics: Optional[ConditionMetrics] = None):
+        self.metrics = metrics or ConditionMetrics()
+        # policy_id → (update_count, 条件文字列, 評価関数)
+        self._compiled: Dict[str, Tuple[int, str, Predicate]] = {}
+        self._lock = threading.Lock()
+
+    def validate(self, source: str) -> None:
+        """条件を解釈できるかを検証する（ポリシー登録時に使う）。"""
+        compile_condition(source)
+
+    def get(self, policy_id: str, update_count: int, source: str) -> Predicate:
+        """コンパイル済みの評価関数を返す。"""
+        cached = self._compiled.get(policy_id)
+        if cached is not None and cached[0] == update_count and cached[1] == source:
+            self.metrics.record_compile(hit=True)
+            return cached[2]
+
+        try:
+            predicate = compile_condition(source)
+        except PolicyConditionError as e:
+            logger.warning("policy %s has an invalid condition and never grants: %s", policy_id, e)
+            predicate = _deny
+        with self._lock:
+            self._compiled[policy_id] = (update_count, source, predicate)
+        self.metrics.record_compile(hit=False)
+        return predicate
+
+    def evaluate(self, policy_id: str, update_count: int, source: str, context: Mapping[str, Any]) -> bool:
+        """条件を評価する。評価中の例外は許可しない側（False）として扱う。"""
+        predicate = self.get(policy_id, update_count, source)
+        start = time.perf_counter()
+        failed = False
+        try:
+            return predicate(context)
+        except Exception:
+            failed = True
+            logger.exception("failed to evaluate condition of policy %s", policy_id)
+            return False
+        finally:
+            self.metrics.record_evaluation(time.perf_counter() - start, failed)
+
+    def discard(self, policy_id: str) -> None:
+        """指定ポリシーのコンパイル結果を破棄する。"""
+        with self._lock:
+            self._compiled.pop(policy_id, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._compiled.clear()
+
+
+def _deny(context: Mapping[str, Any]) -> bool:
+    return False
@@ -0,0 +1,628 @@
+import logging
+import os
+import threading
+import time
+import weakref
+from datetime import date
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Mapping, Optional, Set, Tuple
+from sqlalchemy import event
+from sqlalchemy.orm import ORMExecuteState, Session
+from app.common.orm_invalidation import current_and_previous, written_model
+from app.engine.policy_condition import ConditionCompiler, build_context
+from app.engine.policy_snapshot import (
+    AffiliationRow, GroupRoleRow, PolicyRow, PolicySnapshot, PolicySnapshotError, UserRoleRow, write_snapshot
+)
+from app.engine import group_hierarchy  # noqa: F401  m_group の変更を部署階層の閉包へ反映する
+from app.models.models import Group, GroupRole, Policy, UserGroup, UserRole
+from app.repositories.group_role_repository import GroupRoleRepository
+from app.repositories.policy_version_repository import PolicyVersionRepository
+from app.repositories.policy_repository import PolicyRepository
+from app.repositories.user_group_repository import UserGroupRepository
+from app.repositories.user_role_repository import UserRoleRepository
+
+######################################################################
+# Copyright 2016–2025 Ryuta Miki. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+######################################################################
+
+logger = logging.getLogger(__name__)
+
+# (permission_id, resource_id)
+Grant = Tuple[str, str]
+# (condition, update_count)：condition が None のポリシーは無条件で許可する
+PolicyEntry = Tuple[Optional[str], int]
+# (tenant_uuid, group_code, term_from, term_to)
+Affiliation = Tuple[str, str, Optional[date], Optional[date]]
+
+# m_policy_version の対象名（認可情報の書き込みごとに加算する）
+POLICY_VERSION_SCOPE = "cerberus"
+# 他ワーカーの書き込みを確認する間隔（秒）。0 の場合は判定のたびに確認する
+DEFAULT_VERSION_CHECK_SECONDS = float(os.getenv("CERBERUS_POLICY_VERSION_CHECK_SECONDS", "1"))
+
+
+class PolicyIndex:
+    """
+    認可判定用のインメモリインデックス（ユーザー → ロール → (パーミッション, リソース)）。
+
+    ユーザーのロールは、直接割り当てたロール（m_user_role）と、所属部署およびその上位部署に
+    割り当てたロール（m_group_role。m_group_closure で展開済み）の和集合になる。
+
+    load() で各テーブルを1回ずつ読み込み、以降の判定はDBを参照しない。
+    UserRole / Policy を ORM で書き込むと、その差分がセッションに積まれ、コミット時に
+    インデックスへ反映される（ロールバックされた変更は反映しない）。
+    部署・所属・部署ロールの変更と、一括 UPDATE / DELETE のように差分を特定できない書き込みは、
+    コミット時にインデックスを stale にする。stale の間は判定に使わず、load() し直すこと。
+
+    他のプロセス（ワーカー）での書き込みはこのインデックスには届かないため、認可情報を書き込む
+    フラッシュでは m_policy_version の版数を加算する。version（読込時の版数）とDBの版数を
+    比較し、異なれば load() し直すこと。generation は内容が変わるたびに加算されるプロセス内の
+    世代番号で、判定結果のキャッシュの無効化に使う。
+
+    条件（condition）付きのポリシーは、判定時のコンテキストで条件を評価して許可を決める。
+    条件は ConditionCompiler で (policy_id, update_count) ごとに1回だけコンパイルする。
+    判定はロックを取らずに行い、更新はロック内で値を差し替える。
+    """
+
+    def __init__(
+        self,
+        user_role_repository: Optional[UserRoleRepository] = None,
+        policy_repository: Optional[PolicyRepository] = None,
+        condition_compiler: Optional[ConditionCompiler] = None,
+        group_role_repository: Optional[GroupRoleRepository] = None,
+        user_group_repository: Optional[UserGroupRepository] = None,
+        policy_version_repository: Optional[PolicyVersionRepository] = None
+    ):
+        self.user_role_repository = user_role_repository or UserRoleRepository()
+        self.policy_repository = policy_repository or PolicyRepository()
+        self.group_role_repository = group_role_repository or GroupRoleRepository()
+        self.user_group_repository = user_group_repository or UserGroupRepository()
+        self.policy_version_repository = policy_version_repository or PolicyVersionRepository()
+        self.condition_compiler = condition_compiler or ConditionCompiler()
+        # 判定はロックを取らずに行うため、値は差し替えのみで更新する（コピーオンライト）
+        self._user_roles: Dict[str, FrozenSet[str]] = {}
+        self._user_groups: Dict[str, Tuple[Affiliation, ...]] = {}
+        # (tenant_uuid, group_code) → 上位部署から継承したものを含むロール
+        self._group_roles: Dict[Tuple[str, str], FrozenSet[str]] = {}
+        # role_id → permission_id → resource_id → policy_id → (condition, update_count)
+        self._role_grants: Dict[str, Dict[str, Dict[str, Dict[str, PolicyEntry]]]] = {}
+        self._loaded = False
+        self._stale = False
+        self._version: Optional[int] = None
+        self._generation = 0
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+        self._sync_lock = threading.Lock()
+        _indexes.add(self)
+
+    @property
+    def loaded(self) -> bool:
+        """読込済みで、かつ一括更新による不整合が無いかを返す。"""
+        return self._loaded and not self._stale
+
+    @property
+    def version(self) -> Optional[int]:
+        """読込時点の m_policy_version の版数（未読込の場合は None）。"""
+        return self._version
+
+    @property
+    def generation(self) -> int:
+        """インデックスの内容が変わるたびに加算される世代番号。"""
+        return self._generation
+
+    def current_version(self, db_session: Session) -> int:
+        """DB上の最新の版数を返す。"""
+        return self.policy_version_repository.get_version(db_session, POLICY_VERSION_SCOPE)
+
+    def ensure_current(
+        self,
+        session_factory: Callable[[], Session],
+        check_interval: float = DEFAULT_VERSION_CHECK_SECONDS
+    ) -> None:
+        """
+        未読込・stale の場合、または check_interval 秒ごとの確認でDBの版数が読込時と
+        異なる場合（他ワーカーでの書き込み）に load() し直す。
+        """
+        if self.loaded and time.monotonic() - self._checked_at < check_interval:
+            return
+        with self._sync_lock:
+            if self.loaded and time.monotonic() - self._checked_at < check_interval:
+                return
+            with session_factory() as db:
+                if not self.loaded or self.current_version(db) != self._version:
+                    self.load(db)
+            self._checked_at = time.monotonic()
+
+    def load(self, db_session: Session) -> None:
+        """m_user_role・m_policy・部署ロール・所属部署を全件読み込み、インデックスを作り直す。"""
+        # 版数を先に読むことで、読込中に加算された書き込みは次回の比較で必ず検出される
+        version = self.current_version(db_session)
+        user_roles = [(row.user_id, row.role_id) for row in self.user_role_repository.find_all(db_session)]
+        policies = [
+            (row.policy_id, row.role_id, row.permission_id, row.resource_id, row.condition, row.update_count)
+            for row in self.policy_repository.find_all(db_session)
+        ]
+        group_roles = self.group_role_repository.find_inherited_roles(db_session)
+        affiliations = self.user_group_repository.find_all_affiliations(db_session)
+        self._replace(version, user_roles, policies, group_roles, affiliations)
+
+    def save_snapshot(self, path: str) -> int:
+        """
+        インデックスの内容をスナップショット（policy_snapshot の形式）として書き出す。
+
+        読込済みでない（未読込・stale）場合は ValueError。
+
+        Returns:
+            int: 書き出したバイト数
+        """
+        with self._lock:
+            if not self.loaded:
+                raise ValueError("Policy index is not loaded")
+            version = self._version
+            user_roles = [(user, role) for user, roles in self._user_roles.items() for role in roles]
+            policies = [
+                (policy_id, role_id, permission_id, resource_id, condition, update_count)
+                for role_id, permissions in self._role_grants.items()
+                for permission_id, resources in permissions.items()
+                for resource_id, entries in resources.items()
+                for policy_id, (condition, update_count) in entries.items()
+            ]
+            group_roles = [(*group, role) for group, roles in self._group_roles.items() for role in roles]
+            affiliations = [(user, *group) for user, groups in self._user_groups.items() for group in groups]
+        return write_snapshot(path, version, user_roles, policies, group_roles, affiliations)
+
+    def load_snapshot(self, db_session: Session, path: str) -> str:
+        """
+        スナップショットからインデックスを作り、DBの版数と比較して最新の状態に追いつく。
+
+        - 版数が一致する場合は、スナップショットのみで作る（DBは版数の確認のみ）。
+        - DBの版数が進んでいる場合は、m_policy を (ポリシーID, 更新回数) の2列だけ読んで差分を取り、
+          追加・更新されたポリシーのみを取得する。ユーザーロール・部署ロール・所属部署は
+          件数が少ないため読み直す。更新回数を変えずに SQL で直接書き換えたポリシーは検出できないため、
+          その場合は load() すること。
+        - スナップショットが無い・壊れている・DBより新しい場合は load() する。
+
+        Returns:
+            str: "current"（そのまま利用）／ "caught_up"（差分を反映）／ "loaded"（全件読込）
+        """
+        version = self.current_version(db_session)
+        try:
+            with PolicySnapshot(path) as snapshot:
+                snapshot_version = snapshot.version
+                if snapshot_version <= version:
+                    user_roles: List[UserRoleRow] = list(snapshot.user_roles())
+                    policies: List[PolicyRow] = list(snapshot.policies())
+                    group_roles: List[GroupRoleRow] = list(snapshot.group_roles())
+                    affiliations: List[AffiliationRow] = list(snapshot.affiliations())
+        except (OSError, PolicySnapshotError):
+            logger.warning("認可インデックスのスナップショットを読めないため、全件読み込みます: %s", path, exc_info=True)
+            snapshot_version = None
+
+        if snapshot_version is None or snapshot_version > version:
+            self.load(db_session)
+            return "loaded"
+        if snapshot_version == version:
+            self._replace(version, user_roles, policies, group_roles, affiliations)
+            return "current"
+
+        revisions = self.policy_repository.find_revisions(db_session)
+        policies = [row for row in policies if revisions.get(row[0]) == row[5]]
+        unchanged = {row[0] for row in policies}
+        policies.extend(self.policy_repository.find_rows_by_policy_ids(
+            db_session, [policy_id for policy_id in revisions if policy_id not in unchanged]
+        ))
+        self._replace(
+            version,
+            self.user_role_repository.find_all_pairs(db_session),
+            policies,
+            self.group_role_repository.find_inherited_roles(db_session),
+            self.user_group_repository.find_all_affiliations(db_session)
+        )
+        return "caught_up"
+
+    def _replace(
+        self,
+        version: int,
+        user_roles: Iterable[UserRoleRow],
+        policies: Iterable[PolicyRow],
+        group_roles: Iterable[GroupRoleRow],
+        affiliations: Iterable[AffiliationRow]
+    ) -> None:
+        user_groups: Dict[str, List[Affiliation]] = {}
+        for user_uuid, tenant_uuid, group_code, term_from, term_to in affiliations:
+            user_groups.setdefault(user_uuid, []).append((tenant_uuid, group_code, term_from, term_to))
+        inherited: Dict[Tuple[str, str], set] = {}
+        for tenant_uuid, group_code, role_id in group_roles:
+            inherited.setdefault((tenant_uuid, group_code), set()).add(role_id)
+
+        with self._lock:
+            self._user_roles = {}
+            self._role_grants = {}
+            self._user_groups = {user: tuple(groups) for user, groups in user_groups.items()}
+            self._group_roles = {key: frozenset(roles) for key, roles in inherited.items()}
+            for user_id, role_id in user_roles:
+                self._add_user_role(user_id, role_id)
+            for row in policies:
+                self._add_policy(*row)
+            self._loaded = True
+            self._stale = False
+            self._version = version
+            self._generation += 1
+            self._checked_at = time.monotonic()
+
+    def check(
+        self,
+        user_id: str,
+        permission_id: str,
+        resource_id: str,
+        context: Optional[Mapping[str, Any]] = None
+    ) -> bool:
+        """
+        ユーザーがリソースに対してパーミッションを持つかを返す（DBアクセスなし）。
+
+        無条件のポリシーがあればそれで許可し、条件付きのポリシーしか無い場合のみ
+        context（省略時は build_context() の現在時刻のみ）で条件を評価する。
+        """
+        return self.decide(user_id, permission_id, resource_id, context)[0]
+
+    def decide(
+        self,
+        user_id: str,
+        permission_id: str,
+        resource_id: str,
+        context: Optional[Mapping[str, Any]] = None,
+        system_date: Optional[date] = None
+    ) -> Tuple[bool, bool]:
+        """
+        check() と同じ判定を行い、(許可するか, 結果をキャッシュできるか) を返す。
+
+        条件を評価した判定は context や時刻によって変わるため、キャッシュできない。
+        部署から継承したロールは system_date（省略時は当日）時点の所属で判定する。
+        """
+        conditional: List[Tuple[str, PolicyEntry]] = []
+        for role_id in self.roles_of(user_id, system_date):
+            policies = self._role_grants.get(role_id, {}).get(permission_id, {}).get(resource_id)
+            if not policies:
+                continue
+            for policy_id, entry in policies.items():
+                if not entry[0]:
+                    return True, True
+                conditional.append((policy_id, entry))
+        if not conditional:
+            return False, True
+        return self._evaluate_any(conditional, context), False
+
+    def filter_allowed(
+        self,
+        user_id: str,
+        permission_id: str,
+        resource_ids: Iterable[str],
+        context: Optional[Mapping[str, Any]] = None
+    ) -> Set[str]:
+        """
+        resource_ids のうち、ユーザーがパーミッションを持つものを集合で返す（DBアクセスなし）。
+
+        ロールごとに「要求されたリソース」と「ロールに許可されたリソース」の積集合を取るため、
+        件数が多くても check() を繰り返すより大幅に速い。
+        条件付きのポリシーは全リソース共通の context で評価する（リソースの属性で許可が
+        変わる条件は、リソースごとに check() で判定すること）。
+        """
+        requested = set(resource_ids)
+        allowed: Set[str] = set()
+        conditional: Dict[str, List[Tuple[str, PolicyEntry]]] = {}
+        for role_id in self.roles_of(user_id):
+            resources = self._role_grants.get(role_id, {}).get(permission_id)
+            if not resources:
+                continue
+            for resource_id in requested.intersection(resources) - allowed:
+                policies = resources[resource_id]
+                if any(not entry[0] for entry in policies.values()):
+                    allowed.add(resource_id)
+                else:
+                    conditional.setdefault(resource_id, []).extend(policies.items())
+
+        if conditional and context is None:
+            context = build_context()
+        for resource_id, policies in conditional.items():
+            if resource_id not in allowed and self._evaluate_any(policies, context):
+                allowed.add(resource_id)
+        return allowed
+
+    def roles_of(self, user_id: str, system_date: Optional[date] = None) -> FrozenSet[str]:
+        """
+        ユーザーの実効ロール（直接割り当て＋有効期間内の所属部署から継承したもの）を返す。
+
+        部署階層は読込時に展開済みのため、所属部署ごとに1回の辞書参照で済む。
+        """
+        roles = self._user_roles.get(user_id, frozenset())
+        affiliations = self._user_groups.get(user_id)
+        if not affiliations:
+            return roles
+        system_date = system_date or date.today()
+        for tenant_uuid, group_code, term_from, term_to in affiliations:
+            if (term_from is None or term_from <= system_date) and (term_to is None or system_date <= term_to):
+                roles = roles | self._group_roles.get((tenant_uuid, group_code), frozenset())
+        return roles
+
+    def permissions_of(self, user_id: str, system_date: Optional[date] = None) -> FrozenSet[str]:
+        """
+        ユーザーの実効ロールのいずれかがポリシーを持つパーミッションを返す（リソース・条件は問わない）。
+
+        画面・API単位の粗い認可に使う。リソースごとの判定は check() で行うこと。
+        """
+        role_grants = self._role_grants
+        return frozenset(
+            permission_id
+            for role_id in self.roles_of(user_id, system_date)
+            for permission_id in role_grants.get(role_id, ())
+        )
+
+    def grants_of(self, role_id: str) -> FrozenSet[Grant]:
+        """ロールに割り当てられた (パーミッション, リソース) を返す。"""
+        return frozenset(
+            (permission_id, resource_id)
+            for permission_id, resources in self._role_grants.get(role_id, {}).items()
+            for resource_id in resources
+        )
+
+    def apply(self, changes: Iterable["IndexChange"]) -> None:
+        """コミット済みの差分を反映する。"""
+        with self._lock:
+            for change in changes:
+                change.apply_to(self)
+            self._generation += 1
+
+    def advance_version(self, previous: int, version: int) -> None:
+        """
+        このプロセスでコミットした書き込み（apply() で反映済み）による版数の加算を記録する。
+
+        インデックスが加算前の版数（previous）のままの場合のみ version に進める。間に他ワーカーの
+        書き込みが挟まっている場合は進めず、次回の版数確認で読み込み直す。
+        """
+        with self._lock:
+            if self._version is not None and self._version == previous:
+                self._version = version
+
+    def mark_stale(self) -> None:
+        with self._lock:
+            self._stale = True
+            self._generation += 1
+
+    def clear(self) -> None:
+        """インデックスを破棄する（未読込の状態に戻す）。"""
+        with self._lock:
+            self._user_roles = {}
+            self._user_groups = {}
+            self._group_roles = {}
+            self._role_grants = {}
+            self._loaded = False
+            self._stale = False
+            self._version = None
+            self._generation += 1
+        self.condition_compiler.clear()
+
+    def _evaluate_any(
+        self, policies: List[Tuple[str, PolicyEntry]], context: Optional[Mapping[str, Any]]
+    ) -> bool:
+        if not policies:
+            return False
+        if context is None:
+            context = build_context()
+        return any(
+            self.condition_compiler.evaluate(policy_id, update_count, condition, context)
+            for policy_id, (condition, update_count) in policies
+        )
+
+    def _add_user_role(self, user_id: str, role_id: str) -> None:
+        self._user_roles[user_id] = self._user_roles.get(user_id, frozenset()) | {role_id}
+
+    def _remove_user_role(self, user_id: str, role_id: str) -> None:
+        roles = self._user_roles.get(user_id, frozenset()) - {role_id}
+        if roles:
+            self._user_roles[user_id] = roles
+        else:
+            self._user_roles.pop(user_id, None)
+
+    def _add_policy(
+        self, policy_id: str, role_id: str, permission_id: str, resource_id: str,
+        condition: Optional[str], update_count: Optional[int]
+    ) -> None:
+        resources = self._role_grants.setdefault(role_id, {}).setdefault(permission_id, {})
+        resources[resource_id] = {**resources.get(resource_id, {}), policy_id: (condition, update_count or 0)}
+
+    def _remove_policy(self, policy_id: str, role_id: str, permission_id: str, resource_id: str) -> None:
+        self.condition_compiler.discard(policy_id)
+        permissions = self._role_grants.get(role_id)
+        resources = permissions.get(permission_id) if permissions else None
+        if resources is None:
+            return
+        policies = {k: v for k, v in resources.get(resource_id, {}).items() if k != policy_id}
+        if policies:
+            resources[resource_id] = policies
+        else:
+            resources.pop(resource_id, None)
+        if not resources:
+            permissions.pop(permission_id, None)
+        if not permissions:
+            self._role_grants.pop(role_id, None)
+
+
+class IndexChange:
+    """セッションに積まれるインデックスの差分（1行分の追加または削除）。"""
+
+    __slots__ = ("kind", "added", "values")
+
+    def __init__(self, kind: str, added: bool, values: Tuple):
+        self.kind = kind
+        self.added = added
+        self.values = values
+
+    def apply_to(self, index: PolicyIndex) -> None:
+        if self.kind == "reload":
+            # apply() がロックを保持しているため、mark_stale() は使わない
+            index._stale = True
+        elif self.kind == "user_role":
+            (index._add_user_role if self.added else index._remove_user_role)(*self.values)
+        elif self.added:
+            index._add_policy(*self.values)
+        else:
+            index._remove_policy(*self.values[:4])
+
+
+# ----------------------------------------------------------------------
+# ORM 書き込み時の差分反映
+# ----------------------------------------------------------------------
+
+_indexes: "weakref.WeakSet[PolicyIndex]" = weakref.WeakSet()
+
+_PENDING_KEY = "cerberus_policy_index_changes"
+_WRITTEN_KEY = "cerberus_policy_written"
+# このトランザクションで加算した版数の (加算前, 最後の加算後)
+_BUMPED_KEY = "cerberus_policy_version_bumped"
+
+_version_repository = PolicyVersionRepository()
+
+
+def _pending(session: Session) -> List[IndexChange]:
+    return session.info.setdefault(_PENDING_KEY, [])
+
+
+def _values_of(target, previous: bool) -> Tuple:
+    def pick(attribute: str):
+        values = current_and_previous(target, attribute)
+        return values[-1] if previous else values[0]
+
+    if isinstance(target, UserRole):
+        return pick("user_id"), pick("role_id")
+    return (
+        pick("policy_id"), pick("role_id"), pick("permission_id"), pick("resource_id"),
+        pick("condition"), pick("update_count")
+    )
+
+
+def _kind_of(target) -> str:
+    if isinstance(target, UserRole):
+        return "user_role"
+    if isinstance(target, Policy):
+        return "policy"
+    return "reload"
+
+
+def _record(target, changes: List[Tuple[bool, bool]]) -> None:
+    session = Session.object_session(target)
+    if session is None:
+        return
+    session.info[_WRITTEN_KEY] = True
+    pending = _pending(session)
+    kind = _kind_of(target)
+    if kind == "reload":
+        # 部署・所属・部署ロールの変更は継承関係に波及するため、差分ではなく再読込で反映する
+        pending.append(IndexChange(kind, False, ()))
+        return
+    for added, previous in changes:
+        pending.append(IndexChange(kind, added, _values_of(target, previous)))
+
+
+def _on_insert(mapper, connection, target) -> None:
+    _record(target, [(True, False)])
+
+
+def _on_delete(mapper, connection, target) -> None:
+    _record(target, [(False, True)])
+
+
+def _on_update(mapper, connection, target) -> None:
+    # 更新は「変更前の行の削除」＋「変更後の行の追加」として扱う
+    _record(target, [(False, True), (True, False)])
+
+
+def record_bulk_insert(
+    session: Session,
+    user_roles: Iterable[Tuple[str, str]] = (),
+    policies: Iterable[Tuple[str, str, str, str, Optional[str]]] = ()
+) -> None:
+    """
+    ORM を経由せずに一括登録した行を、ORM の書き込みと同様にコミット時にインデックスへ反映する。
+    版数もこの時点で（同じトランザクション内で）加算する。
+
+    Args:
+        user_roles: 追加した (ユーザーID, ロールID)
+        policies: 追加した (ポリシーID, ロールID, パーミッションID, リソースID, 条件)
+    """
+    pending = _pending(session)
+    changes = [IndexChange("user_role", True, tuple(row)) for row in user_roles]
+    changes.extend(IndexChange("policy", True, tuple(row) + (0,)) for row in policies)
+    if changes:
+        pending.extend(changes)
+        _bump_version(session)
+
+
+def record_reload(session: Session) -> None:
+    """
+    インデックスの読込対象（部署階層の閉包など）を ORM を経由せずに作り直した場合に、
+    コミット時にインデックスを再読込する。版数もこの時点で加算し、他のワーカーにも再読込させる。
+    """
+    _pending(session).append(IndexChange("reload", False, ()))
+    _bump_version(session)
+
+
+def _bump_version(session: Session) -> None:
+    version = _version_repository.bump(session, POLICY_VERSION_SCOPE)
+    bumped = session.info.get(_BUMPED_KEY)
+    session.info[_BUMPED_KEY] = (bumped[0] if bumped else version - 1, version)
+
+
+def _bump_version_on_flush(session: Session, flush_context) -> None:
+    # 同じトランザクションで版数を加算し、他のワーカーがコミット後に変更を検出できるようにする
+    if session.info.pop(_WRITTEN_KEY, False):
+        _bump_version(session)
+
+
+def _apply_on_commit(session: Session) -> None:
+    changes = session.info.pop(_PENDING_KEY, None)
+    bumped = session.info.pop(_BUMPED_KEY, None)
+    for index in list(_indexes):
+        if changes:
+            index.apply(changes)
+        if bumped:
+            index.advance_version(*bumped)
+
+
+def _discard_on_rollback(session: Session, previous_transaction) -> None:
+    session.info.pop(_PENDING_KEY, None)
+    session.info.pop(_WRITTEN_KEY, None)
+    session.info.pop(_BUMPED_KEY, None)
+
+
+def _reload_on_execute(orm_execute_state: ORMExecuteState) -> None:
+    # Session.execute() による一括の INSERT / UPDATE / DELETE は対象行が分からないため、
+    # 同じトランザクションで版数を加算し、コミット時に再読込が必要な状態にする
+    if written_model(orm_execute_state, _INDEXED_MODELS) is not None:
+        session = orm_execute_state.session
+        _pending(session).append(IndexChange("reload", False, ()))
+        _bump_version(session)
+
+
+_INDEXED_MODELS = (UserRole, Policy, GroupRole, UserGroup, Group)
+
+for _model in _INDEXED_MODELS:
+    event.listen(_model, "after_insert", _on_insert)
+    event.listen(_model, "after_delete", _on_delete)
+    event.listen(_model, "after_update", _on_update)
+event.listen(Session, "after_flush", _bump_version_on_flush)
+event.listen(Session, "after_commit", _apply_on_commit)
+event.listen(Session, "after_soft_rollback", _discard_on_rollback)
+event.listen(Session, "do_orm_execute", _reload_on_execute)
+
+
+default_policy_index = PolicyIndex()
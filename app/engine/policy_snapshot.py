@@ -0,0 +1,320 @@
+import mmap
+import os
+import struct
+import sys
+from array import array
+from datetime import date
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+######################################################################
+# Copyright 2016–2025 Ryuta Miki. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+######################################################################
+
+# ----------------------------------------------------------------------
+# PolicyIndex の内容を保存するバイナリ形式（ワーカー起動時の読込短縮用）。
+#
+# ID・条件などの文字列はすべて文字列表に1回だけ格納し（インターン）、各表は文字列表の
+# 番号を並べた int32 の配列で持つ。ユーザー → ロール、ロール → ポリシー、部署 → ロールは
+# 「キーの配列＋開始位置の配列＋値の配列」（CSR 形式の隣接配列）で表す。
+#
+#   ヘッダ   : マジック(4) 形式版(uint16) 予約(uint16) m_policy_version の版数(int64) 表の数(uint32)
+#   各表     : 型コード(1) 予約(3) 要素数(uint64) データ（8バイト境界に揃える）
+#
+# 数値はリトルエンディアン。読込時は mmap したファイルの各表を memoryview.cast() で
+# そのまま配列として参照するため、ファイル全体をコピーしない。
+# ----------------------------------------------------------------------
+
+MAGIC = b"CPIX"
+FORMAT_VERSION = 1
+NONE = -1
+
+_HEADER = struct.Struct("<4sHHqI")
+_SECTION = struct.Struct("<c3xQ")
+_ALIGN = 8
+
+# 表の並び（名前, 型コード）。i = int32、I = uint32（開始位置）、B = バイト列
+_SECTIONS: Tuple[Tuple[str, str], ...] = (
+    ("string_offsets", "I"),
+    ("string_data", "B"),
+    ("user_role_users", "i"),
+    ("user_role_offsets", "I"),
+    ("user_role_roles", "i"),
+    ("grant_roles", "i"),
+    ("grant_offsets", "I"),
+    ("policy_ids", "i"),
+    ("policy_permissions", "i"),
+    ("policy_resources", "i"),
+    ("policy_conditions", "i"),
+    ("policy_update_counts", "i"),
+    ("group_tenants", "i"),
+    ("group_codes", "i"),
+    ("group_role_offsets", "I"),
+    ("group_role_roles", "i"),
+    ("affiliation_users", "i"),
+    ("affiliation_tenants", "i"),
+    ("affiliation_groups", "i"),
+    ("affiliation_from", "i"),
+    ("affiliation_to", "i"),
+)
+
+# (user_id, role_id)
+UserRoleRow = Tuple[str, str]
+# (policy_id, role_id, permission_id, resource_id, condition, update_count)
+PolicyRow = Tuple[str, str, str, str, Optional[str], int]
+# (tenant_uuid, group_code, role_id)
+GroupRoleRow = Tuple[str, str, str]
+# (user_uuid, tenant_uuid, group_code, term_from, term_to)
+AffiliationRow = Tuple[str, str, str, Optional[date], Optional[date]]
+
+
+class PolicySnapshotError(ValueError):
+    """スナップショットの形式が不正（壊れている・形式版が異なる）。"""
+
+
+class _Interner:
+    def __init__(self):
+        self.ids: Dict[str, int] = {}
+
+    def __call__(self, value: Optional[str]) -> int:
+        if value is None:
+            return NONE
+        index = self.ids.get(value)
+        if index is None:
+            index = self.ids[value] = len(self.ids)
+        return index
+
+
+def _ordinal(value: Optional[date]) -> int:
+    return value.toordinal() if value is not None else NONE
+
+
+def _csr(groups: Dict[int, List[int]], keys: List[int]) -> Tuple[array, array]:
+    offsets, values = array("I", [0]), array("i")
+    for key in keys:
+        values.extend(groups[key])
+        offsets.append(len(values))
+    return offsets, values
+
+
+def write_snapshot(
+    path: str,
+    version: int,
+    user_roles: Iterable[UserRoleRow],
+    policies: Iterable[PolicyRow],
+    group_roles: Iterable[GroupRoleRow],
+    affiliations: Iterable[AffiliationRow]
+) -> int:
+    """
+    インデックスの内容をスナップショットとして書き出す。
+
+    一時ファイルに書いてから置き換えるため、読込中のワーカーが途中までのファイルを読むことはない。
+
+    Returns:
+        int: 書き出したバイト数
+    """
+    intern = _Interner()
+    tables: Dict[str, array] = {name: array(code) for name, code in _SECTIONS}
+
+    roles_by_user: Dict[int, List[int]] = {}
+    for user_id, role_id in user_roles:
+        roles_by_user.setdefault(intern(user_id), []).append(intern(role_id))
+    users = sorted(roles_by_user)
+    tables["user_role_users"].extend(users)
+    tables["user_role_offsets"], tables["user_role_roles"] = _csr(roles_by_user, users)
+
+    policies_by_role: Dict[int, List[PolicyRow]] = {}
+    for row in policies:
+        policies_by_role.setdefault(intern(row[1]), []).append(row)
+    tables["grant_offsets"].append(0)
+    for role in sorted(policies_by_role):
+        tables["grant_roles"].append(role)
+        for policy_id, _, permission_id, resource_id, condition, update_count in policies_by_role[role]:
+            tables["policy_ids"].append(intern(policy_id))
+            tables["policy_permissions"].append(intern(permission_id))
+            tables["policy_resources"].append(intern(resource_id))
+            tables["policy_conditions"].append(intern(condition or None))
+            tables["policy_update_counts"].append(update_count or 0)
+        tables["grant_offsets"].append(len(tables["policy_ids"]))
+
+    roles_by_group: Dict[Tuple[int, int], List[int]] = {}
+    for tenant_uuid, group_code, role_id in group_roles:
+        roles_by_group.setdefault((intern(tenant_uuid), intern(group_code)), []).append(intern(role_id))
+    tables["group_role_offsets"].append(0)
+    for key in sorted(roles_by_group):
+        tables["group_tenants"].append(key[0])
+        tables["group_codes"].append(key[1])
+        tables["group_role_roles"].extend(roles_by_group[key])
+        tables["group_role_offsets"].append(len(tables["group_role_roles"]))
+
+    for user_uuid, tenant_uuid, group_code, term_from, term_to in affiliations:
+        tables["affiliation_users"].append(intern(user_uuid))
+        tables["affiliation_tenants"].append(intern(tenant_uuid))
+        tables["affiliation_groups"].append(intern(group_code))
+        tables["affiliation_from"].append(_ordinal(term_from))
+        tables["affiliation_to"].append(_ordinal(term_to))
+
+    encoded = [value.encode("utf-8") for value in intern.ids]
+    tables["string_offsets"].append(0)
+    for value in encoded:
+        tables["string_offsets"].append(tables["string_offsets"][-1] + len(value))
+    tables["string_data"] = array("B", b"".join(encoded))
+
+    temporary = f"{path}.{os.getpid()}.tmp"
+    with open(temporary, "wb") as f:
+        f.write(_HEADER.pack(MAGIC, FORMAT_VERSION, 0, version, len(_SECTIONS)))
+        for name, code in _SECTIONS:
+            table = tables[name]
+            if sys.byteorder != "little" and table.itemsize > 1:
+                table.byteswap()
+            f.write(_SECTION.pack(code.encode("ascii"), len(table)))
+            f.write(b"\0" * (-f.tell() % _ALIGN))
+            table.tofile(f)
+        size = f.tell()
+    os.replace(temporary, path)
+    return size
+
+
+class PolicySnapshot:
+    """
+    mmap で開いたスナップショット。各表はファイル上の領域をそのまま参照する。
+
+    with 文で使い、抜けた時点でファイルを閉じる（取り出した文字列・タプルは閉じた後も使える）。
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, "rb") as f:
+            try:
+                self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError as e:
+                raise PolicySnapshotError(f"Empty policy snapshot: {path}") from e
+        self._views: List[memoryview] = []
+        try:
+            self.version, self._tables = self._parse()
+            self.strings = self._decode_strings()
+        except Exception:
+            self.close()
+            raise
+
+    def __enter__(self) -> "PolicySnapshot":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        # mmap は参照中の memoryview が残っていると閉じられないため、先に解放する
+        for view in reversed(self._views):
+            view.release()
+        self._views.clear()
+        self._tables = {}
+        self._mmap.close()
+
+    def table(self, name: str) -> Sequence[int]:
+        return self._tables[name]
+
+    def user_roles(self) -> Iterator[UserRoleRow]:
+        strings, users, offsets, roles = (
+            self.strings, self.table("user_role_users"), self.table("user_role_offsets"), self.table("user_role_roles")
+        )
+        for i, user in enumerate(users):
+            user_id = strings[user]
+            for role in roles[offsets[i]:offsets[i + 1]]:
+                yield user_id, strings[role]
+
+    def policies(self) -> Iterator[PolicyRow]:
+        strings, roles, offsets = self.strings, self.table("grant_roles"), self.table("grant_offsets")
+        ids, permissions, resources = (
+            self.table("policy_ids"), self.table("policy_permissions"), self.table("policy_resources")
+        )
+        conditions, update_counts = self.table("policy_conditions"), self.table("policy_update_counts")
+        for i, role in enumerate(roles):
+            role_id = strings[role]
+            for j in range(offsets[i], offsets[i + 1]):
+                condition = conditions[j]
+                yield (
+                    strings[ids[j]], role_id, strings[permissions[j]], strings[resources[j]],
+                    strings[condition] if condition != NONE else None, update_counts[j]
+                )
+
+    def group_roles(self) -> Iterator[GroupRoleRow]:
+        strings, tenants, codes = self.strings, self.table("group_tenants"), self.table("group_codes")
+        offsets, roles = self.table("group_role_offsets"), self.table("group_role_roles")
+        for i, tenant in enumerate(tenants):
+            tenant_uuid, group_code = strings[tenant], strings[codes[i]]
+            for role in roles[offsets[i]:offsets[i + 1]]:
+                yield tenant_uuid, group_code, strings[role]
+
+    def affiliations(self) -> Iterator[AffiliationRow]:
+        strings = self.strings
+        columns = zip(
+            self.table("affiliation_users"), self.table("affiliation_tenants"), self.table("affiliation_groups"),
+            self.table("affiliation_from"), self.table("affiliation_to")
+        )
+        for user, tenant, group, term_from, term_to in columns:
+            yield (
+                strings[user], strings[tenant], strings[group],
+                date.fromordinal(term_from) if term_from != NONE else None,
+                date.fromordinal(term_to) if term_to != NONE else None
+            )
+
+    def _parse(self) -> Tuple[int, Dict[str, Sequence[int]]]:
+        buffer = memoryview(self._mmap)
+        self._views.append(buffer)
+        if len(buffer) < _HEADER.size:
+            raise PolicySnapshotError(f"Truncated policy snapshot: {self.path}")
+        magic, format_version, _, version, count = _HEADER.unpack_from(buffer)
+        if magic != MAGIC or format_version != FORMAT_VERSION or count != len(_SECTIONS):
+            raise PolicySnapshotError(f"Unsupported policy snapshot: {self.path}")
+
+        tables: Dict[str, Sequence[int]] = {}
+        position = _HEADER.size
+        for name, code in _SECTIONS:
+            if position + _SECTION.size > len(buffer):
+                raise PolicySnapshotError(f"Truncated policy snapshot: {self.path}")
+            stored_code, length = _SECTION.unpack_from(buffer, position)
+            if stored_code.decode("ascii") != code:
+                raise PolicySnapshotError(f"Corrupted policy snapshot: {self.path}")
+            position += _SECTION.size
+            position += -position % _ALIGN
+            itemsize = array(code).itemsize
+            end = position + length * itemsize
+            if end > len(buffer):
+                raise PolicySnapshotError(f"Truncated policy snapshot: {self.path}")
+            tables[name] = self._table(buffer[position:end], code)
+            position = end
+        return version, tables
+
+    def _table(self, region: memoryview, code: str) -> Sequence[int]:
+        self._views.append(region)
+        if code == "B":
+            return region
+        if sys.byteorder != "little":
+            # ビッグエンディアン環境ではファイルを直接参照できないため、変換したコピーを使う
+            table = array(code, region.tobytes())
+            table.byteswap()
+            return table
+        view = region.cast(code)
+        self._views.append(view)
+        return view
+
+    def _decode_strings(self) -> List[str]:
+        offsets, data = self._tables["string_offsets"], self._tables["string_data"]
+        if not offsets or offsets[-1] > len(data):
+            raise PolicySnapshotError(f"Corrupted policy snapshot: {self.path}")
+        try:
+            return [str(data[offsets[i]:offsets[i + 1]], "utf-8") for i in range(len(offsets) - 1)]
+        except UnicodeDecodeError as e:
+            raise PolicySnapshotError(f"Corrupted policy snapshot: {self.path}") from e
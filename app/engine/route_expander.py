@@ -0,0 +1,256 @@
+import logging
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, List, Optional, Sequence, Set, Tuple
+from sqlalchemy.orm import Session
+from app.common.error_message_loader import ErrorMessageLoader
+from app.dtos.application_info_dto import ApplicationInfoDto
+from app.dtos.approverl_info_dto import ApproverlInfoDto
+from app.engine.approver_resolver import ApproverLookups, ApproverResolver
+from app.engine.boss_resolver import BossResolver, BossTarget
+from app.engine.master_data_resolver import MasterDataResolver
+from app.engine.route_plan_cache import PlannedActivity, RoutePlanCache
+from app.exception.laubeException import LaubeException
+from app.models.models import ApplicationFormRoute
+from app.models.specifiedValue import ApprovalFunction, RouteFlag, RouteType
+from app.repositories.application_form_repository import ApplicationFormRepository
+from app.repositories.application_form_route_repository import ApplicationFormRouteRepository
+
+######################################################################
+# Copyright 2016–2025 Ryuta Miki. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+######################################################################
+
+logger = logging.getLogger(__name__)
+
+# 上司ルートは直属上司1名の審査として展開する
+BOSS_ACTIVITY_CODE = 1
+
+
+class PhaseTimer:
+    """
+    処理フェーズごとの経過時間（秒）を積算する。
+    """
+
+    def __init__(self):
+        self.timings: Dict[str, float] = {}
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.timings[name] = self.timings.get(name, 0.0) + time.perf_counter() - start
+
+
+@dataclass
+class RouteExpansion:
+    """
+    expand_route の結果。
+
+    Attributes:
+        application_form_code: 申請書コード
+        route_flag: 申請書の直接部門の扱い
+        individual_route_code: 展開した直接部門コード（上司ルート・直接部門なしの場合は None）
+        common_route_code: 展開した間接部門コード（未設定の場合は None）
+        boss: 上司ルートで解決した上司（上司ルート以外、または上司マスタが無い場合は None）
+        individual: 直接部門側（上司ルートを含む）の承認者リスト
+        common: 間接部門側の承認者リスト
+        timings: フェーズ名 → 経過秒数（form / boss / plan / lookups / names / build）
+    """
+    application_form_code: str
+    route_flag: RouteFlag
+    individual_route_code: Optional[str] = None
+    common_route_code: Optional[str] = None
+    boss: Optional[BossTarget] = None
+    individual: List[ApproverlInfoDto] = field(default_factory=list)
+    common: List[ApproverlInfoDto] = field(default_factory=list)
+    timings: Dict[str, float] = field(default_factory=dict)
+
+    @property
+    def approvers(self) -> List[ApproverlInfoDto]:
+        """承認順（直接部門 → 間接部門）に並べた承認者リストを返す。"""
+        return self.individual + self.common
+
+
+class RouteExpander:
+    """
+    申請内容から承認経路全体（上司ルート・直接部門ルート・間接部門ルート）を1回で展開する。
+
+    - 申請書と申請書別ルートはそれぞれ1回の検索で取得する（部署指定を部署未指定より優先）。
+    - ルート構造は RoutePlanCache から取得するため、キャッシュヒット時はアクティビティを再読込しない。
+    - 承認者の検証用マスタと表示名称は全ルート分をまとめて取得し、ルートごとに検索しない。
+    - skip_apply_employee が設定された申請書では、申請者本人を承認者から外す。
+    - 自動承認の重複判定はルートをまたいで行う（直接部門で承認済みの承認者は間接部門で自動承認）。
+    """
+
+    def __init__(
+        self,
+        error_loader: Optional[ErrorMessageLoader] = None,
+        application_form_repository: Optional[ApplicationFormRepository] = None,
+        application_form_route_repository: Optional[ApplicationFormRouteRepository] = None,
+        boss_resolver: Optional[BossResolver] = None,
+        route_plan_cache: Optional[RoutePlanCache] = None,
+        approver_resolver: Optional[ApproverResolver] = None
+    ):
+        self.error_loader = error_loader or ErrorMessageLoader()
+        self.application_form_repository = application_form_repository or ApplicationFormRepository()
+        self.application_form_route_repository = application_form_route_repository or ApplicationFormRouteRepository()
+        self.boss_resolver = boss_resolver or BossResolver()
+        self.route_plan_cache = route_plan_cache or RoutePlanCache()
+        self.approver_resolver = approver_resolver or ApproverResolver(error_loader=self.error_loader)
+
+    def expand(
+        self,
+        db_session: Session,
+        tenant_uuid: str,
+        application: ApplicationInfoDto,
+        system_date,
+        master_data: Optional[MasterDataResolver] = None
+    ) -> RouteExpansion:
+        """
+        承認経路を展開する。
+
+        Args:
+            db_session (Session): DBセッション
+            tenant_uuid (str): 申請書・ルートマスタを保持するテナントUUID
+            application (ApplicationInfoDto): 申請内容（申請書コード・対象者・申請者を参照）
+            system_date (date): 有効期限判定の基準日
+            master_data (Optional[MasterDataResolver]): リクエスト内で共有する名称リゾルバ
+
+        Returns:
+            RouteExpansion: 展開結果とフェーズごとの経過時間
+        """
+        timer = PhaseTimer()
+        form_code = application.application_form_code
+
+        with timer.phase("form"):
+            application_form = self.application_form_repository.get_by_code(db_session, tenant_uuid, form_code)
+            if application_form is None:
+                raise LaubeException("Laube-E006", self.error_loader.get_message("Laube-E006"))
+            form_route = self._find_form_route(db_session, tenant_uuid, form_code, application.target_group_code)
+
+        expansion = RouteExpansion(
+            application_form_code=form_code,
+            route_flag=application_form.route_flag,
+            common_route_code=self._route_code(form_route and form_route.common_route_code)
+        )
+
+        # 直接部門側のアクティビティ（上司ルートまたは個別ルート）と、その承認者を検証するテナント
+        individual: Tuple[PlannedActivity, ...] = ()
+        individual_tenant = tenant_uuid
+        if RouteFlag.BOSS_ROUTE == application_form.route_flag:
+            with timer.phase("boss"):
+                expansion.boss = self.boss_resolver.resolve(
+                    db_session, tenant_uuid, application.target_user_uuid, application.target_group_code, form_code
+                )
+            if expansion.boss is not None:
+                individual = (self._boss_activity(expansion.boss),)
+                individual_tenant = expansion.boss.boss_tenant_uuid
+        elif RouteFlag.INDIVIDUAL_ROUTE == application_form.route_flag:
+            expansion.individual_route_code = self._route_code(form_route and form_route.individual_route_code)
+        elif RouteFlag.NO_INDIVIDUAL_ROUTE != application_form.route_flag:
+            raise LaubeException("Laube-E007", self.error_loader.get_message("Laube-E007"))
+
+        common: Tuple[PlannedActivity, ...] = ()
+        with timer.phase("plan"):
+            if expansion.individual_route_code:
+                individual = self.route_plan_cache.get_plan(
+                    db_session, tenant_uuid, expansion.individual_route_code, RouteType.INDIVIDUAL
+                ).activities
+            if expansion.common_route_code:
+                common = self.route_plan_cache.get_plan(
+                    db_session, tenant_uuid, expansion.common_route_code, RouteType.COMMON
+                ).activities
+
+        if application_form.skip_apply_employee:
+            applicant = application.applicant_user_uuid or application.target_user_uuid
+            individual = self._without_user(individual, applicant)
+            common = self._without_user(common, applicant)
+
+        if individual or common:
+            with timer.phase("lookups"):
+                lookups = self._load_lookups(
+                    db_session, [(individual_tenant, individual), (tenant_uuid, common)]
+                )
+            with timer.phase("names"):
+                names = master_data or self.approver_resolver.new_master_data_resolver(db_session)
+                self.approver_resolver.prefetch_names(names, tenant_uuid, individual + common)
+            with timer.phase("build"):
+                route_user_uuids: Set[str] = set()
+                expansion.individual = self.approver_resolver.build(
+                    tenant_uuid, individual, application_form, system_date,
+                    lookups[individual_tenant], names, RouteType.INDIVIDUAL, route_user_uuids
+                )
+                expansion.common = self.approver_resolver.build(
+                    tenant_uuid, common, application_form, system_date,
+                    lookups[tenant_uuid], names, RouteType.COMMON, route_user_uuids
+                )
+
+        expansion.timings = timer.timings
+        logger.debug("route expanded: form=%s timings=%s", form_code, timer.timings)
+        return expansion
+
+    def _find_form_route(
+        self, db_session: Session, tenant_uuid: str, form_code: str, group_code: Optional[str]
+    ) -> Optional[ApplicationFormRoute]:
+        # 部署指定と部署未指定のルートを1回で取得し、部署指定を優先する
+        routes = self.application_form_route_repository.find_by_codes_and_group(
+            db_session, tenant_uuid, [form_code], group_code
+        )
+        picked: Optional[ApplicationFormRoute] = None
+        for route in routes:
+            if picked is None or (picked.group_code is None and route.group_code is not None):
+                picked = route
+        return picked
+
+    def _load_lookups(
+        self, db_session: Session, segments: Sequence[Tuple[str, Sequence[PlannedActivity]]]
+    ) -> Dict[str, ApproverLookups]:
+        """
+        検証テナントごとに全ルート分のアクティビティをまとめ、マスタを1回ずつ取得する。
+        """
+        by_tenant: Dict[str, List[PlannedActivity]] = {}
+        for tenant_uuid, activities in segments:
+            by_tenant.setdefault(tenant_uuid, []).extend(activities)
+        return {
+            tenant_uuid: self.approver_resolver.load(db_session, tenant_uuid, activities)
+            if activities else ApproverLookups()
+            for tenant_uuid, activities in by_tenant.items()
+        }
+
+    @staticmethod
+    def _boss_activity(boss: BossTarget) -> PlannedActivity:
+        return PlannedActivity(
+            activity_code=BOSS_ACTIVITY_CODE,
+            function=ApprovalFunction.EXAMINATION,
+            approverl_tenant_uuid=boss.boss_tenant_uuid,
+            approverl_group_code=boss.boss_group_code,
+            approverl_user_uuid=boss.boss_user_uuid
+        )
+
+    @staticmethod
+    def _without_user(activities: Tuple[PlannedActivity, ...], user_uuid: Optional[str]) -> Tuple[PlannedActivity, ...]:
+        if not user_uuid:
+            return activities
+        return tuple(
+            a for a in activities
+            if a.approverl_user_uuid != user_uuid or (a.approverl_role_code and a.approverl_role_code.strip())
+        )
+
+    @staticmethod
+    def _route_code(route_code: Optional[str]) -> Optional[str]:
+        return route_code if route_code and route_code.strip() else None
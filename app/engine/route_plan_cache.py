@@ -0,0 +1,291 @@
+import threading
+import time
+import weakref
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Optional, Set, Tuple
+from sqlalchemy.orm import Session
+from app.common.lru_cache import LruCache
+from app.common.orm_invalidation import current_and_previous, invalidate_on_write
+from app.models.models import CommonActivity, CommonRoute, IndividualActivity, IndividualRoute
+from app.models.specifiedValue import ApprovalFunction, RouteType
+from app.repositories.common_activity_repository import CommonActivityRepository
+from app.repositories.common_route_repository import CommonRouteRepository
+from app.repositories.individual_activity_repository import IndividualActivityRepository
+from app.repositories.individual_route_repository import IndividualRouteRepository
+
+######################################################################
+# Copyright 2016–2025 Ryuta Miki. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+######################################################################
+
+
+@dataclass(frozen=True)
+class PlannedActivity:
+    """
+    コンパイル済みルートプラン内の1アクティビティ（不変）。
+
+    IndividualActivity / CommonActivity のうち承認者リスト構築に必要な項目だけを保持する。
+    属性名は両モデルと同じなので、ApproverResolver にそのまま渡せる。
+    """
+    activity_code: int
+    function: ApprovalFunction
+    approverl_tenant_uuid: Optional[str] = None
+    approverl_role_code: Optional[str] = None
+    approverl_group_code: Optional[str] = None
+    approverl_user_uuid: Optional[str] = None
+    instance_group_id: Optional[str] = None
+    instance_index: Optional[int] = None
+    total_instance_count: Optional[int] = None
+    is_milestone: bool = False
+    is_terminal: bool = False
+
+
+@dataclass(frozen=True)
+class RoutePlan:
+    """
+    個別ルート（m_individual_route / m_individual_activity）または共通ルート
+    （m_common_route / m_common_activity）をコンパイルした不変のプラン。
+
+    Attributes:
+        tenant_uuid: テナントUUID
+        route_type: ルート種別（直接部門 / 間接部門）
+        route_code: 直接部門コードまたは間接部門コード
+        route_name: ルート名（ルートヘッダが無い場合は None）
+        activities: アクティビティコード順のアクティビティ
+        instance_groups: 多重インスタンスグループID → 所属アクティビティコード
+        milestones: マイルストーンのアクティビティコード
+        version: コンパイル時点の更新状態（各 RouteRepository.get_route_version の戻り値）
+    """
+    tenant_uuid: str
+    route_type: RouteType
+    route_code: str
+    route_name: Optional[str]
+    activities: Tuple[PlannedActivity, ...]
+    instance_groups: Tuple[Tuple[str, Tuple[int, ...]], ...]
+    milestones: Tuple[int, ...]
+    version: Tuple[Any, ...]
+
+    def instance_group(self, instance_group_id: str) -> Tuple[int, ...]:
+        """指定した多重インスタンスグループに属するアクティビティコードを返す。"""
+        for group_id, activity_codes in self.instance_groups:
+            if group_id == instance_group_id:
+                return activity_codes
+        return ()
+
+
+@dataclass
+class _CacheEntry:
+    plan: RoutePlan
+    checked_at: float = field(default_factory=time.monotonic)
+
+
+class RoutePlanCache:
+    """
+    (tenant_uuid, route_type, route_code) 単位でルートプランを保持するキャッシュ。
+
+    - テナント単位の LRU と、テナント内のルート単位の LRU の二段構成。
+    - 個別ルート・共通ルートのヘッダ／アクティビティを ORM で書き込むと、そのルートのプランは
+      フラッシュ時とコミット時に破棄される（同一プロセス内の即時無効化）。
+    - revalidate_after を指定すると、その秒数を過ぎたプランは update_count / update_date の
+      集計クエリ1本で鮮度を確認し、他プロセスでの更新も検知する。
+    """
+
+    def __init__(
+        self,
+        max_tenants: int = 256,
+        max_routes_per_tenant: int = 512,
+        revalidate_after: Optional[float] = None,
+        individual_route_repository: Optional[IndividualRouteRepository] = None,
+        individual_activity_repository: Optional[IndividualActivityRepository] = None,
+        common_route_repository: Optional[CommonRouteRepository] = None,
+        common_activity_repository: Optional[CommonActivityRepository] = None
+    ):
+        self.max_routes_per_tenant = max_routes_per_tenant
+        self.revalidate_after = revalidate_after
+        self.individual_route_repository = individual_route_repository or IndividualRouteRepository()
+        self.individual_activity_repository = individual_activity_repository or IndividualActivityRepository()
+        self.common_route_repository = common_route_repository or CommonRouteRepository()
+        self.common_activity_repository = common_activity_repository or CommonActivityRepository()
+        self._tenants: LruCache[str, LruCache[Tuple[RouteType, str], _CacheEntry]] = LruCache(max_tenants)
+        self._lock = threading.Lock()
+        _caches.add(self)
+
+    def get_plan(
+        self,
+        db_session: Session,
+        tenant_uuid: str,
+        route_code: str,
+        route_type: RouteType = RouteType.INDIVIDUAL
+    ) -> RoutePlan:
+        """
+        ルートプランを返す。キャッシュに無ければコンパイルして登録する。
+
+        Args:
+            db_session (Session): DBセッション（キャッシュミス時・鮮度確認時のみ使用）
+            tenant_uuid (str): テナントUUID
+            route_code (str): 直接部門コード（route_type が COMMON の場合は間接部門コード）
+            route_type (RouteType): ルート種別
+
+        Returns:
+            RoutePlan: コンパイル済みプラン（アクティビティが無ければ空のプラン）
+        """
+        bucket = self._bucket(tenant_uuid)
+        entry = bucket.get((route_type, route_code))
+        if entry is not None and not self._needs_revalidation(entry):
+            return entry.plan
+
+        if entry is not None:
+            version = self._route_repository(route_type).get_route_version(db_session, tenant_uuid, route_code)
+            if version == entry.plan.version:
+                entry.checked_at = time.monotonic()
+                return entry.plan
+
+        plan = self.compile(db_session, tenant_uuid, route_code, route_type)
+        bucket.put((route_type, route_code), _CacheEntry(plan))
+        return plan
+
+    def compile(
+        self,
+        db_session: Session,
+        tenant_uuid: str,
+        route_code: str,
+        route_type: RouteType = RouteType.INDIVIDUAL
+    ) -> RoutePlan:
+        """
+        DBからルートを読み込み、不変のプランに変換する（キャッシュには登録しない）。
+        """
+        route_repository = self._route_repository(route_type)
+        version = route_repository.get_route_version(db_session, tenant_uuid, route_code)
+        route = route_repository.get_by_route_code(db_session, tenant_uuid, route_code)
+        if RouteType.COMMON == route_type:
+            rows = self.common_activity_repository.find_by_tenant_and_route(db_session, tenant_uuid, route_code)
+            route_name = route.common_route_name if route else None
+        else:
+            rows = self.individual_activity_repository.find_by_tenant_and_route(db_session, tenant_uuid, route_code)
+            route_name = route.individual_route_name if route else None
+
+        activities = tuple(
+            PlannedActivity(
+                activity_code=row.activity_code,
+                function=row.function,
+                approverl_tenant_uuid=row.approverl_tenant_uuid,
+                approverl_role_code=row.approverl_role_code,
+                approverl_group_code=row.approverl_group_code,
+                approverl_user_uuid=row.approverl_user_uuid,
+                instance_group_id=row.instance_group_id,
+                instance_index=row.instance_index,
+                total_instance_count=row.total_instance_count,
+                is_milestone=bool(row.is_milestone),
+                is_terminal=bool(row.is_terminal)
+            )
+            for row in rows
+        )
+        instance_groups: Dict[str, list] = {}
+        for activity in activities:
+            if activity.instance_group_id:
+                instance_groups.setdefault(activity.instance_group_id, []).append(activity.activity_code)
+
+        return RoutePlan(
+            tenant_uuid=tenant_uuid,
+            route_type=route_type,
+            route_code=route_code,
+            route_name=route_name,
+            activities=activities,
+            instance_groups=tuple((k, tuple(v)) for k, v in instance_groups.items()),
+            milestones=tuple(a.activity_code for a in activities if a.is_milestone),
+            version=version
+        )
+
+    def invalidate(
+        self,
+        tenant_uuid: str,
+        route_code: Optional[str] = None,
+        route_type: RouteType = RouteType.INDIVIDUAL
+    ) -> None:
+        """
+        プランを破棄する。ルートコードを省略した場合はテナント配下をすべて破棄する。
+        """
+        if route_code is None:
+            self._tenants.pop(tenant_uuid)
+            return
+        bucket = self._tenants.get(tenant_uuid)
+        if bucket is not None:
+            bucket.pop((route_type, route_code))
+
+    def clear(self) -> None:
+        """全テナントのプランを破棄する。"""
+        self._tenants.clear()
+
+    def __len__(self) -> int:
+        return sum(len(self._tenants.get(t) or ()) for t in self._tenants.keys())
+
+    def _bucket(self, tenant_uuid: str) -> LruCache:
+        with self._lock:
+            bucket = self._tenants.get(tenant_uuid)
+            if bucket is None:
+                bucket = LruCache(self.max_routes_per_tenant)
+                self._tenants.put(tenant_uuid, bucket)
+            return bucket
+
+    def _route_repository(self, route_type: RouteType):
+        if RouteType.COMMON == route_type:
+            return self.common_route_repository
+        return self.individual_route_repository
+
+    def _needs_revalidation(self, entry: _CacheEntry) -> bool:
+        if self.revalidate_after is None:
+            return False
+        return time.monotonic() - entry.checked_at >= self.revalidate_after
+
+
+# ----------------------------------------------------------------------
+# ORM 書き込み時の無効化
+# ----------------------------------------------------------------------
+
+_caches: "weakref.WeakSet[RoutePlanCache]" = weakref.WeakSet()
+
+
+def _route_keys(route_type: RouteType, code_attr: str) -> Callable[[Any], Set[Tuple[str, str, RouteType]]]:
+    def keys_of(target) -> Set[Tuple[str, str, RouteType]]:
+        # テナントやルートコード自体が変更された場合は変更前のプランも破棄する
+        return {
+            (tenant_uuid, route_code, route_type)
+            for tenant_uuid in current_and_previous(target, "tenant_uuid")
+            for route_code in current_and_previous(target, code_attr)
+        }
+    return keys_of
+
+
+def _invalidate(keys: Set[Tuple[str, str, RouteType]]) -> None:
+    for cache in list(_caches):
+        for tenant_uuid, route_code, route_type in keys:
+            cache.invalidate(tenant_uuid, route_code, route_type)
+
+
+def _invalidate_all() -> None:
+    for cache in list(_caches):
+        cache.clear()
+
+
+invalidate_on_write(
+    (IndividualRoute, IndividualActivity),
+    _route_keys(RouteType.INDIVIDUAL, "individual_route_code"), _invalidate, _invalidate_all
+)
+invalidate_on_write(
+    (CommonRoute, CommonActivity),
+    _route_keys(RouteType.COMMON, "common_route_code"), _invalidate, _invalidate_all
+)
+
+
+default_route_plan_cache = RoutePlanCache()
@@ -0,0 +1,282 @@
+import os
+from concurrent.futures import FIRST_COMPLETED, Executor, ProcessPoolExecutor, wait
+from dataclasses import dataclass
+from datetime import date
+from itertools import islice
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple, Type
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import StaticPool
+from app.dtos.application_info_dto import ApplicationInfoDto
+from app.engine.engine_context import EngineContext
+from app.engine.master_data_resolver import MasterDataCache
+from app.engine.route_expander import RouteExpander
+from app.engine.route_plan_cache import RoutePlanCache
+from app.exception.laubeException import LaubeException
+from app.models.models import (
+    ApplicationForm, ApplicationFormRoute, Base, Boss, CommonActivity, CommonRoute, Group,
+    IndividualActivity, IndividualRoute, Role, Tenant, TenantUser, User, UserGroup
+)
+
+######################################################################
+# Copyright 2016–2025 Ryuta Miki. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+######################################################################
+
+# ルート展開で参照するマスタ（テナント単位で取得するもの）
+TENANT_MODELS: Tuple[Type[Any], ...] = (
+    Tenant, Group, TenantUser, UserGroup, Boss, ApplicationForm, ApplicationFormRoute,
+    IndividualRoute, IndividualActivity, CommonRoute, CommonActivity
+)
+# テナントに属さないマスタ（全件取得する）
+GLOBAL_MODELS: Tuple[Type[Any], ...] = (User, Role)
+
+# 承認者1件の比較キー：(ルート種別, ルート番号, 承認者テナント, 部署, ユーザー, ロール, 承認機能)
+ApproverKey = Tuple[Any, ...]
+
+
+class MasterSnapshot:
+    """
+    ルート展開に必要なマスタテーブルの内容を行データ（dict）として保持するスナップショット。
+
+    pickle 可能なため、プロセスプールの各ワーカーへそのまま渡せる。
+    with_rows() で一部のテーブルを差し替えたスナップショットを作成し、組織変更後の
+    マスタ（what-if）として使う。materialize() はインメモリ SQLite に展開したセッションを返す。
+    """
+
+    def __init__(self, tables: Mapping[str, Sequence[Dict[str, Any]]]):
+        self._tables: Mapping[str, Tuple[Dict[str, Any], ...]] = MappingProxyType(
+            {name: tuple(rows) for name, rows in tables.items()}
+        )
+
+    @classmethod
+    def capture(cls, db_session: Session, tenant_uuids: Iterable[str]) -> "MasterSnapshot":
+        """
+        現在のマスタを取得する。上司・承認者が別テナントの場合はそのテナントも指定すること。
+        """
+        tenant_uuids = list(dict.fromkeys(tenant_uuids))
+        tables: Dict[str, List[Dict[str, Any]]] = {}
+        for model in TENANT_MODELS:
+            rows = db_session.query(model).filter(model.tenant_uuid.in_(tenant_uuids)).all()
+            tables[model.__tablename__] = [cls._row_of(model, row) for row in rows]
+        for model in GLOBAL_MODELS:
+            tables[model.__tablename__] = [cls._row_of(model, row) for row in db_session.query(model).all()]
+        return cls(tables)
+
+    def rows(self, model: Type[Any]) -> Tuple[Dict[str, Any], ...]:
+        """指定テーブルの行データを返す。"""
+        return self._tables.get(model.__tablename__, ())
+
+    def with_rows(self, model: Type[Any], rows: Iterable[Dict[str, Any]]) -> "MasterSnapshot":
+        """指定テーブルの行データを差し替えたスナップショットを返す（自身は変更しない）。"""
+        tables = dict(self._tables)
+        tables[model.__tablename__] = tuple(rows)
+        return MasterSnapshot(tables)
+
+    def materialize(self) -> Session:
+        """
+        スナップショットをインメモリ SQLite に展開し、そのセッションを返す。
+        ORM を経由せずに投入するため、プロセス共有キャッシュの無効化イベントは発生しない。
+        """
+        engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+        Base.metadata.create_all(bind=engine)
+        with engine.begin() as connection:
+            for name, rows in self._tables.items():
+                if rows:
+                    connection.execute(Base.metadata.tables[name].insert(), [dict(row) for row in rows])
+        return sessionmaker(bind=engine, autoflush=False)()
+
+    def __getstate__(self) -> Dict[str, Any]:
+        return {"tables": dict(self._tables)}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__init__(state["tables"])
+
+    @staticmethod
+    def _row_of(model: Type[Any], row: Any) -> Dict[str, Any]:
+        return {attr.key: getattr(row, attr.key) for attr in model.__mapper__.column_attrs}
+
+
+@dataclass(frozen=True)
+class SimulationCase:
+    """
+    シミュレーション対象の仮想申請（対象ユーザー・部署・申請書の組み合わせ）。
+    """
+    target_user_uuid: str
+    target_group_code: str
+    application_form_code: str
+    applicant_user_uuid: Optional[str] = None
+
+    def to_application(self) -> ApplicationInfoDto:
+        return ApplicationInfoDto(
+            application_form_code=self.application_form_code,
+            target_group_code=self.target_group_code,
+            target_user_uuid=self.target_user_uuid,
+            applicant_user_uuid=self.applicant_user_uuid or self.target_user_uuid
+        )
+
+
+@dataclass(frozen=True)
+class RouteOutcome:
+    """1件分の展開結果（承認者キーの並び、または展開時のエラーコード）。"""
+    approvers: Tuple[ApproverKey, ...] = ()
+    error: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class RouteDiff:
+    """
+    現行マスタ（before）と組織変更後マスタ（after）で承認経路が異なった申請。
+    """
+    case: SimulationCase
+    before: RouteOutcome
+    after: RouteOutcome
+
+    @property
+    def removed(self) -> Tuple[ApproverKey, ...]:
+        """変更後に承認経路から外れる承認者。"""
+        return tuple(a for a in self.before.approvers if a not in self.after.approvers)
+
+    @property
+    def added(self) -> Tuple[ApproverKey, ...]:
+        """変更後に承認経路へ加わる承認者。"""
+        return tuple(a for a in self.after.approvers if a not in self.before.approvers)
+
+
+class _SnapshotEngine:
+    """スナップショット1つ分の展開環境（セッションと専用キャッシュ）。"""
+
+    def __init__(self, snapshot: MasterSnapshot):
+        self.session = snapshot.materialize()
+        context = EngineContext(route_plan_cache=RoutePlanCache(), master_data_cache=MasterDataCache())
+        self.expander: RouteExpander = context.route_expander
+
+    def expand(self, tenant_uuid: str, case: SimulationCase, system_date: date) -> RouteOutcome:
+        try:
+            expansion = self.expander.expand(self.session, tenant_uuid, case.to_application(), system_date)
+        except LaubeException as e:
+            return RouteOutcome(error=e.code)
+        return RouteOutcome(approvers=tuple(
+            (
+                dto.route_type, dto.route_number, dto.approverl_tenant_uuid, dto.approverl_group_code,
+                dto.approverl_user_uuid, dto.approverl_role_code, dto.approval_function
+            )
+            for dto in expansion.approvers
+        ))
+
+
+# ワーカープロセスごとに1回だけ展開するスナップショット
+_worker_engines: Optional[Tuple[_SnapshotEngine, _SnapshotEngine]] = None
+
+
+def _init_worker(before: MasterSnapshot, after: MasterSnapshot) -> None:
+    global _worker_engines
+    _worker_engines = (_SnapshotEngine(before), _SnapshotEngine(after))
+
+
+def _simulate_chunk(
+    tenant_uuid: str, cases: Sequence[SimulationCase], system_date: date, include_unchanged: bool,
+    engines: Optional[Tuple[_SnapshotEngine, _SnapshotEngine]] = None
+) -> List[RouteDiff]:
+    before_engine, after_engine = engines or _worker_engines
+    diffs: List[RouteDiff] = []
+    for case in cases:
+        before = before_engine.expand(tenant_uuid, case, system_date)
+        after = after_engine.expand(tenant_uuid, case, system_date)
+        if include_unchanged or before != after:
+            diffs.append(RouteDiff(case, before, after))
+    return diffs
+
+
+class RouteSimulator:
+    """
+    組織変更前後のマスタスナップショットで承認経路を展開し、差分を返すシミュレータ。
+
+    - 各ワーカーは起動時にスナップショットをインメモリ SQLite に1回だけ展開し、
+      専用のルートプラン・名称キャッシュを使って RouteExpander で展開する（本番DBは参照しない）。
+    - 申請は chunk_size 件ずつワーカーに割り当て、完了したチャンクから順に差分を返す
+      （結果の順序は入力順と一致しない）。同時に投入するチャンク数は max_workers の2倍まで。
+    - max_workers=0 の場合は呼び出し元プロセス内で順に実行する。
+    """
+
+    def __init__(
+        self,
+        before: MasterSnapshot,
+        after: MasterSnapshot,
+        max_workers: Optional[int] = None,
+        chunk_size: int = 500
+    ):
+        self.before = before
+        self.after = after
+        self.max_workers = (os.cpu_count() or 1) if max_workers is None else max_workers
+        self.chunk_size = chunk_size
+
+    def simulate(
+        self,
+        tenant_uuid: str,
+        cases: Iterable[SimulationCase],
+        system_date: Optional[date] = None,
+        include_unchanged: bool = False
+    ) -> Iterator[RouteDiff]:
+        """
+        仮想申請を展開し、承認経路が変わるものを順次返す。
+
+        Args:
+            tenant_uuid (str): 申請書・ルートマスタを保持するテナントUUID
+            cases (Iterable[SimulationCase]): 仮想申請（ジェネレータ可。チャンク単位で読み進める）
+            system_date (Optional[date]): 有効期限判定の基準日（省略時は当日）
+            include_unchanged (bool): True の場合は変化の無い申請も返す
+
+        Yields:
+            RouteDiff: 変更前後の展開結果
+        """
+        system_date = system_date or date.today()
+        chunks = self._chunks(cases)
+
+        if self.max_workers == 0:
+            engines = (_SnapshotEngine(self.before), _SnapshotEngine(self.after))
+            for chunk in chunks:
+                yield from _simulate_chunk(tenant_uuid, chunk, system_date, include_unchanged, engines)
+            return
+
+        with ProcessPoolExecutor(
+            max_workers=self.max_workers, initializer=_init_worker, initargs=(self.before, self.after)
+        ) as executor:
+            yield from self._stream(executor, chunks, tenant_uuid, system_date, include_unchanged)
+
+    def _stream(
+        self, executor: Executor, chunks: Iterator[List[SimulationCase]],
+        tenant_uuid: str, system_date: date, include_unchanged: bool
+    ) -> Iterator[RouteDiff]:
+        max_pending = self.max_workers * 2
+        pending = set()
+        for chunk in chunks:
+            pending.add(executor.submit(_simulate_chunk, tenant_uuid, chunk, system_date, include_unchanged))
+            if len(pending) >= max_pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield from future.result()
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield from future.result()
+
+    def _chunks(self, cases: Iterable[SimulationCase]) -> Iterator[List[SimulationCase]]:
+        iterator = iter(cases)
+        while True:
+            chunk = list(islice(iterator, self.chunk_size))
+            if not chunk:
+                return
+            yield chunk
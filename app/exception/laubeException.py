@@ -1,3 +1,5 @@
+from app.common.error_message_loader import ErrorMessageLoader
+
 ##################################################################
 # Copyright (c) 2016, Ryuta Miki All Rights Reserved.
 #
@@ -30,3 +32,21 @@ class LaubeException(Exception):
 
     def __str__(self):
         return f"[{self.code}] {self.message}"
+
+
+class OptimisticLockException(LaubeException):
+    """
+    楽観ロックの競合。
+
+    読み込んだ後に他のトランザクションが同じ行を更新（または削除）し、
+    UPDATE ... WHERE id = ? AND update_count = ? が1行も更新しなかった場合に発生する。
+    """
+
+    CODE = "Laube-E014"
+
+    def __init__(self, entity: str, key=None, expected_update_count=None, actual_update_count=None):
+        self.entity = entity
+        self.key = key
+        self.expected_update_count = expected_update_count
+        self.actual_update_count = actual_update_count
+        super().__init__(self.CODE, ErrorMessageLoader().get_message(self.CODE, entity))
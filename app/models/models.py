@@ -33,6 +33,9 @@ class User(Base):
 
 
 
+    __mapper_args__ = {
+        'version_id_col': update_count
+    }
 
 
 
@@ -53,6 +56,9 @@ class Role(Base):
 
 
 
+    __mapper_args__ = {
+        'version_id_col': update_count
+    }
 
 
 
@@ -73,6 +79,9 @@ class UserRole(Base):
 
 
 
+    __mapper_args__ = {
+        'version_id_col': update_count
+    }
 
     __table_args__ = (
         UniqueConstraint(user_id, role_id),
@@ -95,6 +104,9 @@ class Permission(Base):
 
 
 
+    __mapper_args__ = {
+        'version_id_col': update_count
+    }
 
 
 
@@ -115,6 +127,9 @@ class RolePermission(Base):
 
 
 
+    __mapper_args__ = {
+        'version_id_col': update_count
+    }
 
     __table_args__ = (
         UniqueConstraint(role_id, permission_id),
@@ -135,6 +150,9 @@ class Resource(Base):
 
 
 
+    __mapper_args__ = {
+        'version_id_col': update_count
+    }
 
 
 
@@ -156,6 +174,9 @@ class Policy(Base):
 
 
 
+    __mapper_args__ = {
+        'version_id_col': update_count
+    }
 
 
 
@@ -167,6 +188,7 @@ class Tenant(Base):
     __tablename__ = 'm_tenant'
     id = Column('id', Integer, primary_key=True, autoincrement=True, comment="サロゲートキー")
     tenant_uuid = Column('tenant_uuid', String(36), nullable=False, unique=True, default=uuid.uuid4, comment="テナントUUID")
+    tenant_name = Column('tenant_name', String(100), nullable=True, comment="テナント名（会社名）")
     create_date = Column('create_date', TIMESTAMP, nullable=False, default=datetime.now, comment="作成日時")
     create_user_uuid = Column('create_user_uuid', String(36), nullable=False, comment="作成者ユーザーコード")
     update_date = Column('update_date', TIMESTAMP, nullable=False, default=datetime.now, onupdate=datetime.now, comment="更新日時")
@@ -175,6 +197,9 @@ class Tenant(Base):
 
 
 
+    __mapper_args__ = {
+        'version_id_col': update_count
+    }
 
 
 
@@ -198,6 +223,9 @@ class TenantUser(Base):
 
 
 
+    __mapper_args__ = {
+        'version_id_col': update_count
+    }
 
     __table_args__ = (
         ForeignKeyConstraint(['user_uuid'], ['m_user.user_uuid']),
@@ -227,6 +255,9 @@ class Group(Base):
 
 
 
+    __mapper_args__ = {
+        'version_id_col': update_count
+    }
 
     __table_args__ = (
         Index('ix_m_grouptenant_uuid', tenant_uuid),
@@ -658,6 +689,9 @@ class ApplicationObject(Base):
 
 
 
+    __mapper_args__ = {
+        'version_id_col': update_count
+    }
 
     __table_args__ = (
         Index('ix_t_application_objecttenant_uuid', tenant_uuid),
@@ -720,6 +754,9 @@ class ActivityObject(Base):
 
 
 
+    __mapper_args__ = {
+        'version_id_col': update_count
+    }
 
     __table_args__ = (
         Index('ix_t_activity_objecttenant_uuid_application_number', tenant_uuid, application_number),
@@ -952,6 +989,9 @@ class WorkflowTrigger(Base):
 
 
 
+    __mapper_args__ = {
+        'version_id_col': update_count
+    }
 
     __table_args__ = (
         Index('ix_t_workflow_triggertenant_uuid_trigger_form_code', tenant_uuid, trigger_form_code),
@@ -981,6 +1021,9 @@ class DynamicRouteNode(Base):
 
 
 
+    __mapper_args__ = {
+        'version_id_col': update_count
+    }
 
     __table_args__ = (
         Index('ix_t_dynamic_route_nodetenant_uuid_application_number_route_type_route_number', tenant_uuid, application_number, route_type, route_number),
@@ -1014,6 +1057,9 @@ class ReworkRoute(Base):
 
 
 
+    __mapper_args__ = {
+        'version_id_col': update_count
+    }
 
     __table_args__ = (
         Index('ix_t_rework_routetenant_uuid_application_form_code', tenant_uuid, application_form_code),
@@ -1045,6 +1091,9 @@ class FieldVisibility(Base):
 
 
 
+    __mapper_args__ = {
+        'version_id_col': update_count
+    }
 
     __table_args__ = (
         Index('ix_t_field_visibilitytenant_uuid_application_form_code_activity_code', tenant_uuid, application_form_code, activity_code),
@@ -1073,6 +1122,9 @@ class ApplicationSnapshot(Base):
 
 
 
+    __mapper_args__ = {
+        'version_id_col': update_count
+    }
 
     __table_args__ = (
         Index('ix_t_application_snapshottenant_uuid_application_number_version_number', tenant_uuid, application_number, version_number),
@@ -1102,6 +1154,9 @@ class ApprovalPolicy(Base):
 
 
 
+    __mapper_args__ = {
+        'version_id_col': update_count
+    }
 
     __table_args__ = (
         Index('ix_t_approval_policytenant_uuid_application_form_code_priority', tenant_uuid, application_form_code, priority),
@@ -1126,6 +1181,9 @@ class Message(Base):
 
 
 
+    __mapper_args__ = {
+        'version_id_col': update_count
+    }
 
     __table_args__ = (
         UniqueConstraint(language_code, message_key),
@@ -1157,7 +1215,127 @@ class WorkflowGraphView(Base):
 
 
 
+    __mapper_args__ = {
+        'version_id_col': update_count
+    }
 
     __table_args__ = (
         Index('ix_t_workflow_graph_viewtenant_uuid_application_form_code', tenant_uuid, application_form_code),
+    )
+
+class MaintenanceWindow(Base):
+    """
+    　エンジンの利用停止（メンテナンス）期間マスタ
+    """
+
+    __tablename__ = 'm_maintenance_window'
+    id = Column('id', Integer, primary_key=True, autoincrement=True, comment="サロゲートキー")
+    engine_name = Column('engine_name', String(30), nullable=False, comment="対象エンジン名（Laube / Cerberus）")
+    start_date = Column('start_date', TIMESTAMP, nullable=False, comment="停止開始日時")
+    end_date = Column('end_date', TIMESTAMP, nullable=True, comment="停止終了日時（NULLの場合は解除されるまで停止）")
+    reason = Column('reason', String(255), nullable=True, comment="停止理由")
+    create_date = Column('create_date', TIMESTAMP, nullable=False, default=datetime.now)
+    create_user_uuid = Column('create_user_uuid', String(36), nullable=False)
+    update_date = Column('update_date', TIMESTAMP, nullable=False, default=datetime.now, onupdate=datetime.now)
+    update_user_uuid = Column('update_user_uuid', String(36), nullable=False)
+    update_count = Column('update_count', Integer, nullable=False)
+
+
+
+    __mapper_args__ = {
+        'version_id_col': update_count
+    }
+
+    __table_args__ = (
+        Index('ix_m_maintenance_windowengine_name_start_date', engine_name, start_date),
+    )
+
+class GroupRole(Base):
+    """
+    　部署とロールの関連（配下の部署にも継承される）
+    """
+
+    __tablename__ = 'm_group_role'
+    id = Column('id', Integer, primary_key=True, autoincrement=True, comment="サロゲートキー")
+    tenant_uuid = Column('tenant_uuid', String(36), nullable=False, comment="テナントUUID")
+    group_code = Column('group_code', String(10), nullable=False, comment="部署コード")
+    role_id = Column('role_id', String(36), nullable=False, comment="ロールID")
+    create_date = Column('create_date', TIMESTAMP, nullable=False, default=datetime.now, comment="作成日時")
+    create_user_uuid = Column('create_user_uuid', String(36), nullable=False, comment="作成者ユーザーコード")
+    update_date = Column('update_date', TIMESTAMP, nullable=False, default=datetime.now, onupdate=datetime.now, comment="更新日時")
+    update_user_uuid = Column('update_user_uuid', String(36), nullable=False, comment="更新者ユーザーコード")
+    update_count = Column('update_count', Integer, nullable=False, default=0, comment="更新回数")
+
+
+
+    __mapper_args__ = {
+        'version_id_col': update_count
+    }
+
+    __table_args__ = (
+        Index('ix_m_group_rolerole_id', role_id),
+        UniqueConstraint(tenant_uuid, group_code, role_id),
+    )
+
+class GroupClosure(Base):
+    """
+    　部署階層の閉包（上位部署 → 配下の部署。m_group の変更時に自動で更新する）
+    """
+
+    __tablename__ = 'm_group_closure'
+    id = Column('id', Integer, primary_key=True, autoincrement=True, comment="サロゲートキー")
+    tenant_uuid = Column('tenant_uuid', String(36), nullable=False, comment="テナントUUID")
+    ancestor_group_code = Column('ancestor_group_code', String(10), nullable=False, comment="上位部署コード（自部署を含む）")
+    descendant_group_code = Column('descendant_group_code', String(10), nullable=False, comment="配下の部署コード")
+    depth = Column('depth', Integer, nullable=False, comment="階層の差（自部署は0）")
+
+
+
+
+    __table_args__ = (
+        Index('ix_m_group_closuretenant_uuid_ancestor_group_code', tenant_uuid, ancestor_group_code),
+        UniqueConstraint(tenant_uuid, descendant_group_code, ancestor_group_code),
+    )
+
+class PolicyVersion(Base):
+    """
+    　認可情報の版数（割り当て・解除のたびに加算し、各ワーカーのキャッシュ無効化に使う）
+    """
+
+    __tablename__ = 'm_policy_version'
+    id = Column('id', Integer, primary_key=True, autoincrement=True, comment="サロゲートキー")
+    scope = Column('scope', String(30), nullable=False, comment="対象（cerberus）")
+    version = Column('version', Integer, nullable=False, default=0, comment="版数")
+    update_date = Column('update_date', TIMESTAMP, nullable=False, default=datetime.now, onupdate=datetime.now, comment="更新日時")
+
+
+
+
+    __table_args__ = (
+        UniqueConstraint(scope),
+    )
+
+class AuthorizationAudit(Base):
+    """
+    　認可の監査ログ（判定結果と割り当て・解除の記録）
+    """
+
+    __tablename__ = 't_authorization_audit'
+    id = Column('id', Integer, primary_key=True, autoincrement=True, comment="サロゲートキー")
+    event_type = Column('event_type', String(30), nullable=False, comment="種別（check / assign_role / revoke_role など）")
+    event_date = Column('event_date', TIMESTAMP, nullable=False, comment="発生日時")
+    user_id = Column('user_id', String(36), nullable=True, comment="ユーザーID")
+    role_id = Column('role_id', String(36), nullable=True, comment="ロールID")
+    permission_id = Column('permission_id', String(36), nullable=True, comment="パーミッションID")
+    resource_id = Column('resource_id', String(255), nullable=True, comment="リソースID")
+    allowed = Column('allowed', Boolean, nullable=True, comment="判定結果（判定以外はNULL）")
+    detail = Column('detail', Text, nullable=True, comment="補足情報（JSON）")
+    operator_uuid = Column('operator_uuid', String(36), nullable=True, comment="操作者ユーザーUUID")
+
+
+
+
+    __table_args__ = (
+        Index('ix_t_authorization_auditevent_date', event_date),
+        Index('ix_t_authorization_audituser_id_event_date', user_id, event_date),
     )
\ No newline at end of file
@@ -86,6 +86,7 @@ class ActivityStatus(IntEnum):
     IN_PROGRESS = 1  # 進行中 / In progress
     COMPLETED = 2    # 完了 / Completed
     CANCELED = 3     # キャンセル / Canceled
+    AUTHORIZER_UNTREATED = 4  # 未処理（承認者に未到達） / Untreated
 
 
 class ApplicantStatus(IntEnum):
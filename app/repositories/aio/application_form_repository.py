@@ -0,0 +1,28 @@
+from typing import List, Optional
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.common.bulk_insert import chunked
+from app.common.statement_registry import fetch_scalars
+from app.daos import application_form_dao  # noqa: F401  m_application_form.* の文を登録する
+from app.models.models import ApplicationForm
+from app.repositories.aio.base import AsyncRepositoryBase
+from app.repositories.application_form_repository import ApplicationFormRepository
+
+
+class AsyncApplicationFormRepository(AsyncRepositoryBase):
+    """
+    ApplicationFormRepository の非同期版
+    """
+    def __init__(self, repository: Optional[ApplicationFormRepository] = None):
+        self.repository = repository or ApplicationFormRepository()
+
+    async def get_by_code(self, db_session: AsyncSession, tenant_uuid: str, application_form_code: str) -> Optional[ApplicationForm]:
+        return await self._run(db_session, self.repository.get_by_code, tenant_uuid, application_form_code)
+
+    async def get_by_codes(self, db_session: AsyncSession, tenant_uuid: str, application_form_codes: List[str]) -> List[ApplicationForm]:
+        forms = []
+        for codes in chunked(dict.fromkeys(application_form_codes)):
+            forms.extend(await self._execute(
+                db_session, "m_application_form.get_by_codes",
+                {"tenant_uuid": tenant_uuid, "application_form_codes": codes}, fetch=fetch_scalars
+            ))
+        return forms
@@ -0,0 +1,33 @@
+from typing import List, Optional
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.common.statement_registry import fetch_scalars
+from app.daos import application_form_route_dao  # noqa: F401  m_application_form_route.* の文を登録する
+from app.models.models import ApplicationFormRoute
+from app.repositories.aio.base import AsyncRepositoryBase
+from app.repositories.application_form_route_repository import ApplicationFormRouteRepository
+
+
+class AsyncApplicationFormRouteRepository(AsyncRepositoryBase):
+    """
+    ApplicationFormRouteRepository の非同期版
+    """
+    def __init__(self, repository: Optional[ApplicationFormRouteRepository] = None):
+        self.repository = repository or ApplicationFormRouteRepository()
+
+    async def get_by_code_and_group(
+        self, db_session: AsyncSession, tenant_uuid: str, application_form_code: str, group_code: Optional[str]
+    ) -> Optional[ApplicationFormRoute]:
+        return await self._run(
+            db_session, self.repository.get_by_code_and_group, tenant_uuid, application_form_code, group_code
+        )
+
+    async def find_by_codes_and_group(
+        self, db_session: AsyncSession, tenant_uuid: str, application_form_codes: List[str], group_code: Optional[str]
+    ) -> List[ApplicationFormRoute]:
+        if not application_form_codes:
+            return []
+        return await self._execute(db_session, "m_application_form_route.find_by_codes_and_group", {
+            "tenant_uuid": tenant_uuid,
+            "application_form_codes": list(set(application_form_codes)),
+            "group_code": group_code,
+        }, fetch=fetch_scalars)
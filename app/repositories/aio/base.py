@@ -0,0 +1,32 @@
+from typing import Any, Callable, Dict, Optional, TypeVar
+from sqlalchemy.engine import Result
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.common.statement_registry import StatementRegistry, default_statement_registry, fetch_all
+
+T = TypeVar("T")
+
+
+class AsyncRepositoryBase:
+    """
+    AsyncSession 用リポジトリの基底クラス。
+
+    SQLは同期版の DAO に集約したまま、次のどちらかで実行する。
+
+    - _execute(): DAO が StatementRegistry に登録した文を AsyncSession.execute で直接実行する（ネイティブの非同期実行）。
+    - _run(): 登録文の無い検索は、同期版のメソッドを AsyncSession.run_sync で非同期ドライバ上の
+      同期セッションとして実行する（イベントループはブロックしないが、ORM の処理は同期コードで行う）。
+    """
+
+    statement_registry: StatementRegistry = default_statement_registry
+
+    async def _execute(
+        self,
+        db_session: AsyncSession,
+        name: str,
+        params: Optional[Dict[str, Any]] = None,
+        fetch: Callable[[Result], Any] = fetch_all
+    ) -> Any:
+        return await self.statement_registry.execute_async(db_session, name, params, fetch)
+
+    async def _run(self, db_session: AsyncSession, fn: Callable[..., T], *args: Any) -> T:
+        return await db_session.run_sync(fn, *args)
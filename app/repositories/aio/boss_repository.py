@@ -0,0 +1,24 @@
+from typing import List, Optional
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.common.statement_registry import fetch_scalars
+from app.daos import boss_dao  # noqa: F401  m_boss.* の文を登録する
+from app.models.models import Boss
+from app.repositories.aio.base import AsyncRepositoryBase
+
+
+class AsyncBossRepository(AsyncRepositoryBase):
+    """
+    BossRepository の非同期版
+    """
+
+    async def find_by_tenant(self, db_session: AsyncSession, tenant_uuid: str) -> List[Boss]:
+        return await self._execute(db_session, "m_boss.find_by_tenant", {"tenant_uuid": tenant_uuid}, fetch=fetch_scalars)
+
+    async def find_candidates_for_user(
+        self, db_session: AsyncSession, tenant_uuid: str, user_uuid: str, group_code: Optional[str]
+    ) -> List[Boss]:
+        return await self._execute(db_session, "m_boss.find_candidates_for_user", {
+            "tenant_uuid": tenant_uuid,
+            "user_uuid": user_uuid,
+            "group_code": group_code,
+        }, fetch=fetch_scalars)
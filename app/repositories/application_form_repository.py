@@ -16,3 +16,9 @@ class ApplicationFormRepository(ApplicationFormRepositoryBase):
         DAO経由で取得
         """
         return self.dao.get_by_code(db_session, tenant_uuid, application_form_code)
+
+    def get_by_codes(self, db_session: Session, tenant_uuid: str, application_form_codes: List[str]) -> List[ApplicationForm]:
+        """
+        DAO経由で複数の申請書をまとめて取得
+        """
+        return self.dao.get_by_codes(db_session, tenant_uuid, application_form_codes)
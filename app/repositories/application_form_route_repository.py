@@ -17,3 +17,11 @@ class ApplicationFormRouteRepository(ApplicationFormRouteRepositoryBase):
         DAOを経由して申請ルートを取得する
         """
         return self.dao.get_by_code_and_group(db_session, tenant_uuid, application_form_code, group_code)
+
+    def find_by_codes_and_group(
+        self, db_session: Session, tenant_uuid: str, application_form_codes: List[str], group_code: Optional[str]
+    ) -> List[ApplicationFormRoute]:
+        """
+        DAOを経由して複数申請書の申請ルート（指定グループ＋グループ未指定）をまとめて取得する
+        """
+        return self.dao.find_by_codes_and_group(db_session, tenant_uuid, application_form_codes, group_code)
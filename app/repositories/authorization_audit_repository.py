@@ -0,0 +1,19 @@
+from typing import Any, Dict, Sequence
+from sqlalchemy.orm import Session
+from app.daos.authorization_audit_dao import AuthorizationAuditDao
+from app.repositories.base.authorization_audit_repository_base import AuthorizationAuditRepositoryBase
+
+class AuthorizationAuditRepository(AuthorizationAuditRepositoryBase):
+    """
+    AuthorizationAuditRepositoryBase のカスタムメソッド追加用
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.dao = AuthorizationAuditDao()
+
+    def insert_events(self, db: Session, rows: Sequence[Dict[str, Any]]) -> int:
+        """
+        監査ログをまとめて登録する。
+        """
+        return self.dao.insert_events(db, rows)
@@ -0,0 +1,44 @@
+from typing import Optional
+from app.daos.base.policy_version_dao_base import PolicyVersionDaoBase
+from app.models.models import PolicyVersion
+from app.repositories.base.base_repository import BaseRepository
+
+class PolicyVersionRepositoryBase(BaseRepository):
+    def __init__(self, dao: Optional[PolicyVersionDaoBase] = None):
+        self.dao = dao or PolicyVersionDaoBase()
+    def bulk_delete(self, db_session, keys, key_columns=None, chunk_size=500):
+        return self.dao.bulk_delete(db_session, keys, key_columns, chunk_size)
+    def bulk_insert(self, db_session, rows, chunk_size=500, ignore_conflicts=False):
+        return self.dao.bulk_insert(db_session, rows, chunk_size, ignore_conflicts)
+    def bulk_upsert(self, db_session, rows, chunk_size=500, update_columns=None):
+        return self.dao.bulk_upsert(db_session, rows, chunk_size, update_columns)
+    def compare_and_update(self, db_session, id, expected_update_count, update_data):
+        return self.dao.compare_and_update(db_session, id, expected_update_count, update_data)
+    def count(self, db_session):
+        return self.dao.count(db_session)
+    def create(self, db_session, data):
+        return self.dao.create(db_session, data)
+    def delete(self, db_session, instance):
+        return self.dao.delete(db_session, instance)
+    def find_by_columns(self, db_session, values, limit=None):
+        return self.dao.find_by_columns(db_session, values, limit)
+    def get(self, db_session, id):
+        return self.dao.get(db_session, id)
+    def get_all(self, db_session, limit=100, offset=0):
+        return self.dao.get_all(db_session, limit, offset)
+    def get_by_key(self, db_session, id):
+        return self.dao.get_by_key(db_session, id)
+    def get_by_scope(self, db_session, scope):
+        return self.dao.get_by_scope(db_session, scope)
+    def get_many_by_columns(self, db_session, key_columns, keys, chunk_size=500):
+        return self.dao.get_many_by_columns(db_session, key_columns, keys, chunk_size)
+    def get_many_by_scope(self, db_session, keys, chunk_size=500):
+        return self.dao.get_many_by_scope(db_session, keys, chunk_size)
+    def get_page_after(self, db_session, last_id=None, limit=100, key_columns=('id',)):
+        return self.dao.get_page_after(db_session, last_id, limit, key_columns)
+    def insert(self, db_session, instance):
+        return self.dao.insert(db_session, instance)
+    def iter_all(self, db_session, batch_size=1000):
+        return self.dao.iter_all(db_session, batch_size)
+    def update(self, db_session, id, update_data, expected_update_count=None):
+        return self.dao.update(db_session, id, update_data, expected_update_count)
@@ -1,5 +1,5 @@
 from sqlalchemy.orm import Session
-from typing import Optional
+from typing import List, Optional
 from app.repositories.base.boss_repository_base import BossRepositoryBase
 from app.models.models import Boss
 from app.daos.boss_dao import BossDao
@@ -65,3 +65,25 @@ class BossRepository(BossRepositoryBase):
             "user_uuid": user_uuid,
             "application_form_code": None
         })
+
+    def find_prioritized_boss(
+        self, db: Session, tenant_uuid: str, user_uuid: str, group_code: Optional[str], application_form_code: Optional[str]
+    ) -> Optional[Boss]:
+        """
+        上記4パターンを優先順位付きで1クエリにまとめた上司マスタ検索。
+        """
+        return self.dao.find_prioritized(db, tenant_uuid, user_uuid, group_code, application_form_code)
+
+    def find_by_tenant(self, db: Session, tenant_uuid: str) -> List[Boss]:
+        """
+        テナント内の上司マスタを全件取得する。
+        """
+        return self.dao.find_by_tenant(db, tenant_uuid)
+
+    def find_candidates_for_user(
+        self, db: Session, tenant_uuid: str, user_uuid: str, group_code: Optional[str]
+    ) -> List[Boss]:
+        """
+        対象ユーザーの上司マスタ候補（部署一致または NULL、申請書は問わない）を取得する。
+        """
+        return self.dao.find_candidates_for_user(db, tenant_uuid, user_uuid, group_code)
@@ -1,8 +1,23 @@
 from typing import Optional, Any, List
+from sqlalchemy.orm import Session
+from app.daos.common_activity_dao import CommonActivityDao
+from app.models.models import CommonActivity
 from app.repositories.base.common_activity_repository_base import CommonActivityRepositoryBase
 
 class CommonActivityRepository(CommonActivityRepositoryBase):
     """
     CommonActivityRepositoryBase のカスタムメソッド追加用
     """
-    pass
\ No newline at end of file
+    def __init__(self):
+        self.dao = CommonActivityDao()
+
+    def find_by_tenant_and_route(
+        self,
+        db_session: Session,
+        tenant_uuid: str,
+        common_route_code: str
+    ) -> List[CommonActivity]:
+        """
+        DAO経由で共通ルートのアクティビティを取得する。
+        """
+        return self.dao.find_by_tenant_and_route(db_session, tenant_uuid, common_route_code)
@@ -1,8 +1,34 @@
-from typing import Optional, Any, List
+from typing import Optional, Any, List, Tuple
+from sqlalchemy.orm import Session
+from app.daos.common_route_dao import CommonRouteDao
+from app.models.models import CommonRoute
 from app.repositories.base.common_route_repository_base import CommonRouteRepositoryBase
 
 class CommonRouteRepository(CommonRouteRepositoryBase):
     """
     CommonRouteRepositoryBase のカスタムメソッド追加用
     """
-    pass
\ No newline at end of file
+    def __init__(self):
+        self.dao = CommonRouteDao()
+
+    def get_by_route_code(
+        self,
+        db_session: Session,
+        tenant_uuid: str,
+        common_route_code: str
+    ) -> Optional[CommonRoute]:
+        """
+        DAO経由で共通ルートを取得する。
+        """
+        return self.dao.get_by_route_code(db_session, tenant_uuid, common_route_code)
+
+    def get_route_version(
+        self,
+        db_session: Session,
+        tenant_uuid: str,
+        common_route_code: str
+    ) -> Tuple[Any, ...]:
+        """
+        DAO経由で共通ルートの更新状態（バージョン）を取得する。
+        """
+        return self.dao.get_route_version(db_session, tenant_uuid, common_route_code)
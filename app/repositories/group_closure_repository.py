@@ -0,0 +1,28 @@
+from typing import Dict
+from sqlalchemy.orm import Session
+from app.daos.group_closure_dao import GroupClosureDao
+from app.repositories.base.group_closure_repository_base import GroupClosureRepositoryBase
+
+
+class GroupClosureRepository(GroupClosureRepositoryBase):
+    """
+    GroupClosureRepositoryBase のカスタムメソッド追加用クラス。
+
+    部署階層の閉包（m_group_closure）の再構築を提供する。通常の更新は m_group の変更時に自動で行われる。
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.dao = GroupClosureDao()
+
+    def rebuild(self, db: Session, tenant_uuid: str) -> int:
+        """
+        m_group からテナントの部署階層を作り直し、作成した行数を返す。
+        """
+        return self.dao.rebuild(db, tenant_uuid)
+
+    def rebuild_missing(self, db: Session) -> Dict[str, int]:
+        """
+        閉包が作られていない部署のあるテナントだけ部署階層を作り直し、テナントごとの作成行数を返す。
+        """
+        return {tenant_uuid: self.dao.rebuild(db, tenant_uuid) for tenant_uuid in self.dao.tenants_missing_closure(db)}
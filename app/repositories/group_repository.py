@@ -1,8 +1,18 @@
-from typing import Optional, Any, List
+from typing import Optional, Any, List, Tuple
+from sqlalchemy.orm import Session
+from app.daos.group_dao import GroupDao
+from app.models.models import Group
 from app.repositories.base.group_repository_base import GroupRepositoryBase
 
 class GroupRepository(GroupRepositoryBase):
     """
     GroupRepositoryBase のカスタムメソッド追加用
     """
-    pass
\ No newline at end of file
+    def __init__(self):
+        self.dao = GroupDao()
+
+    def get_by_group_keys(self, db_session: Session, keys: List[Tuple[str, str]]) -> List[Group]:
+        """
+        DAO経由で (テナントUUID, 部署コード) に一致する部署をまとめて取得する。
+        """
+        return self.dao.get_by_group_keys(db_session, keys)
@@ -0,0 +1,44 @@
+from datetime import date
+from typing import List, Optional, Tuple
+from sqlalchemy.orm import Session
+from app.daos.group_role_dao import GroupRoleDao
+from app.models.models import GroupRole
+from app.repositories.base.group_role_repository_base import GroupRoleRepositoryBase
+
+
+class GroupRoleRepository(GroupRoleRepositoryBase):
+    """
+    GroupRoleRepositoryBase のカスタムメソッド追加用クラス。
+
+    部署に対するロール割り当て／解除と、部署階層を考慮した実効ロールの取得を提供。
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.dao = GroupRoleDao()
+
+    def assign_role_to_group(
+        self, db: Session, tenant_uuid: str, group_code: str, role_id: str, operator_uuid: str = "system"
+    ) -> GroupRole:
+        """
+        部署にロールを割り当てる（配下の部署にも継承される）。
+        """
+        return self.dao.add_group_role(db, tenant_uuid, group_code, role_id, operator_uuid)
+
+    def revoke_role_from_group(self, db: Session, tenant_uuid: str, group_code: str, role_id: str) -> None:
+        """
+        部署からロールを解除する。
+        """
+        self.dao.remove_group_role(db, tenant_uuid, group_code, role_id)
+
+    def find_inherited_roles(self, db: Session) -> List[Tuple[str, str, str]]:
+        """
+        部署ごとの実効ロールを (テナントUUID, 部署コード, ロールID) で全件取得する。
+        """
+        return self.dao.find_inherited_roles(db)
+
+    def find_effective_role_ids(self, db: Session, user_uuid: str, system_date: Optional[date] = None) -> List[str]:
+        """
+        ユーザーが所属部署を通じて持つロールを取得する。
+        """
+        return self.dao.find_effective_role_ids(db, user_uuid, system_date)
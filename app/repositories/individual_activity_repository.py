@@ -1,5 +1,5 @@
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 from app.models.models import IndividualActivity
 from app.repositories.base.individual_activity_repository_base import IndividualActivityRepositoryBase
 from app.daos.individual_activity_dao import IndividualActivityDao 
@@ -19,7 +19,7 @@ class IndividualActivityRepository(IndividualActivityRepositoryBase):
         db_session: Session,
         tenant_uuid: str,
         individual_route_code: str,
-        activity_code: str
+        activity_code: Optional[int] = None
     ) -> List[IndividualActivity]:
         return self.dao.find_by_tenant_and_route(
             db_session,
@@ -1,8 +1,34 @@
-from typing import Optional, Any, List
+from typing import Optional, Any, List, Tuple
+from sqlalchemy.orm import Session
+from app.daos.individual_route_dao import IndividualRouteDao
+from app.models.models import IndividualRoute
 from app.repositories.base.individual_route_repository_base import IndividualRouteRepositoryBase
 
 class IndividualRouteRepository(IndividualRouteRepositoryBase):
     """
     IndividualRouteRepositoryBase のカスタムメソッド追加用
     """
-    pass
\ No newline at end of file
+    def __init__(self):
+        self.dao = IndividualRouteDao()
+
+    def get_by_route_code(
+        self,
+        db_session: Session,
+        tenant_uuid: str,
+        individual_route_code: str
+    ) -> Optional[IndividualRoute]:
+        """
+        DAO経由で個別ルートを取得する。
+        """
+        return self.dao.get_by_route_code(db_session, tenant_uuid, individual_route_code)
+
+    def get_route_version(
+        self,
+        db_session: Session,
+        tenant_uuid: str,
+        individual_route_code: str
+    ) -> Tuple[Any, ...]:
+        """
+        DAO経由で個別ルートの更新状態（バージョン）を取得する。
+        """
+        return self.dao.get_route_version(db_session, tenant_uuid, individual_route_code)
@@ -0,0 +1,20 @@
+from datetime import datetime
+from typing import List
+from sqlalchemy.orm import Session
+from app.models.models import MaintenanceWindow
+from app.daos.maintenance_window_dao import MaintenanceWindowDao
+from app.repositories.base.maintenance_window_repository_base import MaintenanceWindowRepositoryBase
+
+
+class MaintenanceWindowRepository(MaintenanceWindowRepositoryBase):
+    """
+    MaintenanceWindowRepositoryBase のカスタムメソッド追加用
+    """
+    def __init__(self):
+        self.dao = MaintenanceWindowDao()
+
+    def find_open_windows(self, db_session: Session, now: datetime) -> List[MaintenanceWindow]:
+        """
+        DAO経由で終了していない停止期間を取得
+        """
+        return self.dao.find_open_windows(db_session, now)
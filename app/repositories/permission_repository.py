@@ -1,8 +1,19 @@
-from typing import Optional, Any, List
+from typing import Dict
+from sqlalchemy.orm import Session
+from app.daos.permission_dao import PermissionDao
 from app.repositories.base.permission_repository_base import PermissionRepositoryBase
 
 class PermissionRepository(PermissionRepositoryBase):
     """
     PermissionRepositoryBase のカスタムメソッド追加用
     """
-    pass
\ No newline at end of file
+
+    def __init__(self):
+        super().__init__()
+        self.dao = PermissionDao()
+
+    def find_positions(self, db_session: Session) -> Dict[str, int]:
+        """
+        全パーミッションを {パーミッションID: サロゲートキー} で返す。
+        """
+        return self.dao.find_positions(db_session)
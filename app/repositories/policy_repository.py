@@ -1,5 +1,7 @@
 # repositories/policy_repository.py
-from typing import Optional
+from datetime import date
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+from sqlalchemy import Select
 from sqlalchemy.orm import Session
 from app.models.models import Policy
 from app.daos.policy_dao import PolicyDao
@@ -17,7 +19,15 @@ class PolicyRepository(PolicyRepositoryBase):
         super().__init__()
         self.dao = PolicyDao()
 
-    def assign_resource_to_role(self, db: Session, role_id: str, permission_id: str, resource_id: str, condition: Optional[str] = None) -> Policy:
+    def assign_resource_to_role(
+        self,
+        db: Session,
+        role_id: str,
+        permission_id: str,
+        resource_id: str,
+        condition: Optional[str] = None,
+        operator_uuid: str = "system"
+    ) -> Policy:
         """
         ロールに対してリソース×パーミッションのアクセスポリシーを割り当てる。
 
@@ -29,13 +39,15 @@ class PolicyRepository(PolicyRepositoryBase):
         resource_id : str
         condition : Optional[str]
             オプションの条件式（JSON等）
+        operator_uuid : str
+            登録者のユーザーUUID
 
         Returns:
         -------
         Policy
             登録された Policy エンティティ
         """
-        return self.dao.add_policy(db, role_id, permission_id, resource_id, condition)
+        return self.dao.add_policy(db, role_id, permission_id, resource_id, condition, operator_uuid)
 
     def revoke_resource_from_role(self, db: Session, role_id: str, permission_id: str, resource_id: str) -> None:
         """
@@ -55,7 +67,49 @@ class PolicyRepository(PolicyRepositoryBase):
         指定されたrole_idとpermission_idの組み合わせで
         少なくとも1つのpolicyが存在するかチェック
         """
-        return db.query(self.model_class).filter_by(
-            role_id=role_id,
-            permission_id=permission_id
-        ).first() is not None
+        return self.dao.exists_for_role_permission(db, role_id, permission_id)
+
+    def find_all(self, db: Session) -> List[Policy]:
+        """
+        ポリシーを全件取得する。
+        """
+        return self.dao.find_all(db)
+
+    def find_revisions(self, db: Session) -> Dict[str, int]:
+        """
+        全ポリシーの {ポリシーID: 更新回数} を返す。
+        """
+        return self.dao.find_revisions(db)
+
+    def find_rows_by_policy_ids(
+        self, db: Session, policy_ids: Iterable[str]
+    ) -> List[Tuple[str, str, str, str, Optional[str], int]]:
+        """
+        ポリシーを (ポリシーID, ロールID, パーミッションID, リソースID, 条件, 更新回数) で取得する。
+        """
+        return self.dao.find_rows_by_policy_ids(db, policy_ids)
+
+    def allowed_resource_ids(self, user_id: str, permission_id: str, system_date: Optional[date] = None) -> Select:
+        """
+        ユーザーがパーミッションを持つリソースIDの SELECT を返す（部署からの継承を含む。条件付きポリシーは除く）。
+        """
+        return self.dao.allowed_resource_ids(user_id, permission_id, system_date)
+
+    def find_existing_policies(
+        self, db: Session, keys: Iterable[Tuple[str, str, str]]
+    ) -> Set[Tuple[str, str, str, Optional[str]]]:
+        """
+        登録済みのポリシーを (ロールID, パーミッションID, リソースID, 条件) で返す。
+        """
+        return self.dao.find_existing_policies(db, keys)
+
+    def bulk_assign_resources_to_roles(
+        self,
+        db: Session,
+        policies: Iterable[Tuple[str, str, str, Optional[str]]],
+        operator_uuid: str = "system"
+    ) -> List[Tuple[str, str, str, str, Optional[str]]]:
+        """
+        ポリシーを一括登録し、(ポリシーID, ロールID, パーミッションID, リソースID, 条件) を返す。
+        """
+        return self.dao.bulk_add_policies(db, policies, operator_uuid)
@@ -0,0 +1,25 @@
+from sqlalchemy.orm import Session
+from app.daos.policy_version_dao import PolicyVersionDao
+from app.repositories.base.policy_version_repository_base import PolicyVersionRepositoryBase
+
+
+class PolicyVersionRepository(PolicyVersionRepositoryBase):
+    """
+    PolicyVersionRepositoryBase のカスタムメソッド追加用クラス。
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.dao = PolicyVersionDao()
+
+    def get_version(self, db: Session, scope: str) -> int:
+        """
+        版数を返す（行が無い場合は0）。
+        """
+        return self.dao.get_version(db, scope)
+
+    def bump(self, db: Session, scope: str) -> int:
+        """
+        版数を1加算し、加算後の版数を返す。
+        """
+        return self.dao.bump(db, scope)
@@ -1,4 +1,5 @@
 # repositories/role_permission_repository.py
+from typing import Iterable, List, Set, Tuple
 from sqlalchemy.orm import Session
 from app.models.models import RolePermission
 from app.daos.role_permission_dao import RolePermissionDao
@@ -16,7 +17,9 @@ class RolePermissionRepository(RolePermissionRepositoryBase):
         super().__init__()
         self.dao = RolePermissionDao()
 
-    def assign_permission_to_role(self, db: Session, role_id: str, permission_id: str) -> RolePermission:
+    def assign_permission_to_role(
+        self, db: Session, role_id: str, permission_id: str, operator_uuid: str = "system"
+    ) -> RolePermission:
         """
         ロールにパーミッションを割り当てる。
 
@@ -28,29 +31,39 @@ class RolePermissionRepository(RolePermissionRepositoryBase):
             対象ロールID
         permission_id : str
             対象パーミッションID
+        operator_uuid : str
+            登録者のユーザーUUID
 
         Returns:
         -------
         RolePermission
             登録された RolePermission エンティティ
         """
-        return self.dao.add_role_permission(db, role_id, permission_id)
+        return self.dao.add_role_permission(db, role_id, permission_id, operator_uuid)
 
     def revoke_permission_from_role(self, db: Session, role_id: str, permission_id: str):
         """
         ロールからパーミッションを解除する。
-        policyが関連している場合は削除不可。
+        policyが関連している場合の削除可否は呼び出し側（Cerberus）で判定する。
         """
-        if self.policy_repo.has_policy(db, role_id, permission_id):
-            raise ValueError(f"Permission {permission_id} is still used in policies for Role {role_id}")
-
-        self.role_permission_repo.revoke_permission_from_role(db, role_id, permission_id)
+        self.dao.remove_role_permission(db, role_id, permission_id)
 
     def has_permission(self, db: Session, role_id: str, permission_id: str) -> bool:
         """
         指定されたロールが指定されたパーミッションを保持しているかどうかを返す。
         """
-        return db.query(self.model_class).filter_by(
-            role_id=role_id,
-            permission_id=permission_id
-        ).first() is not None
+        return self.dao.exists(db, role_id, permission_id)
+
+    def find_existing_pairs(self, db: Session, pairs: Iterable[Tuple[str, str]]) -> Set[Tuple[str, str]]:
+        """
+        登録済みの (ロールID, パーミッションID) を返す。
+        """
+        return self.dao.find_existing_pairs(db, pairs)
+
+    def bulk_assign_permissions_to_roles(
+        self, db: Session, pairs: Iterable[Tuple[str, str]], operator_uuid: str = "system"
+    ) -> List[Tuple[str, str]]:
+        """
+        ロールへのパーミッション割り当てを一括登録し、追加された (ロールID, パーミッションID) を返す。
+        """
+        return self.dao.bulk_add_role_permissions(db, pairs, operator_uuid)
@@ -1,5 +1,5 @@
 from sqlalchemy.orm import Session
-from typing import Optional, Any, List
+from typing import Dict, Optional, Any, List
 from app.repositories.base.role_repository_base import RoleRepositoryBase
 from app.daos.role_dao import RoleDao
 from app.models.models import Role
@@ -35,4 +35,20 @@ class RoleRepository(RoleRepositoryBase):
             tenant_uuid=tenant_uuid,
             approverl_tenant_uuid=approverl_tenant_uuid,
             role_code=role_code
-        )
\ No newline at end of file
+        )
+
+    def get_by_role_ids(
+        self,
+        db_session: Session,
+        role_ids: List[str]
+    ) -> List[Role]:
+        """
+        DAO経由で複数のロールをまとめて取得する。
+        """
+        return self.role_dao.get_by_role_ids(db_session, role_ids)
+
+    def find_positions(self, db_session: Session) -> Dict[str, int]:
+        """
+        全ロールを {ロールID: サロゲートキー} で返す。
+        """
+        return self.role_dao.find_positions(db_session)
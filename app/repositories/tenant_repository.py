@@ -1,8 +1,18 @@
 from typing import Optional, Any, List
+from sqlalchemy.orm import Session
+from app.daos.tenant_dao import TenantDao
+from app.models.models import Tenant
 from app.repositories.base.tenant_repository_base import TenantRepositoryBase
 
 class TenantRepository(TenantRepositoryBase):
     """
     TenantRepositoryBase のカスタムメソッド追加用
     """
-    pass
\ No newline at end of file
+    def __init__(self):
+        self.dao = TenantDao()
+
+    def get_by_tenant_uuids(self, db_session: Session, tenant_uuids: List[str]) -> List[Tenant]:
+        """
+        DAO経由で複数のテナントをまとめて取得する。
+        """
+        return self.dao.get_by_tenant_uuids(db_session, tenant_uuids)
@@ -22,3 +22,14 @@ class TenantUserRepository(TenantUserRepositoryBase):
             TenantUser.user_uuid == user_uuid,
             TenantUser.belong_end_date.is_(None)
         ).first()
+
+    def find_active_users(
+        self,
+        db_session: Session,
+        tenant_uuid: str,
+        user_uuids: List[str]
+    ) -> List[TenantUser]:
+        """
+        DAO経由で所属中のユーザーをまとめて取得する。
+        """
+        return self.dao.find_active_users(db_session, tenant_uuid, user_uuids)
@@ -1,7 +1,7 @@
 from sqlalchemy.orm import Session
 from app.daos.user_group_dao import UserGroupDao
 from app.models.models import UserGroup
-from typing import Optional, Any, List
+from typing import Optional, Any, List, Tuple
 from app.repositories.base.user_group_repository_base import UserGroupRepositoryBase
 
 class UserGroupRepository(UserGroupRepositoryBase):
@@ -16,4 +16,21 @@ class UserGroupRepository(UserGroupRepositoryBase):
             tenant_uuid=tenant_uuid,
             user_uuid=user_uuid,
             group_code=group_code
-        ).first()
\ No newline at end of file
+        ).first()
+
+    def find_by_user_group_keys(
+        self,
+        db_session: Session,
+        tenant_uuid: str,
+        keys: List[Tuple[str, str]]
+    ) -> List[UserGroup]:
+        """
+        DAO経由で (ユーザーUUID, 部署コード) の組み合わせに一致する従業員部署をまとめて取得する。
+        """
+        return self.dao.find_by_user_group_keys(db_session, tenant_uuid, keys)
+
+    def find_all_affiliations(self, db_session: Session) -> List[Tuple[str, str, str, Any, Any]]:
+        """
+        全従業員の所属部署を (ユーザーUUID, テナントUUID, 部署コード, 有効開始日, 有効終了日) で取得する。
+        """
+        return self.dao.find_all_affiliations(db_session)
@@ -1,8 +1,18 @@
 from typing import Optional, Any, List
+from sqlalchemy.orm import Session
+from app.daos.user_dao import UserDao
+from app.models.models import User
 from app.repositories.base.user_repository_base import UserRepositoryBase
 
 class UserRepository(UserRepositoryBase):
     """
     UserRepositoryBase のカスタムメソッド追加用
     """
-    pass
\ No newline at end of file
+    def __init__(self):
+        self.dao = UserDao()
+
+    def get_by_user_uuids(self, db_session: Session, user_uuids: List[str]) -> List[User]:
+        """
+        DAO経由で複数のユーザーをまとめて取得する。
+        """
+        return self.dao.get_by_user_uuids(db_session, user_uuids)
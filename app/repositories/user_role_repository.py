@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import Iterable, List, Optional, Set, Tuple
 from sqlalchemy.orm import Session
 from app.daos.user_role_dao import UserRoleDao
 from app.models.models import UserRole
@@ -16,7 +16,7 @@ class UserRoleRepository(UserRoleRepositoryBase):
         super().__init__()
         self.dao = UserRoleDao()
 
-    def assign_role_to_user(self, db: Session, user_id: str, role_id: str) -> UserRole:
+    def assign_role_to_user(self, db: Session, user_id: str, role_id: str, operator_uuid: str = "system") -> UserRole:
         """
         ユーザーにロールを割り当てる。
 
@@ -28,13 +28,15 @@ class UserRoleRepository(UserRoleRepositoryBase):
             対象ユーザーID
         role_id : str
             対象ロールID
+        operator_uuid : str
+            登録者のユーザーUUID
 
         Returns:
         -------
         UserRole
             登録された UserRole エンティティ
         """
-        return self.dao.add_user_role(db, user_id, role_id)
+        return self.dao.add_user_role(db, user_id, role_id, operator_uuid)
 
     def revoke_role_from_user(self, db: Session, user_id: str, role_id: str) -> None:
         """
@@ -50,3 +52,29 @@ class UserRoleRepository(UserRoleRepositoryBase):
             対象ロールID
         """
         self.dao.remove_user_role(db, user_id, role_id)
+
+    def find_all(self, db: Session) -> List[UserRole]:
+        """
+        ユーザーとロールの関連付けを全件取得する。
+        """
+        return self.dao.find_all(db)
+
+    def find_all_pairs(self, db: Session) -> List[Tuple[str, str]]:
+        """
+        ユーザーとロールの関連付けを (ユーザーID, ロールID) で全件取得する。
+        """
+        return self.dao.find_all_pairs(db)
+
+    def find_existing_pairs(self, db: Session, pairs: Iterable[Tuple[str, str]]) -> Set[Tuple[str, str]]:
+        """
+        登録済みの (ユーザーID, ロールID) を返す。
+        """
+        return self.dao.find_existing_pairs(db, pairs)
+
+    def bulk_assign_roles_to_users(
+        self, db: Session, pairs: Iterable[Tuple[str, str]], operator_uuid: str = "system"
+    ) -> List[Tuple[str, str]]:
+        """
+        ユーザーへのロール割り当てを一括登録し、追加された (ユーザーID, ロールID) を返す。
+        """
+        return self.dao.bulk_add_user_roles(db, pairs, operator_uuid)
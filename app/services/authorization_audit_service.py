@@ -0,0 +1,29 @@
+from typing import Optional
+from sqlalchemy.orm import Session
+from app.repositories.authorization_audit_repository import AuthorizationAuditRepository
+from app.models.models import AuthorizationAudit
+from app.services.base.base_service import BaseService
+
+
+class AuthorizationAuditService(BaseService):
+    """
+    AuthorizationAudit に対応するサービスクラス。
+    ビジネスロジックをここに記述。
+    """
+    def __init__(self, dao: Optional[AuthorizationAuditRepository] = None):
+        self.dao = dao or AuthorizationAuditRepository()
+
+    def get(self, db: Session, id: int) -> Optional[AuthorizationAudit]:
+        return self.dao.get(db, id)
+
+    def get_all(self, db: Session, limit: int = 100, offset: int = 0):
+        return self.dao.get_all(db, limit, offset)
+
+    def create(self, db: Session, data: AuthorizationAudit):
+        return self.dao.create(db, data)
+
+    def update(self, db: Session, instance: AuthorizationAudit, values: dict):
+        return self.dao.update(db, instance, values)
+
+    def delete(self, db: Session, instance: AuthorizationAudit):
+        return self.dao.delete(db, instance)
\ No newline at end of file
@@ -0,0 +1,29 @@
+from typing import Optional
+from sqlalchemy.orm import Session
+from app.repositories.group_closure_repository import GroupClosureRepository
+from app.models.models import GroupClosure
+from app.services.base.base_service import BaseService
+
+
+class GroupClosureService(BaseService):
+    """
+    GroupClosure に対応するサービスクラス。
+    ビジネスロジックをここに記述。
+    """
+    def __init__(self, dao: Optional[GroupClosureRepository] = None):
+        self.dao = dao or GroupClosureRepository()
+
+    def get(self, db: Session, id: int) -> Optional[GroupClosure]:
+        return self.dao.get(db, id)
+
+    def get_all(self, db: Session, limit: int = 100, offset: int = 0):
+        return self.dao.get_all(db, limit, offset)
+
+    def create(self, db: Session, data: GroupClosure):
+        return self.dao.create(db, data)
+
+    def update(self, db: Session, instance: GroupClosure, values: dict):
+        return self.dao.update(db, instance, values)
+
+    def delete(self, db: Session, instance: GroupClosure):
+        return self.dao.delete(db, instance)
\ No newline at end of file
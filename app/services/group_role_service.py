@@ -0,0 +1,29 @@
+from typing import Optional
+from sqlalchemy.orm import Session
+from app.repositories.group_role_repository import GroupRoleRepository
+from app.models.models import GroupRole
+from app.services.base.base_service import BaseService
+
+
+class GroupRoleService(BaseService):
+    """
+    GroupRole に対応するサービスクラス。
+    ビジネスロジックをここに記述。
+    """
+    def __init__(self, dao: Optional[GroupRoleRepository] = None):
+        self.dao = dao or GroupRoleRepository()
+
+    def get(self, db: Session, id: int) -> Optional[GroupRole]:
+        return self.dao.get(db, id)
+
+    def get_all(self, db: Session, limit: int = 100, offset: int = 0):
+        return self.dao.get_all(db, limit, offset)
+
+    def create(self, db: Session, data: GroupRole):
+        return self.dao.create(db, data)
+
+    def update(self, db: Session, instance: GroupRole, values: dict):
+        return self.dao.update(db, instance, values)
+
+    def delete(self, db: Session, instance: GroupRole):
+        return self.dao.delete(db, instance)
\ No newline at end of file
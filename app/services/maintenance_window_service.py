@@ -0,0 +1,29 @@
+from typing import Optional
+from sqlalchemy.orm import Session
+from app.repositories.maintenance_window_repository import MaintenanceWindowRepository
+from app.models.models import MaintenanceWindow
+from app.services.base.base_service import BaseService
+
+
+class MaintenanceWindowService(BaseService):
+    """
+    MaintenanceWindow に対応するサービスクラス。
+    ビジネスロジックをここに記述。
+    """
+    def __init__(self, dao: Optional[MaintenanceWindowRepository] = None):
+        self.dao = dao or MaintenanceWindowRepository()
+
+    def get(self, db: Session, id: int) -> Optional[MaintenanceWindow]:
+        return self.dao.get(db, id)
+
+    def get_all(self, db: Session, limit: int = 100, offset: int = 0):
+        return self.dao.get_all(db, limit, offset)
+
+    def create(self, db: Session, data: MaintenanceWindow):
+        return self.dao.create(db, data)
+
+    def update(self, db: Session, instance: MaintenanceWindow, values: dict):
+        return self.dao.update(db, instance, values)
+
+    def delete(self, db: Session, instance: MaintenanceWindow):
+        return self.dao.delete(db, instance)
\ No newline at end of file
@@ -0,0 +1,29 @@
+from typing import Optional
+from sqlalchemy.orm import Session
+from app.repositories.policy_version_repository import PolicyVersionRepository
+from app.models.models import PolicyVersion
+from app.services.base.base_service import BaseService
+
+
+class PolicyVersionService(BaseService):
+    """
+    PolicyVersion に対応するサービスクラス。
+    ビジネスロジックをここに記述。
+    """
+    def __init__(self, dao: Optional[PolicyVersionRepository] = None):
+        self.dao = dao or PolicyVersionRepository()
+
+    def get(self, db: Session, id: int) -> Optional[PolicyVersion]:
+        return self.dao.get(db, id)
+
+    def get_all(self, db: Session, limit: int = 100, offset: int = 0):
+        return self.dao.get_all(db, limit, offset)
+
+    def create(self, db: Session, data: PolicyVersion):
+        return self.dao.create(db, data)
+
+    def update(self, db: Session, instance: PolicyVersion, values: dict):
+        return self.dao.update(db, instance, values)
+
+    def delete(self, db: Session, instance: PolicyVersion):
+        return self.dao.delete(db, instance)
\ No newline at end of file
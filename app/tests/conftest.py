@@ -1,7 +1,13 @@
 import pytest
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
 from app.models.models import Base
+from app.engine.cerberus import Cerberus
+from app.engine.maintenance_registry import default_maintenance_registry
+from app.engine.master_data_resolver import default_master_data_cache
+from app.engine.decision_cache import DecisionCache, default_decision_cache
+from app.engine.policy_index import PolicyIndex, default_policy_index
+from app.engine.route_plan_cache import default_route_plan_cache
 from app.repositories.individual_activity_repository import IndividualActivityRepository
 from app.repositories.tenant_user_repository import TenantUserRepository
 from app.repositories.user_group_repository import UserGroupRepository
@@ -27,6 +33,34 @@ def db_session():
     session.close()
     transaction.rollback()
     connection.close()
+    # ロールバックしたルートのプランや名称が次のテストに残らないようにする
+    default_route_plan_cache.clear()
+    default_master_data_cache.clear()
+    default_maintenance_registry.reset()
+    default_policy_index.clear()
+    default_decision_cache.clear()
+
+@pytest.fixture
+def query_counter():
+    """テスト中に発行されたSQL文を記録する（N+1 回帰テスト用）"""
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    yield statements
+    event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+@pytest.fixture
+def cerberus(db_session):
+    """テスト用セッションで読み込んだ、専用のインデックス・判定キャッシュを持つ Cerberus"""
+    engine = Cerberus(
+        policy_index=PolicyIndex(), session_factory=lambda: db_session,
+        decision_cache=DecisionCache(maxsize=4), version_check_interval=60
+    )
+    engine.load_index(db_session)
+    return engine
 
 # 以下は repository を必要とするテスト向け
 @pytest.fixture
@@ -3,6 +3,7 @@ from sqlalchemy.orm import Session
 from app.models.models import Appended
 from app.daos.appended_dao import AppendedDao
 from datetime import datetime, date, time
+from app.exception.laubeException import OptimisticLockException
 
 
 @pytest.fixture
@@ -40,9 +41,43 @@ def test_update_appended(db_session: Session, appended_dict):
     updated = dao.get(db_session, obj.id)
     assert updated.tenant_uuid == "updated"
 
+def test_update_conflict_appended(db_session: Session, appended_dict):
+    dao = AppendedDao()
+    obj = dao.create(db_session, appended_dict)
+    with pytest.raises(OptimisticLockException):
+        dao.update(db_session, obj.id, {"tenant_uuid": "updated"}, expected_update_count=obj.update_count + 1)
+
 def test_delete_appended(db_session: Session, appended_dict):
     dao = AppendedDao()
     obj = dao.create(db_session, appended_dict)
     dao.delete(db_session, obj)
     deleted = dao.get(db_session, obj.id)
-    assert deleted is None
\ No newline at end of file
+    assert deleted is None
+
+def test_get_page_after_and_iter_all_appended(db_session: Session, appended_dict):
+    dao = AppendedDao()
+    obj = dao.create(db_session, appended_dict)
+    assert dao.get_page_after(db_session, limit=10) == [obj]
+    assert dao.get_page_after(db_session, last_id=obj.id, limit=10) == []
+    assert list(dao.iter_all(db_session, batch_size=10)) == [obj]
+
+def test_bulk_insert_and_delete_appended(db_session: Session, appended_dict):
+    dao = AppendedDao()
+    assert dao.bulk_insert(db_session, [appended_dict]) == 1
+    assert dao.count(db_session) == 1
+    assert dao.bulk_delete(db_session, [appended_dict["id"]]) == 1
+    assert dao.count(db_session) == 0
+
+def test_get_by_unique_key_appended(db_session: Session, appended_dict):
+    dao = AppendedDao()
+    obj = dao.create(db_session, appended_dict)
+    assert dao.get_by_tenant_uuid_and_application_number_and_route_type_and_route_number(db_session, appended_dict["tenant_uuid"], appended_dict["application_number"], appended_dict["route_type"], appended_dict["route_number"]) is obj
+    assert dao.get_many_by_tenant_uuid_and_application_number_and_route_type_and_route_number(db_session, [(appended_dict["tenant_uuid"], appended_dict["application_number"], appended_dict["route_type"], appended_dict["route_number"])]) == [obj]
+
+def test_bulk_upsert_appended(db_session: Session, appended_dict):
+    dao = AppendedDao()
+    row = {key: value for key, value in appended_dict.items() if key != "id"}
+    dao.bulk_upsert(db_session, [row])
+    dao.bulk_upsert(db_session, [row])
+    assert dao.count(db_session) == 1
+    assert dao.get_all(db_session)[0].update_count == row["update_count"] + 1
\ No newline at end of file
@@ -3,6 +3,7 @@ from sqlalchemy.orm import Session
 from app.models.models import ApplicationClassificationFormat
 from app.daos.application_classification_format_dao import ApplicationClassificationFormatDao
 from datetime import datetime, date, time
+from app.exception.laubeException import OptimisticLockException
 
 
 @pytest.fixture
@@ -33,9 +34,43 @@ def test_update_application_classification_format(db_session: Session, applicati
     updated = dao.get(db_session, obj.id)
     assert updated.application_classification_code == "updated"
 
+def test_update_conflict_application_classification_format(db_session: Session, application_classification_format_dict):
+    dao = ApplicationClassificationFormatDao()
+    obj = dao.create(db_session, application_classification_format_dict)
+    with pytest.raises(OptimisticLockException):
+        dao.update(db_session, obj.id, {"application_classification_code": "updated"}, expected_update_count=obj.update_count + 1)
+
 def test_delete_application_classification_format(db_session: Session, application_classification_format_dict):
     dao = ApplicationClassificationFormatDao()
     obj = dao.create(db_session, application_classification_format_dict)
     dao.delete(db_session, obj)
     deleted = dao.get(db_session, obj.id)
-    assert deleted is None
\ No newline at end of file
+    assert deleted is None
+
+def test_get_page_after_and_iter_all_application_classification_format(db_session: Session, application_classification_format_dict):
+    dao = ApplicationClassificationFormatDao()
+    obj = dao.create(db_session, application_classification_format_dict)
+    assert dao.get_page_after(db_session, limit=10) == [obj]
+    assert dao.get_page_after(db_session, last_id=obj.id, limit=10) == []
+    assert list(dao.iter_all(db_session, batch_size=10)) == [obj]
+
+def test_bulk_insert_and_delete_application_classification_format(db_session: Session, application_classification_format_dict):
+    dao = ApplicationClassificationFormatDao()
+    assert dao.bulk_insert(db_session, [application_classification_format_dict]) == 1
+    assert dao.count(db_session) == 1
+    assert dao.bulk_delete(db_session, [application_classification_format_dict["id"]]) == 1
+    assert dao.count(db_session) == 0
+
+def test_get_by_unique_key_application_classification_format(db_session: Session, application_classification_format_dict):
+    dao = ApplicationClassificationFormatDao()
+    obj = dao.create(db_session, application_classification_format_dict)
+    assert dao.get_by_application_classification_code(db_session, application_classification_format_dict["application_classification_code"]) is obj
+    assert dao.get_many_by_application_classification_code(db_session, [application_classification_format_dict["application_classification_code"]]) == [obj]
+
+def test_bulk_upsert_application_classification_format(db_session: Session, application_classification_format_dict):
+    dao = ApplicationClassificationFormatDao()
+    row = {key: value for key, value in application_classification_format_dict.items() if key != "id"}
+    dao.bulk_upsert(db_session, [row])
+    dao.bulk_upsert(db_session, [row])
+    assert dao.count(db_session) == 1
+    assert dao.get_all(db_session)[0].update_count == row["update_count"] + 1
\ No newline at end of file
@@ -3,6 +3,7 @@ from sqlalchemy.orm import Session
 from app.models.models import ApplicationCommentAttachment
 from app.daos.application_comment_attachment_dao import ApplicationCommentAttachmentDao
 from datetime import datetime, date, time
+from app.exception.laubeException import OptimisticLockException
 
 
 @pytest.fixture
@@ -32,4 +33,18 @@ def test_delete_application_comment_attachment(db_session: Session, application_
     obj = dao.create(db_session, application_comment_attachment_dict)
     dao.delete(db_session, obj)
     deleted = dao.get(db_session, obj.id)
-    assert deleted is None
\ No newline at end of file
+    assert deleted is None
+
+def test_get_page_after_and_iter_all_application_comment_attachment(db_session: Session, application_comment_attachment_dict):
+    dao = ApplicationCommentAttachmentDao()
+    obj = dao.create(db_session, application_comment_attachment_dict)
+    assert dao.get_page_after(db_session, limit=10) == [obj]
+    assert dao.get_page_after(db_session, last_id=obj.id, limit=10) == []
+    assert list(dao.iter_all(db_session, batch_size=10)) == [obj]
+
+def test_bulk_insert_and_delete_application_comment_attachment(db_session: Session, application_comment_attachment_dict):
+    dao = ApplicationCommentAttachmentDao()
+    assert dao.bulk_insert(db_session, [application_comment_attachment_dict]) == 1
+    assert dao.count(db_session) == 1
+    assert dao.bulk_delete(db_session, [application_comment_attachment_dict["id"]]) == 1
+    assert dao.count(db_session) == 0
\ No newline at end of file
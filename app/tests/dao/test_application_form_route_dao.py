@@ -3,6 +3,7 @@ from sqlalchemy.orm import Session
 from app.models.models import ApplicationFormRoute
 from app.daos.application_form_route_dao import ApplicationFormRouteDao
 from datetime import datetime, date, time
+from app.exception.laubeException import OptimisticLockException
 
 
 @pytest.fixture
@@ -34,9 +35,43 @@ def test_update_application_form_route(db_session: Session, application_form_rou
     updated = dao.get(db_session, obj.id)
     assert updated.tenant_uuid == "updated"
 
+def test_update_conflict_application_form_route(db_session: Session, application_form_route_dict):
+    dao = ApplicationFormRouteDao()
+    obj = dao.create(db_session, application_form_route_dict)
+    with pytest.raises(OptimisticLockException):
+        dao.update(db_session, obj.id, {"tenant_uuid": "updated"}, expected_update_count=obj.update_count + 1)
+
 def test_delete_application_form_route(db_session: Session, application_form_route_dict):
     dao = ApplicationFormRouteDao()
     obj = dao.create(db_session, application_form_route_dict)
     dao.delete(db_session, obj)
     deleted = dao.get(db_session, obj.id)
-    assert deleted is None
\ No newline at end of file
+    assert deleted is None
+
+def test_get_page_after_and_iter_all_application_form_route(db_session: Session, application_form_route_dict):
+    dao = ApplicationFormRouteDao()
+    obj = dao.create(db_session, application_form_route_dict)
+    assert dao.get_page_after(db_session, limit=10) == [obj]
+    assert dao.get_page_after(db_session, last_id=obj.id, limit=10) == []
+    assert list(dao.iter_all(db_session, batch_size=10)) == [obj]
+
+def test_bulk_insert_and_delete_application_form_route(db_session: Session, application_form_route_dict):
+    dao = ApplicationFormRouteDao()
+    assert dao.bulk_insert(db_session, [application_form_route_dict]) == 1
+    assert dao.count(db_session) == 1
+    assert dao.bulk_delete(db_session, [application_form_route_dict["id"]]) == 1
+    assert dao.count(db_session) == 0
+
+def test_get_by_unique_key_application_form_route(db_session: Session, application_form_route_dict):
+    dao = ApplicationFormRouteDao()
+    obj = dao.create(db_session, application_form_route_dict)
+    assert dao.get_by_tenant_uuid_and_application_form_code_and_group_code(db_session, application_form_route_dict["tenant_uuid"], application_form_route_dict["application_form_code"], application_form_route_dict["group_code"]) is obj
+    assert dao.get_many_by_tenant_uuid_and_application_form_code_and_group_code(db_session, [(application_form_route_dict["tenant_uuid"], application_form_route_dict["application_form_code"], application_form_route_dict["group_code"])]) == [obj]
+
+def test_bulk_upsert_application_form_route(db_session: Session, application_form_route_dict):
+    dao = ApplicationFormRouteDao()
+    row = {key: value for key, value in application_form_route_dict.items() if key != "id"}
+    dao.bulk_upsert(db_session, [row])
+    dao.bulk_upsert(db_session, [row])
+    assert dao.count(db_session) == 1
+    assert dao.get_all(db_session)[0].update_count == row["update_count"] + 1
\ No newline at end of file
@@ -0,0 +1,56 @@
+import pytest
+from sqlalchemy.orm import Session
+from app.models.models import AuthorizationAudit
+from app.daos.authorization_audit_dao import AuthorizationAuditDao
+from datetime import datetime, date, time
+from app.exception.laubeException import OptimisticLockException
+
+
+@pytest.fixture
+def authorization_audit_dict():
+    return {
+        "id": 1,
+        "event_type": 'dummy',
+        "event_date": datetime(2024, 1, 1, 0, 0, 0),
+        "user_id": 'dummy',
+        "role_id": 'dummy',
+        "permission_id": 'dummy',
+        "resource_id": 'dummy',
+        "allowed": True,
+        "detail": 'dummy',
+        "operator_uuid": 'dummy'
+    }
+
+def test_create_and_get_authorization_audit(db_session: Session, authorization_audit_dict):
+    dao = AuthorizationAuditDao()
+    obj = dao.create(db_session, authorization_audit_dict)
+    found = dao.get(db_session, obj.id)
+    assert found is not None
+
+def test_update_authorization_audit(db_session: Session, authorization_audit_dict):
+    dao = AuthorizationAuditDao()
+    obj = dao.create(db_session, authorization_audit_dict)
+    dao.update(db_session, obj.id, {"event_type": "updated"})
+    updated = dao.get(db_session, obj.id)
+    assert updated.event_type == "updated"
+
+def test_delete_authorization_audit(db_session: Session, authorization_audit_dict):
+    dao = AuthorizationAuditDao()
+    obj = dao.create(db_session, authorization_audit_dict)
+    dao.delete(db_session, obj)
+    deleted = dao.get(db_session, obj.id)
+    assert deleted is None
+
+def test_get_page_after_and_iter_all_authorization_audit(db_session: Session, authorization_audit_dict):
+    dao = AuthorizationAuditDao()
+    obj = dao.create(db_session, authorization_audit_dict)
+    assert dao.get_page_after(db_session, limit=10) == [obj]
+    assert dao.get_page_after(db_session, last_id=obj.id, limit=10) == []
+    assert list(dao.iter_all(db_session, batch_size=10)) == [obj]
+
+def test_bulk_insert_and_delete_authorization_audit(db_session: Session, authorization_audit_dict):
+    dao = AuthorizationAuditDao()
+    assert dao.bulk_insert(db_session, [authorization_audit_dict]) == 1
+    assert dao.count(db_session) == 1
+    assert dao.bulk_delete(db_session, [authorization_audit_dict["id"]]) == 1
+    assert dao.count(db_session) == 0
\ No newline at end of file
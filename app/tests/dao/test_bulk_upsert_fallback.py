@@ -0,0 +1,42 @@
+from datetime import date
+import pytest
+from app.common import bulk_insert
+from app.daos.group_dao import GroupDao
+from app.models.specifiedValue import PermissionRange
+
+AUDIT = dict(create_user_uuid="test", update_user_uuid="test", update_count=1)
+
+
+def group_row(group_code, group_name):
+    return dict(
+        tenant_uuid="T1", group_code=group_code, group_name=group_name, term_from=date(2024, 1, 1),
+        permission_range=PermissionRange.ALL, **AUDIT
+    )
+
+
+@pytest.fixture
+def without_upsert_syntax(monkeypatch):
+    """UPSERT 構文の無いDBとして扱い、検索してから INSERT / UPDATE する経路を通す"""
+    monkeypatch.setattr(bulk_insert, "UPSERT_DIALECTS", ())
+
+
+def test_fallback_inserts_new_and_updates_existing_rows(db_session, without_upsert_syntax):
+    dao = GroupDao()
+    dao.bulk_upsert(db_session, [group_row("G1", "営業部")])
+
+    sent = dao.bulk_upsert(db_session, [group_row("G1", "営業一部"), group_row("G2", "総務部")])
+
+    assert sent == 2
+    groups = {g.group_code: g for g in dao.get_all(db_session)}
+    assert set(groups) == {"G1", "G2"}
+    db_session.refresh(groups["G1"])
+    assert (groups["G1"].group_name, groups["G1"].update_count) == ("営業一部", 2)
+    assert (groups["G2"].group_name, groups["G2"].update_count) == ("総務部", 1)
+
+
+def test_fallback_keeps_the_last_row_for_duplicate_keys(db_session, without_upsert_syntax):
+    dao = GroupDao()
+
+    dao.bulk_upsert(db_session, [group_row("G1", "営業部"), group_row("G1", "営業一部")])
+
+    assert [g.group_name for g in dao.get_all(db_session)] == ["営業一部"]
@@ -3,6 +3,7 @@ from sqlalchemy.orm import Session
 from app.models.models import CommonRoute
 from app.daos.common_route_dao import CommonRouteDao
 from datetime import datetime, date, time
+from app.exception.laubeException import OptimisticLockException
 
 
 @pytest.fixture
@@ -34,9 +35,43 @@ def test_update_common_route(db_session: Session, common_route_dict):
     updated = dao.get(db_session, obj.id)
     assert updated.tenant_uuid == "updated"
 
+def test_update_conflict_common_route(db_session: Session, common_route_dict):
+    dao = CommonRouteDao()
+    obj = dao.create(db_session, common_route_dict)
+    with pytest.raises(OptimisticLockException):
+        dao.update(db_session, obj.id, {"tenant_uuid": "updated"}, expected_update_count=obj.update_count + 1)
+
 def test_delete_common_route(db_session: Session, common_route_dict):
     dao = CommonRouteDao()
     obj = dao.create(db_session, common_route_dict)
     dao.delete(db_session, obj)
     deleted = dao.get(db_session, obj.id)
-    assert deleted is None
\ No newline at end of file
+    assert deleted is None
+
+def test_get_page_after_and_iter_all_common_route(db_session: Session, common_route_dict):
+    dao = CommonRouteDao()
+    obj = dao.create(db_session, common_route_dict)
+    assert dao.get_page_after(db_session, limit=10) == [obj]
+    assert dao.get_page_after(db_session, last_id=obj.id, limit=10) == []
+    assert list(dao.iter_all(db_session, batch_size=10)) == [obj]
+
+def test_bulk_insert_and_delete_common_route(db_session: Session, common_route_dict):
+    dao = CommonRouteDao()
+    assert dao.bulk_insert(db_session, [common_route_dict]) == 1
+    assert dao.count(db_session) == 1
+    assert dao.bulk_delete(db_session, [common_route_dict["id"]]) == 1
+    assert dao.count(db_session) == 0
+
+def test_get_by_unique_key_common_route(db_session: Session, common_route_dict):
+    dao = CommonRouteDao()
+    obj = dao.create(db_session, common_route_dict)
+    assert dao.get_by_tenant_uuid_and_common_route_code(db_session, common_route_dict["tenant_uuid"], common_route_dict["common_route_code"]) is obj
+    assert dao.get_many_by_tenant_uuid_and_common_route_code(db_session, [(common_route_dict["tenant_uuid"], common_route_dict["common_route_code"])]) == [obj]
+
+def test_bulk_upsert_common_route(db_session: Session, common_route_dict):
+    dao = CommonRouteDao()
+    row = {key: value for key, value in common_route_dict.items() if key != "id"}
+    dao.bulk_upsert(db_session, [row])
+    dao.bulk_upsert(db_session, [row])
+    assert dao.count(db_session) == 1
+    assert dao.get_all(db_session)[0].update_count == row["update_count"] + 1
\ No newline at end of file
@@ -3,6 +3,7 @@ from sqlalchemy.orm import Session
 from app.models.models import DynamicRouteNode
 from app.daos.dynamic_route_node_dao import DynamicRouteNodeDao
 from datetime import datetime, date, time
+from app.exception.laubeException import OptimisticLockException
 from app.models.specifiedValue import ApprovalFunction
 
 @pytest.fixture
@@ -37,9 +38,43 @@ def test_update_dynamic_route_node(db_session: Session, dynamic_route_node_dict)
     updated = dao.get(db_session, obj.id)
     assert updated.tenant_uuid == "updated"
 
+def test_update_conflict_dynamic_route_node(db_session: Session, dynamic_route_node_dict):
+    dao = DynamicRouteNodeDao()
+    obj = dao.create(db_session, dynamic_route_node_dict)
+    with pytest.raises(OptimisticLockException):
+        dao.update(db_session, obj.id, {"tenant_uuid": "updated"}, expected_update_count=obj.update_count + 1)
+
 def test_delete_dynamic_route_node(db_session: Session, dynamic_route_node_dict):
     dao = DynamicRouteNodeDao()
     obj = dao.create(db_session, dynamic_route_node_dict)
     dao.delete(db_session, obj)
     deleted = dao.get(db_session, obj.id)
-    assert deleted is None
\ No newline at end of file
+    assert deleted is None
+
+def test_get_page_after_and_iter_all_dynamic_route_node(db_session: Session, dynamic_route_node_dict):
+    dao = DynamicRouteNodeDao()
+    obj = dao.create(db_session, dynamic_route_node_dict)
+    assert dao.get_page_after(db_session, limit=10) == [obj]
+    assert dao.get_page_after(db_session, last_id=obj.id, limit=10) == []
+    assert list(dao.iter_all(db_session, batch_size=10)) == [obj]
+
+def test_bulk_insert_and_delete_dynamic_route_node(db_session: Session, dynamic_route_node_dict):
+    dao = DynamicRouteNodeDao()
+    assert dao.bulk_insert(db_session, [dynamic_route_node_dict]) == 1
+    assert dao.count(db_session) == 1
+    assert dao.bulk_delete(db_session, [dynamic_route_node_dict["id"]]) == 1
+    assert dao.count(db_session) == 0
+
+def test_get_by_unique_key_dynamic_route_node(db_session: Session, dynamic_route_node_dict):
+    dao = DynamicRouteNodeDao()
+    obj = dao.create(db_session, dynamic_route_node_dict)
+    assert dao.get_by_tenant_uuid_and_application_number_and_route_type_and_route_number(db_session, dynamic_route_node_dict["tenant_uuid"], dynamic_route_node_dict["application_number"], dynamic_route_node_dict["route_type"], dynamic_route_node_dict["route_number"]) is obj
+    assert dao.get_many_by_tenant_uuid_and_application_number_and_route_type_and_route_number(db_session, [(dynamic_route_node_dict["tenant_uuid"], dynamic_route_node_dict["application_number"], dynamic_route_node_dict["route_type"], dynamic_route_node_dict["route_number"])]) == [obj]
+
+def test_bulk_upsert_dynamic_route_node(db_session: Session, dynamic_route_node_dict):
+    dao = DynamicRouteNodeDao()
+    row = {key: value for key, value in dynamic_route_node_dict.items() if key != "id"}
+    dao.bulk_upsert(db_session, [row])
+    dao.bulk_upsert(db_session, [row])
+    assert dao.count(db_session) == 1
+    assert dao.get_all(db_session)[0].update_count == row["update_count"] + 1
\ No newline at end of file
@@ -3,6 +3,7 @@ from sqlalchemy.orm import Session
 from app.models.models import FieldVisibility
 from app.daos.field_visibility_dao import FieldVisibilityDao
 from datetime import datetime, date, time
+from app.exception.laubeException import OptimisticLockException
 from app.models.specifiedValue import FieldVisibilityType
 
 @pytest.fixture
@@ -38,9 +39,43 @@ def test_update_field_visibility(db_session: Session, field_visibility_dict):
     updated = dao.get(db_session, obj.id)
     assert updated.tenant_uuid == "updated"
 
+def test_update_conflict_field_visibility(db_session: Session, field_visibility_dict):
+    dao = FieldVisibilityDao()
+    obj = dao.create(db_session, field_visibility_dict)
+    with pytest.raises(OptimisticLockException):
+        dao.update(db_session, obj.id, {"tenant_uuid": "updated"}, expected_update_count=obj.update_count + 1)
+
 def test_delete_field_visibility(db_session: Session, field_visibility_dict):
     dao = FieldVisibilityDao()
     obj = dao.create(db_session, field_visibility_dict)
     dao.delete(db_session, obj)
     deleted = dao.get(db_session, obj.id)
-    assert deleted is None
\ No newline at end of file
+    assert deleted is None
+
+def test_get_page_after_and_iter_all_field_visibility(db_session: Session, field_visibility_dict):
+    dao = FieldVisibilityDao()
+    obj = dao.create(db_session, field_visibility_dict)
+    assert dao.get_page_after(db_session, limit=10) == [obj]
+    assert dao.get_page_after(db_session, last_id=obj.id, limit=10) == []
+    assert list(dao.iter_all(db_session, batch_size=10)) == [obj]
+
+def test_bulk_insert_and_delete_field_visibility(db_session: Session, field_visibility_dict):
+    dao = FieldVisibilityDao()
+    assert dao.bulk_insert(db_session, [field_visibility_dict]) == 1
+    assert dao.count(db_session) == 1
+    assert dao.bulk_delete(db_session, [field_visibility_dict["id"]]) == 1
+    assert dao.count(db_session) == 0
+
+def test_get_by_unique_key_field_visibility(db_session: Session, field_visibility_dict):
+    dao = FieldVisibilityDao()
+    obj = dao.create(db_session, field_visibility_dict)
+    assert dao.get_by_tenant_uuid_and_application_form_code_and_activity_code_and_field_name(db_session, field_visibility_dict["tenant_uuid"], field_visibility_dict["application_form_code"], field_visibility_dict["activity_code"], field_visibility_dict["field_name"]) is obj
+    assert dao.get_many_by_tenant_uuid_and_application_form_code_and_activity_code_and_field_name(db_session, [(field_visibility_dict["tenant_uuid"], field_visibility_dict["application_form_code"], field_visibility_dict["activity_code"], field_visibility_dict["field_name"])]) == [obj]
+
+def test_bulk_upsert_field_visibility(db_session: Session, field_visibility_dict):
+    dao = FieldVisibilityDao()
+    row = {key: value for key, value in field_visibility_dict.items() if key != "id"}
+    dao.bulk_upsert(db_session, [row])
+    dao.bulk_upsert(db_session, [row])
+    assert dao.count(db_session) == 1
+    assert dao.get_all(db_session)[0].update_count == row["update_count"] + 1
\ No newline at end of file
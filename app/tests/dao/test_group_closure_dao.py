@@ -0,0 +1,64 @@
+import pytest
+from sqlalchemy.orm import Session
+from app.models.models import GroupClosure
+from app.daos.group_closure_dao import GroupClosureDao
+from datetime import datetime, date, time
+from app.exception.laubeException import OptimisticLockException
+
+
+@pytest.fixture
+def group_closure_dict():
+    return {
+        "id": 1,
+        "tenant_uuid": 'dummy',
+        "ancestor_group_code": 'dummy',
+        "descendant_group_code": 'dummy',
+        "depth": 1
+    }
+
+def test_create_and_get_group_closure(db_session: Session, group_closure_dict):
+    dao = GroupClosureDao()
+    obj = dao.create(db_session, group_closure_dict)
+    found = dao.get(db_session, obj.id)
+    assert found is not None
+
+def test_update_group_closure(db_session: Session, group_closure_dict):
+    dao = GroupClosureDao()
+    obj = dao.create(db_session, group_closure_dict)
+    dao.update(db_session, obj.id, {"tenant_uuid": "updated"})
+    updated = dao.get(db_session, obj.id)
+    assert updated.tenant_uuid == "updated"
+
+def test_delete_group_closure(db_session: Session, group_closure_dict):
+    dao = GroupClosureDao()
+    obj = dao.create(db_session, group_closure_dict)
+    dao.delete(db_session, obj)
+    deleted = dao.get(db_session, obj.id)
+    assert deleted is None
+
+def test_get_page_after_and_iter_all_group_closure(db_session: Session, group_closure_dict):
+    dao = GroupClosureDao()
+    obj = dao.create(db_session, group_closure_dict)
+    assert dao.get_page_after(db_session, limit=10) == [obj]
+    assert dao.get_page_after(db_session, last_id=obj.id, limit=10) == []
+    assert list(dao.iter_all(db_session, batch_size=10)) == [obj]
+
+def test_bulk_insert_and_delete_group_closure(db_session: Session, group_closure_dict):
+    dao = GroupClosureDao()
+    assert dao.bulk_insert(db_session, [group_closure_dict]) == 1
+    assert dao.count(db_session) == 1
+    assert dao.bulk_delete(db_session, [group_closure_dict["id"]]) == 1
+    assert dao.count(db_session) == 0
+
+def test_get_by_unique_key_group_closure(db_session: Session, group_closure_dict):
+    dao = GroupClosureDao()
+    obj = dao.create(db_session, group_closure_dict)
+    assert dao.get_by_tenant_uuid_and_descendant_group_code_and_ancestor_group_code(db_session, group_closure_dict["tenant_uuid"], group_closure_dict["descendant_group_code"], group_closure_dict["ancestor_group_code"]) is obj
+    assert dao.get_many_by_tenant_uuid_and_descendant_group_code_and_ancestor_group_code(db_session, [(group_closure_dict["tenant_uuid"], group_closure_dict["descendant_group_code"], group_closure_dict["ancestor_group_code"])]) == [obj]
+
+def test_bulk_upsert_group_closure(db_session: Session, group_closure_dict):
+    dao = GroupClosureDao()
+    row = {key: value for key, value in group_closure_dict.items() if key != "id"}
+    dao.bulk_upsert(db_session, [row])
+    dao.bulk_upsert(db_session, [row])
+    assert dao.count(db_session) == 1
\ No newline at end of file
@@ -0,0 +1,75 @@
+import pytest
+from sqlalchemy.orm import Session
+from app.models.models import GroupRole
+from app.daos.group_role_dao import GroupRoleDao
+from datetime import datetime, date, time
+from app.exception.laubeException import OptimisticLockException
+
+
+@pytest.fixture
+def group_role_dict():
+    return {
+        "id": 1,
+        "tenant_uuid": 'dummy',
+        "group_code": 'dummy',
+        "role_id": 'dummy',
+        "create_date": datetime(2024, 1, 1, 0, 0, 0),
+        "create_user_uuid": 'dummy',
+        "update_date": datetime(2024, 1, 1, 0, 0, 0),
+        "update_user_uuid": 'dummy',
+        "update_count": 1
+    }
+
+def test_create_and_get_group_role(db_session: Session, group_role_dict):
+    dao = GroupRoleDao()
+    obj = dao.create(db_session, group_role_dict)
+    found = dao.get(db_session, obj.id)
+    assert found is not None
+
+def test_update_group_role(db_session: Session, group_role_dict):
+    dao = GroupRoleDao()
+    obj = dao.create(db_session, group_role_dict)
+    dao.update(db_session, obj.id, {"tenant_uuid": "updated"})
+    updated = dao.get(db_session, obj.id)
+    assert updated.tenant_uuid == "updated"
+
+def test_update_conflict_group_role(db_session: Session, group_role_dict):
+    dao = GroupRoleDao()
+    obj = dao.create(db_session, group_role_dict)
+    with pytest.raises(OptimisticLockException):
+        dao.update(db_session, obj.id, {"tenant_uuid": "updated"}, expected_update_count=obj.update_count + 1)
+
+def test_delete_group_role(db_session: Session, group_role_dict):
+    dao = GroupRoleDao()
+    obj = dao.create(db_session, group_role_dict)
+    dao.delete(db_session, obj)
+    deleted = dao.get(db_session, obj.id)
+    assert deleted is None
+
+def test_get_page_after_and_iter_all_group_role(db_session: Session, group_role_dict):
+    dao = GroupRoleDao()
+    obj = dao.create(db_session, group_role_dict)
+    assert dao.get_page_after(db_session, limit=10) == [obj]
+    assert dao.get_page_after(db_session, last_id=obj.id, limit=10) == []
+    assert list(dao.iter_all(db_session, batch_size=10)) == [obj]
+
+def test_bulk_insert_and_delete_group_role(db_session: Session, group_role_dict):
+    dao = GroupRoleDao()
+    assert dao.bulk_insert(db_session, [group_role_dict]) == 1
+    assert dao.count(db_session) == 1
+    assert dao.bulk_delete(db_session, [group_role_dict["id"]]) == 1
+    assert dao.count(db_session) == 0
+
+def test_get_by_unique_key_group_role(db_session: Session, group_role_dict):
+    dao = GroupRoleDao()
+    obj = dao.create(db_session, group_role_dict)
+    assert dao.get_by_tenant_uuid_and_group_code_and_role_id(db_session, group_role_dict["tenant_uuid"], group_role_dict["group_code"], group_role_dict["role_id"]) is obj
+    assert dao.get_many_by_tenant_uuid_and_group_code_and_role_id(db_session, [(group_role_dict["tenant_uuid"], group_role_dict["group_code"], group_role_dict["role_id"])]) == [obj]
+
+def test_bulk_upsert_group_role(db_session: Session, group_role_dict):
+    dao = GroupRoleDao()
+    row = {key: value for key, value in group_role_dict.items() if key != "id"}
+    dao.bulk_upsert(db_session, [row])
+    dao.bulk_upsert(db_session, [row])
+    assert dao.count(db_session) == 1
+    assert dao.get_all(db_session)[0].update_count == row["update_count"] + 1
\ No newline at end of file
@@ -3,6 +3,7 @@ from sqlalchemy.orm import Session
 from app.models.models import IndividualActivity
 from app.daos.individual_activity_dao import IndividualActivityDao
 from datetime import datetime, date, time
+from app.exception.laubeException import OptimisticLockException
 from app.models.specifiedValue import ApprovalFunction, ConditionExpressionType, EscalationAction, SkipMode
 
 @pytest.fixture
@@ -55,9 +56,43 @@ def test_update_individual_activity(db_session: Session, individual_activity_dic
     updated = dao.get(db_session, obj.id)
     assert updated.tenant_uuid == "updated"
 
+def test_update_conflict_individual_activity(db_session: Session, individual_activity_dict):
+    dao = IndividualActivityDao()
+    obj = dao.create(db_session, individual_activity_dict)
+    with pytest.raises(OptimisticLockException):
+        dao.update(db_session, obj.id, {"tenant_uuid": "updated"}, expected_update_count=obj.update_count + 1)
+
 def test_delete_individual_activity(db_session: Session, individual_activity_dict):
     dao = IndividualActivityDao()
     obj = dao.create(db_session, individual_activity_dict)
     dao.delete(db_session, obj)
     deleted = dao.get(db_session, obj.id)
-    assert deleted is None
\ No newline at end of file
+    assert deleted is None
+
+def test_get_page_after_and_iter_all_individual_activity(db_session: Session, individual_activity_dict):
+    dao = IndividualActivityDao()
+    obj = dao.create(db_session, individual_activity_dict)
+    assert dao.get_page_after(db_session, limit=10) == [obj]
+    assert dao.get_page_after(db_session, last_id=obj.id, limit=10) == []
+    assert list(dao.iter_all(db_session, batch_size=10)) == [obj]
+
+def test_bulk_insert_and_delete_individual_activity(db_session: Session, individual_activity_dict):
+    dao = IndividualActivityDao()
+    assert dao.bulk_insert(db_session, [individual_activity_dict]) == 1
+    assert dao.count(db_session) == 1
+    assert dao.bulk_delete(db_session, [individual_activity_dict["id"]]) == 1
+    assert dao.count(db_session) == 0
+
+def test_get_by_unique_key_individual_activity(db_session: Session, individual_activity_dict):
+    dao = IndividualActivityDao()
+    obj = dao.create(db_session, individual_activity_dict)
+    assert dao.get_by_tenant_uuid_and_individual_route_code_and_activity_code(db_session, individual_activity_dict["tenant_uuid"], individual_activity_dict["individual_route_code"], individual_activity_dict["activity_code"]) is obj
+    assert dao.get_many_by_tenant_uuid_and_individual_route_code_and_activity_code(db_session, [(individual_activity_dict["tenant_uuid"], individual_activity_dict["individual_route_code"], individual_activity_dict["activity_code"])]) == [obj]
+
+def test_bulk_upsert_individual_activity(db_session: Session, individual_activity_dict):
+    dao = IndividualActivityDao()
+    row = {key: value for key, value in individual_activity_dict.items() if key != "id"}
+    dao.bulk_upsert(db_session, [row])
+    dao.bulk_upsert(db_session, [row])
+    assert dao.count(db_session) == 1
+    assert dao.get_all(db_session)[0].update_count == row["update_count"] + 1
\ No newline at end of file
@@ -0,0 +1,62 @@
+import pytest
+from sqlalchemy.orm import Session
+from app.models.models import MaintenanceWindow
+from app.daos.maintenance_window_dao import MaintenanceWindowDao
+from datetime import datetime, date, time
+from app.exception.laubeException import OptimisticLockException
+
+
+@pytest.fixture
+def maintenance_window_dict():
+    return {
+        "id": 1,
+        "engine_name": 'dummy',
+        "start_date": datetime(2024, 1, 1, 0, 0, 0),
+        "end_date": datetime(2024, 1, 1, 0, 0, 0),
+        "reason": 'dummy',
+        "create_date": datetime(2024, 1, 1, 0, 0, 0),
+        "create_user_uuid": 'dummy',
+        "update_date": datetime(2024, 1, 1, 0, 0, 0),
+        "update_user_uuid": 'dummy',
+        "update_count": 1
+    }
+
+def test_create_and_get_maintenance_window(db_session: Session, maintenance_window_dict):
+    dao = MaintenanceWindowDao()
+    obj = dao.create(db_session, maintenance_window_dict)
+    found = dao.get(db_session, obj.id)
+    assert found is not None
+
+def test_update_maintenance_window(db_session: Session, maintenance_window_dict):
+    dao = MaintenanceWindowDao()
+    obj = dao.create(db_session, maintenance_window_dict)
+    dao.update(db_session, obj.id, {"engine_name": "updated"})
+    updated = dao.get(db_session, obj.id)
+    assert updated.engine_name == "updated"
+
+def test_update_conflict_maintenance_window(db_session: Session, maintenance_window_dict):
+    dao = MaintenanceWindowDao()
+    obj = dao.create(db_session, maintenance_window_dict)
+    with pytest.raises(OptimisticLockException):
+        dao.update(db_session, obj.id, {"engine_name": "updated"}, expected_update_count=obj.update_count + 1)
+
+def test_delete_maintenance_window(db_session: Session, maintenance_window_dict):
+    dao = MaintenanceWindowDao()
+    obj = dao.create(db_session, maintenance_window_dict)
+    dao.delete(db_session, obj)
+    deleted = dao.get(db_session, obj.id)
+    assert deleted is None
+
+def test_get_page_after_and_iter_all_maintenance_window(db_session: Session, maintenance_window_dict):
+    dao = MaintenanceWindowDao()
+    obj = dao.create(db_session, maintenance_window_dict)
+    assert dao.get_page_after(db_session, limit=10) == [obj]
+    assert dao.get_page_after(db_session, last_id=obj.id, limit=10) == []
+    assert list(dao.iter_all(db_session, batch_size=10)) == [obj]
+
+def test_bulk_insert_and_delete_maintenance_window(db_session: Session, maintenance_window_dict):
+    dao = MaintenanceWindowDao()
+    assert dao.bulk_insert(db_session, [maintenance_window_dict]) == 1
+    assert dao.count(db_session) == 1
+    assert dao.bulk_delete(db_session, [maintenance_window_dict["id"]]) == 1
+    assert dao.count(db_session) == 0
\ No newline at end of file
@@ -3,6 +3,7 @@ from sqlalchemy.orm import Session
 from app.models.models import Message
 from app.daos.message_dao import MessageDao
 from datetime import datetime, date, time
+from app.exception.laubeException import OptimisticLockException
 
 
 @pytest.fixture
@@ -32,9 +33,43 @@ def test_update_message(db_session: Session, message_dict):
     updated = dao.get(db_session, obj.id)
     assert updated.language_code == "updated"
 
+def test_update_conflict_message(db_session: Session, message_dict):
+    dao = MessageDao()
+    obj = dao.create(db_session, message_dict)
+    with pytest.raises(OptimisticLockException):
+        dao.update(db_session, obj.id, {"language_code": "updated"}, expected_update_count=obj.update_count + 1)
+
 def test_delete_message(db_session: Session, message_dict):
     dao = MessageDao()
     obj = dao.create(db_session, message_dict)
     dao.delete(db_session, obj)
     deleted = dao.get(db_session, obj.id)
-    assert deleted is None
\ No newline at end of file
+    assert deleted is None
+
+def test_get_page_after_and_iter_all_message(db_session: Session, message_dict):
+    dao = MessageDao()
+    obj = dao.create(db_session, message_dict)
+    assert dao.get_page_after(db_session, limit=10) == [obj]
+    assert dao.get_page_after(db_session, last_id=obj.id, limit=10) == []
+    assert list(dao.iter_all(db_session, batch_size=10)) == [obj]
+
+def test_bulk_insert_and_delete_message(db_session: Session, message_dict):
+    dao = MessageDao()
+    assert dao.bulk_insert(db_session, [message_dict]) == 1
+    assert dao.count(db_session) == 1
+    assert dao.bulk_delete(db_session, [message_dict["id"]]) == 1
+    assert dao.count(db_session) == 0
+
+def test_get_by_unique_key_message(db_session: Session, message_dict):
+    dao = MessageDao()
+    obj = dao.create(db_session, message_dict)
+    assert dao.get_by_language_code_and_message_key(db_session, message_dict["language_code"], message_dict["message_key"]) is obj
+    assert dao.get_many_by_language_code_and_message_key(db_session, [(message_dict["language_code"], message_dict["message_key"])]) == [obj]
+
+def test_bulk_upsert_message(db_session: Session, message_dict):
+    dao = MessageDao()
+    row = {key: value for key, value in message_dict.items() if key != "id"}
+    dao.bulk_upsert(db_session, [row])
+    dao.bulk_upsert(db_session, [row])
+    assert dao.count(db_session) == 1
+    assert dao.get_all(db_session)[0].update_count == row["update_count"] + 1
\ No newline at end of file
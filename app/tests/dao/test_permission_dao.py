@@ -3,6 +3,7 @@ from sqlalchemy.orm import Session
 from app.models.models import Permission
 from app.daos.permission_dao import PermissionDao
 from datetime import datetime, date, time
+from app.exception.laubeException import OptimisticLockException
 
 
 @pytest.fixture
@@ -31,9 +32,29 @@ def test_update_permission(db_session: Session, permission_dict):
     updated = dao.get(db_session, obj.id)
     assert updated.permission_id == "updated"
 
+def test_update_conflict_permission(db_session: Session, permission_dict):
+    dao = PermissionDao()
+    obj = dao.create(db_session, permission_dict)
+    with pytest.raises(OptimisticLockException):
+        dao.update(db_session, obj.id, {"permission_id": "updated"}, expected_update_count=obj.update_count + 1)
+
 def test_delete_permission(db_session: Session, permission_dict):
     dao = PermissionDao()
     obj = dao.create(db_session, permission_dict)
     dao.delete(db_session, obj)
     deleted = dao.get(db_session, obj.id)
-    assert deleted is None
\ No newline at end of file
+    assert deleted is None
+
+def test_get_page_after_and_iter_all_permission(db_session: Session, permission_dict):
+    dao = PermissionDao()
+    obj = dao.create(db_session, permission_dict)
+    assert dao.get_page_after(db_session, limit=10) == [obj]
+    assert dao.get_page_after(db_session, last_id=obj.id, limit=10) == []
+    assert list(dao.iter_all(db_session, batch_size=10)) == [obj]
+
+def test_bulk_insert_and_delete_permission(db_session: Session, permission_dict):
+    dao = PermissionDao()
+    assert dao.bulk_insert(db_session, [permission_dict]) == 1
+    assert dao.count(db_session) == 1
+    assert dao.bulk_delete(db_session, [permission_dict["id"]]) == 1
+    assert dao.count(db_session) == 0
\ No newline at end of file
@@ -0,0 +1,63 @@
+import pytest
+from sqlalchemy.orm import Session
+from app.models.models import PolicyVersion
+from app.daos.policy_version_dao import PolicyVersionDao
+from datetime import datetime, date, time
+from app.exception.laubeException import OptimisticLockException
+
+
+@pytest.fixture
+def policy_version_dict():
+    return {
+        "id": 1,
+        "scope": 'dummy',
+        "version": 1,
+        "update_date": datetime(2024, 1, 1, 0, 0, 0)
+    }
+
+def test_create_and_get_policy_version(db_session: Session, policy_version_dict):
+    dao = PolicyVersionDao()
+    obj = dao.create(db_session, policy_version_dict)
+    found = dao.get(db_session, obj.id)
+    assert found is not None
+
+def test_update_policy_version(db_session: Session, policy_version_dict):
+    dao = PolicyVersionDao()
+    obj = dao.create(db_session, policy_version_dict)
+    dao.update(db_session, obj.id, {"scope": "updated"})
+    updated = dao.get(db_session, obj.id)
+    assert updated.scope == "updated"
+
+def test_delete_policy_version(db_session: Session, policy_version_dict):
+    dao = PolicyVersionDao()
+    obj = dao.create(db_session, policy_version_dict)
+    dao.delete(db_session, obj)
+    deleted = dao.get(db_session, obj.id)
+    assert deleted is None
+
+def test_get_page_after_and_iter_all_policy_version(db_session: Session, policy_version_dict):
+    dao = PolicyVersionDao()
+    obj = dao.create(db_session, policy_version_dict)
+    assert dao.get_page_after(db_session, limit=10) == [obj]
+    assert dao.get_page_after(db_session, last_id=obj.id, limit=10) == []
+    assert list(dao.iter_all(db_session, batch_size=10)) == [obj]
+
+def test_bulk_insert_and_delete_policy_version(db_session: Session, policy_version_dict):
+    dao = PolicyVersionDao()
+    assert dao.bulk_insert(db_session, [policy_version_dict]) == 1
+    assert dao.count(db_session) == 1
+    assert dao.bulk_delete(db_session, [policy_version_dict["id"]]) == 1
+    assert dao.count(db_session) == 0
+
+def test_get_by_unique_key_policy_version(db_session: Session, policy_version_dict):
+    dao = PolicyVersionDao()
+    obj = dao.create(db_session, policy_version_dict)
+    assert dao.get_by_scope(db_session, policy_version_dict["scope"]) is obj
+    assert dao.get_many_by_scope(db_session, [policy_version_dict["scope"]]) == [obj]
+
+def test_bulk_upsert_policy_version(db_session: Session, policy_version_dict):
+    dao = PolicyVersionDao()
+    row = {key: value for key, value in policy_version_dict.items() if key != "id"}
+    dao.bulk_upsert(db_session, [row])
+    dao.bulk_upsert(db_session, [row])
+    assert dao.count(db_session) == 1
\ No newline at end of file
@@ -3,6 +3,7 @@ from sqlalchemy.orm import Session
 from app.models.models import Resource
 from app.daos.resource_dao import ResourceDao
 from datetime import datetime, date, time
+from app.exception.laubeException import OptimisticLockException
 
 
 @pytest.fixture
@@ -29,9 +30,29 @@ def test_update_resource(db_session: Session, resource_dict):
     updated = dao.get(db_session, obj.id)
     assert updated.resource_id == "updated"
 
+def test_update_conflict_resource(db_session: Session, resource_dict):
+    dao = ResourceDao()
+    obj = dao.create(db_session, resource_dict)
+    with pytest.raises(OptimisticLockException):
+        dao.update(db_session, obj.id, {"resource_id": "updated"}, expected_update_count=obj.update_count + 1)
+
 def test_delete_resource(db_session: Session, resource_dict):
     dao = ResourceDao()
     obj = dao.create(db_session, resource_dict)
     dao.delete(db_session, obj)
     deleted = dao.get(db_session, obj.id)
-    assert deleted is None
\ No newline at end of file
+    assert deleted is None
+
+def test_get_page_after_and_iter_all_resource(db_session: Session, resource_dict):
+    dao = ResourceDao()
+    obj = dao.create(db_session, resource_dict)
+    assert dao.get_page_after(db_session, limit=10) == [obj]
+    assert dao.get_page_after(db_session, last_id=obj.id, limit=10) == []
+    assert list(dao.iter_all(db_session, batch_size=10)) == [obj]
+
+def test_bulk_insert_and_delete_resource(db_session: Session, resource_dict):
+    dao = ResourceDao()
+    assert dao.bulk_insert(db_session, [resource_dict]) == 1
+    assert dao.count(db_session) == 1
+    assert dao.bulk_delete(db_session, [resource_dict["id"]]) == 1
+    assert dao.count(db_session) == 0
\ No newline at end of file
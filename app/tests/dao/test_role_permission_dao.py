@@ -3,6 +3,7 @@ from sqlalchemy.orm import Session
 from app.models.models import RolePermission
 from app.daos.role_permission_dao import RolePermissionDao
 from datetime import datetime, date, time
+from app.exception.laubeException import OptimisticLockException
 
 
 @pytest.fixture
@@ -31,9 +32,43 @@ def test_update_role_permission(db_session: Session, role_permission_dict):
     updated = dao.get(db_session, obj.id)
     assert updated.role_id == "updated"
 
+def test_update_conflict_role_permission(db_session: Session, role_permission_dict):
+    dao = RolePermissionDao()
+    obj = dao.create(db_session, role_permission_dict)
+    with pytest.raises(OptimisticLockException):
+        dao.update(db_session, obj.id, {"role_id": "updated"}, expected_update_count=obj.update_count + 1)
+
 def test_delete_role_permission(db_session: Session, role_permission_dict):
     dao = RolePermissionDao()
     obj = dao.create(db_session, role_permission_dict)
     dao.delete(db_session, obj)
     deleted = dao.get(db_session, obj.id)
-    assert deleted is None
\ No newline at end of file
+    assert deleted is None
+
+def test_get_page_after_and_iter_all_role_permission(db_session: Session, role_permission_dict):
+    dao = RolePermissionDao()
+    obj = dao.create(db_session, role_permission_dict)
+    assert dao.get_page_after(db_session, limit=10) == [obj]
+    assert dao.get_page_after(db_session, last_id=obj.id, limit=10) == []
+    assert list(dao.iter_all(db_session, batch_size=10)) == [obj]
+
+def test_bulk_insert_and_delete_role_permission(db_session: Session, role_permission_dict):
+    dao = RolePermissionDao()
+    assert dao.bulk_insert(db_session, [role_permission_dict]) == 1
+    assert dao.count(db_session) == 1
+    assert dao.bulk_delete(db_session, [role_permission_dict["id"]]) == 1
+    assert dao.count(db_session) == 0
+
+def test_get_by_unique_key_role_permission(db_session: Session, role_permission_dict):
+    dao = RolePermissionDao()
+    obj = dao.create(db_session, role_permission_dict)
+    assert dao.get_by_role_id_and_permission_id(db_session, role_permission_dict["role_id"], role_permission_dict["permission_id"]) is obj
+    assert dao.get_many_by_role_id_and_permission_id(db_session, [(role_permission_dict["role_id"], role_permission_dict["permission_id"])]) == [obj]
+
+def test_bulk_upsert_role_permission(db_session: Session, role_permission_dict):
+    dao = RolePermissionDao()
+    row = {key: value for key, value in role_permission_dict.items() if key != "id"}
+    dao.bulk_upsert(db_session, [row])
+    dao.bulk_upsert(db_session, [row])
+    assert dao.count(db_session) == 1
+    assert dao.get_all(db_session)[0].update_count == row["update_count"] + 1
\ No newline at end of file
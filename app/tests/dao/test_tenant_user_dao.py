@@ -3,6 +3,7 @@ from sqlalchemy.orm import Session
 from app.models.models import TenantUser
 from app.daos.tenant_user_dao import TenantUserDao
 from datetime import datetime, date, time
+from app.exception.laubeException import OptimisticLockException
 
 
 @pytest.fixture
@@ -33,9 +34,43 @@ def test_update_tenant_user(db_session: Session, tenant_user_dict):
     updated = dao.get(db_session, obj.id)
     assert updated.tenant_uuid == "updated"
 
+def test_update_conflict_tenant_user(db_session: Session, tenant_user_dict):
+    dao = TenantUserDao()
+    obj = dao.create(db_session, tenant_user_dict)
+    with pytest.raises(OptimisticLockException):
+        dao.update(db_session, obj.id, {"tenant_uuid": "updated"}, expected_update_count=obj.update_count + 1)
+
 def test_delete_tenant_user(db_session: Session, tenant_user_dict):
     dao = TenantUserDao()
     obj = dao.create(db_session, tenant_user_dict)
     dao.delete(db_session, obj)
     deleted = dao.get(db_session, obj.id)
-    assert deleted is None
\ No newline at end of file
+    assert deleted is None
+
+def test_get_page_after_and_iter_all_tenant_user(db_session: Session, tenant_user_dict):
+    dao = TenantUserDao()
+    obj = dao.create(db_session, tenant_user_dict)
+    assert dao.get_page_after(db_session, limit=10) == [obj]
+    assert dao.get_page_after(db_session, last_id=obj.id, limit=10) == []
+    assert list(dao.iter_all(db_session, batch_size=10)) == [obj]
+
+def test_bulk_insert_and_delete_tenant_user(db_session: Session, tenant_user_dict):
+    dao = TenantUserDao()
+    assert dao.bulk_insert(db_session, [tenant_user_dict]) == 1
+    assert dao.count(db_session) == 1
+    assert dao.bulk_delete(db_session, [tenant_user_dict["id"]]) == 1
+    assert dao.count(db_session) == 0
+
+def test_get_by_unique_key_tenant_user(db_session: Session, tenant_user_dict):
+    dao = TenantUserDao()
+    obj = dao.create(db_session, tenant_user_dict)
+    assert dao.get_by_tenant_uuid_and_user_uuid_and_belong_start_date(db_session, tenant_user_dict["tenant_uuid"], tenant_user_dict["user_uuid"], tenant_user_dict["belong_start_date"]) is obj
+    assert dao.get_many_by_tenant_uuid_and_user_uuid_and_belong_start_date(db_session, [(tenant_user_dict["tenant_uuid"], tenant_user_dict["user_uuid"], tenant_user_dict["belong_start_date"])]) == [obj]
+
+def test_bulk_upsert_tenant_user(db_session: Session, tenant_user_dict):
+    dao = TenantUserDao()
+    row = {key: value for key, value in tenant_user_dict.items() if key != "id"}
+    dao.bulk_upsert(db_session, [row])
+    dao.bulk_upsert(db_session, [row])
+    assert dao.count(db_session) == 1
+    assert dao.get_all(db_session)[0].update_count == row["update_count"] + 1
\ No newline at end of file
@@ -3,6 +3,7 @@ from sqlalchemy.orm import Session
 from app.models.models import User
 from app.daos.user_dao import UserDao
 from datetime import datetime, date, time
+from app.exception.laubeException import OptimisticLockException
 
 
 @pytest.fixture
@@ -34,9 +35,43 @@ def test_update_user(db_session: Session, user_dict):
     updated = dao.get(db_session, obj.id)
     assert updated.user_uuid == "updated"
 
+def test_update_conflict_user(db_session: Session, user_dict):
+    dao = UserDao()
+    obj = dao.create(db_session, user_dict)
+    with pytest.raises(OptimisticLockException):
+        dao.update(db_session, obj.id, {"user_uuid": "updated"}, expected_update_count=obj.update_count + 1)
+
 def test_delete_user(db_session: Session, user_dict):
     dao = UserDao()
     obj = dao.create(db_session, user_dict)
     dao.delete(db_session, obj)
     deleted = dao.get(db_session, obj.id)
-    assert deleted is None
\ No newline at end of file
+    assert deleted is None
+
+def test_get_page_after_and_iter_all_user(db_session: Session, user_dict):
+    dao = UserDao()
+    obj = dao.create(db_session, user_dict)
+    assert dao.get_page_after(db_session, limit=10) == [obj]
+    assert dao.get_page_after(db_session, last_id=obj.id, limit=10) == []
+    assert list(dao.iter_all(db_session, batch_size=10)) == [obj]
+
+def test_bulk_insert_and_delete_user(db_session: Session, user_dict):
+    dao = UserDao()
+    assert dao.bulk_insert(db_session, [user_dict]) == 1
+    assert dao.count(db_session) == 1
+    assert dao.bulk_delete(db_session, [user_dict["id"]]) == 1
+    assert dao.count(db_session) == 0
+
+def test_get_by_unique_key_user(db_session: Session, user_dict):
+    dao = UserDao()
+    obj = dao.create(db_session, user_dict)
+    assert dao.get_by_user_uuid(db_session, user_dict["user_uuid"]) is obj
+    assert dao.get_many_by_user_uuid(db_session, [user_dict["user_uuid"]]) == [obj]
+
+def test_bulk_upsert_user(db_session: Session, user_dict):
+    dao = UserDao()
+    row = {key: value for key, value in user_dict.items() if key != "id"}
+    dao.bulk_upsert(db_session, [row])
+    dao.bulk_upsert(db_session, [row])
+    assert dao.count(db_session) == 1
+    assert dao.get_all(db_session)[0].update_count == row["update_count"] + 1
\ No newline at end of file
@@ -3,6 +3,7 @@ from sqlalchemy.orm import Session
 from app.models.models import UserGroup
 from app.daos.user_group_dao import UserGroupDao
 from datetime import datetime, date, time
+from app.exception.laubeException import OptimisticLockException
 from app.models.specifiedValue import DefaultGroupFlg, Range
 
 @pytest.fixture
@@ -36,9 +37,43 @@ def test_update_user_group(db_session: Session, user_group_dict):
     updated = dao.get(db_session, obj.id)
     assert updated.tenant_uuid == "updated"
 
+def test_update_conflict_user_group(db_session: Session, user_group_dict):
+    dao = UserGroupDao()
+    obj = dao.create(db_session, user_group_dict)
+    with pytest.raises(OptimisticLockException):
+        dao.update(db_session, obj.id, {"tenant_uuid": "updated"}, expected_update_count=obj.update_count + 1)
+
 def test_delete_user_group(db_session: Session, user_group_dict):
     dao = UserGroupDao()
     obj = dao.create(db_session, user_group_dict)
     dao.delete(db_session, obj)
     deleted = dao.get(db_session, obj.id)
-    assert deleted is None
\ No newline at end of file
+    assert deleted is None
+
+def test_get_page_after_and_iter_all_user_group(db_session: Session, user_group_dict):
+    dao = UserGroupDao()
+    obj = dao.create(db_session, user_group_dict)
+    assert dao.get_page_after(db_session, limit=10) == [obj]
+    assert dao.get_page_after(db_session, last_id=obj.id, limit=10) == []
+    assert list(dao.iter_all(db_session, batch_size=10)) == [obj]
+
+def test_bulk_insert_and_delete_user_group(db_session: Session, user_group_dict):
+    dao = UserGroupDao()
+    assert dao.bulk_insert(db_session, [user_group_dict]) == 1
+    assert dao.count(db_session) == 1
+    assert dao.bulk_delete(db_session, [user_group_dict["id"]]) == 1
+    assert dao.count(db_session) == 0
+
+def test_get_by_unique_key_user_group(db_session: Session, user_group_dict):
+    dao = UserGroupDao()
+    obj = dao.create(db_session, user_group_dict)
+    assert dao.get_by_tenant_uuid_and_user_uuid_and_group_code(db_session, user_group_dict["tenant_uuid"], user_group_dict["user_uuid"], user_group_dict["group_code"]) is obj
+    assert dao.get_many_by_tenant_uuid_and_user_uuid_and_group_code(db_session, [(user_group_dict["tenant_uuid"], user_group_dict["user_uuid"], user_group_dict["group_code"])]) == [obj]
+
+def test_bulk_upsert_user_group(db_session: Session, user_group_dict):
+    dao = UserGroupDao()
+    row = {key: value for key, value in user_group_dict.items() if key != "id"}
+    dao.bulk_upsert(db_session, [row])
+    dao.bulk_upsert(db_session, [row])
+    assert dao.count(db_session) == 1
+    assert dao.get_all(db_session)[0].update_count == row["update_count"] + 1
\ No newline at end of file
@@ -3,6 +3,7 @@ from sqlalchemy.orm import Session
 from app.models.models import WorkflowTrigger
 from app.daos.workflow_trigger_dao import WorkflowTriggerDao
 from datetime import datetime, date, time
+from app.exception.laubeException import OptimisticLockException
 from app.models.specifiedValue import InheritMode
 
 @pytest.fixture
@@ -35,9 +36,43 @@ def test_update_workflow_trigger(db_session: Session, workflow_trigger_dict):
     updated = dao.get(db_session, obj.id)
     assert updated.tenant_uuid == "updated"
 
+def test_update_conflict_workflow_trigger(db_session: Session, workflow_trigger_dict):
+    dao = WorkflowTriggerDao()
+    obj = dao.create(db_session, workflow_trigger_dict)
+    with pytest.raises(OptimisticLockException):
+        dao.update(db_session, obj.id, {"tenant_uuid": "updated"}, expected_update_count=obj.update_count + 1)
+
 def test_delete_workflow_trigger(db_session: Session, workflow_trigger_dict):
     dao = WorkflowTriggerDao()
     obj = dao.create(db_session, workflow_trigger_dict)
     dao.delete(db_session, obj)
     deleted = dao.get(db_session, obj.id)
-    assert deleted is None
\ No newline at end of file
+    assert deleted is None
+
+def test_get_page_after_and_iter_all_workflow_trigger(db_session: Session, workflow_trigger_dict):
+    dao = WorkflowTriggerDao()
+    obj = dao.create(db_session, workflow_trigger_dict)
+    assert dao.get_page_after(db_session, limit=10) == [obj]
+    assert dao.get_page_after(db_session, last_id=obj.id, limit=10) == []
+    assert list(dao.iter_all(db_session, batch_size=10)) == [obj]
+
+def test_bulk_insert_and_delete_workflow_trigger(db_session: Session, workflow_trigger_dict):
+    dao = WorkflowTriggerDao()
+    assert dao.bulk_insert(db_session, [workflow_trigger_dict]) == 1
+    assert dao.count(db_session) == 1
+    assert dao.bulk_delete(db_session, [workflow_trigger_dict["id"]]) == 1
+    assert dao.count(db_session) == 0
+
+def test_get_by_unique_key_workflow_trigger(db_session: Session, workflow_trigger_dict):
+    dao = WorkflowTriggerDao()
+    obj = dao.create(db_session, workflow_trigger_dict)
+    assert dao.get_by_tenant_uuid_and_trigger_form_code_and_trigger_activity_code_and_target_form_code(db_session, workflow_trigger_dict["tenant_uuid"], workflow_trigger_dict["trigger_form_code"], workflow_trigger_dict["trigger_activity_code"], workflow_trigger_dict["target_form_code"]) is obj
+    assert dao.get_many_by_tenant_uuid_and_trigger_form_code_and_trigger_activity_code_and_target_form_code(db_session, [(workflow_trigger_dict["tenant_uuid"], workflow_trigger_dict["trigger_form_code"], workflow_trigger_dict["trigger_activity_code"], workflow_trigger_dict["target_form_code"])]) == [obj]
+
+def test_bulk_upsert_workflow_trigger(db_session: Session, workflow_trigger_dict):
+    dao = WorkflowTriggerDao()
+    row = {key: value for key, value in workflow_trigger_dict.items() if key != "id"}
+    dao.bulk_upsert(db_session, [row])
+    dao.bulk_upsert(db_session, [row])
+    assert dao.count(db_session) == 1
+    assert dao.get_all(db_session)[0].update_count == row["update_count"] + 1
\ No newline at end of file
@@ -0,0 +1,28 @@
+from datetime import date
+from app.models.models import Group, UserGroup
+from app.models.specifiedValue import PermissionRange, Range
+
+# エンジンのテストで共用するテナント・監査項目と、部署・所属・権限のデータ作成
+TENANT = "tenant-1"
+AUDIT = dict(create_user_uuid="test", update_user_uuid="test", update_count=1)
+
+
+def add_group(db_session, code, upper=None):
+    group = Group(
+        tenant_uuid=TENANT, group_code=code, group_name=code, upper_group_code=upper,
+        term_from=date(2020, 1, 1), permission_range=PermissionRange.ALL, **AUDIT
+    )
+    db_session.add(group)
+    return group
+
+
+def add_affiliation(db_session, user_uuid, group_code, term_to=None):
+    db_session.add(UserGroup(
+        tenant_uuid=TENANT, user_uuid=user_uuid, group_code=group_code, term_from=date(2020, 1, 1),
+        term_to=term_to, range=Range.ALL, **AUDIT
+    ))
+
+
+def grant(cerberus, db_session, role_id="editor", permission_id="write", resource_id="/api/forms", condition=None):
+    cerberus.assign_permission_to_role(db_session, role_id, permission_id)
+    cerberus.assign_resource_to_role(db_session, role_id, permission_id, resource_id, condition)
@@ -0,0 +1,130 @@
+import pytest
+from datetime import date
+from app.engine.laube import Laube
+from app.exception.laubeException import LaubeException
+from app.models.models import (
+    ApplicationForm, Group, IndividualActivity, Role, Tenant, TenantUser, User, UserGroup
+)
+from app.models.specifiedValue import (
+    ActivityStatus, ApprovalFunction, AutoApproverlFlag, DefaultGroupFlg, PermissionRange, Range, RouteType
+)
+from app.tests.engine.helpers import AUDIT, TENANT
+
+
+def seed_master(db_session, user_count):
+    db_session.add(Tenant(tenant_uuid=TENANT, tenant_name="テスト株式会社", **AUDIT))
+    db_session.add(Group(
+        tenant_uuid=TENANT, group_code="G1", group_name="総務部",
+        term_from=date(2020, 1, 1), permission_range=PermissionRange.ALL, **AUDIT
+    ))
+    db_session.add(Role(role_id="MANAGER", role_name="部長", **AUDIT))
+    for i in range(user_count):
+        user_uuid = f"user-{i}"
+        db_session.add(User(user_uuid=user_uuid, user_name=f"社員{i}", hashed_password="x", **AUDIT))
+        db_session.add(TenantUser(
+            tenant_uuid=TENANT, user_uuid=user_uuid, belong_start_date=date(2020, 1, 1), **AUDIT
+        ))
+        db_session.add(UserGroup(
+            tenant_uuid=TENANT, user_uuid=user_uuid, group_code="G1",
+            default_group_code=DefaultGroupFlg.ON, term_from=date(2020, 1, 1), range=Range.ALL, **AUDIT
+        ))
+    db_session.flush()
+
+
+def seed_route(db_session, route_code, user_uuids, role_steps=()):
+    for i, user_uuid in enumerate(user_uuids, start=1):
+        db_session.add(IndividualActivity(
+            tenant_uuid=TENANT, individual_route_code=route_code, activity_code=i,
+            approverl_tenant_uuid=TENANT, approverl_group_code="G1", approverl_user_uuid=user_uuid,
+            approverl_role_code="MANAGER" if i in role_steps else None,
+            function=ApprovalFunction.EXAMINATION, **AUDIT
+        ))
+    db_session.flush()
+
+
+def application_form(auto_flag=AutoApproverlFlag.MANUAL_APPROVAL):
+    return ApplicationForm(tenant_uuid=TENANT, application_form_code="F1", auto_approverl_flag=auto_flag)
+
+
+def test_get_individual_approverl_list_builds_dtos(db_session):
+    seed_master(db_session, 3)
+    seed_route(db_session, "R1", ["user-0", "user-1", "user-2"], role_steps={3})
+
+    result = Laube().get_individual_approverl_list(db_session, TENANT, TENANT, "R1", application_form())
+
+    assert [dto.route_number for dto in result] == [1, 2, 3]
+    first = result[0]
+    assert first.tenant_name == "テスト株式会社"
+    assert first.approverl_tenant_name == "テスト株式会社"
+    assert first.approverl_group_name == "総務部"
+    assert first.approverl_user_name == "社員0"
+    assert first.route_type == RouteType.INDIVIDUAL
+    assert first.activity_status == ActivityStatus.AUTHORIZER_UNTREATED
+    assert result[2].approverl_role_name == "部長"
+
+
+def test_inactive_user_is_skipped(db_session):
+    seed_master(db_session, 2)
+    db_session.query(TenantUser).filter_by(user_uuid="user-1").update({"belong_end_date": date(2021, 1, 1)})
+    seed_route(db_session, "R1", ["user-0", "user-1"])
+
+    result = Laube().get_individual_approverl_list(db_session, TENANT, TENANT, "R1", application_form())
+
+    assert [dto.approverl_user_uuid for dto in result] == ["user-0"]
+
+
+def test_expired_user_group_raises_e012(db_session):
+    seed_master(db_session, 1)
+    db_session.query(UserGroup).update({"term_to": date(2021, 1, 1)})
+    seed_route(db_session, "R1", ["user-0"])
+
+    with pytest.raises(LaubeException) as excinfo:
+        Laube().get_individual_approverl_list(db_session, TENANT, TENANT, "R1", application_form())
+    assert excinfo.value.code == "Laube-E012"
+
+
+def test_unknown_role_raises_e013(db_session):
+    seed_master(db_session, 1)
+    seed_route(db_session, "R1", ["user-0"], role_steps={1})
+    db_session.query(Role).delete()
+
+    with pytest.raises(LaubeException) as excinfo:
+        Laube().get_individual_approverl_list(db_session, TENANT, TENANT, "R1", application_form())
+    assert excinfo.value.code == "Laube-E013"
+    assert "MANAGER" in excinfo.value.message
+
+
+def test_duplicate_approver_is_auto_approved(db_session):
+    seed_master(db_session, 1)
+    seed_route(db_session, "R1", ["user-0", "user-0"])
+
+    result = Laube().get_individual_approverl_list(
+        db_session, TENANT, TENANT, "R1", application_form(AutoApproverlFlag.AUTOMATIC_APPROVAL)
+    )
+
+    assert result[0].approval_function == ApprovalFunction.EXAMINATION
+    assert result[1].approval_function == ApprovalFunction.AUTHORIZER_AUTOMATIC_APPROVAL
+
+
+def test_query_count_does_not_grow_with_route_length(db_session, query_counter):
+    seed_master(db_session, 12)
+    seed_route(db_session, "SHORT", ["user-0", "user-1"], role_steps={2})
+    seed_route(db_session, "LONG", [f"user-{i}" for i in range(12)], role_steps={4, 8, 12})
+    laube = Laube()
+    # メンテナンス状態は読込済みとして、ルート解決分のクエリだけを数える
+    laube.maintenance_registry.refresh(db_session)
+
+    query_counter.clear()
+    short = laube.get_individual_approverl_list(db_session, TENANT, TENANT, "SHORT", application_form())
+    short_queries = len(query_counter)
+
+    # 名称キャッシュの影響を除き、初回同士で比較する
+    laube.master_data_cache.clear()
+    query_counter.clear()
+    long = laube.get_individual_approverl_list(db_session, TENANT, TENANT, "LONG", application_form())
+    long_queries = len(query_counter)
+
+    assert len(short) == 2 and len(long) == 12
+    # プランのコンパイル 3本（版数・ルート・アクティビティ）+ マスタ取得 6本（ユーザー・従業員部署・ロール・テナント・部署・氏名）
+    assert long_queries <= 9
+    assert long_queries == short_queries
@@ -0,0 +1,113 @@
+import asyncio
+from unittest.mock import MagicMock
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from app.engine.async_laube import AsyncLaube
+from app.engine.engine_context import EngineContext
+from app.engine.laube import Laube
+from app.engine.master_data_resolver import default_master_data_cache
+from app.engine.route_plan_cache import default_route_plan_cache
+from app.exception.laubeException import LaubeException
+from app.models.models import Base
+from app.tests.engine import test_approver_resolver as approver_data
+from app.tests.engine import test_is_display_boss_fields as boss_field_data
+
+pytest.importorskip("aiosqlite")
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine  # noqa: E402
+
+
+@pytest.fixture
+def databases(tmp_path):
+    """同じ SQLite ファイルを同期セッション（データ投入・比較用）と非同期セッションで開く"""
+    path = tmp_path / "laube.sqlite3"
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(bind=engine)
+    sync_session = sessionmaker(bind=engine)()
+    async_engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+
+    yield sync_session, async_sessionmaker(bind=async_engine, expire_on_commit=False)
+
+    sync_session.close()
+    engine.dispose()
+    asyncio.run(async_engine.dispose())
+    default_route_plan_cache.clear()
+    default_master_data_cache.clear()
+
+
+def run(coro_factory, session_factory):
+    async def main():
+        async with session_factory() as session:
+            return await coro_factory(session)
+    return asyncio.run(main())
+
+
+@pytest.mark.parametrize("parallel", [False, True])
+def test_boss_fields_match_sync_engine(databases, parallel):
+    sync_session, session_factory = databases
+    boss_field_data.seed(sync_session)
+    sync_session.commit()
+    codes = boss_field_data.CODES
+    engine = AsyncLaube(session_factory=session_factory if parallel else None)
+
+    expected = Laube().is_display_boss_fields(sync_session, boss_field_data.TENANT, "G1", "U1", codes)
+    batch = run(lambda s: engine.is_display_boss_fields(s, boss_field_data.TENANT, "G1", "U1", codes), session_factory)
+    single = run(lambda s: engine.is_display_boss_field(s, boss_field_data.TENANT, "G1", "U1", "BOSS_MISSING"), session_factory)
+
+    assert batch == expected
+    assert single is expected["BOSS_MISSING"]
+
+
+@pytest.mark.parametrize("parallel", [False, True])
+def test_approver_list_matches_sync_engine(databases, parallel):
+    sync_session, session_factory = databases
+    approver_data.seed_master(sync_session, 3)
+    approver_data.seed_route(sync_session, "R1", ["user-0", "user-1", "user-2"], role_steps={3})
+    sync_session.commit()
+    form = approver_data.application_form()
+    engine = AsyncLaube(session_factory=session_factory if parallel else None)
+    tenant = approver_data.TENANT
+
+    expected = Laube().get_individual_approverl_list(sync_session, tenant, tenant, "R1", form)
+    result = run(lambda s: engine.get_individual_approverl_list(s, tenant, tenant, "R1", form), session_factory)
+
+    assert [vars(dto) for dto in result] == [vars(dto) for dto in expected]
+
+
+def test_validation_error_codes_are_kept(databases):
+    _, session_factory = databases
+    engine = AsyncLaube()
+
+    with pytest.raises(LaubeException) as excinfo:
+        run(lambda s: engine.is_display_boss_fields(s, None, "G1", "U1", ["F1"]), session_factory)
+    assert excinfo.value.code == "Laube-E002"
+
+    with pytest.raises(LaubeException) as excinfo:
+        run(lambda s: engine.get_individual_approverl_list(s, "t1", "t1", "R1", None), session_factory)
+    assert excinfo.value.code == "Laube-E006"
+
+
+def test_indexed_tenant_shares_the_boss_index(databases):
+    sync_session, session_factory = databases
+    boss_field_data.seed(sync_session)
+    sync_session.commit()
+    codes = boss_field_data.CODES
+    laube = Laube(context=EngineContext())
+    laube.boss_resolver.enable_index(boss_field_data.TENANT)
+    engine = AsyncLaube(laube)
+
+    expected = Laube().is_display_boss_fields(sync_session, boss_field_data.TENANT, "G2", "U1", codes)
+    result = run(lambda s: engine.is_display_boss_fields(s, boss_field_data.TENANT, "G2", "U1", codes), session_factory)
+
+    assert result == expected
+    assert laube.boss_resolver.cached_index(boss_field_data.TENANT) is not None
+
+
+def test_missing_session_is_reported_before_maintenance_check():
+    laube = Laube(context=EngineContext(maintenance_registry=MagicMock()))
+    laube.maintenance_registry.is_under_maintenance.return_value = True
+    engine = AsyncLaube(laube)
+
+    with pytest.raises(LaubeException) as excinfo:
+        asyncio.run(engine.get_individual_approverl_list(None, "t1", "t1", "R1", approver_data.application_form()))
+    assert excinfo.value.code == "Laube-E001"
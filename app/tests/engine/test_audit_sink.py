@@ -0,0 +1,164 @@
+import json
+import threading
+import pytest
+from app.engine.audit_sink import AuditEvent, AuditSink, DatabaseAuditWriter, NdjsonAuditWriter, create_audit_sink
+from app.engine.cerberus import Cerberus
+from app.engine.decision_cache import DecisionCache
+from app.engine.policy_index import PolicyIndex
+from app.models.models import AuthorizationAudit
+from app.tests.engine.helpers import grant
+
+
+class MemoryWriter:
+    def __init__(self, fail=False):
+        self.batches = []
+        self.fail = fail
+
+    def write(self, events):
+        if self.fail:
+            raise OSError("disk full")
+        self.batches.append(list(events))
+
+
+class BlockingWriter(MemoryWriter):
+    """release されるまで書き込みを止める（キューを溢れさせる用）"""
+    def __init__(self):
+        super().__init__()
+        self.release = threading.Event()
+
+    def write(self, events):
+        self.release.wait(5)
+        super().write(events)
+
+
+@pytest.fixture
+def sink():
+    sinks = []
+
+    def create(writer, **kwargs):
+        kwargs.setdefault("flush_interval", 60)
+        created = AuditSink(writer, **kwargs)
+        sinks.append(created)
+        return created
+
+    yield create
+    for created in sinks:
+        created.close()
+
+
+def test_events_are_written_in_batches_of_batch_size(sink):
+    writer = MemoryWriter()
+    audit = sink(writer, batch_size=3)
+    for i in range(7):
+        assert audit.emit(AuditEvent("check", user_id=f"U{i}", allowed=True))
+
+    assert audit.flush(timeout=5)
+    assert [len(batch) for batch in writer.batches] == [3, 3, 1]
+    assert [e.user_id for batch in writer.batches for e in batch] == [f"U{i}" for i in range(7)]
+    assert audit.stats()["written"] == 7
+
+
+def test_events_are_written_after_flush_interval(sink):
+    writer = MemoryWriter()
+    audit = sink(writer, batch_size=100, flush_interval=0.05)
+    audit.emit(AuditEvent("check", user_id="U1", allowed=False))
+
+    for _ in range(100):
+        if writer.batches:
+            break
+        threading.Event().wait(0.02)
+    assert [e.user_id for e in writer.batches[0]] == ["U1"]
+
+
+def test_full_queue_drops_events_without_blocking(sink):
+    writer = BlockingWriter()
+    audit = sink(writer, batch_size=1, max_queue=2)
+    results = [audit.emit(AuditEvent("check", user_id=f"U{i}")) for i in range(10)]
+
+    assert results.count(False) >= 7
+    assert audit.stats()["dropped"] == results.count(False)
+    writer.release.set()
+    assert audit.flush(timeout=5)
+    assert audit.stats()["written"] == results.count(True)
+
+
+def test_close_writes_remaining_events(sink):
+    writer = MemoryWriter()
+    audit = sink(writer, batch_size=100)
+    audit.emit(AuditEvent("check", user_id="U1"))
+    audit.close()
+
+    assert len(writer.batches) == 1
+    assert audit.emit(AuditEvent("check", user_id="U2")) is False
+
+
+def test_failed_batch_is_counted_and_writer_keeps_running(sink):
+    writer = MemoryWriter(fail=True)
+    audit = sink(writer, batch_size=1)
+    audit.emit(AuditEvent("check", user_id="U1"))
+    assert audit.flush(timeout=5)
+    writer.fail = False
+    audit.emit(AuditEvent("check", user_id="U2"))
+    assert audit.flush(timeout=5)
+
+    stats = audit.stats()
+    assert (stats["failed"], stats["written"]) == (1, 1)
+
+
+def test_ndjson_writer_appends_one_line_per_event(tmp_path):
+    path = tmp_path / "audit" / "cerberus.ndjson"
+    writer = NdjsonAuditWriter(str(path))
+    writer.write([AuditEvent("check", user_id="U1", allowed=True)])
+    writer.write([AuditEvent("assign_role", user_id="U1", role_id="editor", operator_uuid="admin")])
+
+    records = [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+    assert [(r["event_type"], r["allowed"]) for r in records] == [("check", True), ("assign_role", None)]
+    assert records[1]["operator_uuid"] == "admin"
+
+
+def test_database_writer_inserts_rows(db_session):
+    writer = DatabaseAuditWriter(session_factory=lambda: db_session)
+    writer.write([
+        AuditEvent("check", user_id="U1", permission_id="write", resource_id="/api/forms", allowed=False),
+        AuditEvent("filter", user_id="U1", detail={"allowed": ["A"]}),
+    ])
+
+    rows = db_session.query(AuthorizationAudit).order_by(AuthorizationAudit.id).all()
+    assert [(r.event_type, r.allowed) for r in rows] == [("check", False), ("filter", None)]
+    assert json.loads(rows[1].detail) == {"allowed": ["A"]}
+
+
+def test_create_audit_sink_rejects_unknown_spec():
+    assert create_audit_sink(None) is None
+    with pytest.raises(ValueError):
+        create_audit_sink("kafka")
+
+
+def test_cerberus_records_decisions_and_committed_grants(db_session, sink):
+    writer = MemoryWriter()
+    cerberus = Cerberus(
+        policy_index=PolicyIndex(), session_factory=lambda: db_session,
+        decision_cache=DecisionCache(maxsize=4), version_check_interval=60,
+        audit_sink=sink(writer)
+    )
+    cerberus.load_index(db_session)
+    grant(cerberus, db_session)
+    cerberus.assign_role_to_user(db_session, "U1", "editor", operator_uuid="admin")
+    db_session.commit()
+
+    nested = db_session.begin_nested()
+    cerberus.assign_role_to_user(db_session, "U2", "editor")
+    nested.rollback()
+
+    assert cerberus.check("U1", "write", "/api/forms") is True
+    assert cerberus.check("U1", "write", "/api/forms") is True  # キャッシュからの判定も記録する
+    assert cerberus.filter_allowed("U1", "write", ["/api/forms", "/api/users"]) == {"/api/forms"}
+    assert cerberus.audit_sink.flush(timeout=5)
+
+    events = [e for batch in writer.batches for e in batch]
+    assert [e.event_type for e in events] == [
+        "assign_permission", "assign_policy", "assign_role", "check", "check", "filter"
+    ]
+    assert events[2].operator_uuid == "admin" and events[2].user_id == "U1"
+    assert [e.allowed for e in events[3:5]] == [True, True]
+    assert events[5].detail == {"allowed": ["/api/forms"], "denied": ["/api/users"]}
@@ -0,0 +1,64 @@
+import itertools
+import pytest
+from app.engine.boss_resolver import BossResolver
+from app.models.models import Boss
+
+TENANT = "tenant-1"
+AUDIT = dict(create_user_uuid="test", update_user_uuid="test", update_count=1)
+
+
+def add_boss(db_session, group_code, form_code, boss_user_uuid, user_uuid="U1"):
+    db_session.add(Boss(
+        tenant_uuid=TENANT, user_uuid=user_uuid, group_code=group_code, application_form_code=form_code,
+        boss_tenant_uuid=TENANT, boss_group_code="G9", boss_user_uuid=boss_user_uuid, **AUDIT
+    ))
+    db_session.flush()
+
+
+@pytest.fixture
+def bosses(db_session):
+    add_boss(db_session, "G1", "F1", "both")
+    add_boss(db_session, None, "F1", "form-only")
+    add_boss(db_session, "G1", None, "group-only")
+    add_boss(db_session, None, None, "default")
+    add_boss(db_session, None, None, "other-user", user_uuid="U2")
+
+
+@pytest.mark.parametrize("group_code, form_code, expected", [
+    ("G1", "F1", "both"),
+    ("G2", "F1", "form-only"),
+    ("G1", "F2", "group-only"),
+    ("G2", "F2", "default"),
+])
+def test_resolve_follows_specificity(db_session, bosses, group_code, form_code, expected):
+    target = BossResolver().resolve(db_session, TENANT, "U1", group_code, form_code)
+    assert target.boss_user_uuid == expected
+
+
+def test_resolve_uses_single_query(db_session, bosses, query_counter):
+    query_counter.clear()
+    assert BossResolver().resolve(db_session, TENANT, "U3", "G1", "F1") is None
+    assert len(query_counter) == 1
+
+
+def test_index_matches_database(db_session, bosses):
+    db_resolver = BossResolver()
+    index_resolver = BossResolver(hot_tenants=[TENANT])
+
+    for user_uuid, group_code, form_code in itertools.product(("U1", "U2", "U3"), ("G1", "G2", None), ("F1", "F2", None)):
+        assert (
+            index_resolver.resolve(db_session, TENANT, user_uuid, group_code, form_code)
+            == db_resolver.resolve(db_session, TENANT, user_uuid, group_code, form_code)
+        )
+
+
+def test_index_is_built_once_and_invalidated_on_write(db_session, bosses, query_counter):
+    resolver = BossResolver(hot_tenants=[TENANT])
+    resolver.resolve(db_session, TENANT, "U1", "G1", "F1")
+
+    query_counter.clear()
+    assert resolver.resolve(db_session, TENANT, "U1", "G2", "F2").boss_user_uuid == "default"
+    assert query_counter == []
+
+    add_boss(db_session, "G2", "F2", "new-boss")
+    assert resolver.resolve(db_session, TENANT, "U1", "G2", "F2").boss_user_uuid == "new-boss"
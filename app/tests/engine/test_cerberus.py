@@ -0,0 +1,366 @@
+import pytest
+from datetime import date, datetime
+from app.common.orm_invalidation import CHANGES_RECORDED
+from app.daos.user_role_dao import UserRoleDao
+from app.dtos.assignment_result_dto import AssignmentStatus
+from app.engine.cerberus import Cerberus
+from app.engine.decision_cache import DecisionCache
+from app.engine.policy_condition import PolicyConditionError, build_context
+from app.engine.policy_index import POLICY_VERSION_SCOPE, PolicyIndex
+from app.models.models import Group, Policy, UserRole
+from app.models.specifiedValue import PermissionRange
+from app.repositories.group_role_repository import GroupRoleRepository
+from app.repositories.policy_version_repository import PolicyVersionRepository
+from app.tests.engine.helpers import AUDIT, TENANT, add_affiliation, add_group, grant
+
+
+def test_check_follows_assignments_after_commit(cerberus, db_session, query_counter):
+    grant(cerberus, db_session)
+    cerberus.assign_role_to_user(db_session, "U1", "editor")
+    assert cerberus.check("U1", "write", "/api/forms") is False
+
+    db_session.commit()
+    query_counter.clear()
+
+    assert cerberus.check("U1", "write", "/api/forms") is True
+    assert cerberus.check("U1", "write", "/api/other") is False
+    assert cerberus.check("U2", "write", "/api/forms") is False
+    assert query_counter == []
+
+
+def test_revoke_is_reflected_incrementally(cerberus, db_session):
+    grant(cerberus, db_session)
+    cerberus.assign_role_to_user(db_session, "U1", "editor")
+    db_session.commit()
+
+    cerberus.revoke_resource_from_role(db_session, "editor", "write", "/api/forms")
+    db_session.commit()
+    assert cerberus.check("U1", "write", "/api/forms") is False
+
+    cerberus.assign_resource_to_role(db_session, "editor", "write", "/api/users")
+    cerberus.revoke_role_from_user(db_session, "U1", "editor")
+    db_session.commit()
+    assert cerberus.check("U1", "write", "/api/users") is False
+
+
+def test_rolled_back_assignment_is_not_applied(cerberus, db_session):
+    grant(cerberus, db_session)
+    db_session.commit()
+
+    savepoint = db_session.begin_nested()
+    cerberus.assign_role_to_user(db_session, "U1", "editor")
+    db_session.flush()
+    savepoint.rollback()
+    db_session.commit()
+
+    assert cerberus.check("U1", "write", "/api/forms") is False
+
+
+def test_conditional_policy_is_evaluated_against_context(cerberus, db_session):
+    grant(cerberus, db_session, condition="user.group_code == resource.group_code and now.hour >= 9")
+    cerberus.assign_role_to_user(db_session, "U1", "editor")
+    db_session.commit()
+    morning = datetime(2025, 4, 1, 10, 0)
+
+    same_group = build_context({"group_code": "G1"}, {"group_code": "G1"}, now=morning)
+    other_group = build_context({"group_code": "G1"}, {"group_code": "G2"}, now=morning)
+    assert cerberus.check("U1", "write", "/api/forms", same_group) is True
+    assert cerberus.check("U1", "write", "/api/forms", other_group) is False
+    assert cerberus.check("U1", "write", "/api/forms") is False
+
+    # 同じポリシーの条件は1回だけコンパイルされ、評価は毎回計測される
+    metrics = cerberus.condition_metrics
+    assert metrics["compiles"] == 1
+    assert metrics["evaluations"] == 3
+    assert metrics["evaluation_seconds"] > 0
+
+
+def test_invalid_condition_is_rejected_on_assign(cerberus, db_session):
+    cerberus.assign_permission_to_role(db_session, "editor", "write")
+
+    for condition in ('{"==": [1]}', "user.group_code ==", "__import__('os').getcwd()"):
+        with pytest.raises(PolicyConditionError):
+            cerberus.assign_resource_to_role(db_session, "editor", "write", "/api/forms", condition)
+    assert db_session.query(Policy).count() == 0
+
+
+def test_bulk_update_reloads_index(cerberus, db_session):
+    grant(cerberus, db_session)
+    cerberus.assign_role_to_user(db_session, "U1", "editor")
+    db_session.commit()
+
+    db_session.query(UserRole).filter_by(user_id="U1").update({"user_id": "U2"})
+    db_session.commit()
+
+    assert not cerberus.policy_index.loaded
+    assert cerberus.check("U2", "write", "/api/forms") is True
+    assert cerberus.check("U1", "write", "/api/forms") is False
+
+
+def test_dao_bulk_delete_revokes_access(cerberus, db_session):
+    grant(cerberus, db_session)
+    cerberus.assign_role_to_user(db_session, "U1", "editor")
+    db_session.commit()
+    assert cerberus.check("U1", "write", "/api/forms") is True
+    version = cerberus.policy_index.version
+
+    assert UserRoleDao().bulk_delete(db_session, [("U1", "editor")], key_columns=["user_id", "role_id"]) == 1
+    db_session.commit()
+
+    assert cerberus.check("U1", "write", "/api/forms") is False
+    assert cerberus.policy_index.version == version + 1
+
+
+def test_dao_bulk_insert_grants_access(cerberus, db_session):
+    grant(cerberus, db_session)
+    db_session.commit()
+    assert cerberus.check("U1", "write", "/api/forms") is False
+
+    UserRoleDao().bulk_insert(db_session, [{
+        "user_id": "U1", "role_id": "editor", "create_user_uuid": "system", "update_user_uuid": "system"
+    }])
+    db_session.commit()
+
+    assert cerberus.check("U1", "write", "/api/forms") is True
+
+
+def test_revoke_permission_in_use_is_rejected(cerberus, db_session):
+    grant(cerberus, db_session)
+
+    with pytest.raises(ValueError):
+        cerberus.revoke_permission_from_role(db_session, "editor", "write")
+    assert db_session.query(Policy).count() == 1
+
+
+def test_filter_allowed_matches_per_resource_check(cerberus, db_session):
+    grant(cerberus, db_session, "reader", "read", "/forms/0")
+    for i in range(2, 10, 2):
+        cerberus.assign_resource_to_role(db_session, "reader", "read", f"/forms/{i}")
+    grant(cerberus, db_session, "auditor", "read", "/forms/3")
+    cerberus.assign_resource_to_role(db_session, "auditor", "read", "/forms/5", "user.grade >= 3")
+    cerberus.assign_role_to_user(db_session, "U1", "reader")
+    cerberus.assign_role_to_user(db_session, "U1", "auditor")
+    db_session.commit()
+    resource_ids = [f"/forms/{i}" for i in range(10)]
+    context = build_context({"grade": 1})
+
+    allowed = cerberus.filter_allowed("U1", "read", resource_ids, context)
+
+    assert allowed == {r for r in resource_ids if cerberus.check("U1", "read", r, context)}
+    assert allowed == {"/forms/0", "/forms/2", "/forms/3", "/forms/4", "/forms/6", "/forms/8"}
+    assert "/forms/5" in cerberus.filter_allowed("U1", "read", resource_ids, build_context({"grade": 3}))
+
+
+def test_allowed_resource_filter_pushes_authorization_into_sql(cerberus, db_session):
+    grant(cerberus, db_session, "reader", "read", "/forms/1")
+    cerberus.assign_resource_to_role(db_session, "reader", "read", "/forms/2", "user.grade >= 3")
+    grant(cerberus, db_session, "reader", "write", "/forms/3")
+    cerberus.assign_role_to_user(db_session, "U1", "reader")
+    db_session.flush()
+
+    rows = db_session.query(Policy.resource_id).filter(
+        cerberus.allowed_resource_filter(Policy.resource_id, "U1", "read")
+    ).distinct().all()
+
+    assert [r.resource_id for r in rows] == ["/forms/1"]
+
+
+def test_allowed_resource_filter_includes_roles_inherited_from_groups(cerberus, db_session):
+    for code, upper in [("G1", None), ("G11", "G1")]:
+        add_group(db_session, code, upper)
+    add_affiliation(db_session, "U9", "G11")
+    grant(cerberus, db_session, "manager", "read", "/r1")
+    grant(cerberus, db_session, "auditor", "read", "/r2")
+    cerberus.assign_role_to_group(db_session, TENANT, "G1", "manager")
+    cerberus.assign_role_to_user(db_session, "U9", "auditor")
+    db_session.commit()
+
+    def sql_allowed(system_date=None):
+        rows = db_session.query(Policy.resource_id).filter(
+            cerberus.allowed_resource_filter(Policy.resource_id, "U9", "read", system_date)
+        )
+        return {r.resource_id for r in rows}
+
+    assert sql_allowed() == cerberus.filter_allowed("U9", "read", ["/r1", "/r2"]) == {"/r1", "/r2"}
+    # 所属の開始日より前は部署からの継承が無く、直接割り当てのロールだけになる
+    assert sql_allowed(date(2019, 12, 31)) == {"/r2"}
+
+
+def test_roles_granted_to_a_group_are_inherited_by_sub_groups(cerberus, db_session, query_counter):
+    for code, upper in [("G1", None), ("G11", "G1"), ("G2", None)]:
+        add_group(db_session, code, upper)
+    add_affiliation(db_session, "U1", "G11")
+    grant(cerberus, db_session, "manager", "approve", "/forms")
+    cerberus.assign_role_to_group(db_session, TENANT, "G1", "manager")
+    db_session.commit()
+
+    assert cerberus.roles_of("U1") == {"manager"}
+    assert cerberus.check("U1", "approve", "/forms") is True
+
+    query_counter.clear()
+    assert GroupRoleRepository().find_effective_role_ids(db_session, "U1") == ["manager"]
+    assert len(query_counter) == 1
+
+    # 部署の移動はコミット時にインデックスへ反映される
+    db_session.query(Group).filter_by(group_code="G11").one().upper_group_code = "G2"
+    db_session.commit()
+    assert cerberus.check("U1", "approve", "/forms") is False
+
+
+def test_missing_group_closure_is_rebuilt_on_load(db_session):
+    # 閉包の導入前から存在する部署（m_group_closure に行が無い）
+    db_session.execute(Group.__table__.insert(), [
+        {
+            "tenant_uuid": TENANT, "group_code": code, "group_name": code, "upper_group_code": upper,
+            "term_from": date(2020, 1, 1), "permission_range": PermissionRange.ALL, **AUDIT
+        }
+        for code, upper in [("G1", None), ("G11", "G1")]
+    ])
+    add_affiliation(db_session, "U1", "G11")
+    db_session.commit()
+    engine = Cerberus(
+        policy_index=PolicyIndex(), session_factory=lambda: db_session,
+        decision_cache=DecisionCache(maxsize=4), version_check_interval=60
+    )
+    engine.load_index(db_session)
+    db_session.commit()
+
+    grant(engine, db_session, "manager", "approve", "/forms")
+    engine.assign_role_to_group(db_session, TENANT, "G1", "manager")
+    db_session.commit()
+    assert engine.check("U1", "approve", "/forms") is True
+    assert engine.rebuild_missing_group_closures(db_session) == {}
+
+
+def test_decisions_are_cached_until_an_assignment_changes(cerberus, db_session):
+    grant(cerberus, db_session)
+    cerberus.assign_role_to_user(db_session, "U1", "editor")
+    db_session.commit()
+
+    for _ in range(3):
+        assert cerberus.check("U1", "write", "/api/forms") is True
+        assert cerberus.check("U2", "write", "/api/forms") is False
+    stats = cerberus.decision_cache_stats
+    assert (stats["hits"], stats["misses"], stats["size"]) == (4, 2, 2)
+    assert stats["hit_ratio"] == pytest.approx(4 / 6)
+
+    cerberus.assign_role_to_user(db_session, "U2", "editor")
+    db_session.commit()
+    assert cerberus.check("U2", "write", "/api/forms") is True
+    assert cerberus.decision_cache_stats["invalidations"] == 1
+
+    for i in range(5):
+        cerberus.check(f"U{i + 3}", "write", "/api/forms")
+    assert cerberus.decision_cache_stats["evictions"] == 2
+
+
+def test_cached_decisions_expire_with_the_affiliation_term(db_session):
+    today = [date(2030, 3, 31)]
+    engine = Cerberus(
+        policy_index=PolicyIndex(), session_factory=lambda: db_session,
+        decision_cache=DecisionCache(maxsize=4), version_check_interval=60, today=lambda: today[0]
+    )
+    engine.load_index(db_session)
+    add_group(db_session, "G1", None)
+    add_affiliation(db_session, "U1", "G1", term_to=date(2030, 3, 31))
+    grant(engine, db_session, "manager", "approve", "/forms")
+    engine.assign_role_to_group(db_session, TENANT, "G1", "manager")
+    db_session.commit()
+
+    assert engine.check("U1", "approve", "/forms") is True
+    assert engine.check("U1", "approve", "/forms") is True
+
+    # 所属の終了日を過ぎたら、キャッシュ済みの許可は使わない
+    today[0] = date(2030, 4, 1)
+    assert engine.check("U1", "approve", "/forms") is False
+    assert engine.decision_cache_stats["invalidations"] == 1
+
+
+def test_decisions_from_an_older_generation_are_not_cached():
+    cache = DecisionCache(maxsize=4)
+    day = date(2030, 1, 1)
+    key = ("U1", "write", "/api/forms")
+
+    # 世代5で判定中に、別スレッドが世代6へ進めて参照した
+    assert cache.get(key, 6, day) is None
+    cache.put(key, True, 5, day)
+    assert cache.get(key, 6, day) is None
+    assert cache.get(key, 5, day) is None
+
+    cache.put(key, False, 6, day)
+    assert cache.get(key, 6, day) is False
+
+
+def test_writes_from_another_worker_are_detected_by_version(cerberus, db_session):
+    grant(cerberus, db_session)
+    db_session.commit()
+    assert cerberus.check("U1", "write", "/api/forms") is False
+    version = cerberus.policy_index.current_version(db_session)
+
+    # 別ワーカーでの書き込み：このプロセスのイベントを通らず（CHANGES_RECORDED）、版数だけが加算される
+    db_session.execute(UserRole.__table__.insert().execution_options(**{CHANGES_RECORDED: True}), [{
+        "user_id": "U1", "role_id": "editor", "create_user_uuid": "w2", "update_user_uuid": "w2"
+    }])
+    PolicyVersionRepository().bump(db_session, POLICY_VERSION_SCOPE)
+    db_session.commit()
+
+    assert cerberus.check("U1", "write", "/api/forms") is False  # 確認間隔内はキャッシュのまま
+    cerberus.version_check_interval = 0
+    assert cerberus.check("U1", "write", "/api/forms") is True
+    assert cerberus.policy_index.version == version + 1
+
+
+def test_own_commits_advance_the_index_version_without_reload(cerberus, db_session, query_counter):
+    grant(cerberus, db_session)
+    cerberus.assign_role_to_user(db_session, "U1", "editor")
+    db_session.commit()
+    assert cerberus.policy_index.version == cerberus.policy_index.current_version(db_session)
+
+    generation = cerberus.policy_index.generation
+    cerberus.version_check_interval = 0
+    query_counter.clear()
+    assert cerberus.check("U1", "write", "/api/forms") is True
+    assert len(query_counter) == 1  # 版数の確認のみ（読み込み直さない）
+    assert cerberus.policy_index.generation == generation
+
+
+def test_bulk_assignments_report_per_row_outcomes(cerberus, db_session, query_counter):
+    cerberus.assign_role_to_user(db_session, "U0", "editor")
+    db_session.flush()
+    query_counter.clear()
+
+    results = cerberus.assign_roles_to_users(
+        db_session, [("U0", "editor"), ("U1", "editor"), ("U2", "editor"), ("U1", "editor")]
+    )
+
+    assert [r.status for r in results] == [
+        AssignmentStatus.EXISTS, AssignmentStatus.CREATED, AssignmentStatus.CREATED, AssignmentStatus.DUPLICATE
+    ]
+    # 既存確認・一括登録・版数の加算
+    assert len(query_counter) == 3
+    assert db_session.query(UserRole).count() == 3
+
+
+def test_bulk_policies_are_validated_against_role_permissions(cerberus, db_session):
+    results = cerberus.assign_permissions_to_roles(db_session, [("editor", "write"), ("editor", "read")])
+    assert {r.status for r in results} == {AssignmentStatus.CREATED}
+    cerberus.assign_roles_to_users(db_session, [("U1", "editor")])
+
+    results = cerberus.assign_resources_to_roles(db_session, [
+        ("editor", "write", "/forms/1"),
+        ("editor", "approve", "/forms/1"),
+        ("editor", "read", "/forms/1", "user.grade >="),
+        ("editor", "read", "/forms/2", "user.grade >= 3"),
+    ])
+
+    assert [r.status for r in results] == [
+        AssignmentStatus.CREATED, AssignmentStatus.REJECTED, AssignmentStatus.REJECTED, AssignmentStatus.CREATED
+    ]
+    assert "not assigned" in results[1].reason
+    assert db_session.query(Policy).count() == 2
+    assert cerberus.check("U1", "write", "/forms/1") is False  # コミット前はインデックスに反映しない
+
+    db_session.commit()
+    assert cerberus.check("U1", "write", "/forms/1") is True
+    assert cerberus.assign_resources_to_roles(db_session, [("editor", "write", "/forms/1")])[0].status \
+        == AssignmentStatus.EXISTS
@@ -0,0 +1,45 @@
+from datetime import date, datetime
+from unittest.mock import MagicMock
+from app.common.error_message_loader import load_message_catalog
+from app.engine.engine_context import EngineContext, get_default_context
+from app.engine.laube import Laube
+
+
+def test_laube_instances_share_context_components():
+    first, second = Laube(), Laube()
+
+    assert first.context is get_default_context()
+    assert first.application_form_repository is second.application_form_repository
+    assert first.approver_resolver is second.approver_resolver
+    assert first.error_loader.messages is second.error_loader.messages
+
+
+def test_components_are_built_lazily_and_once():
+    context = EngineContext()
+    assert context._components == {}
+
+    resolver = context.approver_resolver
+
+    assert resolver is context.approver_resolver
+    assert resolver.role_repository is context.role_repository
+    assert resolver.error_loader is context.error_loader
+
+
+def test_message_catalog_is_read_once_per_file():
+    load_message_catalog.cache_clear()
+    for _ in range(3):
+        EngineContext().error_loader.get_message("Laube-E001")
+
+    assert load_message_catalog.cache_info().misses == 1
+
+
+def test_clock_can_be_replaced():
+    context = EngineContext(clock=lambda: datetime(2030, 4, 1, 9, 30))
+    assert context.today() == date(2030, 4, 1)
+
+
+def test_dedicated_context_isolates_mocks():
+    isolated = Laube(context=EngineContext())
+    isolated.application_form_repository.get_by_code = MagicMock()
+
+    assert not isinstance(Laube().application_form_repository.get_by_code, MagicMock)
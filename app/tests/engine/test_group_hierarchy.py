@@ -0,0 +1,68 @@
+import pytest
+from app.daos.group_closure_dao import GroupClosureDao
+from app.models.models import Group, GroupClosure
+from app.tests.engine.helpers import TENANT, add_group
+
+
+def closure(db_session):
+    return {
+        (row.ancestor_group_code, row.descendant_group_code, row.depth)
+        for row in db_session.query(GroupClosure).filter_by(tenant_uuid=TENANT)
+    }
+
+
+def assert_matches_rebuild(db_session):
+    maintained = closure(db_session)
+    GroupClosureDao().rebuild(db_session, TENANT)
+    assert maintained == closure(db_session)
+
+
+def test_closure_is_maintained_on_insert_in_any_order(db_session):
+    # 子部署を親部署より先に追加しても、同じフラッシュ内で正しく接続される
+    add_group(db_session, "G111", "G11")
+    add_group(db_session, "G11", "G1")
+    add_group(db_session, "G1")
+    add_group(db_session, "G12", "G1")
+    db_session.flush()
+
+    assert ("G1", "G111", 2) in closure(db_session)
+    assert ("G12", "G111", 1) not in closure(db_session)
+    assert_matches_rebuild(db_session)
+
+
+def test_moving_a_group_moves_its_subtree(db_session):
+    for code, upper in [("G1", None), ("G11", "G1"), ("G111", "G11"), ("G2", None), ("G21", "G2")]:
+        add_group(db_session, code, upper)
+    db_session.flush()
+
+    db_session.query(Group).filter_by(group_code="G11").one().upper_group_code = "G21"
+    db_session.flush()
+
+    assert ("G2", "G111", 3) in closure(db_session)
+    assert not any(a == "G1" and d != "G1" for a, d, _ in closure(db_session))
+    assert_matches_rebuild(db_session)
+
+
+def test_deleted_group_leaves_children_as_roots(db_session):
+    for code, upper in [("G1", None), ("G11", "G1"), ("G111", "G11")]:
+        add_group(db_session, code, upper)
+    db_session.flush()
+
+    middle = db_session.query(Group).filter_by(group_code="G11").one()
+    db_session.query(Group).filter_by(group_code="G111").one().upper_group_code = None
+    db_session.delete(middle)
+    db_session.flush()
+
+    assert closure(db_session) == {("G1", "G1", 0), ("G111", "G111", 0)}
+
+
+def test_cycle_is_rejected(db_session):
+    add_group(db_session, "G1")
+    add_group(db_session, "G11", "G1")
+    db_session.flush()
+
+    savepoint = db_session.begin_nested()
+    db_session.query(Group).filter_by(group_code="G1").one().upper_group_code = "G11"
+    with pytest.raises(ValueError):
+        db_session.flush()
+    savepoint.rollback()
@@ -0,0 +1,114 @@
+import pytest
+from sqlalchemy.orm.attributes import set_committed_value
+from app.engine.laube import Laube
+from app.exception.laubeException import LaubeException
+from app.models.models import ApplicationForm, ApplicationFormRoute, Boss
+from app.models.specifiedValue import AutoApproverlFlag, PullingFlag, RouteFlag, WithdrawalFlag
+
+TENANT = "tenant-1"
+AUDIT = dict(create_user_uuid="test", update_user_uuid="test", update_count=1)
+
+
+def add_form(db_session, code, route_flag):
+    db_session.add(ApplicationForm(
+        tenant_uuid=TENANT, application_form_code=code, application_form_name=code,
+        application_classification_code="C1", skip_apply_employee=False,
+        auto_approverl_flag=AutoApproverlFlag.MANUAL_APPROVAL, pulling_flag=PullingFlag.A,
+        withdrawal_flag=WithdrawalFlag.ENABLED, route_flag=route_flag, sort_number=1,
+        table_name=f"t_{code}".lower(), screen_code="S00001", **AUDIT
+    ))
+
+
+def add_form_route(db_session, code, group_code, individual_route_code):
+    db_session.add(ApplicationFormRoute(
+        tenant_uuid=TENANT, application_form_code=code, group_code=group_code,
+        individual_route_code=individual_route_code, **AUDIT
+    ))
+
+
+def add_boss(db_session, group_code, form_code):
+    db_session.add(Boss(
+        tenant_uuid=TENANT, user_uuid="U1", group_code=group_code, application_form_code=form_code,
+        boss_tenant_uuid=TENANT, boss_group_code="G9", boss_user_uuid="B1", **AUDIT
+    ))
+
+
+def seed(db_session):
+    add_form(db_session, "NONE", RouteFlag.NO_INDIVIDUAL_ROUTE)
+    add_form(db_session, "IND_G", RouteFlag.INDIVIDUAL_ROUTE)
+    add_form(db_session, "IND_NULL", RouteFlag.INDIVIDUAL_ROUTE)
+    add_form(db_session, "IND_BLANK", RouteFlag.INDIVIDUAL_ROUTE)
+    add_form_route(db_session, "IND_G", None, " ")
+    add_form_route(db_session, "IND_G", "G1", "R1")
+    add_form_route(db_session, "IND_NULL", None, "R2")
+    for code in ("BOSS_EXACT", "BOSS_FORM_NULL", "BOSS_GROUP_NULL", "BOSS_MISSING"):
+        add_form(db_session, code, RouteFlag.BOSS_ROUTE)
+    add_boss(db_session, "G1", "BOSS_EXACT")
+    add_boss(db_session, None, "BOSS_GROUP_NULL")
+    add_boss(db_session, "G2", None)
+    db_session.flush()
+
+
+CODES = [
+    "NONE", "IND_G", "IND_NULL", "IND_BLANK",
+    "BOSS_EXACT", "BOSS_FORM_NULL", "BOSS_GROUP_NULL", "BOSS_MISSING"
+]
+
+
+def test_batch_matches_single_form_results(db_session):
+    seed(db_session)
+    laube = Laube()
+
+    for group_code in ("G1", "G2"):
+        expected = {
+            code: laube.is_display_boss_field(db_session, TENANT, group_code, "U1", code) for code in CODES
+        }
+        assert laube.is_display_boss_fields(db_session, TENANT, group_code, "U1", CODES) == expected
+
+
+def test_batch_uses_fixed_number_of_queries(db_session, query_counter):
+    seed(db_session)
+    for i in range(50):
+        add_form(db_session, f"BULK{i}", RouteFlag.BOSS_ROUTE)
+    db_session.flush()
+    laube = Laube()
+    # メンテナンス状態は読込済みとして、判定分のクエリだけを数える
+    laube.maintenance_registry.refresh(db_session)
+
+    query_counter.clear()
+    result = laube.is_display_boss_fields(db_session, TENANT, "G1", "U1", CODES + [f"BULK{i}" for i in range(50)])
+
+    assert len(result) == len(CODES) + 50
+    # 申請書・申請ルート・上司マスタ候補の3本
+    assert len(query_counter) == 3
+
+
+def test_unknown_form_is_reported_as_e006(db_session):
+    seed(db_session)
+    laube = Laube()
+
+    with pytest.raises(LaubeException) as single:
+        laube.is_display_boss_field(db_session, TENANT, "G1", "U1", "MISSING")
+    with pytest.raises(LaubeException) as batch:
+        laube.is_display_boss_fields(db_session, TENANT, "G1", "U1", ["NONE", "MISSING"])
+
+    for error in (single.value, batch.value):
+        assert error.code == "Laube-E006"
+        assert error.message == laube.error_loader.get_message("Laube-E006")
+
+
+def test_unregistered_route_flag_is_reported_as_e007(db_session):
+    seed(db_session)
+    laube = Laube()
+    # EnumType では登録外の値を保存できないため、読込済みのインスタンスの値だけを差し替える
+    form = db_session.query(ApplicationForm).filter_by(application_form_code="NONE").one()
+    set_committed_value(form, "route_flag", 99)
+
+    with pytest.raises(LaubeException) as single:
+        laube.is_display_boss_field(db_session, TENANT, "G1", "U1", "NONE")
+    with pytest.raises(LaubeException) as batch:
+        laube.is_display_boss_fields(db_session, TENANT, "G1", "U1", ["NONE"])
+
+    for error in (single.value, batch.value):
+        assert error.code == "Laube-E007"
+        assert error.message == laube.error_loader.get_message("Laube-E007")
@@ -1,5 +1,6 @@
 import pytest
 from unittest.mock import MagicMock
+from app.engine.engine_context import EngineContext
 from app.engine.laube import Laube
 from app.models.models import ApplicationForm, ApplicationFormRoute, Boss
 from app.models.specifiedValue import RouteFlag
@@ -30,13 +31,11 @@ def mock_boss():
 
 @pytest.fixture
 def laube_with_mocks():
-    laube = Laube()
+    # リポジトリをモックに差し替えるため、共有コンテキストではなく専用のコンテキストを使う
+    laube = Laube(context=EngineContext())
     laube.application_form_repository.get_by_code = MagicMock()
     laube.application_form_route_repository.get_by_code_and_group = MagicMock()
-    laube.boss_repository.get_by_all_keys = MagicMock()
-    laube.boss_repository.get_by_group_null = MagicMock()
-    laube.boss_repository.get_by_form_null = MagicMock()
-    laube.boss_repository.get_by_group_and_form_null = MagicMock()
+    laube.boss_repository.find_prioritized_boss = MagicMock()
     return laube
 
 def test_no_individual_route(laube_with_mocks):
@@ -58,16 +57,13 @@ def test_individual_route_without_code(laube_with_mocks):
 
 def test_boss_route_with_no_boss(laube_with_mocks):
     laube_with_mocks.application_form_repository.get_by_code.return_value = mock_application_form(RouteFlag.BOSS_ROUTE)
-    laube_with_mocks.boss_repository.get_by_all_keys.return_value = None
-    laube_with_mocks.boss_repository.get_by_group_null.return_value = None
-    laube_with_mocks.boss_repository.get_by_form_null.return_value = None
-    laube_with_mocks.boss_repository.get_by_group_and_form_null.return_value = None
+    laube_with_mocks.boss_repository.find_prioritized_boss.return_value = None
     result = laube_with_mocks.is_display_boss_field("dummy", "t1", "G1", "U1", "FORM1")
     assert result is True
 
 def test_boss_route_with_boss_found(laube_with_mocks):
     laube_with_mocks.application_form_repository.get_by_code.return_value = mock_application_form(RouteFlag.BOSS_ROUTE)
-    laube_with_mocks.boss_repository.get_by_all_keys.return_value = mock_boss()
+    laube_with_mocks.boss_repository.find_prioritized_boss.return_value = mock_boss()
     result = laube_with_mocks.is_display_boss_field("dummy", "t1", "G1", "U1", "FORM1")
     assert result is False
 
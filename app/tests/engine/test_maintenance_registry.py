@@ -0,0 +1,119 @@
+import time
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock
+import pytest
+from sqlalchemy import text
+from app.engine.engine_context import EngineContext
+from app.engine.laube import Laube
+from app.engine.maintenance_registry import MaintenanceRegistry
+from app.exception.laubeException import LaubeException
+from app.models.models import MaintenanceWindow
+
+AUDIT = dict(create_user_uuid="test", update_user_uuid="test", update_count=1)
+NOW = datetime(2025, 4, 1, 12, 0, 0)
+
+
+def add_window(db_session, engine_name="Laube", start=NOW - timedelta(hours=1), end=NOW + timedelta(hours=1)):
+    db_session.add(MaintenanceWindow(engine_name=engine_name, start_date=start, end_date=end, reason="定期保守", **AUDIT))
+    db_session.flush()
+
+
+def new_registry(**kwargs):
+    return MaintenanceRegistry(clock=lambda: NOW, **kwargs)
+
+
+def test_health_check_raises_w001_during_maintenance(db_session):
+    add_window(db_session)
+    laube = Laube(context=EngineContext(maintenance_registry=new_registry()))
+
+    with pytest.raises(LaubeException) as excinfo:
+        laube.is_display_boss_field(db_session, "T1", "G1", "U1", "F1")
+    assert excinfo.value.code == "Laube-W001"
+
+
+def test_other_engine_and_finished_windows_are_ignored(db_session):
+    add_window(db_session, engine_name="Cerberus")
+    add_window(db_session, end=NOW - timedelta(minutes=1))
+    add_window(db_session, start=NOW + timedelta(days=1), end=None)
+    registry = new_registry()
+
+    assert registry.is_under_maintenance(db_session, "Laube") is False
+    assert registry.is_under_maintenance(db_session, "Cerberus") is True
+
+
+def test_state_is_read_once_per_interval(db_session, query_counter):
+    registry = new_registry(refresh_interval=60)
+
+    query_counter.clear()
+    for _ in range(5):
+        assert registry.is_under_maintenance(db_session, "Laube") is False
+    assert len([sql for sql in query_counter if "m_maintenance_window" in sql]) == 1
+
+
+def test_orm_write_forces_reload(db_session):
+    registry = new_registry(refresh_interval=60)
+    assert registry.is_under_maintenance(db_session, "Laube") is False
+
+    add_window(db_session)
+
+    assert registry.needs_refresh()
+    assert registry.is_under_maintenance(db_session, "Laube") is True
+
+
+def test_reload_failure_keeps_previous_state(db_session):
+    add_window(db_session)
+    repository = MagicMock()
+    repository.find_open_windows.return_value = db_session.query(MaintenanceWindow).all()
+    registry = new_registry(repository=repository, refresh_interval=0)
+    assert registry.is_under_maintenance(db_session, "Laube") is True
+
+    repository.find_open_windows.side_effect = RuntimeError("db down")
+
+    assert registry.is_under_maintenance(db_session, "Laube") is True
+    assert registry.stale
+
+
+def test_stale_registry_retries_after_refresh_interval(db_session):
+    repository = MagicMock()
+    repository.find_open_windows.return_value = []
+    registry = new_registry(repository=repository, refresh_interval=0.2)
+    assert registry.is_under_maintenance(db_session, "Laube") is False
+
+    registry.bump_version()
+    repository.find_open_windows.side_effect = RuntimeError("db down")
+    for _ in range(3):
+        assert registry.is_under_maintenance(db_session, "Laube") is False
+    assert repository.find_open_windows.call_count == 2
+    assert not registry.needs_refresh()
+
+    add_window(db_session)
+    repository.find_open_windows.side_effect = None
+    repository.find_open_windows.return_value = db_session.query(MaintenanceWindow).all()
+    time.sleep(0.2)
+    assert registry.needs_refresh()
+    assert registry.is_under_maintenance(db_session, "Laube") is True
+    assert not registry.stale
+
+
+def test_reload_failure_rolls_back_only_its_savepoint(db_session):
+    add_window(db_session)
+    registry = new_registry(refresh_interval=0)
+    assert registry.is_under_maintenance(db_session, "Laube") is True
+
+    def broken_query(session, now):
+        return session.execute(text("SELECT * FROM missing_maintenance_window")).all()
+
+    registry.repository = MagicMock(find_open_windows=broken_query)
+    assert registry.is_under_maintenance(db_session, "Laube") is True
+    assert registry.stale
+    # 呼び出し元のトランザクションはそのまま使える
+    assert db_session.query(MaintenanceWindow).count() == 1
+
+
+def test_first_load_failure_is_raised_unless_fail_open(db_session):
+    repository = MagicMock()
+    repository.find_open_windows.side_effect = RuntimeError("db down")
+
+    with pytest.raises(RuntimeError):
+        new_registry(repository=repository).is_under_maintenance(db_session, "Laube")
+    assert new_registry(repository=repository, fail_open=True).is_under_maintenance(db_session, "Laube") is False
@@ -0,0 +1,76 @@
+import time
+from datetime import date
+from app.common.lru_cache import LruCache
+from app.engine.master_data_resolver import MasterDataCache, MasterDataResolver
+from app.models.models import Group, Tenant, User
+from app.models.specifiedValue import PermissionRange
+
+AUDIT = dict(create_user_uuid="test", update_user_uuid="test", update_count=1)
+
+
+def seed(db_session):
+    db_session.add(Tenant(tenant_uuid="T1", tenant_name="テスト株式会社", **AUDIT))
+    db_session.add(Group(
+        tenant_uuid="T1", group_code="G1", group_name="総務部",
+        term_from=date(2020, 1, 1), permission_range=PermissionRange.ALL, **AUDIT
+    ))
+    for i in range(3):
+        db_session.add(User(user_uuid=f"U{i}", user_name=f"社員{i}", hashed_password="x", **AUDIT))
+    db_session.flush()
+
+
+def prefetch_all(resolver):
+    resolver.prefetch(
+        tenant_uuids=["T1"], group_keys=[("T1", "G1")], user_uuids=["U0", "U1", "U2", "UNKNOWN"]
+    )
+
+
+def test_prefetch_loads_each_kind_once(db_session, query_counter):
+    seed(db_session)
+    resolver = MasterDataResolver(db_session, MasterDataCache())
+
+    query_counter.clear()
+    prefetch_all(resolver)
+    assert len(query_counter) == 3
+
+    query_counter.clear()
+    assert resolver.tenant_name("T1") == "テスト株式会社"
+    assert resolver.group_name("T1", "G1") == "総務部"
+    assert resolver.user_name("U2") == "社員2"
+    assert resolver.user_name("UNKNOWN") is None
+    assert query_counter == []
+    assert resolver.stats() == {"identity_hits": 4, "cache_hits": 0, "db_loads": 5}
+
+
+def test_process_cache_is_shared_between_requests(db_session, query_counter):
+    seed(db_session)
+    cache = MasterDataCache()
+    prefetch_all(MasterDataResolver(db_session, cache))
+
+    second = MasterDataResolver(db_session, cache)
+    query_counter.clear()
+    second.prefetch(tenant_uuids=["T1"], group_keys=[("T1", "G1")], user_uuids=["U0", "U1"])
+
+    assert query_counter == []
+    assert second.stats()["cache_hits"] == 4
+    assert cache.stats()["user"]["hits"] == 2
+
+
+def test_orm_update_invalidates_cached_name(db_session):
+    seed(db_session)
+    cache = MasterDataCache()
+    prefetch_all(MasterDataResolver(db_session, cache))
+
+    db_session.query(User).filter_by(user_uuid="U0").one().user_name = "改名後"
+    db_session.flush()
+
+    assert MasterDataResolver(db_session, cache).user_name("U0") == "改名後"
+
+
+def test_lru_cache_expires_entries_after_ttl():
+    cache = LruCache(maxsize=2, ttl=0.01)
+    cache.put("a", 1)
+    assert cache.get("a") == 1
+    time.sleep(0.02)
+    assert cache.get("a") is None
+    assert cache.stats()["hits"] == 1 and cache.stats()["misses"] == 1
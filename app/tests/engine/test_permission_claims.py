@@ -0,0 +1,66 @@
+from app.dependencies.auth import get_token_claims
+from app.engine.permission_claims import (
+    PERMISSION_CLAIM, VERSION_CLAIM, PermissionClaims, decode_bitmap, encode_bitmap
+)
+from app.models.models import Permission, Role
+from app.tests.engine.helpers import AUDIT, grant
+from app.utils.jwt import create_access_token
+
+
+def add_catalog(db_session, roles=("editor", "viewer"), permissions=("read", "write", "approve")):
+    for role_id in roles:
+        db_session.add(Role(role_id=role_id, role_name=role_id, **AUDIT))
+    for permission_id in permissions:
+        db_session.add(Permission(permission_id=permission_id, permission_name=permission_id, **AUDIT))
+    db_session.flush()
+
+
+def test_bitmap_round_trip():
+    encoded = encode_bitmap([0, 3, 70])
+    assert decode_bitmap(encoded) == (1 << 0) | (1 << 3) | (1 << 70)
+    assert "=" not in encoded
+    assert decode_bitmap(encode_bitmap([])) == 0
+
+
+def test_claims_authorize_without_database_access(cerberus, db_session, query_counter):
+    add_catalog(db_session)
+    grant(cerberus, db_session)
+    cerberus.assign_role_to_user(db_session, "U1", "editor")
+    db_session.commit()
+    claims_service = PermissionClaims(cerberus)
+    claims = {"sub": "U1", **claims_service.issue(db_session, "U1")}
+    assert claims[VERSION_CLAIM] == cerberus.policy_index.current_version(db_session)
+
+    query_counter.clear()
+    assert claims_service.authorize(claims, "write") is True
+    assert claims_service.authorize(claims, "approve") is False
+    assert query_counter == []
+    assert (claims_service.claim_decisions, claims_service.fallbacks) == (2, 0)
+
+
+def test_stale_or_incomplete_claims_fall_back_to_cerberus(cerberus, db_session):
+    add_catalog(db_session)
+    grant(cerberus, db_session)
+    db_session.commit()
+    claims_service = PermissionClaims(cerberus)
+    claims = {"sub": "U1", **claims_service.issue(db_session, "U1")}
+    assert claims_service.authorize(claims, "write") is False
+
+    # 発行後の割り当てで版数が進むと、クレームは使わずに Cerberus で判定する
+    cerberus.assign_role_to_user(db_session, "U1", "editor")
+    db_session.commit()
+    assert claims_service.decide_from_claims(claims, "write") is None
+    assert claims_service.authorize(claims, "write") is True
+
+    # ビット位置の無いパーミッション・ビットマップの無いトークン
+    fresh = {"sub": "U1", **claims_service.issue(db_session, "U1")}
+    assert claims_service.decide_from_claims(fresh, "write") is True
+    assert claims_service.decide_from_claims(fresh, "unknown") is None
+    assert claims_service.decide_from_claims({"sub": "U1"}, "write") is None
+
+
+def test_login_token_is_accepted_by_auth_dependency():
+    token = create_access_token({"sub": "U1", VERSION_CLAIM: 3, PERMISSION_CLAIM: encode_bitmap([1])})
+    claims = get_token_claims(token)
+    assert claims["sub"] == "U1"
+    assert decode_bitmap(claims[PERMISSION_CLAIM]) == 2
@@ -0,0 +1,44 @@
+import pytest
+from datetime import datetime
+from app.engine.policy_condition import ConditionCompiler, PolicyConditionError, build_context, compile_condition
+
+CONTEXT = build_context(
+    user={"group_code": "G1", "grade": 3, "roles": ["editor"]},
+    resource={"group_code": "G1", "status": "draft"},
+    now=datetime(2025, 4, 1, 18, 30),
+)
+
+
+@pytest.mark.parametrize("source, expected", [
+    ('{"==": [{"var": "user.group_code"}, {"var": "resource.group_code"}]}', True),
+    (
+        '{"and": [{">=": [{"var": "user.grade"}, 3]}, {"in": [{"var": "resource.status"}, ["draft", "returned"]]}]}',
+        True
+    ),
+    ('{"!": {"<=": [{"var": "now.time"}, "18:00"]}}', True),
+    ("user.grade > 3 or 'editor' in user.roles", True),
+    ("'09:00' <= now.time <= '18:00'", False),
+    ("resource.owner == user.user_uuid", False),
+    ("resource.owner != user.user_uuid", False),
+    ("user.grade >= '3'", False),
+])
+def test_conditions_are_evaluated(source, expected):
+    assert compile_condition(source)(CONTEXT) is expected
+
+
+@pytest.mark.parametrize("source", [
+    "", "{not json", '{"xor": [true, false]}', "user.grade + 1 > 3", "user.__class__ == 1", "len(user.roles) > 0",
+])
+def test_invalid_conditions_are_rejected(source):
+    with pytest.raises(PolicyConditionError):
+        compile_condition(source)
+
+
+def test_compiled_condition_is_reused_until_update_count_changes():
+    compiler = ConditionCompiler()
+
+    first = compiler.get("P1", 0, "user.grade >= 3")
+    assert compiler.get("P1", 0, "user.grade >= 3") is first
+    assert compiler.get("P1", 1, "user.grade >= 3") is not first
+    assert compiler.metrics.snapshot()["compiles"] == 2
+    assert compiler.metrics.snapshot()["cache_hits"] == 1
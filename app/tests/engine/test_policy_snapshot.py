@@ -0,0 +1,96 @@
+import pytest
+from datetime import date
+from app.engine.policy_index import PolicyIndex
+from app.engine.policy_snapshot import PolicySnapshot, PolicySnapshotError, write_snapshot
+from app.tests.engine.helpers import TENANT, add_affiliation, add_group, grant
+
+
+@pytest.fixture
+def snapshot_path(tmp_path):
+    return str(tmp_path / "policy.idx")
+
+
+def test_snapshot_round_trip(snapshot_path):
+    policies = [
+        ("P1", "editor", "write", "/forms", None, 0),
+        ("P2", "editor", "read", "/forms", "hour >= 9", 3),
+        ("P3", "経理", "approve", "/経費", None, 1),
+    ]
+    affiliations = [("U1", TENANT, "G1", date(2020, 1, 1), None), ("U2", TENANT, "G2", None, date(2030, 3, 31))]
+    write_snapshot(
+        snapshot_path, 42, [("U1", "editor"), ("U1", "経理"), ("U2", "editor")], policies,
+        [(TENANT, "G1", "editor")], affiliations
+    )
+
+    with PolicySnapshot(snapshot_path) as snapshot:
+        assert snapshot.version == 42
+        assert sorted(snapshot.user_roles()) == [("U1", "editor"), ("U1", "経理"), ("U2", "editor")]
+        assert sorted(snapshot.policies()) == sorted(policies)
+        assert list(snapshot.group_roles()) == [(TENANT, "G1", "editor")]
+        assert sorted(snapshot.affiliations()) == affiliations
+        # ID は文字列表に1回だけ格納される
+        assert snapshot.strings.count("editor") == 1
+
+
+def test_broken_snapshot_is_rejected(snapshot_path):
+    write_snapshot(snapshot_path, 1, [("U1", "editor")], [], [], [])
+    with open(snapshot_path, "r+b") as f:
+        f.truncate(40)
+    with pytest.raises(PolicySnapshotError):
+        PolicySnapshot(snapshot_path)
+
+
+def test_warm_start_uses_snapshot_when_version_is_current(cerberus, db_session, snapshot_path, query_counter):
+    for code, upper in [("G1", None), ("G11", "G1")]:
+        add_group(db_session, code, upper)
+    add_affiliation(db_session, "U2", "G11")
+    grant(cerberus, db_session)
+    grant(cerberus, db_session, "manager", "approve", "/forms", condition="hour >= 9")
+    cerberus.assign_role_to_user(db_session, "U1", "editor")
+    cerberus.assign_role_to_group(db_session, TENANT, "G1", "manager")
+    db_session.commit()
+    cerberus.save_snapshot(snapshot_path)
+
+    index = PolicyIndex()
+    query_counter.clear()
+    assert index.load_snapshot(db_session, snapshot_path) == "current"
+    assert len(query_counter) == 1  # 版数の確認のみ
+
+    assert index.version == cerberus.policy_index.version
+    assert index.check("U1", "write", "/api/forms") is True
+    assert index.roles_of("U2") == {"manager"}
+    assert index.check("U2", "approve", "/forms", {"hour": 10}) is True
+    assert index.check("U2", "approve", "/forms", {"hour": 8}) is False
+
+
+def test_warm_start_catches_up_with_later_writes(cerberus, db_session, snapshot_path):
+    grant(cerberus, db_session)
+    cerberus.assign_resource_to_role(db_session, "editor", "write", "/api/users")
+    cerberus.assign_role_to_user(db_session, "U1", "editor")
+    db_session.commit()
+    cerberus.save_snapshot(snapshot_path)
+
+    cerberus.revoke_resource_from_role(db_session, "editor", "write", "/api/users")
+    cerberus.assign_resource_to_role(db_session, "editor", "write", "/api/reports")
+    cerberus.assign_role_to_user(db_session, "U2", "editor")
+    db_session.commit()
+
+    index = PolicyIndex()
+    assert index.load_snapshot(db_session, snapshot_path) == "caught_up"
+    assert index.version == index.current_version(db_session)
+    assert index.check("U1", "write", "/api/forms") is True
+    assert index.check("U1", "write", "/api/users") is False
+    assert index.check("U2", "write", "/api/reports") is True
+
+
+def test_warm_start_falls_back_to_full_load(cerberus, db_session, snapshot_path):
+    grant(cerberus, db_session)
+    cerberus.assign_role_to_user(db_session, "U1", "editor")
+    db_session.commit()
+
+    index = PolicyIndex()
+    assert index.load_snapshot(db_session, snapshot_path) == "loaded"
+    assert index.check("U1", "write", "/api/forms") is True
+
+    with pytest.raises(ValueError):
+        PolicyIndex().save_snapshot(snapshot_path)
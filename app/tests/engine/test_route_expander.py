@@ -0,0 +1,138 @@
+import pytest
+from app.dtos.application_info_dto import ApplicationInfoDto
+from app.engine.laube import Laube
+from app.exception.laubeException import LaubeException
+from app.models.models import ApplicationForm, ApplicationFormRoute, Boss, CommonActivity, CommonRoute
+from app.models.specifiedValue import (
+    ApprovalFunction, AutoApproverlFlag, PullingFlag, RouteFlag, RouteType, WithdrawalFlag
+)
+from app.tests.engine.test_approver_resolver import AUDIT, TENANT, seed_master, seed_route
+
+
+def add_form(db_session, code, route_flag, skip_apply_employee=False, auto_flag=AutoApproverlFlag.MANUAL_APPROVAL):
+    db_session.add(ApplicationForm(
+        tenant_uuid=TENANT, application_form_code=code, application_form_name=code,
+        application_classification_code="C1", skip_apply_employee=skip_apply_employee,
+        auto_approverl_flag=auto_flag, pulling_flag=PullingFlag.A,
+        withdrawal_flag=WithdrawalFlag.ENABLED, route_flag=route_flag, sort_number=1,
+        table_name=f"t_{code}".lower(), screen_code="S00001", **AUDIT
+    ))
+    db_session.flush()
+
+
+def add_form_route(db_session, code, group_code=None, individual_route_code=None, common_route_code=None):
+    db_session.add(ApplicationFormRoute(
+        tenant_uuid=TENANT, application_form_code=code, group_code=group_code,
+        individual_route_code=individual_route_code, common_route_code=common_route_code, **AUDIT
+    ))
+    db_session.flush()
+
+
+def seed_common_route(db_session, route_code, user_uuids):
+    db_session.add(CommonRoute(
+        tenant_uuid=TENANT, common_route_code=route_code, common_route_name="経理ルート", **AUDIT
+    ))
+    for i, user_uuid in enumerate(user_uuids, start=1):
+        db_session.add(CommonActivity(
+            tenant_uuid=TENANT, common_route_code=route_code, activity_code=i,
+            approverl_tenant_uuid=TENANT, approverl_group_code="G1", approverl_user_uuid=user_uuid,
+            function=ApprovalFunction.EXAMINATION, **AUDIT
+        ))
+    db_session.flush()
+
+
+def application(form_code, applicant="user-9"):
+    return ApplicationInfoDto(
+        application_form_code=form_code, target_group_code="G1", target_user_uuid=applicant,
+        applicant_user_uuid=applicant
+    )
+
+
+def approver_uuids(dtos):
+    return [(dto.route_type, dto.approverl_user_uuid) for dto in dtos]
+
+
+def test_individual_and_common_routes_are_expanded_in_order(db_session):
+    seed_master(db_session, 4)
+    seed_route(db_session, "R1", ["user-0", "user-1"])
+    seed_common_route(db_session, "C1", ["user-2", "user-3"])
+    add_form(db_session, "F1", RouteFlag.INDIVIDUAL_ROUTE)
+    add_form_route(db_session, "F1", None, "R9", "C1")
+    add_form_route(db_session, "F1", "G1", "R1", "C1")
+
+    result = Laube().expand_route(db_session, TENANT, application("F1"))
+
+    assert result.individual_route_code == "R1"
+    assert result.common_route_code == "C1"
+    assert approver_uuids(result.approvers) == [
+        (RouteType.INDIVIDUAL, "user-0"), (RouteType.INDIVIDUAL, "user-1"),
+        (RouteType.COMMON, "user-2"), (RouteType.COMMON, "user-3")
+    ]
+    assert result.common[0].approverl_user_name == "社員2"
+    assert {"form", "plan", "lookups", "names", "build"} <= set(result.timings)
+
+
+def test_boss_route_uses_direct_boss(db_session):
+    seed_master(db_session, 2)
+    seed_common_route(db_session, "C1", ["user-1"])
+    add_form(db_session, "F1", RouteFlag.BOSS_ROUTE)
+    add_form_route(db_session, "F1", common_route_code="C1")
+    db_session.add(Boss(
+        tenant_uuid=TENANT, user_uuid="user-9", group_code=None, application_form_code=None,
+        boss_tenant_uuid=TENANT, boss_group_code="G1", boss_user_uuid="user-0", **AUDIT
+    ))
+    db_session.flush()
+
+    result = Laube().expand_route(db_session, TENANT, application("F1"))
+
+    assert result.boss.boss_user_uuid == "user-0"
+    assert approver_uuids(result.approvers) == [(RouteType.INDIVIDUAL, "user-0"), (RouteType.COMMON, "user-1")]
+    assert "boss" in result.timings
+
+
+def test_skip_apply_employee_removes_applicant(db_session):
+    seed_master(db_session, 3)
+    seed_route(db_session, "R1", ["user-0", "user-1"])
+    seed_common_route(db_session, "C1", ["user-1", "user-2"])
+    add_form(db_session, "F1", RouteFlag.INDIVIDUAL_ROUTE, skip_apply_employee=True)
+    add_form_route(db_session, "F1", "G1", "R1", "C1")
+
+    result = Laube().expand_route(db_session, TENANT, application("F1", applicant="user-1"))
+
+    assert [dto.approverl_user_uuid for dto in result.approvers] == ["user-0", "user-2"]
+
+
+def test_auto_approval_dedupes_across_routes(db_session):
+    seed_master(db_session, 2)
+    seed_route(db_session, "R1", ["user-0"])
+    seed_common_route(db_session, "C1", ["user-0", "user-1"])
+    add_form(db_session, "F1", RouteFlag.INDIVIDUAL_ROUTE, auto_flag=AutoApproverlFlag.AUTOMATIC_APPROVAL)
+    add_form_route(db_session, "F1", "G1", "R1", "C1")
+
+    result = Laube().expand_route(db_session, TENANT, application("F1"))
+
+    assert [dto.approval_function for dto in result.approvers] == [
+        ApprovalFunction.EXAMINATION, ApprovalFunction.AUTHORIZER_AUTOMATIC_APPROVAL, ApprovalFunction.EXAMINATION
+    ]
+
+
+def test_cached_expansion_issues_fixed_queries(db_session, query_counter):
+    seed_master(db_session, 4)
+    seed_route(db_session, "R1", ["user-0", "user-1"])
+    seed_common_route(db_session, "C1", ["user-2", "user-3"])
+    add_form(db_session, "F1", RouteFlag.INDIVIDUAL_ROUTE)
+    add_form_route(db_session, "F1", "G1", "R1", "C1")
+    laube = Laube()
+    laube.expand_route(db_session, TENANT, application("F1"))
+
+    query_counter.clear()
+    laube.expand_route(db_session, TENANT, application("F1"))
+
+    # 申請書・申請書別ルート・所属ユーザー・従業員部署（ルート構造と名称はキャッシュ済み）
+    assert len(query_counter) == 4
+
+
+def test_missing_form_raises_e006(db_session):
+    with pytest.raises(LaubeException) as excinfo:
+        Laube().expand_route(db_session, TENANT, application("UNKNOWN"))
+    assert excinfo.value.code == "Laube-E006"
@@ -0,0 +1,108 @@
+from app.common.orm_invalidation import CHANGES_RECORDED
+from app.daos.individual_activity_dao import IndividualActivityDao
+from app.engine.laube import Laube
+from app.engine.route_plan_cache import RoutePlanCache
+from app.models.models import IndividualActivity, IndividualRoute
+from app.models.specifiedValue import ApprovalFunction
+from app.tests.engine.test_approver_resolver import AUDIT, TENANT, application_form, seed_master, seed_route
+
+
+def seed_header(db_session, route_code):
+    db_session.add(IndividualRoute(
+        tenant_uuid=TENANT, individual_route_code=route_code, individual_route_name="営業ルート", **AUDIT
+    ))
+    db_session.flush()
+
+
+def activity_queries(statements):
+    return [s for s in statements if "FROM m_individual_activity" in s]
+
+
+def test_compile_builds_immutable_plan(db_session):
+    seed_header(db_session, "R1")
+    for code, group_id in ((1, None), (2, "IG"), (3, "IG")):
+        db_session.add(IndividualActivity(
+            tenant_uuid=TENANT, individual_route_code="R1", activity_code=code,
+            approverl_tenant_uuid=TENANT, approverl_group_code="G1", approverl_user_uuid=f"user-{code}",
+            function=ApprovalFunction.EXAMINATION, instance_group_id=group_id,
+            is_milestone=(code == 1), is_terminal=(code == 3), **AUDIT
+        ))
+    db_session.flush()
+
+    plan = RoutePlanCache().get_plan(db_session, TENANT, "R1")
+
+    assert plan.route_name == "営業ルート"
+    assert [a.activity_code for a in plan.activities] == [1, 2, 3]
+    assert plan.instance_group("IG") == (2, 3)
+    assert plan.milestones == (1,)
+    assert plan.activities[-1].is_terminal
+    assert isinstance(plan.activities, tuple)
+
+
+def test_cached_plan_skips_route_queries(db_session, query_counter):
+    seed_master(db_session, 2)
+    seed_route(db_session, "R1", ["user-0", "user-1"])
+    laube = Laube()
+    laube.route_plan_cache = RoutePlanCache()
+
+    laube.get_individual_approverl_list(db_session, TENANT, TENANT, "R1", application_form())
+    query_counter.clear()
+    result = laube.get_individual_approverl_list(db_session, TENANT, TENANT, "R1", application_form())
+
+    assert len(result) == 2
+    assert activity_queries(query_counter) == []
+
+
+def test_orm_write_invalidates_plan(db_session):
+    seed_route(db_session, "R1", ["user-0"])
+    cache = RoutePlanCache()
+    cache.get_plan(db_session, TENANT, "R1")
+
+    activity = db_session.query(IndividualActivity).filter_by(individual_route_code="R1").one()
+    activity.approverl_user_uuid = "user-1"
+    activity.update_count += 1
+    db_session.commit()
+
+    assert cache.get_plan(db_session, TENANT, "R1").activities[0].approverl_user_uuid == "user-1"
+
+
+def test_compare_and_update_invalidates_plan(db_session):
+    seed_route(db_session, "R1", ["user-0"])
+    cache = RoutePlanCache()
+    cache.get_plan(db_session, TENANT, "R1")
+    activity = db_session.query(IndividualActivity).filter_by(individual_route_code="R1").one()
+
+    IndividualActivityDao().compare_and_update(
+        db_session, activity.id, activity.update_count, {"approverl_user_uuid": "user-1"}
+    )
+
+    assert cache.get_plan(db_session, TENANT, "R1").activities[0].approverl_user_uuid == "user-1"
+    db_session.commit()
+    assert cache.get_plan(db_session, TENANT, "R1").activities[0].approverl_user_uuid == "user-1"
+
+
+def test_revalidation_detects_out_of_band_update(db_session):
+    seed_route(db_session, "R1", ["user-0"])
+    cache = RoutePlanCache(revalidate_after=0)
+    cache.get_plan(db_session, TENANT, "R1")
+
+    # このプロセスのイベントを経由しない更新（他プロセスからの更新相当）
+    db_session.execute(
+        IndividualActivity.__table__.update().values(approverl_user_uuid="user-9", update_count=2)
+        .execution_options(**{CHANGES_RECORDED: True})
+    )
+
+    assert cache.get_plan(db_session, TENANT, "R1").activities[0].approverl_user_uuid == "user-9"
+
+
+def test_lru_evicts_least_recently_used_route(db_session):
+    for code in ("R1", "R2", "R3"):
+        seed_route(db_session, code, ["user-0"])
+    cache = RoutePlanCache(max_routes_per_tenant=2)
+
+    for code in ("R1", "R2", "R3"):
+        cache.get_plan(db_session, TENANT, code)
+
+    assert len(cache) == 2
+    cache.invalidate(TENANT)
+    assert len(cache) == 0
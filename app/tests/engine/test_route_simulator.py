@@ -0,0 +1,74 @@
+import pickle
+import pytest
+from app.engine.route_simulator import MasterSnapshot, RouteSimulator, SimulationCase
+from app.models.models import Boss, IndividualActivity
+from app.models.specifiedValue import RouteFlag
+from app.tests.engine.test_approver_resolver import AUDIT, TENANT, seed_master, seed_route
+from app.tests.engine.test_route_expander import add_form, add_form_route
+
+
+def seed(db_session):
+    seed_master(db_session, 3)
+    seed_route(db_session, "R1", ["user-0", "user-1"])
+    add_form(db_session, "F1", RouteFlag.INDIVIDUAL_ROUTE)
+    add_form_route(db_session, "F1", "G1", "R1")
+    add_form(db_session, "F2", RouteFlag.BOSS_ROUTE)
+    for user_uuid in ("user-1", "user-2"):
+        db_session.add(Boss(
+            tenant_uuid=TENANT, user_uuid=user_uuid, group_code=None, application_form_code=None,
+            boss_tenant_uuid=TENANT, boss_group_code="G1", boss_user_uuid="user-0", **AUDIT
+        ))
+    db_session.flush()
+
+
+def reorganized(snapshot):
+    # 承認ルート R1 の2段目を user-1 から user-2 に付け替える
+    activities = [
+        dict(row, approverl_user_uuid="user-2") if row["approverl_user_uuid"] == "user-1" else row
+        for row in snapshot.rows(IndividualActivity)
+    ]
+    return snapshot.with_rows(IndividualActivity, activities)
+
+
+CASES = [
+    SimulationCase("user-1", "G1", "F1"),
+    SimulationCase("user-1", "G1", "F2"),
+    SimulationCase("user-2", "G1", "F2"),
+    SimulationCase("user-2", "G1", "MISSING"),
+]
+
+
+def test_snapshot_is_picklable_and_immutable(db_session):
+    seed(db_session)
+    before = MasterSnapshot.capture(db_session, [TENANT])
+    after = reorganized(before)
+
+    restored = pickle.loads(pickle.dumps(after))
+
+    assert restored.rows(IndividualActivity) == after.rows(IndividualActivity)
+    assert before.rows(IndividualActivity) != after.rows(IndividualActivity)
+
+
+@pytest.mark.parametrize("max_workers", [0, 2])
+def test_only_changed_routes_are_reported(db_session, max_workers):
+    seed(db_session)
+    before = MasterSnapshot.capture(db_session, [TENANT])
+    simulator = RouteSimulator(before, reorganized(before), max_workers=max_workers, chunk_size=1)
+
+    diffs = list(simulator.simulate(TENANT, iter(CASES)))
+
+    assert [d.case for d in diffs] == [CASES[0]]
+    assert [key[4] for key in diffs[0].removed] == ["user-1"]
+    assert [key[4] for key in diffs[0].added] == ["user-2"]
+
+
+def test_unchanged_and_error_cases_can_be_included(db_session):
+    seed(db_session)
+    before = MasterSnapshot.capture(db_session, [TENANT])
+    simulator = RouteSimulator(before, before, max_workers=0)
+
+    diffs = {d.case: d for d in simulator.simulate(TENANT, CASES, include_unchanged=True)}
+
+    assert len(diffs) == len(CASES)
+    assert diffs[CASES[3]].after.error == "Laube-E006"
+    assert [key[4] for key in diffs[CASES[1]].after.approvers] == ["user-0"]
@@ -0,0 +1,53 @@
+from sqlalchemy import bindparam, func, select
+from app.common.statement_registry import StatementRegistry, match
+from app.models.models import Boss
+from app.repositories.boss_repository import BossRepository
+from app.tests.engine.test_boss_resolver import TENANT, add_boss
+
+
+def test_null_matching_lookups_use_m_boss(db_session):
+    add_boss(db_session, "G1", "F1", "B1")
+    add_boss(db_session, None, "F1", "B2")
+    add_boss(db_session, "G1", None, "B3")
+    add_boss(db_session, None, None, "B4")
+    repository = BossRepository()
+    # 他のテストで作られたバリアントを数えないよう、専用の登録簿を使う
+    registry = repository.dao.statement_registry = StatementRegistry()
+
+    assert repository.get_by_all_keys(db_session, TENANT, "G1", "U1", "F1").boss_user_uuid == "B1"
+    assert repository.get_by_group_null(db_session, TENANT, "U1", "F1").boss_user_uuid == "B2"
+    assert repository.get_by_form_null(db_session, TENANT, "G1", "U1").boss_user_uuid == "B3"
+    assert repository.get_by_group_and_form_null(db_session, TENANT, "U1").boss_user_uuid == "B4"
+    assert repository.get_by_all_keys(db_session, TENANT, "G2", "U1", "F1") is None
+
+    # 4パターンとも同じ文の NULL バリアントとして登録・集計される
+    name = "m_boss.find_by(tenant_uuid, group_code, user_uuid, application_form_code)"
+    stats = registry.stats()[name]
+    assert stats["executions"] == 5
+    assert stats["variants"] == 4
+    assert stats["total_seconds"] > 0
+
+    # 上限はバインドパラメータで渡すため、上限の値が変わっても登録は列の組み合わせごとに1件のまま
+    values = {"tenant_uuid": TENANT, "group_code": None, "user_uuid": "U1", "application_form_code": None}
+    assert len(repository.dao.find_by_columns(db_session, values, limit=3)) == 1
+    assert len(repository.dao.find_by_columns(db_session, {**values, "group_code": "G1"}, limit=None)) == 1
+    assert registry.names() == [name]
+
+
+def test_registered_statement_is_built_once_per_variant(db_session):
+    add_boss(db_session, "G1", "F1", "B1")
+    registry = StatementRegistry()
+    built = []
+
+    @registry.statement("boss_count", nullable=("group_code",))
+    def build(nulls):
+        built.append(nulls)
+        return select(func.count()).select_from(Boss).where(
+            Boss.user_uuid == bindparam("user_uuid"), match(Boss.group_code, "group_code", nulls)
+        )
+
+    for _ in range(3):
+        assert registry.execute(db_session, "boss_count", {"user_uuid": "U1", "group_code": "G1"})[0][0] == 1
+    assert registry.execute(db_session, "boss_count", {"user_uuid": "U1", "group_code": None})[0][0] == 0
+    assert built == [frozenset(), frozenset({"group_code"})]
+    assert registry.stats()["boss_count"]["executions"] == 4
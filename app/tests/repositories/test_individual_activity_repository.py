@@ -27,3 +27,49 @@ def test_find_by_tenant_and_route(db_session, individual_activity_repository):
     assert len(results) == 1
     assert results[0].individual_route_code == "ROUTE001"
     assert results[0].activity_code == "A001"
+
+
+def add_activity(db_session, route_code, activity_code, role_code=None):
+    activity = IndividualActivity(
+        tenant_uuid="abc",
+        individual_route_code=route_code,
+        activity_code=activity_code,
+        approverl_role_code=role_code,
+        function=ApprovalFunction.EXAMINATION,
+        create_user_uuid="test-user",
+        update_user_uuid="test-user",
+        update_count=1
+    )
+    db_session.add(activity)
+    db_session.flush()
+    return activity
+
+
+def test_generated_unique_and_index_finders(db_session, individual_activity_repository, query_counter):
+    first = add_activity(db_session, "ROUTE001", 1, "R1")
+    second = add_activity(db_session, "ROUTE001", 2)
+    other = add_activity(db_session, "ROUTE002", 1, "R1")
+    repository = individual_activity_repository
+
+    assert repository.get_by_tenant_uuid_and_individual_route_code_and_activity_code(
+        db_session, "abc", "ROUTE001", 2
+    ) is second
+    assert repository.get_by_tenant_uuid_and_individual_route_code_and_activity_code(
+        db_session, "abc", "ROUTE001", 9
+    ) is None
+    assert repository.find_by_tenant_uuid_and_individual_route_code(db_session, "abc", "ROUTE001") == [first, second]
+    assert repository.find_by_tenant_uuid_and_approverl_role_code(db_session, "abc", "R1") == [first, other]
+
+    query_counter.clear()
+    found = repository.get_many_by_tenant_uuid_and_individual_route_code_and_activity_code(
+        db_session, [("abc", "ROUTE001", 1), ("abc", "ROUTE002", 1), ("abc", "ROUTE009", 1)], 2
+    )
+    assert sorted(a.id for a in found) == [first.id, other.id]
+    assert len(query_counter) == 2  # 2件ずつ
+
+    # 複合キーの一括検索も一意制約の索引を使う（全件走査にならない）
+    statement = query_counter[0]
+    plan = db_session.connection().exec_driver_sql(
+        "EXPLAIN QUERY PLAN " + statement, (None,) * statement.count("?")
+    ).all()
+    assert not any(row[-1].startswith("SCAN m_individual_activity") for row in plan)
@@ -0,0 +1,58 @@
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from app.exception.laubeException import OptimisticLockException
+from app.models.models import Base
+from app.repositories.group_repository import GroupRepository
+from app.tests.engine.helpers import TENANT, add_group
+
+
+@pytest.fixture
+def sessions(tmp_path):
+    # 2人の承認者を、別々のコネクション・トランザクションで再現する
+    engine = create_engine(f"sqlite:///{tmp_path / 'occ.sqlite3'}")
+    Base.metadata.create_all(engine)
+    factory = sessionmaker(bind=engine)
+    with factory() as db:
+        add_group(db, "G1")
+        db.commit()
+    first, second = factory(), factory()
+    yield first, second
+    first.close()
+    second.close()
+    engine.dispose()
+
+
+def test_second_writer_gets_conflict_instead_of_lost_update(sessions):
+    first, second = sessions
+    repository = GroupRepository()
+    mine = repository.get_by_tenant_uuid_and_group_code(first, TENANT, "G1")
+    theirs = repository.get_by_tenant_uuid_and_group_code(second, TENANT, "G1")
+    assert mine.update_count == theirs.update_count == 1
+
+    repository.update(first, mine.id, {"group_name": "営業1部"})
+    first.commit()
+    assert mine.update_count == 2
+
+    with pytest.raises(OptimisticLockException) as raised:
+        repository.update(second, theirs.id, {"group_name": "営業2部"})
+    assert raised.value.code == "Laube-E014"
+    second.rollback()
+
+    assert repository.get(second, theirs.id).group_name == "営業1部"
+
+
+def test_expected_update_count_from_client(sessions):
+    first, _ = sessions
+    repository = GroupRepository()
+    group = repository.get_by_tenant_uuid_and_group_code(first, TENANT, "G1")
+
+    # 画面から戻ってきた古い更新回数では更新できない
+    with pytest.raises(OptimisticLockException) as raised:
+        repository.update(first, group.id, {"group_name": "総務部", "update_count": 0})
+    assert (raised.value.expected_update_count, raised.value.actual_update_count) == (0, 1)
+
+    assert repository.compare_and_update(first, group.id, 1, {"group_name": "総務部"}) == 2
+    assert group.group_name == "総務部" and group.update_count == 2
+    with pytest.raises(OptimisticLockException):
+        repository.compare_and_update(first, group.id, 1, {"group_name": "人事部"})
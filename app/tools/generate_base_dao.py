@@ -4,6 +4,7 @@ import re
 import importlib.util
 import inspect
 from pathlib import Path
+import yaml
 from jinja2 import Environment, FileSystemLoader
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
@@ -16,6 +17,7 @@ PROJECT_DIR = Path(os.getenv("PROJECT_DIR") or Path(__file__).resolve().parents[
 APP_DIR = PROJECT_DIR / "app" # laube2/app/
 
 MODELS_FILE = APP_DIR / "models" / "models.py"
+SCHEMA_FILE = APP_DIR / "config" / "schema.yaml"
 TEMPLATE_DIR = APP_DIR / "templates"
 DAO_DIR = APP_DIR / "daos"
 DAO_BASE_DIR = DAO_DIR / "base"
@@ -66,6 +68,38 @@ def get_pk_fields_with_comments(model_cls):
         })
     return pk_fields
 
+def load_schema_keys(path):
+    """
+    schema.yaml から、モデルごとの一意制約と索引の列を読み込む。
+
+    generate_models.py が models.py に出力するもの（uniques / type: unique の constraints /
+    unique: true の列、indexes / index: true の列）だけを対象にする。
+    戻り値: {class_name: (一意制約の列リストのリスト, 索引の列リストのリスト)}
+    """
+    data = yaml.safe_load(Path(path).read_text(encoding="utf-8"))
+    models_list = data["models"] if isinstance(data, dict) else data
+    keys = {}
+    for model in models_list:
+        columns = model.get("columns") or []
+        uniques = [list(u) for u in model.get("uniques") or []]
+        uniques += [list(c["columns"]) for c in model.get("constraints") or [] if c.get("type") == "unique"]
+        uniques += [[c["name"]] for c in columns if c.get("unique") and not c.get("primary_key")]
+        indexes = [list(i) for i in model.get("indexes") or []]
+        indexes += [[c["name"]] for c in columns if c.get("index") and not c.get("primary_key")]
+        uniques = [u for n, u in enumerate(uniques) if u not in uniques[:n]]
+        # 一意制約と同じ列の索引は get_by_* で足りるため除く
+        indexes = [i for n, i in enumerate(indexes) if i not in indexes[:n] and i not in uniques]
+        keys[model["class_name"]] = (uniques, indexes)
+    return keys
+
+def get_key_fields(model_cls, column_names):
+    return [
+        {"name": name, "type": get_column_type(model_cls.__table__.c[name])}
+        for name in column_names
+    ]
+
+schema_keys = load_schema_keys(SCHEMA_FILE)
+
 # === モデル一覧取得 ===
 model_classes = [
     (name, cls) for name, cls in inspect.getmembers(models, inspect.isclass)
@@ -91,6 +125,7 @@ for original_name, model_cls in model_classes:
     dao_class_name = f"{model_pascal}Dao"
 
     pk_fields = get_pk_fields_with_comments(model_cls)
+    uniques, indexes = schema_keys.get(original_name, ([], []))
 
     # Base DAO生成（毎回）
     base_path = DAO_BASE_DIR / f"{model_snake}_dao_base.py"
@@ -99,6 +134,10 @@ for original_name, model_cls in model_classes:
         model_lower=model_snake,
         base_dao_class_name=base_dao_class_name,
         pk_fields=pk_fields,
+        unique_key=uniques[0] if uniques else [],
+        has_version=model_cls.__mapper__.version_id_col is not None,
+        unique_finders=[get_key_fields(model_cls, u) for u in uniques],
+        index_finders=[get_key_fields(model_cls, i) for i in indexes],
         imports=used_types
     )
     with open(base_path, "w", encoding="utf-8") as f:
@@ -1,3 +1,4 @@
+import ast
 import os
 import importlib
 import inspect
@@ -40,17 +41,28 @@ def scan_dao_files():
                     dao_files.append((root, file))
     return dao_files
 
+def format_param(param):
+    # リテラルの既定値（None・数値・文字列・タプル等）はリポジトリ側にも引き継ぐ
+    if param.default is inspect.Parameter.empty:
+        return param.name
+    try:
+        ast.literal_eval(repr(param.default))
+    except (ValueError, SyntaxError):
+        return param.name
+    return f"{param.name}={param.default!r}"
+
 def get_public_methods(clazz):
-    return [
-        {
+    methods = []
+    for name, method in inspect.getmembers(clazz, predicate=inspect.isfunction):
+        if name.startswith("_"):
+            continue
+        params = [p for p in inspect.signature(method).parameters.values() if p.name != "self"]
+        methods.append({
             "name": name,
-            "args": [
-                arg for arg in inspect.signature(method).parameters.keys() if arg != "self"
-            ],
-        }
-        for name, method in inspect.getmembers(clazz, predicate=inspect.isfunction)
-        if not name.startswith("_")
-    ]
+            "params": [format_param(p) for p in params],
+            "args": [p.name for p in params],
+        })
+    return methods
 
 def render_template(template_name, params):
     from jinja2 import Environment, FileSystemLoader
@@ -33,6 +33,7 @@ from sqlalchemy.orm import Session
 from app.models.models import {{ model_class }}
 from app.daos.{{ model_lower }}_dao import {{ dao_class_name }}
 from datetime import datetime, date, time
+from app.exception.laubeException import OptimisticLockException
 {{ enum_imports }}
 
 @pytest.fixture
@@ -55,6 +56,14 @@ def test_update_{{ model_lower }}(db_session: Session, {{ model_lower }}_dict):
     dao.update(db_session, {{ pk_args }}, {"{{ update_col }}": "updated"})
     updated = dao.get(db_session, obj.id)
     assert updated.{{ update_col }} == "updated"
+{%- if has_update_count %}
+
+def test_update_conflict_{{ model_lower }}(db_session: Session, {{ model_lower }}_dict):
+    dao = {{ dao_class_name }}()
+    obj = dao.create(db_session, {{ model_lower }}_dict)
+    with pytest.raises(OptimisticLockException):
+        dao.update(db_session, {{ pk_args }}, {"{{ update_col }}": "updated"}, expected_update_count=obj.update_count + 1)
+{%- endif %}
 
 def test_delete_{{ model_lower }}(db_session: Session, {{ model_lower }}_dict):
     dao = {{ dao_class_name }}()
@@ -62,6 +71,38 @@ def test_delete_{{ model_lower }}(db_session: Session, {{ model_lower }}_dict):
     dao.delete(db_session, obj)
     deleted = dao.get(db_session, obj.id)
     assert deleted is None
+
+def test_get_page_after_and_iter_all_{{ model_lower }}(db_session: Session, {{ model_lower }}_dict):
+    dao = {{ dao_class_name }}()
+    obj = dao.create(db_session, {{ model_lower }}_dict)
+    assert dao.get_page_after(db_session, limit=10) == [obj]
+    assert dao.get_page_after(db_session, last_id=obj.id, limit=10) == []
+    assert list(dao.iter_all(db_session, batch_size=10)) == [obj]
+
+def test_bulk_insert_and_delete_{{ model_lower }}(db_session: Session, {{ model_lower }}_dict):
+    dao = {{ dao_class_name }}()
+    assert dao.bulk_insert(db_session, [{{ model_lower }}_dict]) == 1
+    assert dao.count(db_session) == 1
+    assert dao.bulk_delete(db_session, [{{ pk_values }}]) == 1
+    assert dao.count(db_session) == 0
+{%- if unique_key %}
+
+def test_get_by_unique_key_{{ model_lower }}(db_session: Session, {{ model_lower }}_dict):
+    dao = {{ dao_class_name }}()
+    obj = dao.create(db_session, {{ model_lower }}_dict)
+    assert dao.get_by_{{ unique_suffix }}(db_session, {{ unique_args }}) is obj
+    assert dao.get_many_by_{{ unique_suffix }}(db_session, [{{ unique_key_value }}]) == [obj]
+
+def test_bulk_upsert_{{ model_lower }}(db_session: Session, {{ model_lower }}_dict):
+    dao = {{ dao_class_name }}()
+    row = {key: value for key, value in {{ model_lower }}_dict.items() if key != "id"}
+    dao.bulk_upsert(db_session, [row])
+    dao.bulk_upsert(db_session, [row])
+    assert dao.count(db_session) == 1
+    {%- if has_update_count %}
+    assert dao.get_all(db_session)[0].update_count == row["update_count"] + 1
+    {%- endif %}
+{%- endif %}
 '''
 
 output_dir = PROJECT_DIR / "app" / "tests" / "dao"
@@ -127,6 +168,12 @@ for name, model_cls in model_classes:
     # 複合PK対応
     pk_fields = [col for col in model_cls.__table__.primary_key.columns]
     pk_args = ", ".join([f"obj.{col.name}" for col in pk_fields])
+    pk_values = ", ".join([f'{model_lower}_dict["{col.name}"]' for col in pk_fields])
+    if len(pk_fields) > 1:
+        pk_values = f"({pk_values})"
+
+    unique_key = getattr(importlib.import_module(f"app.daos.{model_lower}_dao"), dao_class_name).unique_key
+    unique_args = ", ".join([f'{model_lower}_dict["{name}"]' for name in unique_key])
 
     template = JinjaTemplate(PYTEST_TEMPLATE)
     rendered = template.render(
@@ -136,6 +183,12 @@ for name, model_cls in model_classes:
         columns=columns,
         update_col=update_col,
         pk_args=pk_args,
+        pk_values=pk_values,
+        unique_key=unique_key,
+        unique_suffix="_and_".join(unique_key),
+        unique_args=unique_args,
+        unique_key_value=f"({unique_args})" if len(unique_key) > 1 else unique_args,
+        has_update_count="update_count" in model_cls.__table__.c,
         enum_imports=enum_imports,
     )
 
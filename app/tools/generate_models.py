@@ -55,6 +55,21 @@ else:
 
 print(f"[DEBUG] 読み込んだモデル数: {len(models_list)}")
 
+# ------------------------------------------------------------
+# 2-1. 楽観ロック
+#   update_count 列を持つモデルは version_id_col にして、ORM の UPDATE / DELETE を
+#   WHERE id = ? AND update_count = ? の条件付きにする（optimistic_lock: false で対象外）
+# ------------------------------------------------------------
+VERSION_COLUMN = "update_count"
+
+for model in models_list:
+    column_names = {col.get("name") for col in model.get("columns") or []}
+    if VERSION_COLUMN not in column_names or model.get("optimistic_lock") is False:
+        continue
+    mapper_args = model.setdefault("mapper_args", {}) or {}
+    mapper_args.setdefault("version_id_col", VERSION_COLUMN)
+    model["mapper_args"] = mapper_args
+
 # ------------------------------------------------------------
 # 3. Jinja2 環境
 # ------------------------------------------------------------
@@ -1,9 +1,12 @@
+import os
 from datetime import datetime, timedelta
 from jose import JWTError, jwt
 
-SECRET_KEY = "super-secret-key"  # 本番では .env で管理
+SECRET_KEY = os.getenv("JWT_SECRET_KEY", "super-secret-key")  # 本番では .env で管理
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 30
+# ログイン時にアクセストークンへ権限ビットマップ（app.engine.permission_claims）を埋め込むか
+EMBED_PERMISSIONS = os.getenv("JWT_EMBED_PERMISSIONS", "false").lower() in ("1", "true", "yes")
 
 def create_access_token(data: dict, expires_delta: timedelta = None):
     to_encode = data.copy()
@@ -1,10 +1,13 @@
-from fastapi import FastAPI
+import os
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
 from app.api.routers import (
     auth_router,
     protected_router,
     common_router,
     access_control_router
 )
+from app.exception.laubeException import OptimisticLockException
 
 # アプリケーションインスタンスを生成
 app = FastAPI(
@@ -40,3 +43,24 @@ app.include_router(
     prefix="/access-control",
     tags=["Access Control"]
 )
+
+# 楽観ロックの競合（他のユーザーが先に更新した）は 409 Conflict で返す
+@app.exception_handler(OptimisticLockException)
+def optimistic_lock_conflict(request: Request, exc: OptimisticLockException):
+    return JSONResponse(status_code=409, content={"code": exc.code, "message": exc.message})
+
+
+# 認可インデックスのスナップショット（CERBERUS_POLICY_SNAPSHOT）があれば、起動時にそこから読み込み、
+# 終了時に書き出す。DBの版数が進んでいれば差分のみを取得して追いつく
+@app.on_event("startup")
+def warm_start_policy_index():
+    snapshot_path = os.getenv("CERBERUS_POLICY_SNAPSHOT")
+    if snapshot_path:
+        access_control_router.engine.warm_start(snapshot_path)
+
+
+@app.on_event("shutdown")
+def save_policy_index_snapshot():
+    snapshot_path = os.getenv("CERBERUS_POLICY_SNAPSHOT")
+    if snapshot_path and access_control_router.engine.policy_index.loaded:
+        access_control_router.engine.policy_index.save_snapshot(snapshot_path)